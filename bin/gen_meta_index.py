@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generates ucsmsdk/ucsmetaindex.py, the compact index of the managed object
+meta loaded on first use by ucsmeta.MO_CLASS_META.
+
+After the meta generator emits a new ucsmeta.py, which builds MO_CLASS_META
+as a dict of MoMeta, run this script with that file as --source. It writes
+the index of the new meta, and writes ucsmsdk/ucsmeta.py from the source
+with the MO_CLASS_META dict replaced by the lazy MoMetaIndex over the index.
+Do not copy the generated ucsmeta.py into the tree by hand, its eager dict
+would be used instead of the index, and the index would go stale.
+
+Without a source, the index is regenerated from the meta of this tree,
+which only rewrites the current index.
+
+Usage:
+    python bin/gen_meta_index.py --source /path/to/generated/ucsmeta.py
+    python bin/gen_meta_index.py
+"""
+
+from __future__ import print_function
+
+import optparse
+import os
+import sys
+
+# the index is generated for the ucsmsdk of this tree
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _ROOT)
+
+_HEADER = '''# Copyright 2015 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This is an auto-generated module containing the compact index of the
+ManagedObject Meta information, generated by bin/gen_meta_index.py.
+
+class_id -> (xml_attribute, rn, version, inp_out, mask, field_names, access,
+             parents, children, verbs)
+where version is the name of the UcsVersion in ucsmeta.VersionMeta.
+"""
+
+MO_CLASS_INDEX = {
+'''
+
+# replaces the MO_CLASS_META dict of the generated ucsmeta.py
+_LAZY_META = (
+    "# class_id -> MoMeta, created on first use from the index in "
+    "ucsmetaindex\n"
+    "MO_CLASS_META = MoMetaIndex(\"ucsmsdk.ucsmetaindex\", VersionMeta)\n")
+
+
+def _load_meta(source):
+    from ucsmsdk import ucsmeta
+
+    if source is None:
+        return ucsmeta.VersionMeta, ucsmeta.MO_CLASS_META
+
+    namespace = {"__name__": "ucsmsdk.ucsmeta", "__package__": "ucsmsdk"}
+    with open(source) as source_file:
+        exec(compile(source_file.read(), source, "exec"), namespace)
+    return namespace["VersionMeta"], namespace["MO_CLASS_META"]
+
+
+def generate(source=None, target=None):
+    version_meta, mo_class_meta = _load_meta(source)
+    versions = dict((value.version, name)
+                    for name, value in vars(version_meta).items()
+                    if name.startswith("Version"))
+
+    if target is None:
+        target = os.path.join(_ROOT, "ucsmsdk", "ucsmetaindex.py")
+
+    # the entries are read before the target is written, the target may be
+    # the index the meta is read from
+    entries = []
+    for class_id in sorted(mo_class_meta):
+        meta = mo_class_meta[class_id]
+        entries.append((str(class_id), (
+            meta.xml_attribute, meta.rn, versions[meta.version.version],
+            meta.inp_out, meta.mask, tuple(meta.field_names),
+            tuple(meta.access), tuple(meta.parents), tuple(meta.children),
+            tuple(meta.verbs))))
+
+    with open(target, "w") as index_file:
+        index_file.write(_HEADER)
+        for class_id, entry in entries:
+            index_file.write("    %r: %r,\n" % (class_id, entry))
+        index_file.write("}\n")
+    print("%d classes written to %s" % (len(mo_class_meta), target))
+
+
+def lazy_meta_source(text):
+    """
+    Returns the text of a generated ucsmeta.py with its MO_CLASS_META dict
+    replaced by the MoMetaIndex over ucsmetaindex.
+    """
+
+    start = text.find("\nMO_CLASS_META = {\n")
+    if start < 0:
+        # already lazy
+        return text
+    end = text.index("\n}\n", start) + len("\n}\n")
+    text = text[:start + 1] + _LAZY_META + text[end:]
+    return text.replace("from .ucscoremeta import MoMeta\n",
+                        "from .ucscoremeta import MoMetaIndex\n")
+
+
+def write_meta(source, target=None):
+    if target is None:
+        target = os.path.join(_ROOT, "ucsmsdk", "ucsmeta.py")
+
+    with open(source) as source_file:
+        text = lazy_meta_source(source_file.read())
+    with open(target, "w") as meta_file:
+        meta_file.write(text)
+    print("lazy meta written to %s" % target)
+
+
+def main():
+    # optparse, as argparse is missing on python 2.6
+    parser = optparse.OptionParser(description=__doc__.split("\n")[1])
+    parser.add_option("--source",
+                      help="ucsmeta.py emitted by the meta generator")
+    parser.add_option("--target", help="path of the generated index")
+    parser.add_option("--meta-target", dest="meta_target",
+                      help="path of the ucsmeta.py written from the "
+                           "source, ucsmsdk/ucsmeta.py by default")
+    options, args = parser.parse_args()
+    if args:
+        parser.error("unexpected arguments: %s" % " ".join(args))
+    generate(options.source, options.target)
+    if options.source is not None:
+        write_meta(options.source, options.meta_target)
+
+
+if __name__ == "__main__":
+    main()
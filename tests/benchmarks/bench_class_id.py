@@ -0,0 +1,94 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how fast class ids given in any case are resolved, and how fast
+class ids are searched for.
+
+Usage:
+    python -m tests.benchmarks.bench_class_id
+    python -m tests.benchmarks.bench_class_id --lookups 100000
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import re
+import time
+
+from ucsmsdk import ucscoreutils
+from ucsmsdk.ucsmeta import MO_CLASS_ID
+
+_CLASS_IDS = ["lsserver", "vnicether", "fabricvlan", "computeblade",
+              "faultinst", "orgorg", "vnicetherif", "equipmentchassis"]
+
+
+def _find_scan(class_id):
+    # what a lookup in another case used to cost, a scan of every class id
+    if class_id in MO_CLASS_ID:
+        return class_id
+    l_class_id = class_id.lower()
+    for key in MO_CLASS_ID:
+        if key.lower() == l_class_id:
+            return key
+    return None
+
+
+def _search_scan(text):
+    # what search_class_id used to run, a regex search of every class id
+    return sorted([cid for cid in MO_CLASS_ID
+                   if re.search(text.lower(), cid, re.IGNORECASE)])
+
+
+def _best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lookups", type=int, default=20000,
+                        help="number of lookups per measure")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measure, the best one is reported")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    class_ids = (_CLASS_IDS * (args.lookups // len(_CLASS_IDS) + 1))[
+        :args.lookups]
+
+    def run(func):
+        for class_id in class_ids:
+            func(class_id)
+
+    for name, func in (
+            ("ignore case (scan)", _find_scan),
+            ("ignore case (map)",
+             ucscoreutils.find_class_id_in_mo_meta_ignore_case),
+            ("search (regex scan)", _search_scan),
+            ("search (trigram index)", ucscoreutils._search_class_ids)):
+        assert [func(class_id) for class_id in _CLASS_IDS] == \
+            [_find_scan(class_id) if "ignore" in name else
+             _search_scan(class_id) for class_id in _CLASS_IDS]
+        elapsed = _best_of(args.repeat, run, func)
+        print("%-24s %12.1f lookups/s" % (name, args.lookups / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures a bulk commit of service profiles to the mock UCSM, in one request
+and in chunks, with and without reading the modified children back.
+
+Usage:
+    python -m tests.benchmarks.bench_commit_chunks
+    python -m tests.benchmarks.bench_commit_chunks --profiles 2000 --chunk 500
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import time
+
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ucsmsdk.mometa.vnic.VnicEther import VnicEther
+from ..connection.mock_ucsm import MockUcsm
+
+
+def _commit(handle, ucsm, profiles, run, **kwargs):
+    for index in range(profiles):
+        sp = LsServer(parent_mo_or_dn="org-root",
+                      name="sp%d-%d" % (run, index))
+        VnicEther(parent_mo_or_dn=sp, name="eth0")
+        handle.add_mo(sp)
+    ucsm.requests = []
+    start = time.time()
+    handle.commit(**kwargs)
+    elapsed = time.time() - start
+    return elapsed, len(ucsm.requests), max(len(body)
+                                            for body in ucsm.requests)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--profiles", type=int, default=2000,
+                        help="number of service profiles in the commit")
+    parser.add_argument("--chunk", type=int, default=500,
+                        help="objects per chunk, their vnics included")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    ucsm = MockUcsm().start()
+    handle = ucsm.handle()
+    handle.login()
+    try:
+        for run, (name, kwargs) in enumerate((
+                ("one request", {}),
+                ("chunks", {"chunk_size": args.chunk}),
+                ("chunks, no refresh", {"chunk_size": args.chunk,
+                                        "refresh": False}))):
+            elapsed, requests, largest = _commit(handle, ucsm, args.profiles,
+                                                 run, **kwargs)
+            print("%-20s %10.1f ms %6d requests %10d bytes largest" % (
+                name, elapsed * 1000, requests, largest))
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+if __name__ == "__main__":
+    main()
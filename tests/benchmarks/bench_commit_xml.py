@@ -0,0 +1,131 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how fast the configConfMos request of a large commit of vlans is
+serialized, through the element tree and written straight to bytes.
+
+Usage:
+    python -m tests.benchmarks.bench_commit_xml
+    python -m tests.benchmarks.bench_commit_xml --vlans 4000 --repeat 5
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import time
+
+from ucsmsdk import ucsxmlcodec as xc
+from ucsmsdk.ucsbasetype import ConfigMap, Pair
+from ucsmsdk.ucscoremeta import WriteXmlOption
+from ucsmsdk.ucsmethodfactory import config_conf_mos
+from ucsmsdk.ucsmo import ManagedObject
+from ucsmsdk.mometa.fabric.FabricVlan import FabricVlan
+
+
+def build_commit(vlans):
+    mo_dict = {}
+    for index in range(vlans):
+        vlan = FabricVlan(parent_mo_or_dn="fabric/lan",
+                          name="vlan%d" % (index + 1), id=str(index + 1),
+                          sharing="none", mcast_policy_name="default")
+        mo_dict[vlan.dn] = vlan
+    return mo_dict
+
+
+def _to_xml_walk(self, xml_doc=None, option=None, elem_name=None):
+    # what every object was serialized with before the serialization plans,
+    # looking up the meta of every key of the object
+    if option == WriteXmlOption.DIRTY and not self.is_dirty():
+        return None
+    xml_obj = self.elem_create(class_tag=self.mo_meta.xml_attribute,
+                               xml_doc=xml_doc, override_tag=elem_name)
+    xtra_props = self._ManagedObject__xtra_props
+    for key in self.__dict__:
+        if key != 'rn' and key in self.prop_meta:
+            mo_prop_meta = self.prop_meta[key]
+            if (option != WriteXmlOption.DIRTY or (
+                    mo_prop_meta.mask is not None and
+                    self._dirty_mask & mo_prop_meta.mask != 0)):
+                value = getattr(self, key)
+                if value is not None:
+                    xml_obj.set(mo_prop_meta.xml_attribute, value)
+        elif key in xtra_props:
+            if option != WriteXmlOption.DIRTY or xtra_props[key].is_dirty:
+                value = xtra_props[key].value
+                if value is not None:
+                    xml_obj.set(key, value)
+    if 'dn' not in xml_obj.attrib:
+        xml_obj.set('dn', self.dn)
+    self.child_to_xml(xml_obj, option)
+    return xml_obj
+
+
+def _elem_tree(mo_dict):
+    config_map = ConfigMap()
+    for dn, mo in mo_dict.items():
+        pair = Pair()
+        pair.key = dn
+        pair.child_add(mo)
+        config_map.child_add(pair)
+    return xc.to_xml_str(config_conf_mos("cookie", config_map, False))
+
+
+def _direct(mo_dict):
+    return xc.conf_mos_to_xml_bytes("cookie", mo_dict)
+
+
+def _best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--vlans", type=int, default=4000,
+                        help="number of vlans in the commit")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measure, the best one is reported")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    mo_dict = build_commit(args.vlans)
+    expected = _elem_tree(mo_dict)
+    assert _direct(mo_dict) == expected
+
+    to_xml = ManagedObject.to_xml
+    ManagedObject.to_xml = _to_xml_walk
+    try:
+        assert _elem_tree(mo_dict) == expected
+        walk = _best_of(args.repeat, _elem_tree, mo_dict)
+    finally:
+        ManagedObject.to_xml = to_xml
+    plan = _best_of(args.repeat, _elem_tree, mo_dict)
+    direct = _best_of(args.repeat, _direct, mo_dict)
+
+    print("%d vlans, %d bytes" % (args.vlans, len(expected)))
+    for name, elapsed in (("element tree (meta lookups)", walk),
+                          ("element tree (plan)", plan),
+                          ("direct bytes", direct)):
+        print("%-28s %10.1f ms %12.1f objects/s" % (
+            name, elapsed * 1000, args.vlans / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Replays the event stream of a rolling firmware upgrade against thousands
+of service profile watchers, and measures how fast events are dispatched
+and how fast polled service profiles are checked.
+
+Usage:
+    python -m tests.benchmarks.bench_event_dispatch
+    python -m tests.benchmarks.bench_event_dispatch --watchers 5000
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import logging
+import time
+
+from ucsmsdk.ucseventhandler import UcsEventHandle, \
+    mo_change_events_from_xml
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ..connection.mock_ucsm import MockUcsm
+
+_EVENT = ('<configMoChangeEvent cookie="" inEid="%(eid)d"><inConfig>'
+          '%(mo)s</inConfig></configMoChangeEvent>')
+
+# every service profile goes through these states, and raises a fault
+_STATES = ["associating", "associated"]
+
+
+def record_stream(servers):
+    """Returns the event channel messages of the upgrade."""
+    stream = []
+    for index in range(servers):
+        dn = "org-root/ls-sp%d" % index
+        for state in _STATES:
+            stream.append('<lsServer dn="%s" assocState="%s" '
+                          'status="modified"/>' % (dn, state))
+        stream.append('<faultInst dn="%s/fault-F0327" code="F0327" '
+                      'severity="warning" status="created"/>' % dn)
+    return [_EVENT % {"eid": eid, "mo": mo}
+            for eid, mo in enumerate(stream, 1)]
+
+
+def add_watchers(ueh, watchers):
+    for index in range(watchers):
+        sp = LsServer("org-root", name="sp%d" % index)
+        params = {'class_id': None, 'managed_object': sp,
+                  'prop': "assoc_state", 'success_value': ["associated"],
+                  'poll_sec': None, 'timeout_sec': None, 'call_back': None,
+                  'start_time': datetime.datetime.now(), 'context': None}
+        ueh.watch_block_add(params,
+                            ueh._add_mo_watch(sp, "assoc_state",
+                                              ["associated"]),
+                            callback=lambda mce: None)
+    params = {'class_id': "faultInst", 'managed_object': None}
+    ueh.watch_block_add(params, ueh._add_class_id_watch("faultInst"),
+                        callback=lambda mce: None)
+
+
+def dispatch_linear(ueh, mces):
+    # what every event cost before the watch blocks were indexed
+    for mce in mces:
+        for watch_block in ueh._wbs:
+            watch_block.fmce(mce)
+
+
+def dispatch_indexed(ueh, mces):
+    for mce in mces:
+        for watch_block in ueh._matching_watch_blocks(mce):
+            watch_block.fmce(mce)
+
+
+def replay(ueh, stream):
+    for message in stream:
+        ueh._process_event_channel_resp(message)
+
+
+def add_pollers(ueh, servers):
+    for index in range(servers):
+        sp = LsServer("org-root", name="sp%d" % index)
+        params = {'class_id': None, 'managed_object': sp,
+                  'prop': "assoc_state", 'success_value': ["associated"],
+                  'poll_sec': 0, 'timeout_sec': None, 'call_back': None,
+                  'start_time': datetime.datetime.now(), 'context': None}
+        ueh.watch_block_add(params,
+                            ueh._add_mo_watch(sp, "assoc_state",
+                                              ["associated"], poll_sec=0),
+                            callback=lambda mce: None)
+
+
+def poll_serial(handle, servers):
+    # what every poll tick cost before the polls were coalesced
+    for index in range(servers):
+        handle.query_dn("org-root/ls-sp%d" % index)
+
+
+def poll_coalesced(ueh):
+    ueh._dequeue_pass()
+
+
+def _best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--watchers", type=int, default=2000,
+                        help="service profiles watched")
+    parser.add_argument("--servers", type=int, default=200,
+                        help="service profiles upgraded in the stream")
+    parser.add_argument("--latency", type=float, default=0.002,
+                        help="seconds spent by the server on a request")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measure, the best one is reported")
+    args = parser.parse_args()
+
+    ucsm = MockUcsm().start()
+    for index in range(args.servers):
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp%d" % index,
+                    name="sp%d" % index, assocState="unassociated")
+    handle = ucsm.handle()
+    handle.login()
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    try:
+        ueh = UcsEventHandle(handle)
+        add_watchers(ueh, args.watchers)
+        stream = record_stream(args.servers)
+        mces = [mce for message in stream
+                for mce in mo_change_events_from_xml(message)]
+
+        print("%d events, %d watchers" % (len(stream), args.watchers + 1))
+        linear = _best_of(args.repeat, dispatch_linear, ueh, mces)
+        indexed = _best_of(args.repeat, dispatch_indexed, ueh, mces)
+        print("%-26s %12.1f events/s" % ("dispatch (every watcher)",
+                                         len(mces) / linear))
+        print("%-26s %12.1f events/s" % ("dispatch (indexed)",
+                                         len(mces) / indexed))
+        # decoding and enqueueing included, once: the queues keep the events
+        elapsed = _best_of(1, replay, ueh, stream)
+        print("%-26s %12.1f events/s" % ("replay", len(stream) / elapsed))
+
+        ucsm.latency = args.latency
+        pollers = UcsEventHandle(handle)
+        add_pollers(pollers, args.servers)
+        serial = _best_of(args.repeat, poll_serial, handle, args.servers)
+        coalesced = _best_of(args.repeat, poll_coalesced, pollers)
+        print("%-26s %12.1f checks/s" % ("poll tick (query_dn each)",
+                                         args.servers / serial))
+        print("%-26s %12.1f checks/s" % ("poll tick (coalesced)",
+                                         args.servers / coalesced))
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the import time of the common entry points of ucsmsdk, as reported
+by python -X importtime, in fresh interpreters with compiled bytecode.
+
+Usage:
+    python -m tests.benchmarks.bench_import
+    python -m tests.benchmarks.bench_import --repeat 10 --top 5
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ENTRY_POINTS = [
+    "ucsmsdk.ucshandle",
+    "ucsmsdk.ucscoreutils",
+    "ucsmsdk.mometa.ls.LsServer",
+    "ucsmsdk.utils.converttopython",
+]
+
+
+def import_times(module, pycache, cwd):
+    """
+    Imports a module in a fresh interpreter, and returns the self and
+    cumulative import time of every imported module, in microseconds.
+    """
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    output = subprocess.check_output(
+        [sys.executable, "-X", "importtime", "-X", "pycache_prefix=" + pycache,
+         "-c", "import " + module],
+        stderr=subprocess.STDOUT, env=env, cwd=cwd)
+
+    times = {}
+    for line in output.decode().splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs per entry point, the best one is reported")
+    parser.add_argument("--top", type=int, default=3,
+                        help="ucsmsdk modules with the most self time shown")
+    args = parser.parse_args()
+
+    cwd = os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__))))
+    pycache = tempfile.mkdtemp()
+    try:
+        for module in ENTRY_POINTS:
+            # the first run compiles the bytecode
+            import_times(module, pycache, cwd)
+            runs = [import_times(module, pycache, cwd)
+                    for _ in range(args.repeat)]
+            best = min(runs, key=lambda times: times[module][1])
+            sdk = sum(self_us for name, (self_us, _) in best.items()
+                      if name.startswith("ucsmsdk"))
+            print("%-32s %8.1f ms total %8.1f ms in ucsmsdk" % (
+                module, best[module][1] / 1000.0, sdk / 1000.0))
+            top = sorted(((self_us, name) for name, (self_us, _)
+                          in best.items() if name.startswith("ucsmsdk")),
+                         reverse=True)[:args.top]
+            for self_us, name in top:
+                print("    %-28s %8.1f ms" % (name, self_us / 1000.0))
+    finally:
+        shutil.rmtree(pycache)
+
+
+if __name__ == "__main__":
+    main()
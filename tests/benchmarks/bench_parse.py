@@ -0,0 +1,157 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how fast a hierarchical configResolveClass response is decoded
+into managed objects, how much of it is spent resolving classes, and how
+fast a wide hierarchical response is flattened.
+
+Usage:
+    python -m tests.benchmarks.bench_parse
+    python -m tests.benchmarks.bench_parse --blades 500 --repeat 5
+    python -m tests.benchmarks.bench_parse --wide 50000
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import time
+
+from ucsmsdk import ucscoreutils
+from ucsmsdk import ucsxmlcodec as xc
+
+_BLADE = (
+    '<computeBlade dn="sys/chassis-%(chassis)d/blade-%(slot)d" '
+    'slotId="%(slot)d" chassisId="%(chassis)d" model="UCSB-B200-M4" '
+    'serial="FCH%(chassis)04d%(slot)04d" operState="ok" '
+    'numOfCpus="2" totalMemory="262144">'
+    '<biosUnit rn="bios" model="UCSB-B200-M4" vendor="Cisco"/>'
+    '<mgmtController rn="mgmt" subject="blade" model="UCSB-B200-M4"/>'
+    '<adaptorUnit rn="adaptor-1" id="1" model="UCSB-MLOM-40G-03"/>'
+    '<memoryArray rn="memarray-1" id="1" maxDevices="24"/>'
+    '<processorUnit rn="cpu-1" id="1" cores="18" model="Intel Xeon"/>'
+    '<processorUnit rn="cpu-2" id="2" cores="18" model="Intel Xeon"/>'
+    '</computeBlade>')
+
+
+def build_response(blades):
+    mos = [_BLADE % {"chassis": 1 + index // 8, "slot": 1 + index % 8}
+           for index in range(blades)]
+    return ('<configResolveClass cookie="" response="yes" '
+            'classId="computeBlade"><outConfigs>%s</outConfigs>'
+            '</configResolveClass>' % "".join(mos))
+
+
+def build_wide_response(children):
+    mos = ['<lsServer rn="ls-sp%d" name="sp%d"/>' % (index, index)
+           for index in range(children)]
+    return ('<configResolveDns cookie="" response="yes"><outConfigs>'
+            '<orgOrg dn="org-root" name="root">%s</orgOrg></outConfigs>'
+            '</configResolveDns>' % "".join(mos))
+
+
+def _flatten_one_at_a_time(method_response):
+    # what hierarchical responses were flattened with before, taking the
+    # children off the front of the child list one at a time
+    mo_list = []
+    current_mo_list = method_response.out_configs.child
+    while len(current_mo_list) > 0:
+        child_mo_list = []
+        for mo in current_mo_list:
+            mo_list.append(mo)
+            while mo.child_count() > 0:
+                for child in mo.child:
+                    mo.child_remove(child)
+                    child.mark_clean()
+                    child_mo_list.append(child)
+                    break
+        current_mo_list = child_mo_list
+    return mo_list
+
+
+def _resolve_uncached(class_id):
+    # what every parsed element used to cost before the class registry
+    mo_class = ucscoreutils.load_class(class_id)
+    naming_props = ucscoreutils._getargspec(mo_class.__init__)[0][2:]
+    return mo_class, naming_props, 'topRoot' in mo_class.mo_meta.parents
+
+
+def _resolve_cached(class_id):
+    return ucscoreutils.load_mo_class_info(class_id)
+
+
+def _best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--blades", type=int, default=200,
+                        help="number of blades in the response")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measure, the best one is reported")
+    parser.add_argument("--wide", type=int, default=20000,
+                        help="number of children of the wide response")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    response = build_response(args.blades)
+    class_ids = ["ComputeBlade", "BiosUnit", "MgmtController",
+                 "AdaptorUnit", "MemoryArray", "ProcessorUnit",
+                 "ProcessorUnit"] * args.blades
+    elements = len(class_ids)
+
+    def resolve(func):
+        for class_id in class_ids:
+            func(class_id)
+
+    uncached = _best_of(args.repeat, resolve, _resolve_uncached)
+    cached = _best_of(args.repeat, resolve, _resolve_cached)
+    decode = _best_of(args.repeat, xc.from_xml_str, response)
+
+    print("%d elements" % elements)
+    print("%-28s %12.1f elements/s" % ("class resolution (uncached)",
+                                       elements / uncached))
+    print("%-28s %12.1f elements/s" % ("class resolution (registry)",
+                                       elements / cached))
+    print("%-28s %12.1f elements/s" % ("from_xml_str", elements / decode))
+
+    # every run detaches the children, it needs a response of its own
+    wide = build_wide_response(args.wide)
+    responses = iter([xc.from_xml_str(wide)
+                      for _ in range(2 * args.repeat)])
+
+    def flatten(func):
+        func(next(responses))
+
+    def extract(response):
+        ucscoreutils.extract_molist_from_method_response(response, True)
+
+    before = _best_of(args.repeat, flatten, _flatten_one_at_a_time)
+    after = _best_of(args.repeat, flatten, extract)
+    print("%d children of one object" % args.wide)
+    print("%-28s %12.1f elements/s" % ("flatten (one at a time)",
+                                       (args.wide + 1) / before))
+    print("%-28s %12.1f elements/s" % ("flatten (linear)",
+                                       (args.wide + 1) / after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the memory held by the result of a large faultInst query, decoded
+into managed objects and into read-only records.
+
+Usage:
+    python -m tests.benchmarks.bench_records
+    python -m tests.benchmarks.bench_records --faults 200000
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+
+from ucsmsdk import ucsxmlcodec as xc
+
+_FAULT = (
+    '<faultInst dn="sys/chassis-1/blade-%(index)d/fault-F%(index)d" '
+    'ack="no" cause="equipment-inoperable" changeSet="" code="F0%(index)d" '
+    'created="2017-01-01T00:00:00.000" descr="Blade %(index)d is '
+    'inoperable" highestSeverity="major" id="%(index)d" '
+    'lastTransition="2017-01-01T00:00:00.000" lc="" occur="1" '
+    'origSeverity="major" prevSeverity="major" rule="equipment-inoperable" '
+    'severity="major" tags="server" type="equipment"/>')
+
+
+def build_response(faults):
+    mos = [_FAULT % {"index": index} for index in range(faults)]
+    return ('<configResolveClass cookie="" response="yes" '
+            'classId="faultInst"><outConfigs>%s</outConfigs>'
+            '</configResolveClass>' % "".join(mos)).encode()
+
+
+def _measure(decode, response):
+    gc.collect()
+    tracemalloc.start()
+    start = time.time()
+    result = list(decode(response))
+    elapsed = time.time() - start
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return len(result), held, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--faults", type=int, default=20000,
+                        help="number of faults in the response")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    response = build_response(args.faults)
+    # the record class and the mo class are loaded before measuring
+    list(xc.iter_records_from_xml(build_response(1)))
+    list(xc.iter_mos_from_xml(build_response(1)))
+
+    for name, decode in (("managed objects", xc.iter_mos_from_xml),
+                         ("records", xc.iter_records_from_xml)):
+        count, held, elapsed = _measure(decode, response)
+        print("%-16s %8d objects %10.1f MB %8d bytes/object %10.1f "
+              "objects/s" % (name, count, held / 1e6, held / count,
+                             count / elapsed))
+
+
+if __name__ == "__main__":
+    main()
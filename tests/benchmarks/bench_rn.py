@@ -0,0 +1,151 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures how fast rns are built and parsed, and how fast the class of a dn
+is found, with the compiled rn templates.
+
+Usage:
+    python -m tests.benchmarks.bench_rn
+    python -m tests.benchmarks.bench_rn --count 50000
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import re
+import time
+
+from ucsmsdk import ucscoreutils
+from ucsmsdk import ucsrntemplate
+
+_DNS = ["org-root/ls-sp1/ether-eth0", "sys/chassis-1/blade-2/adaptor-1",
+        "fabric/lan/net-vlan100", "org-root/org-finance/ls-web/fc-vhba0",
+        "sys/rack-unit-1/board/memarray-1/mem-4"]
+
+_PATTERN = "fault-[code]-[name]-[type]-xyz-[state]"
+_VALUES = {"code": "F35275", "name": "fault", "type": "c2", "state": "on"}
+
+
+def _format_sub(pattern, values):
+    # what make_rn used to run for every object
+    for prop in re.findall(r"""\[([^\]]*)\]""", pattern):
+        pattern = re.sub(r"""\[%s\]""" % prop, '%s' % values[prop], pattern)
+    return pattern
+
+
+def _parse_compile(rn_str, rn_pattern):
+    # what get_naming_props used to run for every rn
+    rn_regex = re.sub(r"\[(.+?)\]", r"(?P<\1>.+)", rn_pattern)
+    return re.match(re.compile(rn_regex), rn_str).groupdict()
+
+
+def _class_id_for_rn_scan(rn, prev_class_id=None):
+    # what converttopython used to run for every rn, loading the class of
+    # every child of the parent
+    mo_meta = ucscoreutils.get_mo_property_meta(
+        ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+            prev_class_id or "TopRoot"), "mo_meta")
+    for child_class_id in mo_meta.children:
+        child_mo_meta = ucscoreutils.get_mo_property_meta(
+            ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+                child_class_id), "mo_meta")
+        if not re.search(r"(\[[^\]]+\])", child_mo_meta.rn):
+            if child_mo_meta.rn == rn:
+                return child_mo_meta.name
+            continue
+        if re.search(r"(([^\]]\[)|(\][^\[]))", child_mo_meta.rn):
+            pattern = "^" + re.sub(r"\[([^\]]+)\]", r"(?P<\1>.*?)",
+                                   child_mo_meta.rn) + "$"
+            if re.match(pattern, rn):
+                return child_mo_meta.name
+    for child_class_id in mo_meta.children:
+        child_mo_meta = ucscoreutils.get_mo_property_meta(child_class_id,
+                                                          "mo_meta")
+        if re.match(r"^(\[[^\]]+\])+$", child_mo_meta.rn):
+            return child_mo_meta.name
+    return None
+
+
+def _class_id_for_dn_scan(dn):
+    class_id = None
+    for rn in dn.split('/'):
+        class_id = _class_id_for_rn_scan(rn, class_id)
+        if class_id is None:
+            break
+    return class_id
+
+
+def _best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=20000,
+                        help="rns built and parsed per measure")
+    parser.add_argument("--dns", type=int, default=500,
+                        help="dns resolved per measure")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measure, the best one is reported")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    template = ucsrntemplate.rn_template(_PATTERN)
+    rn = template.format(_VALUES)
+    dns = (_DNS * (args.dns // len(_DNS) + 1))[:args.dns]
+    assert [_class_id_for_dn_scan(dn) for dn in _DNS] == \
+        [ucsrntemplate.get_class_id_for_dn(dn) for dn in _DNS]
+
+    def build(func):
+        for _ in range(args.count):
+            func(_PATTERN, _VALUES)
+
+    def parse(func):
+        for _ in range(args.count):
+            func(rn, _PATTERN)
+
+    def resolve(func):
+        for dn in dns:
+            func(dn)
+
+    for name, elapsed, count in (
+            ("build rn (re.sub)",
+             _best_of(args.repeat, build, _format_sub), args.count),
+            ("build rn (template)",
+             _best_of(args.repeat, build,
+                      lambda pattern, values: ucsrntemplate.rn_template(
+                          pattern).format(values)), args.count),
+            ("parse rn (compile)",
+             _best_of(args.repeat, parse, _parse_compile), args.count),
+            ("parse rn (template)",
+             _best_of(args.repeat, parse, ucscoreutils.get_naming_props),
+             args.count),
+            ("dn -> class (scan)",
+             _best_of(args.repeat, resolve, _class_id_for_dn_scan),
+             args.dns),
+            ("dn -> class (index)",
+             _best_of(args.repeat, resolve,
+                      ucsrntemplate.get_class_id_for_dn), args.dns)):
+        print("%-24s %12.1f /s" % (name, count / elapsed))
+
+
+if __name__ == "__main__":
+    main()
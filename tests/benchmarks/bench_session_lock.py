@@ -0,0 +1,99 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures query throughput as the number of handles (or of reader threads
+sharing one handle in concurrent reads mode) grows.
+
+Usage:
+    python -m tests.benchmarks.bench_session_lock
+    python -m tests.benchmarks.bench_session_lock --latency 0.05 --queries 10
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import threading
+import time
+
+from ..connection.mock_ucsm import MockUcsm
+
+
+def _throughput(workers, queries):
+    threads = [threading.Thread(target=worker) for worker in workers]
+    start = time.time()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.time() - start
+    return len(workers) * queries / elapsed
+
+
+def bench_handles(ucsm, count, queries):
+    handles = [ucsm.handle() for _ in range(count)]
+    for handle in handles:
+        handle.login()
+
+    def worker(handle):
+        for _ in range(queries):
+            handle.query_dn("sys")
+
+    rate = _throughput([lambda h=handle: worker(h) for handle in handles],
+                       queries)
+    for handle in handles:
+        handle.logout()
+    return rate
+
+
+def bench_concurrent_reads(ucsm, count, queries):
+    handle = ucsm.handle()
+    handle.login()
+    handle.set_mode_concurrent_reads()
+
+    def worker():
+        for _ in range(queries):
+            handle.query_dn("sys")
+
+    rate = _throughput([worker] * count, queries)
+    handle.logout()
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="emulated server time per request in seconds")
+    parser.add_argument("--queries", type=int, default=20,
+                        help="queries issued by every thread")
+    parser.add_argument("--counts", default="1,2,4,8,16,32",
+                        help="comma separated handle/thread counts")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    ucsm = MockUcsm(latency=args.latency).start()
+
+    print("%8s %22s %26s" % ("count", "handles (queries/s)",
+                             "reader threads (queries/s)"))
+    for count in [int(each) for each in args.counts.split(",")]:
+        print("%8d %22.1f %26.1f" % (
+            count,
+            bench_handles(ucsm, count, args.queries),
+            bench_concurrent_reads(ucsm, count, args.queries)))
+
+    ucsm.stop()
+
+
+if __name__ == "__main__":
+    main()
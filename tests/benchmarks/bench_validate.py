@@ -0,0 +1,104 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures property validation while building config in bulk: VLANs,
+service profiles with vNICs, and raw validate_property_value calls.
+
+Usage:
+    python -m tests.benchmarks.bench_validate
+    python -m tests.benchmarks.bench_validate --count 4000 --repeat 5
+"""
+
+from __future__ import print_function
+
+import argparse
+import logging
+import time
+
+from ucsmsdk.mometa.fabric.FabricVlan import FabricVlan
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ucsmsdk.mometa.vnic.VnicEther import VnicEther
+
+# (class, property, value) covering patterns, ranges and value sets
+_VALIDATIONS = [
+    (FabricVlan, "name", "vlan-100"),
+    (FabricVlan, "id", "100"),
+    (FabricVlan, "sharing", "none"),
+    (FabricVlan, "mcast_policy_name", "mcast"),
+    (VnicEther, "addr", "00:25:B5:00:00:01"),
+    (VnicEther, "mtu", "9000"),
+    (VnicEther, "order", "3"),
+    (VnicEther, "switch_id", "A-B"),
+    (LsServer, "usr_lbl", "web tier"),
+    (LsServer, "descr", "created by the benchmark"),
+    (LsServer, "type", "instance"),
+]
+
+
+def build_vlans(count):
+    for index in range(count):
+        FabricVlan("fabric/lan", "vlan-%d" % index, id=str(1 + index % 4000),
+                   sharing="none", mcast_policy_name="mcast")
+
+
+def build_service_profiles(count):
+    for index in range(count):
+        sp = LsServer("org-root", "sp-%d" % index, usr_lbl="web tier",
+                      descr="created by the benchmark")
+        for vnic in ("eth0", "eth1"):
+            VnicEther(sp, vnic, addr="00:25:B5:00:00:%02X" % (index % 256),
+                      mtu="9000", switch_id="A-B", order="1")
+
+
+def validate(count):
+    validations = [(mo_class.prop_meta[prop], value)
+                   for mo_class, prop, value in _VALIDATIONS]
+    for _ in range(count):
+        for prop_meta, value in validations:
+            prop_meta.validate_property_value(value)
+
+
+def _best_of(repeat, func, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.time()
+        func(*args)
+        elapsed = time.time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--count", type=int, default=2000,
+                        help="objects built, or validation rounds")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per measure, the best one is reported")
+    args = parser.parse_args()
+
+    logging.getLogger('ucs').setLevel(logging.WARNING)
+    count = args.count
+
+    elapsed = _best_of(args.repeat, build_vlans, count)
+    print("%-34s %12.1f objects/s" % ("FabricVlan", count / elapsed))
+    elapsed = _best_of(args.repeat, build_service_profiles, count)
+    print("%-34s %12.1f objects/s" % ("LsServer with 2 VnicEther",
+                                      3 * count / elapsed))
+    elapsed = _best_of(args.repeat, validate, count)
+    print("%-34s %12.1f calls/s" % ("validate_property_value",
+                                    len(_VALIDATIONS) * count / elapsed))
+
+
+if __name__ == "__main__":
+    main()
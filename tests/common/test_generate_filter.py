@@ -101,3 +101,39 @@ def test_003_mixed_filter():
 
     assert_equal(xml_str, expected)
 
+
+def test_004_cached_filter_is_a_new_object():
+    filter_str = '(usr_lbl, "web", type="eq", flag="I")'
+    first = generate_infilter(class_id="LsServer", filter_str=filter_str,
+                              is_meta_class_id=True)
+    second = generate_infilter(class_id="LsServer", filter_str=filter_str,
+                               is_meta_class_id=True)
+    assert_true(first is not second)
+    assert_true(first.child[0] is not second.child[0])
+    assert_equal(to_xml_str(first.to_xml()), to_xml_str(second.to_xml()))
+    assert_equal(to_xml_str(second.to_xml()),
+                 b'<filter><eq class="lsServer" property="usrLbl" '
+                 b'value="[Ww][Ee][Bb]" /></filter>')
+
+
+def test_005_cache_key_includes_class_id():
+    filter_str = '(descr, "test", type="eq")'
+    ls_filter = generate_infilter(class_id="LsServer",
+                                  filter_str=filter_str,
+                                  is_meta_class_id=True)
+    org_filter = generate_infilter(class_id="OrgOrg",
+                                   filter_str=filter_str,
+                                   is_meta_class_id=True)
+    assert_equal(ls_filter.child[0].class_, "lsServer")
+    assert_equal(org_filter.child[0].class_, "orgOrg")
+
+
+def test_006_cache_size():
+    from ucsmsdk import ucsfilter
+
+    ucsfilter.clear_filter_cache()
+    for i in range(ucsfilter.FILTER_CACHE_SIZE + 10):
+        generate_infilter(class_id="LsServer",
+                          filter_str='(name, "sp-%d", type="eq")' % i,
+                          is_meta_class_id=True)
+    assert_equal(len(ucsfilter._filter_cache), ucsfilter.FILTER_CACHE_SIZE)
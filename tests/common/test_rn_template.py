@@ -0,0 +1,63 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nose.tools import assert_equal, assert_true, assert_raises
+from ucsmsdk.ucsexception import UcsValidationException
+from ucsmsdk.ucsrntemplate import rn_template, class_rn_template, \
+    get_class_id_for_rn, get_class_id_for_dn
+from ucsmsdk.mometa.ls.LsServer import LsServer
+
+
+def test_001_format_and_parse():
+    template = rn_template("fault-[code]-[name]-[type]-xyz-[state]")
+    assert_true(rn_template("fault-[code]-[name]-[type]-xyz-[state]")
+                is template)
+    values = {"code": "F35275", "name": "fault", "type": "c2",
+              "state": "on"}
+    assert_equal(template.format(values), "fault-F35275-fault-c2-xyz-on")
+    assert_equal(template.parse("fault-F35275-fault-c2-xyz-on"), values)
+    assert_equal(template.parse("event-1"), None)
+    assert_equal(rn_template("fsm").parse("fsm"), {})
+    # literal parts are not regular expressions
+    assert_equal(rn_template("file-[name]|[switch_id]").parse("file-a|B"),
+                 {"name": "a", "switch_id": "B"})
+
+
+def test_002_class_rn_template():
+    template = class_rn_template("lsserver")
+    assert_equal(template.pattern, "ls-[name]")
+    assert_equal(template.format({"name": "sp1"}), "ls-sp1")
+    assert_equal(class_rn_template("NoSuchClass"), None)
+    assert_equal(LsServer(parent_mo_or_dn="org-root", name="sp1").rn,
+                 "ls-sp1")
+
+
+def test_003_class_id_for_dn():
+    assert_equal(get_class_id_for_dn("org-root/ls-sp1"), "LsServer")
+    assert_equal(get_class_id_for_dn("org-root/ls-sp1/ether-eth0"),
+                 "VnicEther")
+    assert_equal(get_class_id_for_dn("sys/chassis-1/blade-2"),
+                 "ComputeBlade")
+    assert_equal(get_class_id_for_dn("fabric/lan/net-vlan100"),
+                 "FabricVlan")
+    # a "|" in the rn of a sibling is not a regular expression alternation
+    assert_equal(get_class_id_for_dn("sys/corefiles/mutation"),
+                 "SysfileMutation")
+    assert_equal(get_class_id_for_dn("no-such-rn/ls-sp1"), None)
+
+
+def test_004_class_id_for_rn():
+    assert_equal(get_class_id_for_rn("org-root"), "OrgOrg")
+    assert_equal(get_class_id_for_rn("ls-sp1", "orgorg"), "LsServer")
+    assert_raises(UcsValidationException, get_class_id_for_rn, "ls-sp1",
+                  "NoSuchClass")
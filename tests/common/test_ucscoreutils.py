@@ -48,4 +48,90 @@ def test_003_get_naming_props():
     #assert_equal(np['card_param_type'], '22')
 
 
+def test_004_load_mo_class_info():
+    from ucsmsdk.mometa.ls.LsServer import LsServer
+    info = cutil.load_mo_class_info("LsServer")
+    assert_equal(info, (LsServer, ("name",), False))
+    assert_true(cutil.load_mo_class_info("LsServer") is info)
 
+
+def test_005_load_mo_class_info_top_root():
+    mo_class, naming_props, top_root = \
+        cutil.load_mo_class_info("TopSystem")
+    assert_equal(naming_props, ())
+    assert_true(top_root)
+
+
+def test_006_load_mo_class_info_unknown():
+    assert_equal(cutil.load_mo_class_info("UnknownClass"), None)
+
+
+_HIERARCHY = (
+    '<configResolveDns cookie="" response="yes">'
+    '<outConfigs><orgOrg dn="org-root" name="root">'
+    '<lsServer rn="ls-sp1" name="sp1"><vnicEther rn="ether-eth0" '
+    'name="eth0"/><vnicEther rn="ether-eth1" name="eth1"/></lsServer>'
+    '<lsServer rn="ls-sp2" name="sp2"/>'
+    '</orgOrg></outConfigs></configResolveDns>')
+
+
+def _hierarchy_response():
+    from ucsmsdk import ucsxmlcodec as xc
+    return xc.from_xml_str(_HIERARCHY)
+
+
+_HIERARCHY_DNS = ["org-root", "org-root/ls-sp1", "org-root/ls-sp2",
+                  "org-root/ls-sp1/ether-eth0", "org-root/ls-sp1/ether-eth1"]
+
+
+def test_007_extract_molist_hierarchical():
+    mo_list = cutil.extract_molist_from_method_response(
+        _hierarchy_response(), in_hierarchical=True)
+    assert_equal([mo.dn for mo in mo_list], _HIERARCHY_DNS)
+    assert_true(all(mo.child_count() == 0 for mo in mo_list))
+    assert_true(not any(mo.is_dirty() for mo in mo_list))
+
+
+def test_008_extract_molist_keep_tree():
+    response = _hierarchy_response()
+    mo_list = list(cutil.extract_molist_from_method_response(
+        response, in_hierarchical=True, keep_tree=True))
+    assert_equal([mo.dn for mo in mo_list], _HIERARCHY_DNS)
+    assert_equal(response.out_configs.child[0].child_count(), 2)
+    assert_equal(mo_list[1].child_count(), 2)
+
+
+def test_009_mo_class_meta_index():
+    from ucsmsdk.ucsmeta import MO_CLASS_META, MO_CLASS_ID, VersionMeta
+
+    meta = MO_CLASS_META["LsServer"]
+    assert_true(MO_CLASS_META["LsServer"] is meta)
+    assert_equal((meta.name, meta.xml_attribute, meta.rn),
+                 ("LsServer", "lsServer", "ls-[name]"))
+    assert_true(meta.version is VersionMeta.Version101e)
+    assert_true("orgOrg" in meta.parents)
+    assert_true("LsServer" in MO_CLASS_META)
+    assert_true("NoSuchClass" not in MO_CLASS_META)
+    assert_raises(KeyError, MO_CLASS_META.__getitem__, "NoSuchClass")
+    assert_equal(set(MO_CLASS_META), MO_CLASS_ID)
+
+
+def test_010_find_class_id_ignore_case():
+    assert_equal(cutil.find_class_id_in_mo_meta_ignore_case("lsserver"),
+                 "LsServer")
+    assert_equal(cutil.find_class_id_in_mo_meta_ignore_case("LSSERVER"),
+                 "LsServer")
+    assert_equal(cutil.find_class_id_in_mo_meta_ignore_case("lsserve"), None)
+    assert_equal(
+        cutil.find_class_id_in_method_meta_ignore_case("configresolvedn"),
+        "ConfigResolveDn")
+
+
+def test_011_search_class_ids():
+    class_ids = cutil._search_class_ids("VnicEtherIf")
+    assert_true("VnicEtherIf" in class_ids)
+    assert_true(all("vnicetherif" in cid.lower() for cid in class_ids))
+    assert_equal(cutil._search_class_ids("qj"), [])
+    assert_equal(cutil._search_class_ids("qzqzq"), [])
+    # regular expressions are still searched for
+    assert_equal(cutil._search_class_ids("^lsserver$"), ["LsServer"])
@@ -31,3 +31,36 @@ def test_002_create_specific_obj():
     assert_equal(obj.name, "temp_sp")
     assert_equal(obj.rn, "ls-temp_sp")
     assert_equal(obj.dn, "org-root/ls-temp_sp")
+
+
+def test_003_set_prop_marks_dirty():
+    from ucsmsdk.mometa.ls.LsServer import LsServer
+    obj = LsServer("org-root", "temp_sp")
+    obj.mark_clean()
+    obj.usr_lbl = "label"
+    assert_equal(obj.usr_lbl, "label")
+    assert_equal(obj._dirty_mask, LsServer.prop_meta["usr_lbl"].mask)
+
+
+@raises(ValueError)
+def test_004_set_invalid_value():
+    from ucsmsdk.mometa.ls.LsServer import LsServer
+    obj = LsServer("org-root", "temp_sp")
+    obj.type = "invalid"
+
+
+@raises(ValueError)
+def test_005_set_read_only_prop():
+    from ucsmsdk.mometa.ls.LsServer import LsServer
+    obj = LsServer("org-root", "temp_sp")
+    obj.oper_state = "ok"
+
+
+def test_006_set_unknown_prop():
+    from ucsmsdk.mometa.ls.LsServer import LsServer
+    obj = LsServer("org-root", "temp_sp")
+    obj.mark_clean()
+    obj.unknown_prop = "value"
+    assert_equal(obj.unknown_prop, "value")
+    assert_true(obj.is_dirty())
+    assert_equal(obj.to_xml().attrib["unknown_prop"], "value")
@@ -0,0 +1,60 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nose.tools import assert_equal
+from ucsmsdk.mometa.fabric.FabricVlan import FabricVlan
+from ucsmsdk.mometa.vnic.VnicEther import VnicEther
+
+
+def _validate(mo_class, prop, values):
+    prop_meta = mo_class.prop_meta[prop]
+    return [prop_meta.validate_property_value(value) for value in values]
+
+
+def test_001_range():
+    assert_equal(_validate(FabricVlan, "id", ["1", "4029", "4030", "4048"]),
+                 [True, True, False, True])
+
+
+def test_002_range_and_value_set():
+    assert_equal(_validate(VnicEther, "order", ["0", "257", "unspecified"]),
+                 [True, False, True])
+
+
+def test_003_pattern():
+    assert_equal(_validate(FabricVlan, "name", ["vlan-100", "vlan 100",
+                                                "v" * 33]),
+                 [True, False, False])
+
+
+def test_004_pattern_and_value_set():
+    assert_equal(_validate(VnicEther, "addr", ["00:25:B5:00:00:01",
+                                               "derived", "zz"]),
+                 [True, True, False])
+
+
+def test_005_value_set():
+    assert_equal(_validate(VnicEther, "switch_id", ["A-B", "C"]),
+                 [True, False])
+
+
+def test_006_length():
+    assert_equal(_validate(FabricVlan, "pub_nw_name", ["", "n" * 510,
+                                                       "n" * 511]),
+                 [True, True, False])
+
+
+def test_007_repeated_validation():
+    values = ["1", "5000", "4093"] * 3
+    assert_equal(_validate(FabricVlan, "id", values),
+                 [True, False, True] * 3)
@@ -0,0 +1,174 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nose.tools import assert_equal, assert_raises
+import ucsmsdk.ucsmo as ucsmo
+import ucsmsdk.ucsxmlcodec as xc
+from ucsmsdk.ucsbasetype import ConfigMap, Pair
+from ucsmsdk.ucscoremeta import WriteXmlOption
+from ucsmsdk.ucsmethodfactory import config_conf_mos
+from ucsmsdk.mometa.fabric.FabricVlan import FabricVlan
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ucsmsdk.mometa.vnic.VnicEther import VnicEther
+from ..connection.mock_ucsm import MockUcsm
+
+
+def _conf_mos_elem_bytes(mo_dict):
+    config_map = ConfigMap()
+    for dn, mo in mo_dict.items():
+        pair = Pair()
+        pair.key = dn
+        pair.child_add(mo)
+        config_map.child_add(pair)
+    return xc.to_xml_str(config_conf_mos("cookie", config_map, False))
+
+
+def _write_xml(mo, option=None):
+    pieces = []
+    mo.write_xml(pieces.append, option)
+    return "".join(pieces).encode("ascii", "xmlcharrefreplace")
+
+
+def _assert_same_bytes(mo_dict):
+    expected = _conf_mos_elem_bytes(mo_dict)
+    assert_equal(xc.conf_mos_to_xml_bytes("cookie", mo_dict), expected)
+
+
+def test_001_write_xml_matches_to_xml():
+    # values the server sends are not validated, unlike the values set
+    xml_str = ('<lsServer dn="org-root/ls-sp1" name="sp1" '
+               'descr="a &amp; b &lt; c &gt; &quot;d&quot;&#10;&#9;line&#13;"'
+               ' usrLbl="sp&#233; &#9731;"><vnicEther rn="ether-eth0" '
+               'name="eth0" mtu="9000"><vnicEtherIf rn="if-default" '
+               'name="default"/></vnicEther></lsServer>')
+    sp = xc.from_xml_str(xml_str)
+    sp.unknownProp = "x < y"
+    sp.child[0].mtu = "1500"
+    for option in (None, WriteXmlOption.DIRTY, WriteXmlOption.ALL):
+        assert_equal(_write_xml(sp, option),
+                     xc.to_xml_str(sp.to_xml(option=option)))
+
+
+def test_002_conf_mos_bytes():
+    mo_dict = {}
+    for index in range(20):
+        vlan = FabricVlan(parent_mo_or_dn="fabric/lan",
+                          name="vlan%d" % index, id=str(index + 1),
+                          sharing="none")
+        mo_dict[vlan.dn] = vlan
+    sp = LsServer(parent_mo_or_dn="org-root", name="sp1", usr_lbl="lbl")
+    sp.newProp = "sp\u00e9 \u2603"
+    VnicEther(parent_mo_or_dn=sp, name="eth0")
+    mo_dict[sp.dn] = sp
+    _assert_same_bytes(mo_dict)
+
+
+def test_003_dirty_only():
+    xml_str = ('<lsServer agentPolicyName="" name="ra11" type="instance" '
+               'usrLbl="b" dn="org-root/ls-ra11" unknownProps="unknown">'
+               '<vnicEther rn="ether-eth0" name="eth0" mtu="1500"/>'
+               '</lsServer>')
+    sp = xc.from_xml_str(xml_str)
+    # nothing is dirty
+    assert_equal(_write_xml(sp, WriteXmlOption.DIRTY), b"")
+    _assert_same_bytes({sp.dn: sp})
+
+    sp.unknownProps = "known"
+    sp.descr = "modified"
+    _assert_same_bytes({sp.dn: sp})
+    sp.child[0].mtu = "9000"
+    _assert_same_bytes({sp.dn: sp})
+
+
+def test_004_empty():
+    _assert_same_bytes({})
+
+
+def test_005_non_string_value():
+    vlan = FabricVlan(parent_mo_or_dn="fabric/lan", name="vlan1", id="1")
+    vlan.__dict__["sharing"] = 1
+    assert_raises(TypeError, _write_xml, vlan)
+
+
+def test_006_commit_direct_xml():
+    ucsm = MockUcsm().start()
+    handle = ucsm.handle()
+    handle.login()
+    try:
+        handle.set_mode_direct_xml()
+        for index in range(5):
+            handle.add_mo(FabricVlan(parent_mo_or_dn="fabric/lan",
+                                     name="vlan%d" % index,
+                                     id=str(100 + index)))
+        handle.commit()
+        vlans = handle.query_classid("FabricVlan")
+        assert_equal(sorted(vlan.id for vlan in vlans),
+                     ["100", "101", "102", "103", "104"])
+        assert_equal(handle.is_direct_xml_enabled(), True)
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+def test_007_conf_mos_pairs():
+    mo_dict = {}
+    for index in range(3):
+        vlan = FabricVlan(parent_mo_or_dn="fabric/lan",
+                          name="vlan%d" % index, id=str(index + 1))
+        mo_dict[vlan.dn] = vlan
+    pairs = [xc.conf_mos_pair_to_xml_bytes(dn, mo)
+             for dn, mo in mo_dict.items()]
+    assert_equal(xc.conf_mos_pairs_to_xml_bytes("cookie", pairs),
+                 xc.conf_mos_to_xml_bytes("cookie", mo_dict))
+    assert_equal(xc.conf_mos_pairs_to_xml_bytes("cookie", []),
+                 xc.conf_mos_to_xml_bytes("cookie", {}))
+
+
+def test_008_text_values():
+    vlan = FabricVlan(parent_mo_or_dn=u"fabric/lan", name=u"v10", id=u"10")
+    _assert_same_bytes({vlan.dn: vlan})
+
+
+def test_009_sorted_attributes():
+    # the order of ElementTree before python 3.8
+    sort_attrib = ucsmo._SORT_ATTRIB
+    ucsmo._SORT_ATTRIB = True
+    try:
+        pieces = []
+        ucsmo.write_xml_elem(pieces.append, "fabricVlan",
+                             {"dn": "fabric/lan/net-v10", "name": "v10",
+                              "id": "10"})
+    finally:
+        ucsmo._SORT_ATTRIB = sort_attrib
+    assert_equal("".join(pieces),
+                 '<fabricVlan dn="fabric/lan/net-v10" id="10" name="v10" />')
+
+
+def test_010_tab_and_carriage_return():
+    # values the server sends are not validated, unlike the values set
+    sp = xc.from_xml_str('<lsServer dn="org-root/ls-sp1" name="sp1" '
+                         'descr="a&#9;b&#13;c"/>')
+    sp.newProp = "d\te\rf"
+    for option in (None, WriteXmlOption.ALL):
+        assert_equal(_write_xml(sp, option),
+                     xc.to_xml_str(sp.to_xml(option=option)))
+    _assert_same_bytes({sp.dn: sp})
+
+    # ElementTree writes them raw before python 3.9
+    escape_cr_tab = ucsmo._ESCAPE_CR_TAB
+    ucsmo._ESCAPE_CR_TAB = False
+    try:
+        raw = ucsmo._escape_attrib("a\tb\rc\nd")
+    finally:
+        ucsmo._ESCAPE_CR_TAB = escape_cr_tab
+    assert_equal(raw, "a\tb\rc&#10;d")
@@ -0,0 +1,461 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A minimal in-process UCSM emulator serving the /nuova xml api over http.
+It is used by the tests and benchmarks that should not depend on a live UCS.
+"""
+
+import operator
+import os
+import re
+import ssl
+import threading
+import time
+
+try:
+    from Queue import Queue
+except ImportError:
+    from queue import Queue
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+
+try:
+    import xml.etree.cElementTree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+
+_CERT_FILE = os.path.join(os.path.dirname(__file__), "mock_ucsm.pem")
+
+_COMPARE = {"eq": operator.eq, "ne": operator.ne, "gt": operator.gt,
+            "ge": operator.ge, "lt": operator.lt, "le": operator.le}
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    ssl_context = None
+
+    def get_request(self):
+        sock, addr = HTTPServer.get_request(self)
+        if self.ssl_context is not None:
+            sock = self.ssl_context.wrap_socket(sock, server_side=True)
+        return sock, addr
+
+
+class _NuovaRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body are written separately, with Nagle every response
+    # would wait for the delayed ack of its headers
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        ucsm = self.server.ucsm
+        ucsm.count_connection()
+        # closes the connections that stay idle for too long
+        self.timeout = ucsm.keep_alive_timeout
+        BaseHTTPRequestHandler.setup(self)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = self.rfile.read(length)
+        if self.server.ucsm.http_error:
+            self.send_error(self.server.ucsm.http_error)
+            return
+
+        if self.server.ucsm.redirect_location:
+            self.send_response(302)
+            self.send_header('Location', self.server.ucsm.redirect_location)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        if body.startswith(b"<eventSubscribe"):
+            self.server.ucsm.serve_events(self)
+            return
+
+        resp = self.server.ucsm.dispatch(body)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/xml')
+        self.send_header('Content-Length', str(len(resp)))
+        self.end_headers()
+        self.wfile.write(resp)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockUcsm(object):
+    """
+    Emulates the subset of UCSM xml api used by the sdk.
+
+    Args:
+        latency (float): seconds every request spends on the "server"
+        keep_alive_timeout (float): seconds after which an idle connection
+            is closed by the server, None to keep it open
+        secure (bool): if True, serves https with a self-signed certificate
+
+    Example:
+        ucsm = MockUcsm(latency=0.01).start()\n
+        handle = ucsm.handle()\n
+        handle.login()\n
+        ucsm.stop()\n
+    """
+
+    def __init__(self, latency=0.0, keep_alive_timeout=None, secure=False):
+        self.latency = latency
+        self.keep_alive_timeout = keep_alive_timeout
+        self.secure = secure
+        self.redirect_location = None
+        self.http_error = None
+        # most objects sent in a page, whatever the inSize of the request
+        self.page_cap = None
+        self.connection_count = 0
+        self.mos = {}
+        self.children = {}
+        self.request_count = 0
+        # body of every request served
+        self.requests = []
+        # dn -> error description of the configConfMos requests changing it
+        self.conf_errors = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # per method, the peak of requests in flight while one of its
+        # requests was being served
+        self.max_in_flight_with = {}
+        self.__in_flight_tags = []
+        self.__event_queues = []
+        self.__event_id = 0
+        self.__lock = threading.Lock()
+        self.__cookie_id = 0
+        self.__server = None
+        self.__thread = None
+
+        self.add_mo("topSystem", dn="sys", name="mock-ucsm",
+                    address="127.0.0.1")
+        self.add_mo("networkElement", dn="sys/switch-A", id="A",
+                    oobIfIp="127.0.0.1")
+
+    @property
+    def port(self):
+        return self.__server.server_address[1]
+
+    @property
+    def uri(self):
+        return "%s://127.0.0.1:%d" % (("http", "https")[self.secure],
+                                      self.port)
+
+    def count_connection(self):
+        with self.__lock:
+            self.connection_count += 1
+
+    def add_mo(self, tag, **attrib):
+        """Adds an object to the emulated management information tree."""
+        dn = attrib["dn"]
+        parent_dn = dn.rsplit("/", 1)[0] if "/" in dn else ""
+        if dn not in self.mos:
+            self.children.setdefault(parent_dn, []).append(dn)
+        self.mos[dn] = (tag, attrib)
+
+    def remove_mo(self, dn):
+        """Removes an object and its subtree from the tree."""
+        for child_dn in list(self.children.get(dn, [])):
+            self.remove_mo(child_dn)
+        self.children.pop(dn, None)
+        parent_dn = dn.rsplit("/", 1)[0] if "/" in dn else ""
+        if dn in self.children.get(parent_dn, []):
+            self.children[parent_dn].remove(dn)
+        self.mos.pop(dn, None)
+
+    def start(self):
+        self.__server = _ThreadingHTTPServer(("127.0.0.1", 0),
+                                             _NuovaRequestHandler)
+        self.__server.ucsm = self
+        if self.secure:
+            ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            ssl_context.load_cert_chain(_CERT_FILE)
+            self.__server.ssl_context = ssl_context
+        self.__thread = threading.Thread(target=self.__server.serve_forever)
+        self.__thread.daemon = True
+        self.__thread.start()
+        return self
+
+    def push_event(self, tag, status="modified", delivered=True, **attrib):
+        """
+        Applies a change to the tree and sends its configMoChangeEvent to
+        the event channels. An event not delivered still takes an event id,
+        like an event the channels missed.
+        """
+        if "deleted" in status:
+            self.remove_mo(attrib["dn"])
+        else:
+            merged = dict(self.mos.get(attrib["dn"], (tag, {}))[1])
+            merged.update(attrib)
+            self.add_mo(tag, **merged)
+
+        with self.__lock:
+            self.__event_id += 1
+            event = ET.Element("configMoChangeEvent",
+                               cookie="", inEid=str(self.__event_id))
+            mo_elem = ET.SubElement(ET.SubElement(event, "inConfig"), tag,
+                                    status=status)
+            for key, value in attrib.items():
+                mo_elem.set(key, value)
+            message = ET.tostring(event)
+            for queue in self.__event_queues if delivered else ():
+                queue.put(message)
+
+    def drop_event_channels(self):
+        """Closes the event channels, like a failover of the server."""
+        with self.__lock:
+            queues, self.__event_queues = self.__event_queues, []
+        for queue in queues:
+            queue.put(None)
+
+    @property
+    def event_channels(self):
+        with self.__lock:
+            return len(self.__event_queues)
+
+    def serve_events(self, handler):
+        """Streams the events to an eventSubscribe request, chunked."""
+        queue = Queue()
+        with self.__lock:
+            self.__event_queues.append(queue)
+        try:
+            handler.send_response(200)
+            handler.send_header('Content-Type', 'text/xml')
+            handler.send_header('Transfer-Encoding', 'chunked')
+            handler.end_headers()
+            handler.wfile.flush()
+            while True:
+                message = queue.get()
+                if message is None:
+                    break
+                data = ("%d\n" % len(message)).encode() + message
+                handler.wfile.write(("%x\r\n" % len(data)).encode() +
+                                    data + b"\r\n")
+                handler.wfile.flush()
+        except (IOError, OSError):
+            pass
+        finally:
+            with self.__lock:
+                if queue in self.__event_queues:
+                    self.__event_queues.remove(queue)
+            handler.close_connection = True
+
+    def stop(self):
+        with self.__lock:
+            for queue in self.__event_queues:
+                queue.put(None)
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def handle(self):
+        """Returns a UcsHandle pointing to this server."""
+        from ucsmsdk.ucshandle import UcsHandle
+        return UcsHandle("127.0.0.1", "admin", "password", port=self.port,
+                         secure=self.secure)
+
+    def dispatch(self, body):
+        req = ET.fromstring(body)
+        with self.__lock:
+            self.request_count += 1
+            self.requests.append(body)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.__in_flight_tags.append(req.tag)
+            for tag in self.__in_flight_tags:
+                self.max_in_flight_with[tag] = max(
+                    self.max_in_flight_with.get(tag, 0), self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            method = getattr(self, "_" + req.tag, self._unsupported)
+            resp = method(req)
+            return ET.tostring(resp)
+        finally:
+            with self.__lock:
+                self.in_flight -= 1
+                self.__in_flight_tags.remove(req.tag)
+
+    def _response(self, req, **attrib):
+        resp = ET.Element(req.tag)
+        resp.set("cookie", req.get("cookie", ""))
+        resp.set("response", "yes")
+        for key, value in attrib.items():
+            resp.set(key, value)
+        return resp
+
+    def _mo_elem(self, dn, hierarchical=False):
+        tag, attrib = self.mos[dn]
+        elem = ET.Element(tag)
+        for key, value in attrib.items():
+            elem.set(key, value)
+        if hierarchical:
+            for child_dn in self.children.get(dn, []):
+                elem.append(self._mo_elem(child_dn, True))
+        return elem
+
+    def _unsupported(self, req):
+        return self._response(req, errorCode="1",
+                              errorDescr="unsupported method %s" % req.tag,
+                              invocationResult="unidentified-fail")
+
+    def _new_cookie(self):
+        with self.__lock:
+            self.__cookie_id += 1
+            return "mock-cookie-%d" % self.__cookie_id
+
+    def _aaaLogin(self, req):
+        return self._response(req, outCookie=self._new_cookie(),
+                              outRefreshPeriod="600", outPriv="admin",
+                              outDomains="", outChannel="noencssl",
+                              outEvtChannel="noencssl", outSessionId="",
+                              outVersion="3.1(2b)", outName="admin")
+
+    def _aaaRefresh(self, req):
+        return self._response(req, outCookie=self._new_cookie(),
+                              outRefreshPeriod="600", outPriv="admin",
+                              outDomains="", outChannel="noencssl",
+                              outEvtChannel="noencssl")
+
+    def _aaaLogout(self, req):
+        return self._response(req, outStatus="success")
+
+    def _configResolveDn(self, req):
+        resp = self._response(req, dn=req.get("dn"))
+        out_config = ET.SubElement(resp, "outConfig")
+        if req.get("dn") in self.mos:
+            out_config.append(self._mo_elem(
+                req.get("dn"), req.get("inHierarchical") == "true"))
+        return resp
+
+    def _configResolveDns(self, req):
+        resp = self._response(req)
+        out_configs = ET.SubElement(resp, "outConfigs")
+        out_unresolved = ET.SubElement(resp, "outUnresolved")
+        hierarchical = req.get("inHierarchical") == "true"
+        for dn_elem in req.iter("dn"):
+            dn = dn_elem.get("value")
+            if dn in self.mos:
+                out_configs.append(self._mo_elem(dn, hierarchical))
+            else:
+                ET.SubElement(out_unresolved, "dn", value=dn)
+        return resp
+
+    def _matches(self, req, dn):
+        in_filter = req.find("inFilter")
+        if in_filter is None or not len(in_filter):
+            return True
+        return self._eval_filter(in_filter[0], self.mos[dn][1])
+
+    def _eval_filter(self, elem, attrib):
+        if elem.tag == "and":
+            return all(self._eval_filter(each, attrib) for each in elem)
+        if elem.tag == "or":
+            return any(self._eval_filter(each, attrib) for each in elem)
+        if elem.tag == "not":
+            return not self._eval_filter(elem[0], attrib)
+        value = attrib.get(elem.get("property"))
+        if value is None:
+            return False
+        if elem.tag == "wcard":
+            return re.search(elem.get("value"), value) is not None
+        return _COMPARE[elem.tag](value, elem.get("value"))
+
+    def _resolve_class(self, req, dns):
+        resp = self._response(req, classId=req.get("classId", ""))
+        out_configs = ET.SubElement(resp, "outConfigs")
+        hierarchical = req.get("inHierarchical") == "true"
+        dns = [dn for dn in dns
+               if (not req.get("classId") or
+                   self.mos[dn][0] == req.get("classId")) and
+               self._matches(req, dn)]
+        if req.get("inSize"):
+            in_size = int(req.get("inSize"))
+            if self.page_cap is not None:
+                in_size = min(in_size, self.page_cap)
+            dns = sorted(dns)[:in_size]
+        for dn in dns:
+            out_configs.append(self._mo_elem(dn, hierarchical))
+        return resp
+
+    def _configResolveClass(self, req):
+        return self._resolve_class(req, sorted(self.mos))
+
+    def _configResolveClassSorted(self, req):
+        return self._resolve_class(req, self.mos)
+
+    def _configResolveClasses(self, req):
+        resp = self._response(req)
+        out_configs = ET.SubElement(resp, "outConfigs")
+        hierarchical = req.get("inHierarchical") == "true"
+        class_ids = [id_elem.get("value") for id_elem in req.iter("classId")]
+        for dn in sorted(self.mos):
+            if self.mos[dn][0] in class_ids:
+                out_configs.append(self._mo_elem(dn, hierarchical))
+        return resp
+
+    def _configResolveChildren(self, req):
+        resp = self._resolve_class(req, self.children.get(req.get("inDn"),
+                                                          []))
+        resp.set("inDn", req.get("inDn"))
+        return resp
+
+    def _configResolveChildrenSorted(self, req):
+        return self._configResolveChildren(req)
+
+    def _configConfMos(self, req):
+        for pair in req.iter("pair"):
+            if pair.get("key") in self.conf_errors:
+                return self._response(
+                    req, errorCode="103",
+                    errorDescr=self.conf_errors[pair.get("key")])
+        resp = self._response(req)
+        out_configs = ET.SubElement(resp, "outConfigs")
+        for pair in req.iter("pair"):
+            for mo_elem in pair:
+                self._conf_mo(mo_elem, "")
+                out_pair = ET.SubElement(out_configs, "pair",
+                                         key=pair.get("key"))
+                if mo_elem.get("dn") in self.mos:
+                    out_pair.append(self._mo_elem(mo_elem.get("dn")))
+                else:
+                    out_pair.append(mo_elem)
+        return resp
+
+    def _conf_mo(self, mo_elem, parent_dn):
+        attrib = dict(mo_elem.attrib)
+        if "dn" not in attrib:
+            attrib["dn"] = parent_dn + "/" + attrib.get("rn", "")
+        dn = attrib["dn"]
+        status = attrib.pop("status", "")
+        if "deleted" in status:
+            self.remove_mo(dn)
+            return
+        if dn in self.mos:
+            merged = dict(self.mos[dn][1])
+            merged.update(attrib)
+            attrib = merged
+        self.add_mo(mo_elem.tag, **attrib)
+        for child in mo_elem:
+            self._conf_mo(child, dn)
@@ -0,0 +1,239 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+The AsyncUcsHandle tests, which use the async syntax of python 3.5, run by
+test_async_handle.
+"""
+
+import asyncio
+import time
+
+from nose.tools import assert_equal, assert_true
+from ucsmsdk.ucsasynchandle import AsyncUcsHandle
+from ucsmsdk.ucsexception import UcsException, UcsConnectionError
+from ucsmsdk.mometa.fabric.FabricVlan import FabricVlan
+from ..connection.mock_ucsm import MockUcsm
+
+
+def _handle(server):
+    return AsyncUcsHandle("127.0.0.1", "admin", "password",
+                          port=server.port, secure=False)
+
+
+def _run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def login_query_logout(ucsm):
+    async def run():
+        handle = _handle(ucsm)
+        await handle.login()
+        assert_true(handle.cookie.startswith("mock-cookie"))
+        assert_equal(handle.ucs, "mock-ucsm")
+        assert_equal(str(handle.version), "3.1(2b)")
+
+        top = await handle.query_dn("sys")
+        assert_equal(top.name, "mock-ucsm")
+        assert_true(top._handle is handle)
+        assert_equal(await handle.query_dn("sys/unknown"), None)
+
+        vlans = await handle.query_classid("FabricVlan")
+        assert_equal([vlan.name for vlan in vlans],
+                     ["vlan0", "vlan1", "vlan2"])
+        vlans = await handle.query_classid(
+            "FabricVlan", filter_str='(id, "101", type="eq")')
+        assert_equal([vlan.name for vlan in vlans], ["vlan1"])
+
+        children = await handle.query_children(in_dn="fabric/lan",
+                                               class_id="fabricVlan")
+        assert_equal(len(children), 3)
+
+        await handle.logout()
+        assert_equal(handle.cookie, None)
+    _run(run())
+
+
+def commit(ucsm):
+    async def run():
+        handle = _handle(ucsm)
+        await handle.login()
+        vlan = FabricVlan("fabric/lan", name="vlan200", id="200")
+        handle.add_mo(vlan)
+        await handle.commit()
+        assert_equal((await handle.query_dn("fabric/lan/net-vlan200")).id,
+                     "200")
+
+        vlan.id = "201"
+        handle.set_mo(vlan)
+        await handle.commit()
+        assert_equal((await handle.query_dn("fabric/lan/net-vlan200")).id,
+                     "201")
+
+        handle.remove_mo(vlan)
+        await handle.commit()
+        assert_equal(await handle.query_dn("fabric/lan/net-vlan200"), None)
+        await handle.logout()
+    _run(run())
+
+
+def concurrent_sessions():
+    server = MockUcsm(latency=0.05).start()
+
+    async def session():
+        handle = _handle(server)
+        await handle.login()
+        for _ in range(3):
+            await handle.query_dn("sys")
+        await handle.logout()
+
+    async def run():
+        await asyncio.gather(*[session() for _ in range(50)])
+
+    try:
+        start = time.time()
+        _run(run())
+        elapsed = time.time() - start
+        # login takes 3 requests, logout 1: 7 requests of 50ms per session
+        assert_true(elapsed < 50 * 7 * 0.05 / 4, elapsed)
+        assert_true(server.max_in_flight > 10)
+    finally:
+        server.stop()
+
+
+def connection_reused():
+    server = MockUcsm().start()
+
+    async def run():
+        handle = _handle(server)
+        await handle.login()
+        for _ in range(5):
+            await handle.query_dn("sys")
+        await handle.logout()
+
+    try:
+        _run(run())
+        assert_equal(server.connection_count, 1)
+    finally:
+        server.stop()
+
+
+def errors():
+    server = MockUcsm().start()
+
+    async def assert_raises_async(exc, coro):
+        try:
+            await coro
+        except exc:
+            return
+        raise AssertionError("%s not raised" % exc.__name__)
+
+    async def run():
+        handle = _handle(server)
+        await handle.login()
+
+        server.http_error = 500
+        try:
+            await assert_raises_async(UcsConnectionError,
+                                      handle.query_dn("sys"))
+        finally:
+            server.http_error = None
+        # the handle is still usable
+        assert_equal((await handle.query_dn("sys")).dn, "sys")
+
+        server._configResolveClass = server._unsupported
+        try:
+            await assert_raises_async(UcsException,
+                                      handle.query_classid("FabricVlan"))
+        finally:
+            del server._configResolveClass
+        await handle.logout()
+
+    try:
+        _run(run())
+    finally:
+        server.stop()
+
+
+def subscribe():
+    server = MockUcsm().start()
+
+    async def run():
+        handle = _handle(server)
+        await handle.login()
+        faults = handle.subscribe(class_id="FaultInst")
+        vlan = handle.subscribe(dn="fabric/lan/net-vlan9")
+        while server.event_channels == 0:
+            await asyncio.sleep(0.01)
+        assert_equal(server.event_channels, 1)
+
+        server.push_event("faultInst", status="created",
+                          dn="sys/fault-F0174", severity="major")
+        server.push_event("fabricVlan", status="created",
+                          dn="fabric/lan/net-vlan9", id="9")
+        server.push_event("faultInst", dn="sys/fault-F0174",
+                          severity="cleared")
+
+        mces = [await faults.get(timeout=5), await faults.get(timeout=5)]
+        assert_equal([mce.mo.dn for mce in mces], ["sys/fault-F0174"] * 2)
+        assert_equal([mce.mo.severity for mce in mces],
+                     ["major", "cleared"])
+        assert_equal([mce.event_id for mce in mces], ["1", "3"])
+
+        async for mce in vlan:
+            assert_equal((mce.mo.dn, mce.mo.id), ("fabric/lan/net-vlan9",
+                                                  "9"))
+            vlan.close()
+
+        faults.close()
+        assert_equal(await faults.get(), None)
+        await handle.logout()
+
+    try:
+        _run(run())
+    finally:
+        server.stop()
+
+
+def redirect_to_https():
+    server = MockUcsm().start()
+    secure_server = MockUcsm(secure=True).start()
+    server.redirect_location = "https://127.0.0.1:%d/nuova" % (
+        secure_server.port)
+
+    async def run():
+        handle = _handle(server)
+        await handle.login()
+        assert_equal(handle.uri,
+                     "https://127.0.0.1:%d" % secure_server.port)
+        assert_equal((await handle.query_dn("sys")).dn, "sys")
+        await handle.logout()
+
+        # without a port, the default port of the scheme
+        handle = _handle(server)
+        server.redirect_location = "https://127.0.0.1/nuova"
+        try:
+            await handle.login()
+        except Exception:
+            pass
+        assert_equal(handle.uri, "https://127.0.0.1:443")
+
+    try:
+        _run(run())
+    finally:
+        server.stop()
+        secure_server.stop()
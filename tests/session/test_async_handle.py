@@ -0,0 +1,65 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+from nose.plugins.skip import SkipTest
+
+if sys.version_info < (3, 5):
+    raise SkipTest("AsyncUcsHandle needs python 3.5")
+
+from . import async_handle_cases as cases  # noqa: E402
+from ..connection.mock_ucsm import MockUcsm  # noqa: E402
+
+ucsm = None
+
+
+def setup_module():
+    global ucsm
+    ucsm = MockUcsm().start()
+    ucsm.add_mo("fabricLanCloud", dn="fabric/lan", rn="lan")
+    for index in range(3):
+        ucsm.add_mo("fabricVlan", dn="fabric/lan/net-vlan%d" % index,
+                    name="vlan%d" % index, id=str(100 + index))
+
+
+def teardown_module():
+    ucsm.stop()
+
+
+def test_001_login_query_logout():
+    cases.login_query_logout(ucsm)
+
+
+def test_002_commit():
+    cases.commit(ucsm)
+
+
+def test_003_concurrent_sessions():
+    cases.concurrent_sessions()
+
+
+def test_004_connection_reused():
+    cases.connection_reused()
+
+
+def test_005_errors():
+    cases.errors()
+
+
+def test_006_subscribe():
+    cases.subscribe()
+
+
+def test_007_redirect_to_https():
+    cases.redirect_to_https()
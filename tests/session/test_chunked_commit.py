@@ -0,0 +1,204 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import xml.etree.ElementTree as ET
+
+from nose.tools import assert_equal, assert_true, assert_raises
+import ucsmsdk.ucsxmlcodec as xc
+from ucsmsdk.ucsexception import UcsException
+from ucsmsdk.mometa.fabric.FabricVlan import FabricVlan
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ucsmsdk.mometa.org.OrgOrg import OrgOrg
+from ucsmsdk.mometa.vnic.VnicEther import VnicEther
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+class _Progress(object):
+    def __init__(self):
+        self.updates = []
+
+    def update(self, total, size, name=None):
+        self.updates.append((total, size))
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def _reset():
+    ucsm.requests = []
+    ucsm.conf_errors = {}
+
+
+def _requests(tag):
+    requests = [ET.fromstring(body) for body in ucsm.requests]
+    return [req for req in requests if req.tag == tag]
+
+
+def _conf_mos_keys():
+    return [[pair.get("key") for pair in req.iter("pair")]
+            for req in _requests("configConfMos")]
+
+
+def _add_vlans(first, count):
+    vlans = []
+    for index in range(first, first + count):
+        vlan = FabricVlan(parent_mo_or_dn="fabric/lan",
+                          name="chunk%d" % index, id=str(index))
+        handle.add_mo(vlan)
+        vlans.append(vlan)
+    return vlans
+
+
+def test_001_chunk_size():
+    _reset()
+    vlans = _add_vlans(100, 25)
+    progress = _Progress()
+    handle.commit(chunk_size=10, progress=progress)
+
+    assert_equal([len(keys) for keys in _conf_mos_keys()], [10, 10, 5])
+    assert_equal(sum(_conf_mos_keys(), []), [vlan.dn for vlan in vlans])
+    assert_equal(progress.updates, [(25, 10), (25, 10), (25, 5)])
+    for vlan in vlans:
+        assert_true(vlan.dn in ucsm.mos)
+    assert_equal(handle._get_commit_buf(), {})
+
+
+def test_002_parents_first():
+    _reset()
+    sp = LsServer(parent_mo_or_dn="org-root/org-chunk", name="sp1")
+    handle.add_mo(sp)
+    handle.add_mo(OrgOrg(parent_mo_or_dn="org-root", name="chunk"))
+    handle.commit(chunk_size=1)
+
+    assert_equal(_conf_mos_keys(),
+                 [["org-root/org-chunk"], ["org-root/org-chunk/ls-sp1"]])
+
+
+def test_003_chunk_bytes():
+    _reset()
+    _add_vlans(200, 12)
+    handle.commit(chunk_bytes=400)
+
+    requests = _requests("configConfMos")
+    assert_true(len(requests) > 1)
+    for req in requests:
+        size = sum(len(ET.tostring(pair)) for pair in req.iter("pair"))
+        assert_true(size <= 400)
+    assert_equal(len(sum(_conf_mos_keys(), [])), 12)
+
+
+def test_004_children_counted():
+    _reset()
+    progress = _Progress()
+    for index in range(3):
+        sp = LsServer(parent_mo_or_dn="org-root", name="chunksp%d" % index)
+        VnicEther(parent_mo_or_dn=sp, name="eth0")
+        VnicEther(parent_mo_or_dn=sp, name="eth1")
+        handle.add_mo(sp)
+    handle.commit(chunk_size=6, progress=progress)
+
+    assert_equal([len(keys) for keys in _conf_mos_keys()], [2, 1])
+    assert_equal(progress.updates, [(9, 6), (9, 3)])
+    # the modified children of every chunk are read back
+    assert_equal(len(_requests("configResolveDns")), 2)
+    assert_true("org-root/ls-chunksp2/ether-eth1" in ucsm.mos)
+
+
+def test_005_no_refresh():
+    _reset()
+    sp = LsServer(parent_mo_or_dn="org-root", name="chunksp9", descr="new")
+    VnicEther(parent_mo_or_dn=sp, name="eth0")
+    handle.add_mo(sp)
+    handle.commit(refresh=False)
+
+    assert_equal(len(_requests("configConfMos")), 1)
+    assert_equal(_requests("configResolveDns"), [])
+    assert_equal(sp.descr, "new")
+
+
+def test_006_chunk_error():
+    _reset()
+    vlans = _add_vlans(300, 6)
+    ucsm.conf_errors[vlans[4].dn] = "invalid vlan"
+    assert_raises(UcsException, handle.commit, chunk_size=2)
+
+    # the chunks before the failed one stay committed, the objects not
+    # committed stay in the buffer
+    for vlan in vlans[:4]:
+        assert_true(vlan.dn in ucsm.mos)
+    for vlan in vlans[4:]:
+        assert_true(vlan.dn not in ucsm.mos)
+    assert_equal(sorted(handle._get_commit_buf()),
+                 sorted(vlan.dn for vlan in vlans[4:]))
+
+    del ucsm.conf_errors[vlans[4].dn]
+    handle.commit(chunk_size=2)
+    for vlan in vlans[4:]:
+        assert_true(vlan.dn in ucsm.mos)
+    assert_equal(handle._get_commit_buf(), {})
+
+
+def test_007_invalid_chunk_size():
+    _reset()
+    _add_vlans(400, 1)
+    assert_raises(ValueError, handle.commit, chunk_size=0)
+    handle.commit_buffer_discard()
+
+
+def test_008_element_tree():
+    _reset()
+    vlans = _add_vlans(500, 4)
+    vlans[0].pub_nw_name = u"chunk500 &<\u00e9>"
+
+    def direct_writer(mo_dn, mo):
+        raise AssertionError("direct xml is not enabled")
+
+    pair_to_xml_bytes = xc.conf_mos_pair_to_xml_bytes
+    xc.conf_mos_pair_to_xml_bytes = direct_writer
+    try:
+        handle.commit(chunk_size=2, chunk_bytes=1000)
+    finally:
+        xc.conf_mos_pair_to_xml_bytes = pair_to_xml_bytes
+
+    assert_equal(_conf_mos_keys(), [[vlan.dn for vlan in vlans[:2]],
+                                    [vlan.dn for vlan in vlans[2:]]])
+    vlan = _requests("configConfMos")[0].find(".//fabricVlan")
+    assert_equal(vlan.get("pubNwName"), u"chunk500 &<\u00e9>")
+
+
+def test_009_direct_xml():
+    _reset()
+    vlans = _add_vlans(600, 5)
+    handle.set_mode_direct_xml()
+    try:
+        handle.commit(chunk_size=2)
+    finally:
+        handle.unset_mode_direct_xml()
+
+    assert_equal(_conf_mos_keys(), [[vlan.dn for vlan in vlans[:2]],
+                                    [vlan.dn for vlan in vlans[2:4]],
+                                    [vlan.dn for vlan in vlans[4:]]])
+    for vlan in vlans:
+        assert_true(vlan.dn in ucsm.mos)
@@ -0,0 +1,155 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import xml.etree.ElementTree as ET
+
+from nose.tools import assert_equal, assert_true, assert_raises
+from ucsmsdk.ucsexception import UcsException, UcsOperationError
+from ucsmsdk.mometa.fabric.FabricVlan import FabricVlan
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ucsmsdk.mometa.org.OrgOrg import OrgOrg
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def _reset(latency):
+    ucsm.latency = latency
+    ucsm.requests = []
+    ucsm.conf_errors = {}
+    ucsm.max_in_flight_with = {}
+
+
+def _add_vlans(tag, first, count):
+    vlans = []
+    for index in range(first, first + count):
+        vlan = FabricVlan(parent_mo_or_dn="fabric/lan",
+                          name="many%d" % index, id=str(index))
+        handle.add_mo(vlan, tag=tag)
+        vlans.append(vlan)
+    return vlans
+
+
+def _conf_mos_keys():
+    requests = [ET.fromstring(body) for body in ucsm.requests]
+    return [[pair.get("key") for pair in req.iter("pair")]
+            for req in requests if req.tag == "configConfMos"]
+
+
+def test_001_independent_tags():
+    _reset(0.1)
+    vlans = []
+    for index in range(4):
+        vlans.extend(_add_vlans("vlans%d" % index, 100 + index * 10, 5))
+    errors = handle.commit_many(["vlans%d" % index for index in range(4)])
+
+    assert_equal(errors, dict(("vlans%d" % index, None)
+                              for index in range(4)))
+    assert_equal(ucsm.max_in_flight_with["configConfMos"], 4)
+    for vlan in vlans:
+        assert_true(vlan.dn in ucsm.mos)
+
+
+def test_002_overlapping_tags():
+    _reset(0.1)
+    handle.add_mo(OrgOrg(parent_mo_or_dn="org-root", name="many"),
+                  tag="org")
+    handle.add_mo(LsServer(parent_mo_or_dn="org-root/org-many", name="sp1"),
+                  tag="sp")
+    _add_vlans("vlans", 200, 2)
+    errors = handle.commit_many(["org", "sp", "vlans"])
+
+    assert_equal(errors, {"org": None, "sp": None, "vlans": None})
+    keys = sum(_conf_mos_keys(), [])
+    # the service profile waits for its org, the vlans do not
+    assert_true(keys.index("org-root/org-many") <
+                keys.index("org-root/org-many/ls-sp1"))
+    assert_equal(ucsm.max_in_flight_with["configConfMos"], 2)
+    assert_true("org-root/org-many/ls-sp1" in ucsm.mos)
+
+
+def test_003_errors_per_tag():
+    _reset(0)
+    good = _add_vlans("good", 300, 3)
+    bad = _add_vlans("bad", 310, 3)
+    ucsm.conf_errors[bad[1].dn] = "invalid vlan"
+    errors = handle.commit_many(["bad", "good", "empty"])
+
+    assert_true(isinstance(errors["bad"], UcsException))
+    assert_equal((errors["good"], errors["empty"]), (None, None))
+    for vlan in good:
+        assert_true(vlan.dn in ucsm.mos)
+    for vlan in bad:
+        assert_true(vlan.dn not in ucsm.mos)
+
+
+def test_004_max_workers():
+    _reset(0.05)
+    for index in range(3):
+        _add_vlans("one%d" % index, 400 + index * 10, 2)
+    errors = handle.commit_many(["one0", "one1", "one2"], max_workers=1)
+
+    assert_equal(list(errors.values()), [None, None, None])
+    assert_equal(ucsm.max_in_flight_with["configConfMos"], 1)
+    assert_raises(ValueError, handle.commit_many, ["one0"], max_workers=0)
+
+
+def test_005_escaped_values():
+    _reset(0)
+    plain = _add_vlans("plain", 500, 2)
+    escaped = _add_vlans("escaped", 510, 2)
+    escaped[0].pub_nw_name = u"net &<\"\u00e9\">"
+    errors = handle.commit_many(["plain", "escaped"], chunk_size=1)
+
+    assert_equal(errors, {"plain": None, "escaped": None})
+    values = [vlan.get("pubNwName")
+              for body in ucsm.requests
+              for vlan in ET.fromstring(body).iter("fabricVlan")]
+    assert_true(u"net &<\"\u00e9\">" in values)
+    for vlan in plain + escaped:
+        assert_true(vlan.dn in ucsm.mos)
+
+
+def test_006_dependency_failed():
+    _reset(0)
+    handle.add_mo(OrgOrg(parent_mo_or_dn="org-root", name="manyfail"),
+                  tag="org")
+    sp = LsServer(parent_mo_or_dn="org-root/org-manyfail", name="sp1")
+    handle.add_mo(sp, tag="sp")
+    vlans = _add_vlans("vlans", 600, 2)
+    ucsm.conf_errors["org-root/org-manyfail"] = "invalid org"
+    errors = handle.commit_many(["org", "sp", "vlans"])
+
+    assert_true(isinstance(errors["org"], UcsException))
+    # the service profile is not committed, its buffer is kept
+    assert_true(isinstance(errors["sp"], UcsOperationError))
+    assert_true("org" in str(errors["sp"]))
+    assert_equal(errors["vlans"], None)
+    assert_equal(sum(_conf_mos_keys(), []).count(sp.dn), 0)
+    assert_equal(list(handle._get_commit_buf("sp")), [sp.dn])
+    for vlan in vlans:
+        assert_true(vlan.dn in ucsm.mos)
+    handle.commit_buffer_discard("sp")
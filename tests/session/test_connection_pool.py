@@ -0,0 +1,197 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import ssl
+import time
+
+from nose.tools import assert_equal, assert_true, assert_raises
+from ucsmsdk.ucsdriver import UcsConnectionPool, UcsDriver
+from ucsmsdk.ucshandle import UcsHandle
+from ..connection.mock_ucsm import MockUcsm
+
+
+class _Connection(object):
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def _driver(handle):
+    return handle._UcsSession__driver
+
+
+def _login(ucsm):
+    handle = ucsm.handle()
+    handle.login()
+    return handle
+
+
+def test_001_connection_reused():
+    ucsm = MockUcsm().start()
+    handle = _login(ucsm)
+    try:
+        count = ucsm.request_count
+        for _ in range(5):
+            handle.query_dn("sys")
+        assert_equal(ucsm.connection_count, 1)
+        assert_equal(ucsm.request_count, count + 5)
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+def test_002_unset_connection_pool():
+    ucsm = MockUcsm().start()
+    handle = _login(ucsm)
+    try:
+        handle.unset_connection_pool()
+        count = ucsm.connection_count
+        for _ in range(3):
+            handle.query_dn("sys")
+        assert_equal(ucsm.connection_count, count + 3)
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+def test_003_idle_connection_closed_by_server():
+    ucsm = MockUcsm(keep_alive_timeout=0.1).start()
+    handle = _login(ucsm)
+    try:
+        count = ucsm.request_count
+        time.sleep(0.3)
+        handle.query_dn("sys")
+        assert_equal(ucsm.connection_count, 2)
+        assert_equal(ucsm.request_count, count + 1)
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+def test_004_idle_connection_closed_no_health_check():
+    # the request is sent again only because the server closed the
+    # connection without reading it
+    ucsm = MockUcsm(keep_alive_timeout=0.1).start()
+    handle = ucsm.handle()
+    handle.set_connection_pool(health_check=False)
+    handle.login()
+    try:
+        count = ucsm.request_count
+        time.sleep(0.3)
+        handle.query_dn("sys")
+        assert_equal(ucsm.connection_count, 2)
+        assert_equal(ucsm.request_count, count + 1)
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+def test_005_idle_timeout():
+    ucsm = MockUcsm().start()
+    handle = ucsm.handle()
+    handle.set_connection_pool(idle_timeout=0)
+    handle.login()
+    try:
+        count = ucsm.connection_count
+        time.sleep(0.01)
+        handle.query_dn("sys")
+        assert_equal(ucsm.connection_count, count + 1)
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+def test_006_pool_size_and_idle_timeout_eviction():
+    pool = UcsConnectionPool(pool_size=2, idle_timeout=0.1,
+                             health_check=False)
+    conns = [_Connection() for _ in range(3)]
+    for conn in conns:
+        pool.put("key", conn)
+    assert_equal([conn.closed for conn in conns], [False, False, True])
+
+    assert_true(pool.get("key") is conns[1])
+    time.sleep(0.2)
+    assert_equal(pool.get("key"), None)
+    assert_true(conns[0].closed)
+
+
+def test_007_redirect():
+    target = MockUcsm().start()
+    ucsm = MockUcsm().start()
+    ucsm.redirect_location = target.uri + "/nuova"
+    handle = _login(ucsm)
+    try:
+        assert_equal(_driver(handle).redirect_uri, target.uri + "/nuova")
+        assert_equal(handle.uri, target.uri + "/nuova")
+        assert_equal(handle.query_dn("sys").dn, "sys")
+        assert_equal(ucsm.request_count, 0)
+        assert_true(target.request_count > 0)
+    finally:
+        handle.logout()
+        ucsm.stop()
+        target.stop()
+
+
+def test_008_ssl_fallback():
+    # an http server does not speak TLS, both the attempt and the fallback
+    # to TLSv1 fail
+    ucsm = MockUcsm().start()
+    handle = UcsHandle("127.0.0.1", "admin", "password", port=ucsm.port,
+                       secure=True)
+    driver = _driver(handle)
+    driver.update_handlers(tls_proto="tlsv1_2")
+    try:
+        assert_raises(ssl.SSLError, handle.login)
+        assert_equal(driver.tls_proto, "tlsv1")
+        assert_equal(ucsm.connection_count, 2)
+    finally:
+        ucsm.stop()
+
+
+def test_009_tls_session_resumed():
+    ucsm = MockUcsm(secure=True).start()
+    handle = ucsm.handle()
+    driver = _driver(handle)
+    driver.update_handlers(tls_proto="tlsv1_2")
+    handle.login()
+    try:
+        driver.pool.clear()
+        handle.query_dn("sys")
+        conn = driver.pool.get(("https", "127.0.0.1", ucsm.port))
+        assert_true(conn.sock.session_reused)
+        conn.close()
+    finally:
+        handle.logout()
+        ucsm.stop()
+
+
+def test_010_pool_survives_freeze():
+    handle = UcsHandle("127.0.0.1", "admin", "password")
+    handle.set_connection_pool(pool_size=8, idle_timeout=30)
+    handle = UcsHandle.unfreeze(handle.freeze())
+    assert_equal(_driver(handle).pool.pool_size, 8)
+    assert_equal(_driver(handle).pool.idle_timeout, 30)
+
+    handle.unset_connection_pool()
+    handle = UcsHandle.unfreeze(handle.freeze())
+    assert_equal(_driver(handle).pool, None)
+
+
+def test_011_proxy_credentials():
+    driver = UcsDriver(proxy="user:p%40ss@192.168.1.1:3128")
+    assert_equal(driver._UcsDriver__proxy_headers(),
+                 {'Proxy-Authorization': 'Basic dXNlcjpwQHNz'})
+    driver = UcsDriver(proxy="192.168.1.1:3128")
+    assert_equal(driver._UcsDriver__proxy_headers(), {})
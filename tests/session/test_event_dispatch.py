@@ -0,0 +1,238 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import threading
+
+from nose.tools import assert_equal, assert_true
+from ucsmsdk.ucseventhandler import UcsEventHandle
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    ucsm.add_mo("orgOrg", dn="org-root", name="root")
+    for index in range(3):
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp%d" % index,
+                    name="sp%d" % index, assocState="unassociated")
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def _event(tag, event_id=1, **attrib):
+    attrs = " ".join('%s="%s"' % item for item in sorted(attrib.items()))
+    return ('<configMoChangeEvent cookie="" inEid="%d"><inConfig>'
+            '<%s %s/></inConfig></configMoChangeEvent>' % (event_id, tag,
+                                                           attrs))
+
+
+def _watch(ueh, class_id=None, managed_object=None, prop=None,
+           success_value=[], poll_sec=None, timeout_sec=None):
+    # adds a watch block like UcsEventHandle.add, without the threads
+    if class_id is not None:
+        filter_callback = ueh._add_class_id_watch(class_id)
+    elif managed_object is not None:
+        filter_callback = ueh._add_mo_watch(managed_object, prop,
+                                            success_value, poll_sec)
+    else:
+        def filter_callback(mce):
+            return True
+    params = {'class_id': class_id, 'managed_object': managed_object,
+              'prop': prop, 'success_value': success_value,
+              'poll_sec': poll_sec, 'timeout_sec': timeout_sec,
+              'call_back': None,
+              'start_time': datetime.datetime.now(), 'context': None}
+    return ueh.watch_block_add(params, filter_callback,
+                               callback=lambda mce: None)
+
+
+def test_001_dispatch_by_dn_class_and_catch_all():
+    ueh = UcsEventHandle(handle)
+    sp0 = LsServer("org-root", name="sp0")
+    by_dn = _watch(ueh, managed_object=sp0, prop="assoc_state",
+                   success_value=["associated"])
+    by_class = _watch(ueh, class_id="lsServer")
+    catch_all = _watch(ueh)
+    polled = _watch(ueh, managed_object=sp0, prop="assoc_state",
+                    success_value=["associated"], poll_sec=5)
+
+    ueh._process_event_channel_resp(_event("lsServer", 1,
+                                           dn="org-root/ls-sp0",
+                                           assocState="associated"))
+    ueh._process_event_channel_resp(_event("lsServer", 2,
+                                           dn="org-root/ls-sp1",
+                                           assocState="associated"))
+    ueh._process_event_channel_resp(_event("orgOrg", 3, dn="org-root",
+                                           descr="root"))
+
+    assert_equal(by_dn.queue_size(), 1)
+    assert_equal(by_class.queue_size(), 2)
+    assert_equal(catch_all.queue_size(), 3)
+    assert_equal(polled.queue_size(), 0)
+    assert_equal(by_dn.dequeue(0).event_id, "1")
+
+
+def test_002_only_matching_watchers_checked():
+    ueh = UcsEventHandle(handle)
+    for index in range(1000):
+        _watch(ueh, managed_object=LsServer("org-root", name="sp%d" % index),
+               prop="assoc_state", success_value=["associated"])
+    from ucsmsdk.ucseventhandler import mo_change_events_from_xml
+    mce = mo_change_events_from_xml(_event("lsServer", 1,
+                                           dn="org-root/ls-sp7"))[0]
+    watch_blocks = ueh._matching_watch_blocks(mce)
+    assert_equal(len(watch_blocks), 1)
+    assert_equal(watch_blocks[0].params["managed_object"].dn,
+                 "org-root/ls-sp7")
+
+
+def test_003_removed_watch_block_unindexed():
+    ueh = UcsEventHandle(handle)
+    sp0 = LsServer("org-root", name="sp0")
+    first = _watch(ueh, managed_object=sp0)
+    second = _watch(ueh, managed_object=sp0)
+    by_class = _watch(ueh, class_id="LsServer")
+    ueh.remove(first)
+    ueh.remove(by_class)
+    ueh._process_event_channel_resp(_event("lsServer", 1,
+                                           dn="org-root/ls-sp0"))
+    assert_equal(first.queue_size(), 0)
+    assert_equal(second.queue_size(), 1)
+    assert_equal(by_class.queue_size(), 0)
+
+    ueh.clean()
+    assert_equal(ueh.get(), [])
+    assert_equal(ueh._wbs_index, {"dn": {}, "class_id": {}, "all": {}})
+
+
+def test_004_event_channel():
+    ueh = UcsEventHandle(handle)
+    sp1 = handle.query_dn("org-root/ls-sp1")
+    done = threading.Event()
+    received = []
+
+    def callback(mce):
+        received.append(mce)
+        done.set()
+
+    ueh.add(managed_object=sp1, prop="assoc_state",
+            success_value=["associated"], call_back=callback,
+            timeout_sec=30)
+    while ucsm.event_channels == 0:
+        done.wait(0.01)
+
+    ucsm.push_event("lsServer", dn="org-root/ls-sp2",
+                    assocState="associated")
+    ucsm.push_event("lsServer", dn="org-root/ls-sp1",
+                    assocState="associating")
+    ucsm.push_event("lsServer", dn="org-root/ls-sp1",
+                    assocState="associated")
+    assert_true(done.wait(10))
+    assert_equal([mce.mo.dn for mce in received], ["org-root/ls-sp1"])
+    assert_equal(received[0].mo.assoc_state, "associated")
+
+
+def test_005_lazy_mo():
+    from ucsmsdk.ucseventhandler import mo_change_events_from_xml
+    mce = mo_change_events_from_xml(_event("lsServer", 7,
+                                           dn="org-root/ls-sp0",
+                                           assocState="associated",
+                                           status="modified"))[0]
+    assert_equal((mce.event_id, mce.dn, mce.class_id),
+                 ("7", "org-root/ls-sp0", "LsServer"))
+    assert_equal(sorted(mce.change_list),
+                 ["assocState", "dn", "rn", "status"])
+    assert_equal(mce.properties["assocState"], "associated")
+
+    mo = mce.mo
+    assert_true(isinstance(mo, LsServer))
+    assert_equal((mo.dn, mo.assoc_state), ("org-root/ls-sp0", "associated"))
+    assert_true(mce.mo is mo)
+    assert_equal(mce.properties, None)
+    assert_equal(mce.dn, "org-root/ls-sp0")
+
+
+def test_006_dispatch_does_not_create_mo():
+    ueh = UcsEventHandle(handle)
+    sp0 = LsServer("org-root", name="sp0")
+    by_dn = _watch(ueh, managed_object=sp0, prop="assoc_state",
+                   success_value=["associated"])
+    by_class = _watch(ueh, class_id="lsServer")
+    ueh._process_event_channel_resp(_event("lsServer", 1,
+                                           dn="org-root/ls-sp0",
+                                           assocState="associating"))
+    # an unknown class does not prevent the dispatch
+    ueh._process_event_channel_resp(_event("unknownClass", 2,
+                                           dn="sys/unknown"))
+    mce = by_dn.dequeue(0)
+    assert_true(mce is by_class.dequeue(0))
+    assert_true(mce.properties is not None)
+
+    assert_true(not ueh._event_prop_val_match(mce, sp0, "assoc_state",
+                                              ["associated"]))
+    assert_true(ueh._event_prop_val_match(mce, sp0, "assoc_state",
+                                          ["associating"]))
+    assert_true(not ueh._event_prop_val_match(mce, sp0, "descr", [""]))
+    assert_true(mce.properties is not None)
+
+
+def test_007_wait_for_the_nearest_timeout():
+    ueh = UcsEventHandle(handle)
+    sp0 = LsServer("org-root", name="sp0")
+    _watch(ueh, class_id="lsServer", timeout_sec=30)
+    _watch(ueh, managed_object=sp0, prop="assoc_state",
+           success_value=["associated"], timeout_sec=2)
+    _watch(ueh)
+
+    timeout = ueh._dequeue_pass()
+    assert_true(1 < timeout <= 2)
+    assert_equal(len(ueh.get()), 3)
+
+
+def _set_assoc_state(state="unassociated", *indexes):
+    for index in indexes or range(3):
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp%d" % index,
+                    name="sp%d" % index, assocState=state)
+
+
+def test_008_coalesced_polls():
+    _set_assoc_state()
+    ueh = UcsEventHandle(handle)
+    polled = [_watch(ueh, managed_object=LsServer("org-root",
+                                                  name="sp%d" % index),
+                     prop="assoc_state", success_value=["associated"],
+                     poll_sec=0)
+              for index in range(3)]
+
+    requests = ucsm.request_count
+    ueh._dequeue_pass()
+    assert_equal(ucsm.request_count, requests + 1)
+    assert_equal(len(ueh.get()), 3)
+
+    _set_assoc_state("associated", 1)
+    try:
+        ueh._dequeue_pass()
+        assert_equal(ucsm.request_count, requests + 2)
+        assert_equal(ueh.get(), [polled[0], polled[2]])
+    finally:
+        _set_assoc_state()
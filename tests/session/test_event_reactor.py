@@ -0,0 +1,272 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+import threading
+import time
+
+from nose.plugins.skip import SkipTest
+from nose.tools import assert_equal, assert_true
+
+try:
+    import selectors  # noqa: F401
+except ImportError:
+    raise SkipTest("UcsEventReactor needs the selectors module")
+
+import ucsmsdk.ucseventreactor as ucseventreactor
+from ucsmsdk.ucseventhandler import UcsEventHandle
+from ucsmsdk.ucseventreactor import UcsEventReactor, _EventStream
+from ..connection.mock_ucsm import MockUcsm
+
+servers = []
+handles = []
+
+
+def setup_module():
+    for _ in range(2):
+        ucsm = MockUcsm().start()
+        ucsm.add_mo("orgOrg", dn="org-root", name="root")
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp0", name="sp0",
+                    assocState="unassociated")
+        servers.append(ucsm)
+        for _ in range(2):
+            handle = ucsm.handle()
+            handle.login()
+            handles.append(handle)
+
+
+def teardown_module():
+    for handle in handles:
+        handle.logout()
+    for ucsm in servers:
+        ucsm.stop()
+
+
+def _client_threads():
+    # the threads of the mock servers are left out
+    return len([thread for thread in threading.enumerate()
+                if "process_request" not in thread.name])
+
+
+def _wait_until(condition, timeout=10):
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_001_stream_decoder():
+    messages = [b'<configMoChangeEvent inEid="1"/>',
+                b'<configMoChangeEvent inEid="22"/>']
+    body = b"".join(b"%d\n%s" % (len(message), message)
+                    for message in messages)
+    data = (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" +
+            b"%x\r\n%s\r\n" % (20, body[:20]) +
+            b"%x\r\n%s\r\n0\r\n\r\n" % (len(body) - 20, body[20:]))
+
+    stream = _EventStream()
+    decoded = []
+    for index in range(len(data)):
+        decoded.extend(stream.feed(data[index:index + 1]))
+    assert_equal(decoded, messages)
+    assert_true(stream.closed)
+
+
+def test_002_shared_threads():
+    reactor = UcsEventReactor(max_workers=2)
+    received = []
+    lock = threading.Lock()
+
+    def callback(mce):
+        with lock:
+            received.append((mce.dn, threading.current_thread().name))
+
+    event_handles = []
+    thread_counts = []
+    for handle in handles:
+        ueh = UcsEventHandle(handle, reactor=reactor)
+        ueh.add(class_id="lsServer", call_back=callback)
+        event_handles.append(ueh)
+        thread_counts.append(_client_threads())
+
+    try:
+        assert_equal(len(set(thread_counts)), 1)
+        assert_equal(len(reactor), len(handles))
+        assert_true(_wait_until(lambda: [ucsm.event_channels
+                                         for ucsm in servers] == [2, 2]))
+
+        for index, ucsm in enumerate(servers):
+            ucsm.push_event("lsServer", dn="org-root/ls-sp0",
+                            descr="event %d" % index)
+        assert_true(_wait_until(lambda: len(received) == len(handles)))
+        assert_equal(sorted(dn for dn, _ in received),
+                     ["org-root/ls-sp0"] * len(handles))
+        assert_true(all(name.startswith("ucs_event_worker")
+                        for _, name in received))
+
+        for ueh in event_handles:
+            ueh.clean()
+        assert_equal(len(reactor), 0)
+    finally:
+        reactor.stop()
+
+
+def test_003_watch_block_done():
+    reactor = UcsEventReactor(max_workers=1)
+    handle = handles[0]
+    ucsm = servers[0]
+    ueh = UcsEventHandle(handle, reactor=reactor)
+    sp0 = handle.query_dn("org-root/ls-sp0")
+    done = threading.Event()
+    received = []
+
+    def callback(mce):
+        received.append(mce.mo.assoc_state)
+        done.set()
+
+    # closed channels are only noticed by the server on the next event
+    channels = ucsm.event_channels
+
+    try:
+        ueh.add(managed_object=sp0, prop="assoc_state",
+                success_value=["associated"], call_back=callback,
+                timeout_sec=30)
+        assert_true(_wait_until(lambda: ucsm.event_channels > channels))
+        ucsm.push_event("lsServer", dn="org-root/ls-sp0",
+                        assocState="associating")
+        ucsm.push_event("lsServer", dn="org-root/ls-sp0",
+                        assocState="associated")
+        assert_true(done.wait(10))
+        assert_equal(received, ["associated"])
+        assert_true(_wait_until(lambda: len(reactor) == 0))
+        assert_equal(ueh.get(), [])
+    finally:
+        reactor.stop()
+
+
+def test_004_timeout_without_events():
+    reactor = UcsEventReactor(max_workers=1)
+    handle = handles[1]
+    ueh = UcsEventHandle(handle, reactor=reactor)
+    sp0 = handle.query_dn("org-root/ls-sp0")
+    context = {"done": False}
+
+    try:
+        ueh.add(managed_object=sp0, prop="assoc_state",
+                success_value=["associated"], timeout_sec=1,
+                context=context)
+        assert_true(_wait_until(lambda: context["done"]))
+        assert_equal(len(reactor), 0)
+    finally:
+        reactor.stop()
+
+
+def test_005_redirect():
+    reactor = UcsEventReactor(max_workers=1)
+    server = MockUcsm().start()
+    secure_server = MockUcsm(secure=True).start()
+    handle = server.handle()
+    handle.login()
+    server.redirect_location = "https://127.0.0.1:%d/nuova" % (
+        secure_server.port)
+    received = []
+
+    try:
+        ueh = UcsEventHandle(handle, reactor=reactor)
+        ueh.add(class_id="lsServer", call_back=received.append)
+        assert_true(_wait_until(lambda: secure_server.event_channels == 1))
+        assert_equal(server.event_channels, 0)
+        secure_server.push_event("lsServer", dn="org-root/ls-sp9")
+        assert_true(_wait_until(lambda: len(received) == 1))
+        assert_equal(received[0].dn, "org-root/ls-sp9")
+    finally:
+        reactor.stop()
+        server.redirect_location = None
+        handle.logout()
+        server.stop()
+        secure_server.stop()
+
+
+class _SilentServer(object):
+    """Accepts connections and never answers."""
+
+    def __init__(self):
+        self.sock = socket.socket()
+        self.sock.bind(("127.0.0.1", 0))
+        self.sock.listen(8)
+        self.port = self.sock.getsockname()[1]
+        self.connections = []
+        thread = threading.Thread(target=self.__accept)
+        thread.daemon = True
+        thread.start()
+
+    def __accept(self):
+        while True:
+            try:
+                self.connections.append(self.sock.accept()[0])
+            except (IOError, OSError):
+                return
+
+    def stop(self):
+        self.sock.close()
+        for conn in self.connections:
+            conn.close()
+
+
+def test_006_unresponsive_server():
+    saved = (ucseventreactor._SUBSCRIBE_TIMEOUT_SEC,
+             ucseventreactor._RESUBSCRIBE_MAX_ATTEMPTS,
+             ucseventreactor._RESUBSCRIBE_MIN_SEC)
+    ucseventreactor._SUBSCRIBE_TIMEOUT_SEC = 1
+    ucseventreactor._RESUBSCRIBE_MAX_ATTEMPTS = 2
+    ucseventreactor._RESUBSCRIBE_MIN_SEC = 0.1
+
+    reactor = UcsEventReactor(max_workers=2)
+    silent = _SilentServer()
+    server = MockUcsm().start()
+    stuck_handle = server.handle()
+    stuck_handle.login()
+    server.redirect_location = "http://127.0.0.1:%d/nuova" % silent.port
+    received = []
+
+    try:
+        stuck = UcsEventHandle(stuck_handle, reactor=reactor)
+        adding = threading.Thread(
+            target=stuck.add, kwargs={"class_id": "lsServer"})
+        adding.start()
+        assert_true(_wait_until(lambda: len(silent.connections) == 1))
+
+        # the other handles get their events meanwhile
+        ucsm = servers[0]
+        channels = ucsm.event_channels
+        ueh = UcsEventHandle(handles[0], reactor=reactor)
+        ueh.add(class_id="lsServer", call_back=received.append)
+        assert_true(_wait_until(lambda: ucsm.event_channels > channels))
+        ucsm.push_event("lsServer", dn="org-root/ls-sp0", descr="live")
+        assert_true(_wait_until(lambda: len(received) == 1, timeout=0.9))
+        adding.join()
+
+        # the first attempt and two retries, then the channel is given up
+        assert_true(_wait_until(lambda: len(silent.connections) == 3))
+        time.sleep(1.5)
+        assert_equal(len(silent.connections), 3)
+        ueh.clean()
+    finally:
+        (ucseventreactor._SUBSCRIBE_TIMEOUT_SEC,
+         ucseventreactor._RESUBSCRIBE_MAX_ATTEMPTS,
+         ucseventreactor._RESUBSCRIBE_MIN_SEC) = saved
+        reactor.stop()
+        server.redirect_location = None
+        stuck_handle.logout()
+        server.stop()
+        silent.stop()
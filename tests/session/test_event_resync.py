@@ -0,0 +1,173 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from nose.plugins.skip import SkipTest
+from nose.tools import assert_equal, assert_true
+from ucsmsdk.ucseventhandler import UcsEventHandle
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    ucsm.add_mo("orgOrg", dn="org-root", name="root")
+    for index in range(3):
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp%d" % index,
+                    name="sp%d" % index, assocState="unassociated")
+    ucsm.add_mo("fabricVlan", dn="fabric/lan/net-vlan100", name="vlan100",
+                id="100")
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def _reactor():
+    # the event reactor needs python 3.4
+    try:
+        import selectors  # noqa: F401
+    except ImportError:
+        raise SkipTest("UcsEventReactor needs the selectors module")
+    from ucsmsdk.ucseventreactor import UcsEventReactor
+    return UcsEventReactor(max_workers=1)
+
+
+def _event(event_id, dn, **attrib):
+    attrib["dn"] = dn
+    attrs = " ".join('%s="%s"' % item for item in sorted(attrib.items()))
+    return ('<configMoChangeEvent cookie="" inEid="%d"><inConfig>'
+            '<lsServer %s/></inConfig></configMoChangeEvent>' % (event_id,
+                                                                 attrs))
+
+
+def _wait_until(condition, timeout=10):
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+def _watch(ueh, received, **kwargs):
+    kwargs.setdefault('class_id', None)
+    kwargs.setdefault('managed_object', None)
+    params = {'prop': None, 'success_value': [], 'poll_sec': None,
+              'timeout_sec': None, 'call_back': None, 'context': None}
+    params.update(kwargs)
+    if params['class_id'] is not None:
+        filter_callback = ueh._add_class_id_watch(params['class_id'])
+    else:
+        filter_callback = ueh._add_mo_watch(params['managed_object'],
+                                            params['prop'],
+                                            params['success_value'])
+    return ueh.watch_block_add(params, filter_callback,
+                               callback=received.append)
+
+
+def test_001_gap_detection():
+    ueh = UcsEventHandle(handle)
+    received = []
+    _watch(ueh, received, class_id="fabricVlan")
+
+    ueh._process_event_channel_resp(_event(1, "org-root/ls-sp0"))
+    ueh._process_event_channel_resp(_event(2, "org-root/ls-sp0"))
+    assert_equal((ueh.last_event_id, ueh._resync_needed), (2, False))
+    ueh._process_event_channel_resp(_event(2, "org-root/ls-sp1"))
+    assert_true(not ueh._resync_needed)
+
+    ueh._process_event_channel_resp(_event(5, "org-root/ls-sp0"))
+    assert_equal((ueh.last_event_id, ueh._resync_needed), (5, True))
+
+
+def test_002_targeted_resync():
+    ueh = UcsEventHandle(handle)
+    received = []
+    sp0 = LsServer("org-root", name="sp0")
+    gone = LsServer("org-root", name="gone")
+    associated = _watch(ueh, received, managed_object=sp0,
+                        prop="assoc_state", success_value=["associated"])
+    removed = _watch(ueh, received, managed_object=gone)
+    vlans = _watch(ueh, received, class_id="fabricVlan")
+
+    ucsm.add_mo("lsServer", dn="org-root/ls-sp0", name="sp0",
+                assocState="associated")
+    try:
+        ueh._process_event_channel_resp(_event(10, "org-root/ls-sp2"))
+        ueh._process_event_channel_resp(_event(20, "org-root/ls-sp2"))
+
+        requests = ucsm.request_count
+        ueh._dequeue_pass()
+        # one configResolveDns and one configResolveClasses
+        assert_equal(ucsm.request_count - requests, 2)
+    finally:
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp0", name="sp0",
+                    assocState="unassociated")
+
+    assert_equal(sorted(mce.dn for mce in received),
+                 ["fabric/lan/net-vlan100", "org-root/ls-gone",
+                  "org-root/ls-sp0"])
+    assert_equal(ueh.get(), [vlans])
+    assert_true(associated.removed and removed.removed)
+
+
+def _resubscribe(reactor=None):
+    ueh = UcsEventHandle(handle, reactor=reactor)
+    received = []
+    lock = threading.Lock()
+
+    def callback(mce):
+        with lock:
+            received.append((mce.dn, mce.mo.descr))
+
+    ueh.add(class_id="lsServer", call_back=callback)
+    try:
+        assert_true(_wait_until(lambda: ucsm.event_channels == 1))
+        ucsm.push_event("lsServer", dn="org-root/ls-sp1", descr="before")
+        assert_true(_wait_until(lambda: len(received) == 1))
+
+        ucsm.drop_event_channels()
+        ucsm.push_event("lsServer", dn="org-root/ls-sp1", descr="missed")
+        ucsm.push_event("lsServer", dn="org-root/ls-sp2", descr="missed",
+                        delivered=False)
+        assert_true(_wait_until(lambda: ucsm.event_channels == 1))
+        assert_true(_wait_until(lambda: ("org-root/ls-sp2", "missed")
+                                in received))
+        assert_true(("org-root/ls-sp1", "missed") in received)
+
+        ucsm.push_event("lsServer", dn="org-root/ls-sp1", descr="after")
+        assert_true(_wait_until(lambda: ("org-root/ls-sp1", "after")
+                                in received))
+    finally:
+        ueh.clean()
+        ucsm.drop_event_channels()
+
+
+def test_003_resubscribe():
+    _resubscribe()
+
+
+def test_004_resubscribe_reactor():
+    reactor = _reactor()
+    try:
+        _resubscribe(reactor)
+    finally:
+        reactor.stop()
@@ -0,0 +1,148 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nose.tools import assert_equal, assert_true, assert_raises
+from ucsmsdk import ucsxmlcodec as xc
+from ucsmsdk.ucsexception import UcsException
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    for index in range(500):
+        ucsm.add_mo("faultInst", dn="sys/fault-%d" % index, id=str(index),
+                    severity="major", descr="fault\nnumber %d" % index)
+    for slot in (1, 2):
+        ucsm.add_mo("computeBlade", dn="sys/chassis-1/blade-%d" % slot,
+                    slotId=str(slot))
+        ucsm.add_mo("biosUnit", dn="sys/chassis-1/blade-%d/bios" % slot,
+                    rn="bios")
+        ucsm.add_mo("biosSettings",
+                    dn="sys/chassis-1/blade-%d/bios/bios-settings" % slot,
+                    rn="bios-settings")
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def test_001_iter_classid():
+    faults = handle.iter_classid("faultInst")
+    assert_true(not isinstance(faults, list))
+    dns = [mo.dn for mo in faults]
+    assert_equal(dns, sorted("sys/fault-%d" % index for index in range(500)))
+
+
+def test_002_same_as_query_classid():
+    streamed = list(handle.iter_classid("FaultInst"))
+    queried = handle.query_classid("FaultInst")
+    assert_equal([mo.dn for mo in streamed], [mo.dn for mo in queried])
+    assert_equal([mo.descr for mo in streamed], [mo.descr for mo in queried])
+    assert_equal(streamed[0].descr, "fault\nnumber 0")
+    assert_true(streamed[0]._handle is handle)
+
+
+def test_003_hierarchy():
+    mos = list(handle.iter_classid("computeBlade", hierarchy=True))
+    assert_equal([mo.dn for mo in mos],
+                 ["sys/chassis-1/blade-1",
+                  "sys/chassis-1/blade-1/bios",
+                  "sys/chassis-1/blade-1/bios/bios-settings",
+                  "sys/chassis-1/blade-2",
+                  "sys/chassis-1/blade-2/bios",
+                  "sys/chassis-1/blade-2/bios/bios-settings"])
+    assert_true(all(not mo.child for mo in mos))
+    assert_equal(len(mos), len(handle.query_classid("computeBlade",
+                                                    hierarchy=True)))
+
+
+def test_004_stopped_early():
+    faults = handle.iter_classid("faultInst")
+    assert_equal(next(faults).dn, "sys/fault-0")
+    faults.close()
+    # the handle is still usable
+    assert_equal(handle.query_dn("sys").dn, "sys")
+
+
+def test_005_error_response():
+    xml_str = ('<configResolveClass cookie="" response="yes" '
+               'errorCode="552" errorDescr="Authorization required"/>')
+    assert_raises(UcsException, list, xc.iter_mos_from_xml(xml_str))
+    xml_str = '<error code="552" errorCode="552" errorDescr="denied"/>'
+    assert_raises(UcsException, list, xc.iter_mos_from_xml(xml_str))
+
+
+def test_006_decode_string():
+    xml_str = ('<configResolveDn cookie="" response="yes" dn="sys">'
+               '<outConfig><topSystem dn="sys" name="ucs"/></outConfig>'
+               '</configResolveDn>')
+    mos = list(xc.iter_mos_from_xml(xml_str))
+    assert_equal([(mo.dn, mo.name) for mo in mos], [("sys", "ucs")])
+
+
+def test_007_paged():
+    count = ucsm.request_count
+    dns = [mo.dn for mo in handle.iter_classid("faultInst", page_size=64)]
+    assert_equal(dns, [mo.dn for mo in handle.query_classid("faultInst")])
+    # 7 full pages, one of 52 objects, and a last empty one
+    assert_equal(ucsm.request_count, count + 9 + 1)
+
+
+def test_008_paged_filter():
+    mos = list(handle.iter_classid(
+        "faultInst", filter_str='(id, "^4[0-9]$", type="re")', page_size=3))
+    assert_equal(sorted(int(mo.id) for mo in mos), list(range(40, 50)))
+
+
+def test_009_paged_exact_multiple():
+    count = ucsm.request_count
+    mos = list(handle.iter_classid("faultInst", page_size=100))
+    assert_equal(len(mos), 500)
+    # the last page is empty
+    assert_equal(ucsm.request_count, count + 6)
+
+
+def test_010_paged_hierarchy():
+    mos = list(handle.iter_classid("computeBlade", hierarchy=True,
+                                   page_size=1))
+    assert_equal([mo.dn for mo in mos],
+                 [mo.dn for mo in handle.iter_classid("computeBlade",
+                                                      hierarchy=True)])
+
+
+def test_011_iter_children():
+    faults = handle.iter_children(in_dn="sys", class_id="faultInst",
+                                  page_size=128)
+    assert_equal(sorted(mo.dn for mo in faults),
+                 sorted(mo.dn for mo in handle.query_children(
+                     in_dn="sys", class_id="faultInst")))
+    assert_raises(ValueError, list, handle.iter_children(in_dn="sys"))
+    assert_raises(ValueError, list, handle.iter_classid("faultInst",
+                                                        page_size=0))
+
+
+def test_012_paged_server_cap():
+    ucsm.page_cap = 30
+    try:
+        dns = [mo.dn for mo in handle.iter_classid("faultInst",
+                                                   page_size=64)]
+    finally:
+        ucsm.page_cap = None
+    assert_equal(dns, [mo.dn for mo in handle.query_classid("faultInst")])
@@ -0,0 +1,203 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+from nose.tools import assert_equal, assert_true
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    ucsm.add_mo("orgOrg", dn="org-root", name="root")
+    for index in range(3):
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp%d" % index,
+                    name="sp%d" % index, descr="")
+    ucsm.add_mo("vnicEther", dn="org-root/ls-sp0/ether-eth0", name="eth0")
+    ucsm.add_mo("fabricVlan", dn="fabric/lan/net-vlan100", name="vlan100",
+                id="100")
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def _wait_until(condition, timeout=10):
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_001_serve_from_cache():
+    cache = handle.enable_cache(class_ids=["LsServer"])
+    try:
+        requests = ucsm.request_count
+        sps = handle.query_classid("LsServer")
+        sp = handle.query_dn("org-root/ls-sp1")
+        children = handle.query_children(in_dn="org-root",
+                                         class_id="lsServer")
+        assert_equal(ucsm.request_count, requests)
+
+        assert_equal([mo.dn for mo in sps], ["org-root/ls-sp0",
+                                             "org-root/ls-sp1",
+                                             "org-root/ls-sp2"])
+        assert_equal((sp.name, sp.get_class_id()), ("sp1", "LsServer"))
+        assert_equal(len(children), 3)
+
+        # every query returns its own objects
+        sp.descr = "changed"
+        assert_equal(handle.query_dn("org-root/ls-sp1").descr, "")
+
+        # filtered queries and other classes go to the server
+        handle.query_classid("LsServer", filter_str='(name, "sp0")')
+        handle.query_dn("fabric/lan/net-vlan100")
+        assert_equal(ucsm.request_count - requests, 2)
+        stats = cache.stats()
+        assert_equal((stats["hits"], stats["misses"]), (4, 1))
+        assert_equal(stats["scopes"]["LsServer"]["objects"], 3)
+    finally:
+        handle.disable_cache()
+
+
+def test_002_events():
+    handle.enable_cache(class_ids=["LsServer"])
+    try:
+        ucsm.push_event("lsServer", dn="org-root/ls-sp0", descr="modified")
+        ucsm.push_event("lsServer", status="created", dn="org-root/ls-sp9",
+                        name="sp9", descr="")
+        ucsm.push_event("lsServer", status="deleted", dn="org-root/ls-sp2")
+
+        requests = ucsm.request_count
+        assert_true(_wait_until(
+            lambda: [mo.dn for mo in handle.query_classid("LsServer")] ==
+            ["org-root/ls-sp0", "org-root/ls-sp1", "org-root/ls-sp9"]))
+        assert_equal(handle.query_dn("org-root/ls-sp0").descr, "modified")
+        assert_equal(handle.query_dn("org-root/ls-sp9").name, "sp9")
+        assert_equal(ucsm.request_count, requests)
+    finally:
+        handle.disable_cache()
+        ucsm.push_event("lsServer", dn="org-root/ls-sp2", name="sp2",
+                        descr="")
+        ucsm.remove_mo("org-root/ls-sp9")
+
+
+def test_003_max_age():
+    cache = handle.enable_cache(class_ids=["LsServer"], max_age=0.2)
+    try:
+        requests = ucsm.request_count
+        handle.query_classid("LsServer")
+        assert_equal(ucsm.request_count, requests)
+
+        time.sleep(0.3)
+        handle.query_classid("LsServer")
+        handle.query_classid("LsServer")
+        assert_equal(ucsm.request_count - requests, 1)
+        assert_equal(cache.stats()["reloads"], 2)
+    finally:
+        handle.disable_cache()
+
+
+def test_004_max_objects():
+    cache = handle.enable_cache(class_ids=["LsServer", "FabricVlan"],
+                                max_objects={"LsServer": 2})
+    try:
+        requests = ucsm.request_count
+        assert_equal(len(handle.query_classid("LsServer")), 3)
+        assert_equal(len(handle.query_classid("FabricVlan")), 1)
+        assert_equal(ucsm.request_count - requests, 1)
+
+        stats = cache.stats()
+        assert_equal(stats["evictions"], 1)
+        assert_true(stats["scopes"]["LsServer"]["evicted"])
+    finally:
+        handle.disable_cache()
+
+
+def test_005_subtree():
+    cache = handle.enable_cache(dns=["org-root/ls-sp0"])
+    try:
+        requests = ucsm.request_count
+        children = handle.query_children(in_dn="org-root/ls-sp0")
+        assert_equal([mo.dn for mo in children],
+                     ["org-root/ls-sp0/ether-eth0"])
+        assert_equal(handle.query_dn("org-root/ls-sp0/ether-eth1"), None)
+        assert_equal(ucsm.request_count, requests)
+
+        ucsm.push_event("vnicEther", status="created",
+                        dn="org-root/ls-sp0/ether-eth1", name="eth1")
+        assert_true(_wait_until(
+            lambda: handle.query_dn("org-root/ls-sp0/ether-eth1")))
+        ucsm.push_event("lsServer", status="deleted", dn="org-root/ls-sp0")
+        assert_true(_wait_until(
+            lambda: cache.stats()["scopes"]["org-root/ls-sp0"][
+                "objects"] == 0))
+        assert_equal(handle.query_children(in_dn="org-root/ls-sp0"), [])
+        assert_equal(ucsm.request_count, requests)
+    finally:
+        handle.disable_cache()
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp0", name="sp0", descr="")
+        ucsm.add_mo("vnicEther", dn="org-root/ls-sp0/ether-eth0",
+                    name="eth0")
+
+
+def test_006_reload_after_missed_events():
+    cache = handle.enable_cache(class_ids=["LsServer"])
+    try:
+        ucsm.drop_event_channels()
+        ucsm.push_event("lsServer", dn="org-root/ls-sp1", descr="missed",
+                        delivered=False)
+        assert_true(_wait_until(
+            lambda: handle.query_dn("org-root/ls-sp1").descr == "missed"))
+        assert_true(cache.stats()["reloads"] >= 2)
+    finally:
+        handle.disable_cache()
+        ucsm.push_event("lsServer", dn="org-root/ls-sp1", descr="")
+
+
+def test_007_lookup_dn_loads_its_class():
+    cache = handle.enable_cache(class_ids=["LsServer", "FabricVlan"])
+    try:
+        cache.invalidate()
+        requests = ucsm.request_count
+        vlan = handle.query_dn("fabric/lan/net-vlan100")
+        assert_equal(vlan.id, "100")
+        # only the vlans are loaded again
+        assert_equal(ucsm.request_count - requests, 1)
+        stats = cache.stats()
+        assert_true(stats["scopes"]["LsServer"]["stale"])
+        assert_true(not stats["scopes"]["FabricVlan"]["stale"])
+    finally:
+        handle.disable_cache()
+
+
+def test_008_read_your_writes():
+    handle.enable_cache(class_ids=["LsServer"])
+    try:
+        sp = handle.query_dn("org-root/ls-sp2")
+        sp.descr = "committed"
+        handle.set_mo(sp)
+        handle.commit()
+        assert_equal(handle.query_dn("org-root/ls-sp2").descr, "committed")
+        assert_equal([mo.descr for mo in handle.query_classid("LsServer")
+                      if mo.dn == "org-root/ls-sp2"], ["committed"])
+    finally:
+        handle.disable_cache()
+        ucsm.push_event("lsServer", dn="org-root/ls-sp2", descr="")
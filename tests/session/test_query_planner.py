@@ -0,0 +1,147 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nose.tools import assert_equal, assert_true, assert_raises
+from ucsmsdk.utils.inventory import get_inventory
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    for slot in range(1, 9):
+        blade = "sys/chassis-1/blade-%d" % slot
+        ucsm.add_mo("computeBlade", dn=blade, slotId=str(slot),
+                    serial="FCH%04d" % slot)
+        ucsm.add_mo("biosUnit", dn=blade + "/bios", rn="bios",
+                    model="B200")
+        for cpu in (1, 2):
+            ucsm.add_mo("processorUnit", dn=blade + "/cpu-%d" % cpu,
+                        rn="cpu-%d" % cpu, id=str(cpu), cores="18")
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def test_001_dns_in_one_request():
+    planner = handle.query_planner()
+    dns = ["sys/chassis-1/blade-%d" % slot for slot in range(1, 9)]
+    indexes = [planner.add_dn(dn) for dn in dns]
+    missing = planner.add_dn("sys/chassis-1/blade-9")
+    count = ucsm.request_count
+    results = planner.execute()
+    assert_equal(ucsm.request_count, count + 1)
+    assert_equal([results[index].dn for index in indexes], dns)
+    assert_equal(results[missing], None)
+    assert_equal(len(planner), 0)
+
+
+def test_002_max_batch_size():
+    planner = handle.query_planner(max_batch_size=3)
+    for slot in range(1, 9):
+        planner.add_dn("sys/chassis-1/blade-%d" % slot)
+    count = ucsm.request_count
+    results = planner.execute()
+    assert_equal(ucsm.request_count, count + 3)
+    assert_true(all(results))
+
+
+def test_003_children_folded_per_class():
+    planner = handle.query_planner()
+    cpus = [planner.add_children("sys/chassis-1/blade-%d" % slot,
+                                 class_id="ProcessorUnit")
+            for slot in range(1, 9)]
+    bioses = [planner.add_children("sys/chassis-1/blade-%d" % slot,
+                                   class_id="biosUnit")
+              for slot in range(1, 9)]
+    blades = planner.add_classid("computeBlade")
+    count = ucsm.request_count
+    results = planner.execute()
+    assert_equal(ucsm.request_count, count + 1)
+    assert_equal(len(results[blades]), 8)
+    for slot, index in enumerate(cpus, 1):
+        assert_equal([mo.dn for mo in results[index]],
+                     ["sys/chassis-1/blade-%d/cpu-1" % slot,
+                      "sys/chassis-1/blade-%d/cpu-2" % slot])
+    for slot, index in enumerate(bioses, 1):
+        assert_equal([mo.dn for mo in results[index]],
+                     ["sys/chassis-1/blade-%d/bios" % slot])
+
+
+def test_004_same_as_single_queries():
+    planner = handle.query_planner()
+    blade = planner.add_dn("sys/chassis-1/blade-1", hierarchy=True)
+    children = planner.add_children("sys/chassis-1/blade-1")
+    cpus = planner.add_classid("processorUnit", hierarchy=True)
+    results = planner.execute()
+    assert_equal([mo.dn for mo in results[blade]],
+                 [mo.dn for mo in handle.query_dn("sys/chassis-1/blade-1",
+                                                  hierarchy=True)])
+    assert_equal([mo.dn for mo in results[children]],
+                 [mo.dn for mo in handle.query_children(
+                     in_dn="sys/chassis-1/blade-1")])
+    assert_equal([mo.dn for mo in results[cpus]],
+                 [mo.dn for mo in handle.query_classid("processorUnit")])
+
+
+def test_005_invalid():
+    planner = handle.query_planner()
+    assert_raises(ValueError, planner.add_dn, "")
+    assert_raises(ValueError, planner.add_classid, None)
+    assert_raises(ValueError, handle.query_planner, 0)
+    assert_equal(planner.execute(), [])
+
+    assert_raises(ValueError, handle.query_planner, 100, 0)
+
+
+def test_006_inventory_children_batched():
+    spec = {"blade": {"class_id": "ComputeBlade",
+                      "props": [{"prop": "dn"},
+                                {"prop": "serial"},
+                                {"prop": "model", "class": "BiosUnit",
+                                 "method": "query_children"}]}}
+    count = ucsm.request_count
+    inventory = get_inventory(handle, component="blade", spec=spec)
+    # the blades, then their bios units all at once
+    assert_equal(ucsm.request_count, count + 2)
+    blades = inventory[handle.ip]["blade"]
+    assert_equal(len(blades), 8)
+    assert_true(all(blade["model"] == "B200" for blade in blades))
+
+
+def test_007_children_of_few_parents():
+    planner = handle.query_planner()
+    cpus = planner.add_children("sys/chassis-1/blade-1",
+                                class_id="ProcessorUnit")
+    count = ucsm.request_count
+    results = planner.execute()
+    # one configResolveChildren, not the cpus of every blade
+    assert_equal(ucsm.request_count, count + 1)
+    assert_equal([mo.dn for mo in results[cpus]],
+                 ["sys/chassis-1/blade-1/cpu-1",
+                  "sys/chassis-1/blade-1/cpu-2"])
+
+    planner = handle.query_planner(min_folded_parents=1)
+    cpus = planner.add_children("sys/chassis-1/blade-1",
+                                class_id="ProcessorUnit")
+    assert_equal([mo.dn for mo in planner.execute()[cpus]],
+                 ["sys/chassis-1/blade-1/cpu-1",
+                  "sys/chassis-1/blade-1/cpu-2"])
+    assert_true(ucsm.requests[-1].startswith(b"<configResolveClasses"))
@@ -0,0 +1,85 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from nose.tools import assert_equal, assert_true, assert_raises
+from ucsmsdk.mometa.fault.FaultInst import FaultInst
+from ucsmsdk.ucsmorecord import MoRecord, mo_record_class
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    for index in range(50):
+        ucsm.add_mo("faultInst", dn="sys/fault-%d" % index, id=str(index),
+                    severity="major", descr="fault\nnumber %d" % index,
+                    newProp="new")
+    ucsm.add_mo("computeBlade", dn="sys/chassis-1/blade-1", slotId="1")
+    ucsm.add_mo("biosUnit", dn="sys/chassis-1/blade-1/bios", rn="bios")
+    ucsm.add_mo("biosSettings",
+                dn="sys/chassis-1/blade-1/bios/bios-settings",
+                rn="bios-settings")
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def test_001_query_classid_records():
+    records = handle.query_classid("FaultInst", records=True)
+    mos = handle.query_classid("FaultInst")
+    assert_equal(len(records), 50)
+
+    record = records[0]
+    assert_true(isinstance(record, MoRecord))
+    assert_true(not hasattr(record, "__dict__"))
+    assert_equal(record.get_class_id(), "FaultInst")
+    assert_equal((record.dn, record.rn, record.severity, record.descr),
+                 (mos[0].dn, mos[0].rn, mos[0].severity, mos[0].descr))
+    # properties not sent, and properties unknown to the meta
+    assert_equal(record.ack, None)
+    assert_equal(record.newProp, "new")
+    assert_raises(AttributeError, getattr, record, "no_such_prop")
+
+
+def test_002_read_only():
+    record = handle.query_classid("FaultInst", records=True)[0]
+    assert_raises(AttributeError, setattr, record, "descr", "changed")
+    assert_raises(AttributeError, delattr, record, "descr")
+    assert_raises(TypeError, mo_record_class("faultInst"))
+
+
+def test_003_to_mo():
+    record = handle.query_classid("FaultInst", records=True)[0]
+    mo = record.to_mo(handle)
+    assert_true(isinstance(mo, FaultInst))
+    assert_equal((mo.dn, mo.descr), (record.dn, record.descr))
+    assert_true(not mo.is_dirty())
+    mo.ack = "yes"
+    assert_equal(mo.ack, "yes")
+    assert_equal(record.ack, None)
+
+
+def test_004_query_children_hierarchy():
+    records = handle.query_children(in_dn="sys/chassis-1/blade-1",
+                                    hierarchy=True, records=True)
+    assert_equal([(record.get_class_id(), record.dn) for record in records],
+                 [("BiosUnit", "sys/chassis-1/blade-1/bios"),
+                  ("BiosSettings",
+                   "sys/chassis-1/blade-1/bios/bios-settings")])
@@ -0,0 +1,108 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+from nose.tools import assert_equal, assert_true, assert_raises
+from ..connection.mock_ucsm import MockUcsm
+
+try:
+    from urllib2 import HTTPError
+except ImportError:
+    from urllib.error import HTTPError
+
+ucsm = None
+handles = []
+
+
+def setup_module():
+    global ucsm
+    ucsm = MockUcsm(latency=0.2).start()
+
+
+def teardown_module():
+    for handle in handles:
+        handle.logout()
+    ucsm.stop()
+
+
+def _login():
+    handle = ucsm.handle()
+    handle.login()
+    handles.append(handle)
+    return handle
+
+
+def _run_parallel(funcs, timeout=None):
+    threads = [threading.Thread(target=func) for func in funcs]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join(timeout)
+    return not any(thread.is_alive() for thread in threads)
+
+
+def test_001_handles_do_not_share_lock():
+    handle_a, handle_b = _login(), _login()
+
+    ucsm.max_in_flight = 0
+    _run_parallel([lambda: handle_a.query_dn("sys"),
+                   lambda: handle_b.query_dn("sys")])
+    assert_equal(ucsm.max_in_flight, 2)
+
+
+def test_002_handle_serializes_reads_by_default():
+    handle = _login()
+
+    ucsm.max_in_flight = 0
+    _run_parallel([lambda: handle.query_dn("sys")] * 2)
+    assert_equal(ucsm.max_in_flight, 1)
+
+
+def test_003_handle_concurrent_reads():
+    handle = _login()
+    handle.set_mode_concurrent_reads()
+
+    ucsm.max_in_flight = 0
+    _run_parallel([lambda: handle.query_dn("sys"),
+                   lambda: handle.query_classid("networkElement")])
+    assert_equal(ucsm.max_in_flight, 2)
+
+    # a refresh is never in flight along with other requests
+    ucsm.max_in_flight_with = {}
+    _run_parallel([lambda: handle.query_dn("sys"),
+                   lambda: handle.query_dn("sys"),
+                   lambda: handle._refresh(),
+                   lambda: handle.query_dn("sys")])
+    assert_equal(ucsm.max_in_flight_with["aaaRefresh"], 1)
+    assert_true(ucsm.max_in_flight_with["configResolveDns"] > 1)
+
+    handle.unset_mode_concurrent_reads()
+    assert_equal(handle.is_concurrent_reads_enabled(), False)
+
+
+def test_004_error_releases_lock():
+    handle = _login()
+    for concurrent_reads in (False, True):
+        if concurrent_reads:
+            handle.set_mode_concurrent_reads()
+
+        ucsm.http_error = 500
+        try:
+            assert_raises(HTTPError, handle.query_dn, "sys")
+        finally:
+            ucsm.http_error = None
+
+        assert_true(_run_parallel([lambda: handle.query_dn("sys"),
+                                   lambda: handle._refresh()], timeout=5))
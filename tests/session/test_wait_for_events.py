@@ -0,0 +1,142 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from nose.plugins.skip import SkipTest
+from nose.tools import assert_equal, assert_true
+from ucsmsdk.ucseventhandler import wait_many
+from ucsmsdk.mometa.ls.LsServer import LsServer
+from ..connection.mock_ucsm import MockUcsm
+
+ucsm = None
+handle = None
+
+
+def setup_module():
+    global ucsm, handle
+    ucsm = MockUcsm().start()
+    ucsm.add_mo("orgOrg", dn="org-root", name="root")
+    handle = ucsm.handle()
+    handle.login()
+
+
+def teardown_module():
+    handle.logout()
+    ucsm.stop()
+
+
+def _reactor():
+    # the event reactor needs python 3.4
+    try:
+        import selectors  # noqa: F401
+    except ImportError:
+        raise SkipTest("UcsEventReactor needs the selectors module")
+    from ucsmsdk.ucseventreactor import UcsEventReactor
+    return UcsEventReactor(max_workers=1)
+
+
+def _service_profiles(count, associated=()):
+    for index in range(count):
+        state = "associated" if index in associated else "unassociated"
+        ucsm.add_mo("lsServer", dn="org-root/ls-sp%d" % index,
+                    name="sp%d" % index, assocState=state)
+    return [handle.query_dn("org-root/ls-sp%d" % index)
+            for index in range(count)]
+
+
+def _associate_later(delay, indexes):
+    def associate():
+        for index in indexes:
+            ucsm.push_event("lsServer", dn="org-root/ls-sp%d" % index,
+                            assocState="associated")
+    timer = threading.Timer(delay, associate)
+    timer.start()
+    return timer
+
+
+def test_001_events():
+    sps = _service_profiles(3, associated=[0])
+    conditions = [(sp, "assoc_state", "associated") for sp in sps]
+    met = []
+
+    timer = _associate_later(0.5, [1])
+    start = time.time()
+    timed_out = handle.wait_for_events(
+        conditions, cb=lambda condition, mce: met.append(mce.mo.dn),
+        timeout=3)
+    timer.join()
+
+    assert_equal(timed_out, [conditions[2]])
+    assert_equal(sorted(met), ["org-root/ls-sp0", "org-root/ls-sp1"])
+    assert_true(time.time() - start >= 3)
+
+
+def test_002_all_met():
+    sps = _service_profiles(20)
+    conditions = [(sp, "assoc_state", ["associated", "failed"])
+                  for sp in sps]
+
+    timer = _associate_later(0.5, range(20))
+    start = time.time()
+    timed_out = handle.wait_for_events(conditions, timeout=30)
+    timer.join()
+
+    assert_equal(timed_out, [])
+    assert_true(time.time() - start < 10)
+
+
+def test_003_batched_polls():
+    sps = _service_profiles(20, associated=range(10))
+    conditions = [(sp, "assoc_state", "associated") for sp in sps]
+
+    timer = _associate_later(0.5, range(10, 20))
+    requests = ucsm.request_count
+    timed_out = handle.wait_for_events(conditions, timeout=10, poll_sec=1)
+    timer.join()
+
+    assert_equal(timed_out, [])
+    # one configResolveDns per poll tick for the 20 service profiles
+    assert_true(ucsm.request_count - requests <= 3)
+
+
+def test_004_reactor():
+    sps = _service_profiles(5)
+    conditions = [(sp, "assoc_state", "associated") for sp in sps]
+    reactor = _reactor()
+
+    timer = _associate_later(0.5, range(5))
+    try:
+        timed_out = wait_many(handle, conditions, timeout_sec=10,
+                              reactor=reactor)
+    finally:
+        timer.join()
+        reactor.stop()
+    assert_equal(timed_out, [])
+
+
+def test_005_polled_dn_missing():
+    sps = _service_profiles(1, associated=[0])
+    missing = LsServer(parent_mo_or_dn="org-root", name="missing")
+    conditions = [(sps[0], "assoc_state", "associated"),
+                  (missing, "assoc_state", "associated")]
+
+    start = time.time()
+    timed_out = handle.wait_for_events(conditions, timeout=30, poll_sec=1)
+    assert_equal(timed_out, [conditions[1]])
+    assert_true(time.time() - start < 10)
+
+    # without a timeout
+    timed_out = handle.wait_for_events(conditions[1:], poll_sec=1)
+    assert_equal(timed_out, conditions[1:])
@@ -0,0 +1,961 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the asyncio flavour of UcsHandle, which lets a single
+event loop drive many UCSM sessions at once. It requires python 3.6+.
+"""
+
+import asyncio
+import logging
+import time
+
+from . import ucsgenutils
+from . import ucscoreutils
+from . import ucsxmlcodec as xc
+from .ucsdriver import TLSConnection
+from .ucseventhandler import mo_change_events_from_xml
+from .ucsexception import UcsException, UcsLoginError, UcsConnectionError
+from .ucssession import _get_port, _get_proto
+
+try:
+    from urllib.parse import urlparse
+except ImportError:
+    from urlparse import urlparse
+
+log = logging.getLogger('ucs')
+
+
+class _AsyncHttpResponse(object):
+    """
+    Body of an http response, read from the connection as it is consumed.
+    Handles Content-Length, chunked and read-until-close bodies.
+    """
+
+    def __init__(self, reader, status, reason, headers):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.__reader = reader
+        self.__chunked = headers.get(
+            "transfer-encoding", "").lower() == "chunked"
+        self.__remaining = None
+        if not self.__chunked and "content-length" in headers:
+            self.__remaining = int(headers["content-length"])
+        self.__buffer = b""
+        self.__eof = False
+
+    @property
+    def complete(self):
+        return self.__eof and not self.__buffer
+
+    async def __fill(self):
+        reader = self.__reader
+        if self.__chunked:
+            size = int((await reader.readline()).split(b";")[0], 16)
+            if size == 0:
+                await reader.readline()
+                self.__eof = True
+                return
+            self.__buffer += await reader.readexactly(size)
+            await reader.readexactly(2)
+        elif self.__remaining is not None:
+            if self.__remaining == 0:
+                self.__eof = True
+                return
+            data = await reader.read(min(self.__remaining, 65536))
+            if not data:
+                raise asyncio.IncompleteReadError(data, self.__remaining)
+            self.__remaining -= len(data)
+            self.__buffer += data
+        else:
+            data = await reader.read(65536)
+            if not data:
+                self.__eof = True
+            self.__buffer += data
+
+    async def read(self):
+        while not self.__eof:
+            await self.__fill()
+        data, self.__buffer = self.__buffer, b""
+        return data
+
+    async def readline(self):
+        while b"\n" not in self.__buffer and not self.__eof:
+            await self.__fill()
+        line, sep, self.__buffer = self.__buffer.partition(b"\n")
+        return line + sep
+
+    async def readexactly(self, size):
+        while len(self.__buffer) < size and not self.__eof:
+            await self.__fill()
+        if len(self.__buffer) < size:
+            raise asyncio.IncompleteReadError(self.__buffer, size)
+        data = self.__buffer[:size]
+        self.__buffer = self.__buffer[size:]
+        return data
+
+
+class _AsyncHttpConnection(object):
+    """
+    A keep-alive http/1.1 client connection on asyncio streams.
+    """
+
+    def __init__(self, reader, writer):
+        self.__reader = reader
+        self.__writer = writer
+        self.keep_alive = True
+
+    @classmethod
+    async def open(cls, host, port, ssl_context=None):
+        reader, writer = await asyncio.open_connection(host, port,
+                                                       ssl=ssl_context)
+        return cls(reader, writer)
+
+    async def request(self, host, path, body):
+        head = ("POST %s HTTP/1.1\r\n"
+                "Host: %s\r\n"
+                "Content-Type: application/x-www-form-urlencoded\r\n"
+                "Content-Length: %d\r\n\r\n" % (path, host, len(body)))
+        self.__writer.write(head.encode("latin-1") + body)
+        await self.__writer.drain()
+
+        status_line = await self.__reader.readline()
+        if not status_line:
+            # the server closed the connection without reading the request
+            raise ConnectionResetError("Remote end closed connection "
+                                       "without response")
+        version, status, reason = (
+            status_line.decode("latin-1").rstrip("\r\n").split(" ", 2) +
+            [""])[:3]
+
+        headers = {}
+        while True:
+            line = await self.__reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        self.keep_alive = connection != "close" and (
+            version != "HTTP/1.0" or connection == "keep-alive")
+        return _AsyncHttpResponse(self.__reader, int(status), reason,
+                                  headers)
+
+    def close(self):
+        self.__writer.close()
+
+
+class AsyncUcsEventSubscription(object):
+    """
+    Events of the event channel of an AsyncUcsHandle, which match a class id
+    and/or a dn. It is an asynchronous iterator of MoChangeEvent.
+
+    Example:
+        subscription = handle.subscribe(class_id="faultInst")\n
+        async for mce in subscription:\n
+            print(mce.mo.dn, mce.change_list)\n
+    """
+
+    def __init__(self, handle, class_id=None, dn=None, capacity=65536):
+        self.__handle = handle
+        self.__class_id = class_id
+        self.__dn = dn
+        self.__queue = asyncio.Queue(capacity)
+        self.overflow = False
+        self.closed = False
+
+    def matches(self, mce):
+        if self.__dn is not None and mce.dn != self.__dn:
+            return False
+        if self.__class_id is not None and mce.class_id != self.__class_id:
+            return False
+        return True
+
+    def enqueue(self, mce):
+        try:
+            self.__queue.put_nowait(mce)
+        except asyncio.QueueFull:
+            self.overflow = True
+
+    async def get(self, timeout=None):
+        """
+        Waits for the next event.
+
+        Args:
+            timeout (float): seconds to wait, None to wait forever
+
+        Returns:
+            MoChangeEvent, or None once the subscription is closed
+        """
+
+        if self.closed and self.__queue.empty():
+            return None
+        return await asyncio.wait_for(self.__queue.get(), timeout)
+
+    def close(self):
+        """Stops receiving events."""
+        if self.closed:
+            return
+        self.closed = True
+        # wakes up a pending get()
+        try:
+            self.__queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+        self.__handle._unsubscribe(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        mce = await self.get()
+        if mce is None:
+            raise StopAsyncIteration
+        return mce
+
+
+class AsyncUcsHandle(object):
+    """
+    AsyncUcsHandle is the asyncio counterpart of UcsHandle. Its requests are
+    sent on non-blocking connections, so that a single event loop can drive
+    hundreds of UCSM sessions concurrently. Requests are built with
+    ucsmethodfactory and responses decoded with ucsxmlcodec, like UcsHandle.
+    Unlike UcsHandle, it does not fall back to TLSv1 for servers which
+    refuse the TLS handshake of the default context.
+
+    Args:
+        ip (str): The IP or Hostname of the UCS Server
+        username (str): The username as configured on the UCS Server
+        password (str): The password as configured on the UCS Server
+        port (int or None): The port number to be used during connection
+        secure (bool or None): True for secure connection, otherwise False
+        max_connections (int): maximum number of requests of this handle in
+            flight at a time, each one on its own keep-alive connection
+
+    Example:
+        handle = AsyncUcsHandle("192.168.1.1","admin","password")\n
+        await handle.login()\n
+        blades = await handle.query_classid("ComputeBlade")\n
+        await handle.logout()\n
+    """
+
+    def __init__(self, ip, username, password, port=None, secure=None,
+                 max_connections=4):
+        port = _get_port(port, secure)
+        protocol = _get_proto(port, secure)
+
+        self.__ip = ip
+        self.__username = username
+        self.__password = password
+        self.__uri = None
+        self.__ssl_context = None
+        self.__set_uri(protocol, ip, port)
+
+        self.__ucs = ip
+        self.__name = None
+        self.__cookie = None
+        self.__session_id = None
+        self.__version = None
+        self.__refresh_period = None
+        self.__priv = None
+        self.__domains = None
+        self.__channel = None
+        self.__evt_channel = None
+        self.__last_update_time = None
+
+        self.__dump_xml = False
+        self.__max_connections = max_connections
+        self.__connection_slots = None
+        self.__idle_connections = []
+        self.__refresh_task = None
+        self.__event_task = None
+        self.__subscriptions = []
+        self.__commit_buf = {}
+
+    @property
+    def ip(self):
+        return self.__ip
+
+    @property
+    def username(self):
+        return self.__username
+
+    @property
+    def uri(self):
+        return self.__uri
+
+    @property
+    def ucs(self):
+        return self.__ucs
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def cookie(self):
+        return self.__cookie
+
+    @property
+    def session_id(self):
+        return self.__session_id
+
+    @property
+    def version(self):
+        from .ucscoremeta import UcsVersion
+        return UcsVersion(self.__version)
+
+    @property
+    def refresh_period(self):
+        return self.__refresh_period
+
+    @property
+    def priv(self):
+        return self.__priv
+
+    @property
+    def domains(self):
+        return self.__domains
+
+    @property
+    def channel(self):
+        return self.__channel
+
+    @property
+    def evt_channel(self):
+        return self.__evt_channel
+
+    @property
+    def last_update_time(self):
+        return self.__last_update_time
+
+    def set_dump_xml(self):
+        """
+        Enables the logging of xml requests and responses.
+        """
+
+        self.__dump_xml = True
+
+    def unset_dump_xml(self):
+        """
+        Disables the logging of xml requests and responses.
+        """
+
+        self.__dump_xml = False
+
+    def __clear(self):
+        self.__name = None
+        self.__cookie = None
+        self.__session_id = None
+        self.__version = None
+        self.__refresh_period = None
+        self.__priv = None
+        self.__domains = None
+        self.__channel = None
+        self.__evt_channel = None
+        self.__last_update_time = str(time.asctime())
+
+    def __update(self, response):
+        self.__name = response.out_name
+        self.__cookie = response.out_cookie
+        self.__session_id = response.out_session_id
+        self.__version = response.out_version
+        self.__refresh_period = int(response.out_refresh_period)
+        self.__priv = response.out_priv
+        self.__domains = response.out_domains
+        self.__channel = response.out_channel
+        self.__evt_channel = response.out_evt_channel
+        self.__last_update_time = str(time.asctime())
+
+    def __set_uri(self, protocol, host, port):
+        self.__uri = "%s://%s:%s" % (protocol, host, port)
+        self.__ssl_context = None
+        if protocol == "https":
+            self.__ssl_context = TLSConnection.create_ssl_context()
+
+    def __host(self):
+        return urlparse(self.__uri).netloc
+
+    async def __connect(self):
+        parsed = urlparse(self.__uri)
+        return await _AsyncHttpConnection.open(parsed.hostname, parsed.port,
+                                               self.__ssl_context)
+
+    async def __send(self, body):
+        """
+        Sends the request on an idle connection, or on a new one.
+        A request that a reused connection dropped without answering is
+        sent again on a new connection, no other request is ever replayed.
+        """
+
+        while self.__idle_connections:
+            conn = self.__idle_connections.pop()
+            try:
+                return conn, await conn.request(self.__host(), "/nuova",
+                                                body)
+            except (ConnectionResetError, BrokenPipeError):
+                conn.close()
+
+        conn = await self.__connect()
+        try:
+            return conn, await conn.request(self.__host(), "/nuova", body)
+        except Exception:
+            conn.close()
+            raise
+
+    async def post_xml(self, xml_str):
+        """
+        sends the xml request and receives the response from ucsm server
+
+        Args:
+            xml_str (bytes): xml string
+
+        Returns:
+            response xml string
+
+        Example:
+            response = await post_xml(b'<aaaLogin inName="user" '
+                                      b'inPassword="pass">')
+        """
+
+        if self.__connection_slots is None:
+            self.__connection_slots = asyncio.Semaphore(
+                self.__max_connections)
+
+        async with self.__connection_slots:
+            for _ in range(2):
+                conn, response = await self.__send(xml_str)
+                try:
+                    data = await response.read()
+                except Exception:
+                    conn.close()
+                    raise
+
+                if conn.keep_alive:
+                    self.__idle_connections.append(conn)
+                else:
+                    conn.close()
+
+                if response.status in (301, 302) and \
+                        response.headers.get("location"):
+                    location = urlparse(response.headers["location"])
+                    host = location.hostname
+                    if ":" in host:
+                        host = "[%s]" % host
+                    port = location.port or (
+                        443 if location.scheme == "https" else 80)
+                    self.__set_uri(location.scheme, host, port)
+                    self.close_connections()
+                    continue
+                break
+
+        if response.status >= 400:
+            raise UcsConnectionError("HTTP Error %d: %s" % (response.status,
+                                                            response.reason))
+        return data.decode('utf-8')
+
+    async def post_elem(self, elem):
+        """
+        sends the request and receives the response from ucsm server using
+        xml element
+
+        Args:
+            elem (xml element)
+
+        Returns:
+            response xml string
+
+        Example:
+            response = await post_elem(elem=xml_element)
+        """
+
+        if 'cookie' in elem.attrib and elem.attrib['cookie'] != "" and \
+                elem.attrib['cookie'] != self.__cookie:
+            elem.attrib['cookie'] = self.__cookie
+
+        xml_str = xc.to_xml_str(elem)
+        if self.__dump_xml:
+            if elem.tag == "aaaLogin":
+                log.debug('%s ====> %s' % (
+                    self.__uri, xml_str.replace(
+                        self.__password.encode(), b"*********")))
+            else:
+                log.debug('%s ====> %s' % (self.__uri, xml_str))
+
+        response_str = await self.post_xml(xml_str)
+        if self.__dump_xml:
+            log.debug('%s <==== %s' % (self.__uri, response_str))
+
+        response = xc.from_xml_str(response_str, self)
+        if elem.tag == "aaaRefresh" and response.error_code == 0:
+            self.__cookie = response.out_cookie
+        return response
+
+    async def __post_method(self, elem):
+        response = await self.post_elem(elem)
+        if response.error_code != 0:
+            raise UcsException(response.error_code, response.error_descr)
+        return response
+
+    def close_connections(self):
+        """
+        Closes the idle connections of the handle.
+        """
+
+        for conn in self.__idle_connections:
+            conn.close()
+        self.__idle_connections = []
+
+    async def login(self, auto_refresh=False, force=False):
+        """
+        Initiates a connection to the server referenced by the
+        AsyncUcsHandle. A cookie is populated in the handle on successful
+        login.
+
+        Args:
+            auto_refresh (bool): if set to True, it refresh the cookie
+                continuously, from a task of the running event loop
+            force (bool): if set to True it reconnects even if cookie exists
+                and is valid for respective connection.
+
+        Returns:
+            True on successful connect
+
+        Example:
+            await handle.login()\n
+            await handle.login(auto_refresh=True)\n
+        """
+
+        from .mometa.top.TopSystem import TopSystem
+        from .mometa.firmware.FirmwareRunning import FirmwareRunning, \
+            FirmwareRunningConsts
+        from .ucsmethodfactory import aaa_login, config_resolve_class, \
+            config_resolve_dn
+
+        if self.__cookie:
+            if not force:
+                elem = config_resolve_dn(cookie=self.__cookie,
+                                         dn=TopSystem().dn)
+                response = await self.post_elem(elem)
+                if response.error_code == 0:
+                    return True
+            else:
+                await self.logout()
+
+        elem = aaa_login(in_name=self.__username,
+                         in_password=self.__password)
+        response = await self.post_elem(elem)
+        if response.error_code != 0:
+            self.__clear()
+            raise UcsException(response.error_code, response.error_descr)
+        self.__update(response)
+
+        # Verify not to connect to IMC
+        elem = config_resolve_class(cookie=self.__cookie, in_filter=None,
+                                    class_id="networkElement")
+        try:
+            response = await self.post_elem(elem)
+        except Exception:
+            response = None
+        if response is None or response.error_code != 0:
+            await self.logout()
+            raise UcsLoginError("Not a supported server.")
+
+        if not self.__version:
+            firmware = FirmwareRunning(TopSystem(),
+                                       FirmwareRunningConsts.DEPLOYMENT_SYSTEM)
+            elem = config_resolve_dn(cookie=self.__cookie, dn=firmware.dn)
+            response = await self.__post_method(elem)
+            self.__version = response.out_config.child[0].version
+
+        elem = config_resolve_dn(cookie=self.__cookie, dn=TopSystem().dn)
+        response = await self.__post_method(elem)
+        self.__ucs = response.out_config.child[0].name
+
+        if auto_refresh:
+            self.__refresh_task = asyncio.ensure_future(
+                self.__refresh_loop())
+        return True
+
+    async def __refresh_loop(self):
+        from .ucsmethodfactory import aaa_refresh
+
+        while self.__cookie:
+            interval = max(60, int(self.__refresh_period) - 60)
+            await asyncio.sleep(interval)
+            elem = aaa_refresh(self.__cookie, self.__username,
+                               self.__password)
+            response = await self.post_elem(elem)
+            if response.error_code != 0:
+                log.debug("Session refresh failed: %s" %
+                          response.error_descr)
+                self.__cookie = None
+                return
+            self.__refresh_period = int(response.out_refresh_period)
+            self.__priv = response.out_priv.split(',')
+            self.__domains = response.out_domains
+            self.__last_update_time = str(time.asctime())
+
+    async def logout(self):
+        """
+        Disconnects from the server referenced by the AsyncUcsHandle.
+
+        Returns:
+            True on successful disconnect
+
+        Example:
+            await handle.logout()
+        """
+
+        from .ucsmethodfactory import aaa_logout
+
+        if self.__cookie is None:
+            return True
+
+        for subscription in list(self.__subscriptions):
+            subscription.close()
+        if self.__refresh_task is not None:
+            self.__refresh_task.cancel()
+            self.__refresh_task = None
+
+        elem = aaa_logout(self.__cookie, 301)
+        response = await self.post_elem(elem)
+        if response.error_code == "555":
+            return True
+        if response.error_code != 0:
+            raise UcsException(response.error_code, response.error_descr)
+
+        self.__clear()
+        self.close_connections()
+        return True
+
+    async def query_dn(self, dn, hierarchy=False):
+        """
+        Finds an object using it's distinguished name.
+
+        Args:
+            dn (str): distinguished name of the object to be queried for.
+            hierarchy(bool): True/False,
+                                get all objects in hierarchy if True
+
+        Returns:
+            managedobject or None   by default\n
+            managedobject list      if hierarchy=True\n
+
+        Example:
+            obj = await handle.query_dn("fabric/lan/net-100")\n
+            obj = await handle.query_dn("fabric/lan/net-100", hierarchy=True)\n
+        """
+
+        from .ucsbasetype import DnSet, Dn
+        from .ucsmethodfactory import config_resolve_dns
+
+        if not dn:
+            raise ValueError("Provide dn.")
+
+        dn_set = DnSet()
+        dn_obj = Dn()
+        dn_obj.value = dn
+        dn_set.child_add(dn_obj)
+
+        elem = config_resolve_dns(cookie=self.__cookie, in_dns=dn_set,
+                                  in_hierarchical=hierarchy)
+        response = await self.__post_method(elem)
+        if hierarchy:
+            return ucscoreutils.extract_molist_from_method_response(
+                response, hierarchy)
+
+        if len(response.out_configs.child) > 0:
+            return response.out_configs.child[0]
+        return None
+
+    def __in_filter(self, class_id, filter_str):
+        from .ucsfilter import generate_infilter
+
+        meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+            class_id)
+        if meta_class_id:
+            is_meta_class_id = True
+        else:
+            meta_class_id = class_id
+            is_meta_class_id = False
+
+        in_filter = None
+        if filter_str:
+            in_filter = generate_infilter(meta_class_id, filter_str,
+                                          is_meta_class_id)
+        return meta_class_id, in_filter
+
+    async def query_classid(self, class_id=None, filter_str=None,
+                            hierarchy=False):
+        """
+        Finds an object using it's class id.
+
+        Args:
+            class_id (str): class id of the object to be queried for.
+            filter_str(str): query objects with specific property with
+                specific value or pattern specifying value.
+                Same syntax as UcsHandle.query_classid.
+            hierarchy(bool): if set to True will return all the child
+                hierarchical objects.
+
+        Returns:
+            managedobjectlist
+
+        Example:
+            obj = await handle.query_classid(class_id="LsServer")\n
+            obj = await handle.query_classid(class_id="LsServer",
+                                    filter_str='(dn,"ls-sp", type="re")')\n
+        """
+
+        from .ucsmethodfactory import config_resolve_class
+
+        if not class_id:
+            raise ValueError("Provide Parameter class_id")
+
+        meta_class_id, in_filter = self.__in_filter(class_id, filter_str)
+        elem = config_resolve_class(cookie=self.__cookie,
+                                    class_id=meta_class_id,
+                                    in_filter=in_filter,
+                                    in_hierarchical=hierarchy)
+        response = await self.__post_method(elem)
+        return ucscoreutils.extract_molist_from_method_response(response,
+                                                                hierarchy)
+
+    async def query_children(self, in_mo=None, in_dn=None, class_id=None,
+                             filter_str=None, hierarchy=False):
+        """
+        Finds children of a given managed object or distinguished name.
+
+        Args:
+            in_mo (managed object): query children managed object under this
+                                        object.
+            in_dn (dn string): query children managed object for a
+                                given managed object of the respective dn.
+            class_id(str): by default None, if given find only specific
+                            children object for a given class_id.
+            filter_str(str): query objects with specific property with
+                specific value or pattern specifying value.
+                Same syntax as UcsHandle.query_children.
+            hierarchy(bool): if set to True will return all the child
+                             hierarchical objects.
+
+        Returns:
+            managedobjectlist
+
+        Example:
+            mo_list = await handle.query_children(in_dn="org-root",
+                                                  class_id="LsServer")\n
+        """
+
+        from .ucsmethodfactory import config_resolve_children
+
+        if not in_mo and not in_dn:
+            raise ValueError('[Error]: GetChild: Provide in_mo or in_dn.')
+
+        parent_dn = in_mo.dn if in_mo else in_dn
+        in_filter = None
+        if class_id:
+            class_id, in_filter = self.__in_filter(class_id, filter_str)
+
+        elem = config_resolve_children(cookie=self.__cookie,
+                                       class_id=class_id,
+                                       in_dn=parent_dn,
+                                       in_filter=in_filter,
+                                       in_hierarchical=hierarchy)
+        response = await self.__post_method(elem)
+        return ucscoreutils.extract_molist_from_method_response(response,
+                                                                hierarchy)
+
+    def add_mo(self, mo, modify_present=False):
+        """
+        Adds a managed object to the commit buffer.
+        This needs to be followed by an await handle.commit().
+
+        Args:
+            mo (managedobject): ManagedObject to be added.
+            modify_present (bool): True/False,
+                                    overwrite existing object if True
+
+        Example:
+            handle.add_mo(mo)\n
+            await handle.commit()\n
+        """
+
+        if modify_present in ucsgenutils.AFFIRMATIVE_LIST:
+            mo.status = "created,modified"
+        else:
+            mo.status = "created"
+        self.__commit_buf[mo.dn] = mo
+
+    def set_mo(self, mo):
+        """
+        Adds a modified managed object to the commit buffer.
+        This needs to be followed by an await handle.commit().
+
+        Args:
+            mo (managedobject): Managed object with modified properties.
+
+        Example:
+            handle.set_mo(mo)\n
+            await handle.commit()\n
+        """
+
+        mo.status = "modified"
+        self.__commit_buf[mo.dn] = mo
+
+    def remove_mo(self, mo):
+        """
+        Adds the removal of a managed object to the commit buffer.
+        This needs to be followed by an await handle.commit().
+
+        Args:
+            mo (managedobject): Managed object to be removed.
+
+        Example:
+            handle.remove_mo(mo)\n
+            await handle.commit()\n
+        """
+
+        mo.status = "deleted"
+        if mo.parent_mo:
+            mo.parent_mo.child_remove(mo)
+        self.__commit_buf[mo.dn] = mo
+
+    def commit_buffer_discard(self):
+        """
+        Discards the commit buffer.
+        """
+
+        self.__commit_buf = {}
+
+    async def commit(self):
+        """
+        Commits the buffer to the server, in a single configConfMos request.
+        The buffer is discarded, whether the commit succeeds or not.
+
+        Example:
+            await handle.commit()\n
+        """
+
+        from .ucsbasetype import ConfigMap, Dn, DnSet, Pair
+        from .ucsmethodfactory import config_conf_mos, config_resolve_dns
+
+        mo_dict, self.__commit_buf = self.__commit_buf, {}
+        if not mo_dict:
+            return None
+
+        refresh_dict = {}
+        config_map = ConfigMap()
+        for mo_dn, mo in mo_dict.items():
+            child_list = mo.child
+            while len(child_list) > 0:
+                current_child_list = child_list
+                child_list = []
+                for child_mo in current_child_list:
+                    if child_mo.is_dirty():
+                        refresh_dict[child_mo.dn] = child_mo
+                    child_list.extend(child_mo.child)
+
+            pair = Pair()
+            pair.key = mo_dn
+            pair.child_add(mo)
+            config_map.child_add(pair)
+
+        elem = config_conf_mos(self.__cookie, config_map, False)
+        response = await self.__post_method(elem)
+        for pair_ in response.out_configs.child:
+            for out_mo in pair_.child:
+                out_mo.sync_mo(mo_dict[out_mo.dn])
+
+        if refresh_dict:
+            dn_set = DnSet()
+            for dn_ in refresh_dict:
+                dn_obj = Dn()
+                dn_obj.value = dn_
+                dn_set.child_add(dn_obj)
+
+            elem = config_resolve_dns(cookie=self.__cookie, in_dns=dn_set)
+            response = await self.__post_method(elem)
+            for out_mo in response.out_configs.child:
+                out_mo.sync_mo(refresh_dict[out_mo.dn])
+
+    def subscribe(self, class_id=None, dn=None, capacity=65536):
+        """
+        Subscribes to the events of the objects of a class id and/or a dn.
+        All the subscriptions of the handle share one event channel, opened
+        with the first subscription and closed with the last one.
+
+        Args:
+            class_id (str): class id of the objects, None for all
+            dn (str): dn of the object, None for all
+            capacity (int): events queued before the subscription overflows
+
+        Returns:
+            AsyncUcsEventSubscription object
+
+        Example:
+            async for mce in handle.subscribe(class_id="faultInst"):\n
+                print(mce.mo.dn, mce.change_list)\n
+        """
+
+        if class_id:
+            class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+                class_id) or class_id
+        subscription = AsyncUcsEventSubscription(self, class_id, dn,
+                                                 capacity)
+        self.__subscriptions.append(subscription)
+        if self.__event_task is None:
+            self.__event_task = asyncio.ensure_future(self.__event_loop())
+        return subscription
+
+    def _unsubscribe(self, subscription):
+        if subscription in self.__subscriptions:
+            self.__subscriptions.remove(subscription)
+        if not self.__subscriptions and self.__event_task is not None:
+            self.__event_task.cancel()
+            self.__event_task = None
+
+    async def __event_loop(self):
+        """
+        Reads the event channel and dispatches the events to the
+        subscriptions.
+        """
+
+        body = ('<eventSubscribe cookie="%s"/>' % self.__cookie).encode()
+        conn = await self.__connect()
+        try:
+            response = await conn.request(self.__host(), "/nuova", body)
+            while self.__subscriptions:
+                length = await response.readline()
+                if not length:
+                    break
+                if not length.strip():
+                    continue
+                xml_str = await response.readexactly(int(length))
+                for mce in mo_change_events_from_xml(xml_str):
+                    for subscription in self.__subscriptions:
+                        if subscription.matches(mce):
+                            subscription.enqueue(mce)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            log.debug("Event channel closed: %s" % str(e))
+        finally:
+            conn.close()
+            # the subscriptions end with the channel
+            self.__event_task = None
+            for subscription in list(self.__subscriptions):
+                subscription.close()
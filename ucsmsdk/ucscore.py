@@ -65,6 +65,11 @@ class UcsBase(object):
         """Method removes the child managed object."""
         self._child.remove(obj)
 
+    def child_remove_all(self):
+        """Method removes all the child managed objects and returns them."""
+        children, self._child = self._child, []
+        return children
+
     def child_count(self):
         """Method returns the child managed object count."""
         return len(self._child)
@@ -191,7 +196,7 @@ class BaseObject(UcsBase):
                 self.attr_set(ucsgenutils.convert_to_python_var_name(
                     attr_name), str(attr_value))
 
-        child_elems = elem.getchildren()
+        child_elems = list(elem)
         if child_elems:
             for child_elem in child_elems:
                 if not ET.iselement(child_elem):
@@ -18,8 +18,15 @@ This module contains all the base classes for the Meta.
 import re
 import logging
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
 log = logging.getLogger('ucs')
 
+_RANGE_PATTERN = re.compile(r"""^(?P<min>[0-9]{1,})\-(?P<max>[0-9]{1,})$""")
+
 
 class WriteXmlOption(object):
     """Class used as enum."""
@@ -42,7 +49,18 @@ class UcsVersion(object):
             return None
 
         self.__version = version
+        self.__parsed = False
+
+    def __parse(self):
+        # the generated meta creates every version at import, the version
+        # string is only parsed when the version is compared
+        if self.__parsed:
+            return
+        self.__parse_version(self.__version)
+        # set last, other threads read the fields once this is set
+        self.__parsed = True
 
+    def __parse_version(self, version):
         match_pattern = re.compile("^(?P<major>[1-9][0-9]{0,2})\."
                                    "(?P<minor>(([0-9])|([1-9][0-9]{0,1})))\("
                                    "(?P<mr>(([0-9])|([1-9][0-9]{0,2})))\."
@@ -80,21 +98,25 @@ class UcsVersion(object):
     @property
     def major(self):
         """Getter Method of UcsVersion Class"""
+        self.__parse()
         return self.__major
 
     @property
     def minor(self):
         """Getter Method of UcsVersion Class"""
+        self.__parse()
         return self.__minor
 
     @property
     def mr(self):
         """Getter Method of UcsVersion Class"""
+        self.__parse()
         return self.__mr
 
     @property
     def patch(self):
         """Getter Method of UcsVersion Class"""
+        self.__parse()
         return self.__patch
 
     @property
@@ -107,6 +129,7 @@ class UcsVersion(object):
         if version is None or not isinstance(version, UcsVersion):
             return 1
 
+        self.__parse()
         if self.__major != version.major:
             return ord(self.__major) - ord(version.major)
         if self.__minor != version.minor:
@@ -207,6 +230,8 @@ class MoPropertyMeta(object):
         self.__restriction = MoPropertyRestriction(min_length, max_length,
                                                    pattern, value_set,
                                                    range_val)
+        # (ranges, regex, value_set) compiled from the restriction
+        self.__validator = None
 
     @property
     def name(self):
@@ -243,6 +268,40 @@ class MoPropertyMeta(object):
         """Getter Method of MoPropertyMeta Class"""
         return self.__restriction
 
+    def __compile_restriction(self):
+        """
+        Internal method to turn the restriction into reusable validation
+        data, on first use.
+        """
+
+        restriction = self.__restriction
+
+        ranges = None
+        if restriction.range_val:
+            ranges = []
+            for rest_range in restriction.range_val:
+                match = _RANGE_PATTERN.match(rest_range)
+                if match:
+                    ranges.append((int(match.group("min")),
+                                   int(match.group("max"))))
+            ranges = tuple(ranges)
+
+        regex = None
+        if restriction.pattern and restriction.value_set:
+            regex = re.compile(
+                "^" + str(restriction.pattern) + "%s%s$" % (
+                    '|' if restriction.value_set else '',
+                    '|'.join(['(' + x + ')'
+                              for x in restriction.value_set])))
+        elif restriction.pattern:
+            regex = re.compile("^" + restriction.pattern + "$")
+
+        value_set = None
+        if restriction.value_set:
+            value_set = frozenset(restriction.value_set)
+
+        self.__validator = (ranges, regex, value_set)
+
     def validate_property_value(self, input_value):
         """validate property value of mo."""
         error_msg = None
@@ -251,6 +310,10 @@ class MoPropertyMeta(object):
             log.debug("<%s> Value should not be None" % self.name)
             return False
 
+        if self.__validator is None:
+            self.__compile_restriction()
+        ranges, regex, value_set = self.__validator
+
         if self.__restriction.min_length:
             if len(input_value) >= self.__restriction.min_length:
                 return True
@@ -266,51 +329,23 @@ class MoPropertyMeta(object):
                 error_msg = (str(self.name) + " maximum character should be " +
                              str(self.__restriction.max_length))
 
-        if self.__restriction.range_val and str(input_value).isdigit() \
-                and len(self.__restriction.range_val) > 0:
-            fits_in_range = False
+        if ranges is not None and str(input_value).isdigit():
             value = int(input_value)
-            for rest_range in self.__restriction.range_val:
-                match = re.match(
-                    r"""^(?P<min>[0-9]{1,})\-(?P<max>[0-9]{1,})$""",
-                    rest_range, 0)
-                if match:
-                    min_ = int(match.group("min"))
-                    max_ = int(match.group("max"))
-                else:
-                    continue
-
-                if min_ <= value and max_ >= value:
-                    fits_in_range = True
-                    break
-            if fits_in_range:
-                return True
-            else:
-                error_msg = ("Value " + str(value) +
-                             " does not fit the range" +
-                             str(self.__restriction.range_val))
-
-        if self.__restriction.pattern and self.__restriction.value_set:
-            pattern = "^" + str(self.__restriction.pattern) + "%s%s$" % (
-                '|' if self.__restriction.value_set else '',
-                '|'.join(['('+x+')' for x in self.__restriction.value_set]))
-            match = re.match(pattern, input_value, 0)
-            if match:
-                return True
-            else:
-                error_msg = (str(self.name) + " should adhere to regex " +
-                             str(pattern))
-        elif self.__restriction.pattern:
-            pattern = "^" + self.__restriction.pattern + "$"
-            match = re.match(pattern, input_value, 0)
-            if match:
+            for min_, max_ in ranges:
+                if min_ <= value <= max_:
+                    return True
+            error_msg = ("Value " + str(value) +
+                         " does not fit the range" +
+                         str(self.__restriction.range_val))
+
+        if regex is not None:
+            if regex.match(input_value):
                 return True
             else:
                 error_msg = (str(self.name) + " should adhere to regex " +
-                             str(pattern))
-        elif self.__restriction.value_set \
-                and len(self.__restriction.value_set) > 0:
-            if input_value in self.__restriction.value_set:
+                             str(regex.pattern))
+        elif value_set is not None:
+            if input_value in value_set:
                 return True
             else:
                 error_msg = (str(self.name) + " valid values are " +
@@ -435,6 +470,56 @@ class MoMeta(object):
         return self.__verbs
 
 
+class MoMetaIndex(Mapping):
+    """
+    Read-only mapping of class id to MoMeta, over the compact index of a
+    generated module. The index is imported on first use, and the MoMeta
+    of a class is only created the first time it is read.
+
+    Args:
+        index_module (str): module name of the index, with a MO_CLASS_INDEX
+            dict of class id -> (xml_attribute, rn, version, inp_out, mask,
+            field_names, access, parents, children, verbs)
+        version_meta (class): class with the UcsVersion named by the index
+    """
+
+    def __init__(self, index_module, version_meta):
+        self.__index_module = index_module
+        self.__version_meta = version_meta
+        self.__index = None
+        self.__metas = {}
+
+    def __get_index(self):
+        if self.__index is None:
+            self.__index = __import__(
+                self.__index_module,
+                fromlist=["MO_CLASS_INDEX"]).MO_CLASS_INDEX
+        return self.__index
+
+    def __getitem__(self, class_id):
+        meta = self.__metas.get(class_id)
+        if meta is not None:
+            return meta
+
+        (xml_attribute, rn, version, inp_out, mask, field_names, access,
+         parents, children, verbs) = self.__get_index()[class_id]
+        meta = MoMeta(class_id, xml_attribute, rn,
+                      getattr(self.__version_meta, version), inp_out, mask,
+                      list(field_names), list(access), list(parents),
+                      list(children), list(verbs))
+        # concurrent readers of a class get the same meta
+        return self.__metas.setdefault(class_id, meta)
+
+    def __contains__(self, class_id):
+        return class_id in self.__get_index()
+
+    def __iter__(self):
+        return iter(self.__get_index())
+
+    def __len__(self):
+        return len(self.__get_index())
+
+
 class MethodPropertyMeta(object):
     """
     This class handles the meta information of the properties of
@@ -20,6 +20,7 @@ from __future__ import print_function
 import os
 import re
 import logging
+from collections import namedtuple
 
 from . import ucsgenutils
 from . import mometa
@@ -30,6 +31,27 @@ from . ucsmeta import MO_CLASS_ID, METHOD_CLASS_ID, OTHER_TYPE_CLASS_ID, \
 
 log = logging.getLogger('ucs')
 
+try:
+    from inspect import getfullargspec as _getargspec
+except ImportError:
+    from inspect import getargspec as _getargspec
+
+
+MoClassInfo = namedtuple("MoClassInfo",
+                         ["mo_class", "naming_props", "top_root"])
+
+# class_id -> MoClassInfo, filled once per class on first use
+_mo_class_info = {}
+
+# "mo" or "method" -> {lowercase class_id: class_id}, built on first use
+_class_id_lower_maps = {}
+
+# "mo" -> {trigram: class_ids whose lowercase form contains it}, built on
+# first use
+_class_id_trigrams = {}
+
+_REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+
 
 def get_ucs_obj(class_id, elem, mo_obj=None):
     """
@@ -45,19 +67,14 @@ def get_ucs_obj(class_id, elem, mo_obj=None):
         object of type ExternalMethod or ManagedObject or GenericMo
     """
 
-    import inspect
-
     from . import ucsmethod
     from . import ucsmo
 
     if class_id in METHOD_CLASS_ID:
         return ucsmethod.ExternalMethod(class_id)
     elif class_id in MO_CLASS_ID:
-        mo_class = load_class(class_id)
-        mo_class_params = inspect.getargspec(mo_class.__init__)[0][2:]
-        mo_class_param_dict = {}
-        for param in mo_class_params:
-            mo_class_param_dict[param] = None
+        mo_class, naming_props, top_root = load_mo_class_info(class_id)
+        mo_class_param_dict = dict.fromkeys(naming_props)
 
         p_dn = ""
         if "dn" in elem.attrib:
@@ -65,7 +82,7 @@ def get_ucs_obj(class_id, elem, mo_obj=None):
         elif "rn" in elem.attrib and mo_obj:
             p_dn = mo_obj.dn
 
-        if 'topRoot' in mo_class.mo_meta.parents:
+        if top_root:
             mo_obj = mo_class(from_xml_response=True, **mo_class_param_dict)
         else:
             mo_obj = mo_class(parent_mo_or_dn=p_dn,
@@ -161,6 +178,40 @@ def load_class(class_id):
     return imported_class
 
 
+def load_mo_class_info(class_id):
+    """
+    Returns the class of a managed object along with the names of its
+    naming properties, in the order expected by the constructor, and
+    whether its parent is topRoot.
+    The lookup is done once per class and cached.
+
+    Args:
+        class_id (str): class_id
+
+    Returns:
+        MoClassInfo or None
+
+    Example:
+        mo_class, naming_props, top_root = load_mo_class_info("LsServer")
+    """
+
+    info = _mo_class_info.get(class_id)
+    if info is not None:
+        return info
+
+    mo_class = load_class(class_id)
+    if mo_class is None:
+        return None
+
+    naming_props = tuple(
+        arg for arg in _getargspec(mo_class.__init__)[0]
+        if arg not in ("self", "parent_mo_or_dn"))
+    info = MoClassInfo(mo_class, naming_props,
+                       'topRoot' in mo_class.mo_meta.parents)
+    _mo_class_info[class_id] = info
+    return info
+
+
 def load_mo(elem):
     """
     This loads the managed object  into the current name space
@@ -173,13 +224,10 @@ def load_mo(elem):
         MangedObject
     """
 
-    import inspect
-
     mo_class_id = elem.tag
-    mo_class = load_class(mo_class_id)
-    mo_class_params = inspect.getargspec(mo_class.__init__)[0][2:]
+    mo_class, naming_props, top_root = load_mo_class_info(mo_class_id)
     mo_class_param_dict = {}
-    for param in mo_class_params:
+    for param in naming_props:
         mo_class_param_dict[param] = elem.attrib[
             mo_class.prop_map[param]]
 
@@ -196,6 +244,22 @@ def is_valid_class_id(class_id):
     return False
 
 
+def _class_id_lower_map(kind):
+    """
+    Returns the map of lowercase class_id to class_id of the mo or method
+    class ids.
+    """
+
+    lower_map = _class_id_lower_maps.get(kind)
+    if lower_map is None:
+        class_ids = {"mo": MO_CLASS_ID,
+                     "method": METHOD_CLASS_ID}[kind]
+        lower_map = dict((class_id.lower(), class_id)
+                         for class_id in class_ids)
+        _class_id_lower_maps[kind] = lower_map
+    return lower_map
+
+
 def find_class_id_in_mo_meta_ignore_case(class_id):
     """
     Methods whether class_id is valid or not . Given class is case insensitive.
@@ -205,12 +269,7 @@ def find_class_id_in_mo_meta_ignore_case(class_id):
         return None
     if class_id in MO_CLASS_ID:
         return class_id
-    # print class_id
-    l_class_id = class_id.lower()
-    for key in MO_CLASS_ID:
-        if key.lower() == l_class_id:
-            return key
-    return None
+    return _class_id_lower_map("mo").get(class_id.lower())
 
 
 def find_class_id_in_method_meta_ignore_case(class_id):
@@ -220,11 +279,7 @@ def find_class_id_in_method_meta_ignore_case(class_id):
 
     if class_id in METHOD_CLASS_ID:
         return class_id
-    l_class_id = class_id.lower()
-    for key in METHOD_CLASS_ID:
-        if key.lower() == l_class_id:
-            return key
-    return None
+    return _class_id_lower_map("method").get(class_id.lower())
 
 
 def get_mo_property_meta(class_id, key):
@@ -279,8 +334,79 @@ def write_object(mo_or_list):
         print(mo_or_list)
 
 
+def _flatten_levels(mo_list):
+    """
+    Returns the managed objects of mo_list and their descendants, level by
+    level. The children are taken off their parents at once, so that
+    flattening stays linear in the number of objects.
+    """
+
+    flat_mo_list = []
+    current_mo_list = list(mo_list)
+    while current_mo_list:
+        flat_mo_list.extend(current_mo_list)
+        child_mo_list = []
+        for mo in current_mo_list:
+            children = mo.child_remove_all()
+            for child in children:
+                child.mark_clean()
+            child_mo_list.extend(children)
+        current_mo_list = child_mo_list
+    return flat_mo_list
+
+
+def flatten_mo_tree(mo):
+    """
+    Detaches the descendants of a managed object from their parents, the way
+    query results are returned with hierarchy.
+
+    Args:
+        mo (ManagedObject): root of the tree
+
+    Returns:
+        List of ManagedObjects, the object first and then its descendants,
+        breadth first
+
+    Example:
+        blade = handle.query_dn("sys/chassis-1/blade-1", need_response=True)\n
+        molist = flatten_mo_tree(blade.out_configs.child[0])
+    """
+
+    return _flatten_levels([mo])
+
+
+def iter_mo_tree(mo_or_list):
+    """
+    Iterates over managed objects and all their descendants, breadth first,
+    leaving the tree intact: every object keeps its children.
+
+    Args:
+        mo_or_list (ManagedObject or list): root or roots of the trees
+
+    Returns:
+        generator of ManagedObjects
+
+    Example:
+        sys = handle.query_dn("sys", need_response=True)\n
+        for mo in iter_mo_tree(sys.out_configs.child):\n
+            print(mo.dn)\n
+    """
+
+    if isinstance(mo_or_list, list):
+        current_mo_list = mo_or_list
+    else:
+        current_mo_list = [mo_or_list]
+    while current_mo_list:
+        child_mo_list = []
+        for mo in current_mo_list:
+            yield mo
+            child_mo_list.extend(mo.child)
+        current_mo_list = child_mo_list
+
+
 def extract_molist_from_method_response(method_response,
-                                        in_hierarchical=False):
+                                        in_hierarchical=False,
+                                        keep_tree=False):
     """
     Methods extracts mo list from response received from ucs server i.e.
     external method object
@@ -289,36 +415,31 @@ def extract_molist_from_method_response(method_response,
         method_response (ExternalMethod Object): response
         in_hierarchical (bool): if True, return all the hierarchical child of
                                     managed objects
+        keep_tree (bool): if True with in_hierarchical, the children are not
+                            detached from their parents, and a generator
+                            over the objects is returned instead of a list
 
     Returns:
-        List of ManagedObjects
+        List of ManagedObjects, or generator of ManagedObjects if keep_tree
 
     Example:
         response = handle.query_dn("org-root", need_response=True)\n
         molist = extract_molist_from_method_response(method_response=response,
-                                                     in_hierarchical=True)
-    """
-
-    mo_list = []
-    if len(method_response.out_configs.child) == 0:
-        return mo_list
+                                                     in_hierarchical=True)\n
+        for mo in extract_molist_from_method_response(response,
+                                                      in_hierarchical=True,
+                                                      keep_tree=True):\n
+            print(mo.dn)\n
+    """
+
+    out_mo_list = method_response.out_configs.child
+    if in_hierarchical and keep_tree:
+        return iter_mo_tree(out_mo_list)
+    if len(out_mo_list) == 0:
+        return []
     if in_hierarchical:
-        current_mo_list = method_response.out_configs.child
-        while len(current_mo_list) > 0:
-            child_mo_list = []
-            for mo in current_mo_list:
-                mo_list.append(mo)
-                while mo.child_count() > 0:
-                    for child in mo.child:
-                        mo.child_remove(child)
-                        child.mark_clean()
-                        child_mo_list.append(child)
-                        break
-            current_mo_list = child_mo_list
-    else:
-        mo_list = method_response.out_configs.child
-
-    return mo_list
+        return _flatten_levels(out_mo_list)
+    return out_mo_list
 
 
 def write_mo_tree(mo, level=0, depth=None, show_level=[],
@@ -488,14 +609,13 @@ def get_naming_props(rn_str, rn_pattern):
                                         rn_pattern="ls-[name]")
     """
 
-    rn_regex = re.sub(r"\[(.+?)\]", r"(?P<\1>.+)", rn_pattern)
-    rn_regex_pat = re.compile(rn_regex)
-    match_obj = re.match(rn_regex_pat, rn_str)
-    if match_obj is None:
+    from .ucsrntemplate import rn_template
+
+    naming_prop_dict = rn_template(rn_pattern).parse(rn_str)
+    if naming_prop_dict is None:
         log.debug("Error getting naming props. rn_str: %s rn_pattern %s" %
                   (rn_str, rn_pattern))
         return {}
-    naming_prop_dict = match_obj.groupdict()
     return naming_prop_dict
 
 
@@ -599,6 +719,42 @@ def _show_tree(class_id, depth=None, level=0, ancestor_str="",
     return out_str
 
 
+def _search_class_ids(text):
+    """
+    Returns the sorted class_ids of the managed objects matching a text,
+    case insensitive. A text without regular expression characters is
+    looked up in an index of the trigrams of the class_ids, instead of
+    being searched for in every class_id.
+    """
+
+    l_text = text.lower()
+    if _REGEX_CHARS.intersection(l_text):
+        return sorted([cid for cid in MO_CLASS_ID
+                       if re.search(l_text, cid, re.IGNORECASE)])
+
+    lower_map = _class_id_lower_map("mo")
+    if len(l_text) < 3:
+        return sorted([cid for l_cid, cid in lower_map.items()
+                       if l_text in l_cid])
+
+    trigrams = _class_id_trigrams.get("mo")
+    if trigrams is None:
+        trigrams = {}
+        for l_cid, cid in lower_map.items():
+            for index in range(len(l_cid) - 2):
+                trigrams.setdefault(l_cid[index:index + 3], set()).add(cid)
+        _class_id_trigrams["mo"] = trigrams
+
+    candidates = None
+    for index in range(len(l_text) - 2):
+        class_ids = trigrams.get(l_text[index:index + 3])
+        if not class_ids:
+            return []
+        candidates = class_ids if candidates is None else \
+            candidates & class_ids
+    return sorted([cid for cid in candidates if l_text in cid.lower()])
+
+
 def search_class_id(class_id):
     """
     case insensitive search for class_id in meta.
@@ -614,17 +770,13 @@ def search_class_id(class_id):
         class_ids = search_class_id(class_id="ls")
     """
 
-    from . import ucsmeta
-
     meta_class_id = find_class_id_in_mo_meta_ignore_case(class_id=class_id)
 
     if meta_class_id is not None:
         return meta_class_id
 
     # if class_id not exists in meta
-    l_class_id = class_id.lower()
-    class_ids = sorted([cid for cid in ucsmeta.MO_CLASS_ID
-                        if re.search(l_class_id, cid, re.IGNORECASE)])
+    class_ids = _search_class_ids(class_id)
     if class_ids:
         log.info('"%s" did not match any available Class Ids.\n'
                  'Related Class Ids are:\n%s\n%s' %
@@ -14,18 +14,26 @@
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import base64
+import io
 import sys
 import socket
+import select
 import ssl
+import threading
+import time
 
 try:
     import urllib2
     import httplib
     from urllib2 import HTTPError
+    from urlparse import urlsplit
+    from urllib import unquote
 except:
     import urllib.request as urllib2
     import http.client as httplib
     from urllib.error import HTTPError
+    from urllib.parse import urlsplit, unquote
 
 
 import logging
@@ -61,8 +69,18 @@ class TLSConnection(httplib.HTTPSConnection):
     """Like HTTPSConnection but more specific"""
 
     def __init__(self, host, **kwargs):
+        self.ssl_context = kwargs.pop("ssl_context", None)
+        self.tls_session = kwargs.pop("tls_session", None)
         httplib.HTTPSConnection.__init__(self, host, **kwargs)
 
+    @staticmethod
+    def create_ssl_context():
+        """Returns the SSLContext used to wrap the connections"""
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        ssl_context.options |= ssl.OP_NO_SSLv2
+        ssl_context.options |= ssl.OP_NO_SSLv3
+        return ssl_context
+
     def connect(self):
         """Overrides HTTPSConnection.connect to specify TLS version"""
         # Standard implementation from HTTPSConnection, which is not
@@ -83,13 +101,13 @@ class TLSConnection(httplib.HTTPSConnection):
         if sys.version_info >= (2, 7, 9):
             # Since python 2.7.9, tls 1.1 and 1.2 are supported via
             # SSLContext
-            ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
-            ssl_context.options |= ssl.OP_NO_SSLv2
-            ssl_context.options |= ssl.OP_NO_SSLv3
-            if self.key_file and self.cert_file:
-                ssl_context.load_cert_chain(keyfile=self.key_file,
-                                            certfile=self.cert_file)
-            self.sock = ssl_context.wrap_socket(sock)
+            ssl_context = self.ssl_context
+            if ssl_context is None:
+                ssl_context = self.create_ssl_context()
+                if self.key_file and self.cert_file:
+                    ssl_context.load_cert_chain(keyfile=self.key_file,
+                                                certfile=self.cert_file)
+            self.sock = _wrap_socket(ssl_context, sock, self.tls_session)
         else:
             # fallback to TLSv1
             self.sock = ssl.wrap_socket(sock, self.key_file, self.cert_file,
@@ -110,8 +128,15 @@ class TLS1Connection(httplib.HTTPSConnection):
     """Like HTTPSConnection but more specific"""
 
     def __init__(self, host, **kwargs):
+        self.ssl_context = kwargs.pop("ssl_context", None)
+        self.tls_session = kwargs.pop("tls_session", None)
         httplib.HTTPSConnection.__init__(self, host, **kwargs)
 
+    @staticmethod
+    def create_ssl_context():
+        """Returns the SSLContext used to wrap the connections"""
+        return ssl.SSLContext(ssl.PROTOCOL_TLSv1)
+
     def connect(self):
         """Overrides HTTPSConnection.connect to specify TLS version"""
         # Standard implementation from HTTPSConnection, which is not
@@ -130,8 +155,165 @@ class TLS1Connection(httplib.HTTPSConnection):
             self._tunnel()
 
         # fallback to TLSv1
-        self.sock = ssl.wrap_socket(sock, self.key_file, self.cert_file,
-                                    ssl_version=ssl.PROTOCOL_TLSv1)
+        if self.ssl_context is not None:
+            self.sock = _wrap_socket(self.ssl_context, sock, self.tls_session)
+        else:
+            self.sock = ssl.wrap_socket(sock, self.key_file, self.cert_file,
+                                        ssl_version=ssl.PROTOCOL_TLSv1)
+
+
+def _wrap_socket(ssl_context, sock, tls_session=None):
+    """
+    Wraps the socket, offering tls_session for resumption when possible.
+    """
+
+    if tls_session is not None and sys.version_info >= (3, 6):
+        try:
+            return ssl_context.wrap_socket(sock, session=tls_session)
+        except ValueError:
+            # session belongs to a different context
+            pass
+    return ssl_context.wrap_socket(sock)
+
+
+def _is_closed_without_response(error):
+    """
+    Tells if the server closed the connection before sending any byte of
+    the response.
+    """
+
+    remote_disconnected = getattr(httplib, "RemoteDisconnected", None)
+    if remote_disconnected is not None and \
+            isinstance(error, remote_disconnected):
+        return True
+    return not error.line
+
+
+def _is_connection_dropped(conn):
+    """
+    An idle keep-alive connection has nothing to read. If the socket is
+    readable, the server has closed it(or sent something unexpected).
+    """
+
+    sock = conn.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (select.error, ValueError):
+        return True
+    return bool(readable)
+
+
+class UcsConnectionPool(object):
+    """
+    This class keeps persistent(keep-alive) http/https connections for
+    reuse, so that every request does not pay for a new TCP and TLS
+    handshake.
+
+    Idle connections are kept per (protocol, host, port). The TLS session
+    of the last handshake with a host is offered for resumption whenever a
+    new connection to that host is needed.
+
+    Args:
+        pool_size (int): max number of idle connections kept per host
+        idle_timeout (int): idle time in seconds after which a connection
+            is not reused anymore
+        health_check (bool): if True, checks that an idle connection has
+            not been closed by the server before reusing it
+
+    Example:
+        pool = UcsConnectionPool(pool_size=4, idle_timeout=60)
+    """
+
+    def __init__(self, pool_size=4, idle_timeout=60, health_check=True):
+        self.pool_size = pool_size
+        self.idle_timeout = idle_timeout
+        self.health_check = health_check
+        self.__idle = {}
+        self.__ssl_contexts = {}
+        self.__tls_sessions = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns a reusable idle connection for the key, or None.
+        """
+
+        while True:
+            with self.__lock:
+                idle = self.__idle.get(key)
+                if not idle:
+                    return None
+                conn, last_used = idle.pop()
+
+            if time.time() - last_used > self.idle_timeout or (
+                    self.health_check and _is_connection_dropped(conn)):
+                conn.close()
+                continue
+            return conn
+
+    def put(self, key, conn):
+        """
+        Returns a connection to the pool after a complete response was read.
+        """
+
+        # with TLS 1.3 the session ticket is only received after the
+        # handshake, so the session is taken once a response was read
+        tls_session = getattr(getattr(conn, "sock", None), "session", None)
+        now = time.time()
+        with self.__lock:
+            if tls_session is not None:
+                self.__tls_sessions[key] = tls_session
+
+            idle = self.__idle.setdefault(key, [])
+            expired = [each for each in idle
+                       if now - each[1] > self.idle_timeout]
+            for each in expired:
+                idle.remove(each)
+            if len(idle) < self.pool_size:
+                idle.append((conn, now))
+                conn = None
+
+        for each in expired:
+            each[0].close()
+        if conn is not None:
+            conn.close()
+
+    def ssl_context(self, key, conn_class):
+        """
+        Returns the SSLContext shared by the connections for the key.
+        A TLS session can only be resumed within the context it was created.
+        """
+
+        if not hasattr(ssl, "SSLContext"):
+            return None
+
+        with self.__lock:
+            ctx_key = (key, conn_class)
+            if ctx_key not in self.__ssl_contexts:
+                self.__ssl_contexts[ctx_key] = conn_class.create_ssl_context()
+            return self.__ssl_contexts[ctx_key]
+
+    def tls_session(self, key):
+        """
+        Returns the last TLS session negotiated for the key.
+        """
+
+        return self.__tls_sessions.get(key)
+
+    def clear(self):
+        """
+        Closes all the idle connections. The TLS sessions are kept, so that
+        the next connections can still resume them.
+        """
+
+        with self.__lock:
+            idle, self.__idle = self.__idle, {}
+
+        for key in idle:
+            for conn, last_used in idle[key]:
+                conn.close()
 
 
 class UcsDriver(object):
@@ -150,11 +332,72 @@ class UcsDriver(object):
         self.__redirect_uri = None
         self.__proxy = proxy
         self.__headers = {}
+        self.__tls_proto = "tlsv1"
         self.__handlers = self.__get_handlers()
+        self.__pool = UcsConnectionPool()
 
     def update_handlers(self, tls_proto=None):
+        self.__tls_proto = tls_proto
         self.__handlers = self.__get_handlers(tls_proto)
 
+    def set_pool(self, pool_size=4, idle_timeout=60, health_check=True):
+        """
+        Sends the requests over persistent connections taken from a pool.
+        This is the default.
+
+        Args:
+            pool_size (int): max number of idle connections kept per host
+            idle_timeout (int): idle time in seconds after which a
+                connection is not reused anymore
+            health_check (bool): if True, checks that an idle connection has
+                not been closed by the server before reusing it
+
+        Returns:
+            None
+
+        Example:
+            driver=UcsDriver()\n
+            driver.set_pool(pool_size=8, idle_timeout=30)\n
+        """
+
+        self.unset_pool()
+        self.__pool = UcsConnectionPool(pool_size=pool_size,
+                                        idle_timeout=idle_timeout,
+                                        health_check=health_check)
+
+    def unset_pool(self):
+        """
+        Sends every request over a new connection.
+        """
+
+        if self.__pool is not None:
+            self.__pool.clear()
+            self.__pool = None
+
+    @property
+    def tls_proto(self):
+        """
+        Getter method of UcsDriver class
+        """
+
+        return self.__tls_proto
+
+    @property
+    def pool(self):
+        """
+        Getter method of UcsDriver class
+        """
+
+        return self.__pool
+
+    def close(self):
+        """
+        Closes the idle pooled connections.
+        """
+
+        if self.__pool is not None:
+            self.__pool.clear()
+
     def __get_handlers(self, tls_proto="tlsv1"):
         """
         Internal method to handle redirection and use TLS protocol.
@@ -254,10 +497,17 @@ class UcsDriver(object):
         try:
             if self.__redirect_uri:
                 uri = self.__redirect_uri
-            request = self.__create_request(uri=uri, data=data)
             if dump_xml:
                 log.debug('%s ====> %s' % (uri, data))
 
+            if read and self.__pool is not None and \
+                    isinstance(data, (bytes, type(u""))):
+                response = self.__pooled_post(uri, data)
+                if dump_xml:
+                    log.debug('%s <==== %s' % (uri, response))
+                return response
+
+            request = self.__create_request(uri=uri, data=data)
             opener = urllib2.build_opener(*self.__handlers)
             try:
                 response = opener.open(request)
@@ -291,3 +541,146 @@ class UcsDriver(object):
         except HTTPError as e:
             log.debug(e.headers)
             raise
+
+    def __pooled_post(self, uri, data):
+        """
+        Internal method to post the data over a pooled connection.
+        Handles the redirection and the fallback to TLSv1 like the
+        urllib handlers do.
+        """
+
+        if not isinstance(data, bytes):
+            data = data.encode('utf-8')
+
+        try:
+            status, reason, headers, body = self.__pooled_send(uri, data)
+        except Exception as e:
+            if "SSL".lower() not in str(e).lower():
+                raise
+
+            # Fallback to TLSv1 for this server
+            self.update_handlers(tls_proto="tlsv1")
+            status, reason, headers, body = self.__pooled_send(uri, data)
+
+        if status == 302 or status == 301:
+            uri = headers.get('Location')
+            self.__redirect = True
+            self.__redirect_uri = uri
+            status, reason, headers, body = self.__pooled_send(uri, data)
+
+        if status >= 400:
+            raise HTTPError(uri, status, reason, headers, io.BytesIO(body))
+
+        return body.decode('utf-8')
+
+    def __pooled_send(self, uri, data):
+        """
+        Internal method to send a request over a pooled connection.
+        A reused connection that turns out to be closed by the server is
+        discarded and the request is sent again over a new connection.
+
+        Returns:
+            (status, reason, headers, body)
+        """
+
+        parsed = urlsplit(uri)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+        key = (parsed.scheme, parsed.hostname, port)
+
+        selector = parsed.path or "/"
+        if parsed.query:
+            selector += "?" + parsed.query
+
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        headers.update(self.__headers)
+
+        if self.__proxy and parsed.scheme == "http":
+            # plain http proxies expect the absolute uri
+            selector = uri
+
+        if self.__proxy and parsed.scheme == "http":
+            headers.update(self.__proxy_headers())
+
+        while True:
+            conn = self.__pool.get(key)
+            reused = conn is not None
+            if conn is None:
+                conn = self.__create_connection(key)
+
+            # A reused connection might have been closed by the server in
+            # the meantime. The request is sent again only if it could not
+            # have reached the server, that is when sending fails or when the
+            # connection is closed without a single byte of response.
+            # Requests like configConfMos must never be applied twice.
+            try:
+                conn.request("POST", selector, data, headers)
+            except (httplib.HTTPException, socket.error):
+                conn.close()
+                if reused:
+                    continue
+                raise
+
+            try:
+                response = conn.getresponse()
+                body = response.read()
+            except httplib.BadStatusLine as e:
+                conn.close()
+                if reused and _is_closed_without_response(e):
+                    continue
+                raise
+            except (httplib.HTTPException, socket.error):
+                conn.close()
+                raise
+            break
+
+        if response.will_close:
+            conn.close()
+        else:
+            self.__pool.put(key, conn)
+
+        return response.status, response.reason, response.msg, body
+
+    def __create_connection(self, key):
+        """
+        Internal method to create a new connection for the key.
+        """
+
+        scheme, host, port = key
+        conn_host, conn_port = host, port
+        if self.__proxy:
+            proxy = self.__parse_proxy()
+            conn_host, conn_port = proxy.hostname, proxy.port or 80
+
+        if scheme != "https":
+            return httplib.HTTPConnection(conn_host, port=conn_port)
+
+        conn_class = (TLSConnection, TLS1Connection)[
+            self.__tls_proto == "tlsv1"]
+        conn = conn_class(conn_host, port=conn_port,
+                          ssl_context=self.__pool.ssl_context(key,
+                                                              conn_class),
+                          tls_session=self.__pool.tls_session(key))
+        if self.__proxy:
+            conn.set_tunnel(host, port, headers=self.__proxy_headers())
+        return conn
+
+    def __parse_proxy(self):
+        proxy = self.__proxy
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+        return urlsplit(proxy)
+
+    def __proxy_headers(self):
+        """
+        Internal method to build the Proxy-Authorization header from the
+        credentials of a proxy given as user:password@host:port
+        """
+
+        proxy = self.__parse_proxy()
+        if proxy.username is None:
+            return {}
+
+        credentials = "%s:%s" % (unquote(proxy.username),
+                                 unquote(proxy.password or ""))
+        credentials = base64.b64encode(credentials.encode('utf-8'))
+        return {'Proxy-Authorization': 'Basic ' + credentials.decode('ascii')}
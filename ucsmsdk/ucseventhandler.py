@@ -23,12 +23,15 @@ try:
 except:
     from queue import Queue
 
-from threading import Condition, Lock, Thread
+from threading import Condition, Event, Lock, Thread
 import datetime
+import heapq
+import itertools
 import logging
 import time
 
 from . import ucsmo
+from . import ucsgenutils
 from . import ucscoreutils
 from . import ucsxmlcodec as xc
 from .ucsexception import UcsWarning
@@ -36,19 +39,104 @@ from .ucsexception import UcsValidationException
 
 log = logging.getLogger('ucs')
 
+# poll ticks due within this many seconds are coalesced in one request
+_POLL_WINDOW = 1.0
+# bounds in seconds of the delay between two attempts to resubscribe
+_RESUBSCRIBE_MIN_SEC = 1
+_RESUBSCRIBE_MAX_SEC = 30
+
 
 class MoChangeEvent(object):
     """
     This class provides structure to save an event generated for any change,
     its associated managed object and property change list.
     This functionality is used during add_event_handler.
+
+    An event decoded from the event channel keeps the xml element of the
+    managed object, and only creates the managed object the first time
+    that mo is accessed. Its dn, class_id and properties are read from the
+    xml element, without creating the managed object.
     """
 
-    def __init__(self, event_id=None, mo=None, change_list=None):
+    def __init__(self, event_id=None, mo=None, change_list=None,
+                 mo_elem=None):
         self.event_id = event_id
-        self.mo = mo
+        self.__mo = mo
+        self.__mo_elem = mo_elem
+        if change_list is None and mo_elem is not None:
+            change_list = list(mo_elem.attrib)
+            if "rn" not in mo_elem.attrib and "dn" in mo_elem.attrib:
+                change_list.append("rn")
         self.change_list = change_list
 
+    @property
+    def mo(self):
+        if self.__mo is None and self.__mo_elem is not None:
+            gmo = ucsmo.generic_mo_from_xml_elem(self.__mo_elem)
+            self.__mo = gmo.to_mo()
+            self.__mo_elem = None
+        return self.__mo
+
+    @mo.setter
+    def mo(self, mo):
+        self.__mo = mo
+        self.__mo_elem = None
+
+    @property
+    def dn(self):
+        if self.__mo_elem is not None and "dn" in self.__mo_elem.attrib:
+            return self.__mo_elem.attrib["dn"]
+        return self.mo.dn if self.mo is not None else None
+
+    @property
+    def class_id(self):
+        if self.__mo_elem is not None:
+            return ucsgenutils.word_u(self.__mo_elem.tag)
+        return self.mo.get_class_id() if self.mo is not None else None
+
+    @property
+    def properties(self):
+        """
+        xml attributes of the managed object of the event, or None once
+        the managed object is created
+        """
+        if self.__mo_elem is not None:
+            return self.__mo_elem.attrib
+        return None
+
+
+def mo_change_events_from_xml(xml_str):
+    """
+    Decodes a message of the event channel into MoChangeEvents.
+    The managed objects of the events are created on demand.
+
+    Args:
+        xml_str (str): methodVessel or configMoChangeEvent xml string
+
+    Returns:
+        list of MoChangeEvent
+
+    Example:
+        for mce in mo_change_events_from_xml(xml_str):\n
+            print(mce.event_id, mce.dn)\n
+    """
+
+    root = xc.extract_root_elem(xml_str)
+    if root.tag == "methodVessel":
+        change_events = [cmce for in_stimuli in root for cmce in in_stimuli]
+    elif root.tag == "configMoChangeEvent":
+        change_events = [root]
+    else:
+        change_events = []
+
+    mces = []
+    for cmce in change_events:
+        for in_config in cmce:
+            for mo_elem in in_config:
+                mces.append(MoChangeEvent(event_id=cmce.attrib.get('inEid'),
+                                          mo_elem=mo_elem))
+    return mces
+
 
 class WatchBlock(object):
     """
@@ -63,6 +151,7 @@ class WatchBlock(object):
         self.capacity = capacity
         self.params = params
         self.overflow = False
+        self.removed = False
         self.error_code = 0
         self.event_q = Queue()  # infinite size Queue
 
@@ -94,15 +183,27 @@ class WatchBlock(object):
         print("\n")
         print('EventId'.ljust(tab_size * 2) + ':' + str(mce.event_id))
         print('ChangeList'.ljust(tab_size * 2) + ':' + str(mce.change_list))
-        print('ClassId'.ljust(tab_size * 2) + ':' + str(mce.mo.get_class_id()))
-        print('MoDn'.ljust(tab_size * 2) + ':' + str(mce.mo.dn))
+        print('ClassId'.ljust(tab_size * 2) + ':' + str(mce.class_id))
+        print('MoDn'.ljust(tab_size * 2) + ':' + str(mce.dn))
 
 
 class UcsEventHandle(object):
-    """This class provides api to add and remove event handler."""
+    """
+    This class provides api to add and remove event handler.
+
+    By default, every event handle reads its event channel and runs its
+    callbacks on two threads of its own. An event handle given a
+    UcsEventReactor instead shares the reactor's threads with all the other
+    event handles of the reactor.
 
-    def __init__(self, handle):
+    Args:
+        handle (UcsHandle): connection handle
+        reactor (UcsEventReactor): reactor which runs the event handle
+    """
+
+    def __init__(self, handle, reactor=None):
         self._handle = handle
+        self._reactor = reactor
         self._lock_object = None
         self._wbs = []
         self._wbs_lock = Lock()
@@ -112,34 +213,25 @@ class UcsEventHandle(object):
         self._dequeue_thread = None
         self._lowest_timeout = None
         self._wb_to_remove = []
-
-    def _process_method_vessel(self, root, elems):
-        for in_stimuli in root:
-            for cmce in in_stimuli:
-                for in_config in cmce:
-                    for mo_elem in in_config:
-                        elems.append(
-                            (mo_elem, cmce.attrib.get('inEid')))
-        return elems
-
-    def _process_mo_change_event(self, root, elems):
-        for in_config in root:
-            for mo_elem in in_config:
-                elems.append(mo_elem)
-        return elems
-
-    def _get_mo_elem(self, xml_str):
-        """
-        Internal method to extract mo elements from xml string
-        """
-
-        root = xc.extract_root_elem(xml_str)
-        mo_elems = []
-        if root.tag == "methodVessel":
-            mo_elems = self._process_method_vessel(root, mo_elems)
-        elif root.tag == "configMoChangeEvent":
-            mo_elems = self._process_mo_change_event(root, mo_elems)
-        return mo_elems
+        # watch blocks with queued events, in the order they got them, and
+        # the heaps of (deadline, seq, watch block) of the timeouts and poll
+        # ticks, all guarded by _condition
+        self._wbs_pending = []
+        self._wbs_pending_set = set()
+        self._timeouts = []
+        self._polls = []
+        self._timer_seq = itertools.count()
+        self._notified = False
+        # set once the server accepted the event subscription
+        self._subscribed = Event()
+        self._last_event_id = None
+        self._resync_needed = False
+        # callables called without arguments before every resync, for the
+        # watchers which rebuild their state themselves
+        self._resync_callbacks = []
+        # watch blocks indexed by the events they can match:
+        # {"dn": {dn: [wb]}, "class_id": {class_id: [wb]}, "all": {None: [wb]}}
+        self._wbs_index = {"dn": {}, "class_id": {}, "all": {}}
 
     def _can_enqueue(self):
         return self._event_chan_resp and len(
@@ -148,51 +240,180 @@ class UcsEventHandle(object):
 
     def _notify_to_dequeue(self):
         with self._condition:
+            self._notified = True
             self._condition.notify()
 
+    def _watch_block_key(self, watch_block):
+        """
+        Returns the index and key of the watch block. Watch blocks of a
+        managed object are indexed by dn, those of a class id by class id,
+        and the others are checked against every event. Those polling for a
+        managed object are never sent an event and are not indexed.
+        """
+
+        params = watch_block.params
+        class_id = params.get("class_id")
+        managed_object = params.get("managed_object")
+        if class_id is not None:
+            return "class_id", class_id.lower()
+        if managed_object is None:
+            return "all", None
+        if params.get("poll_sec") is None:
+            return "dn", managed_object.dn
+        return None, None
+
+    def _index_watch_block(self, watch_block):
+        index, key = self._watch_block_key(watch_block)
+        if index is not None:
+            self._wbs_index[index].setdefault(key, []).append(watch_block)
+
+    def _unindex_watch_block(self, watch_block):
+        index, key = self._watch_block_key(watch_block)
+        if index is None:
+            return
+        watch_blocks = self._wbs_index[index].get(key, [])
+        if watch_block in watch_blocks:
+            watch_blocks.remove(watch_block)
+        if not watch_blocks:
+            self._wbs_index[index].pop(key, None)
+
+    def _matching_watch_blocks(self, mce):
+        """
+        Returns the watch blocks which may match the event, the filter of
+        every one of them still decides.
+        """
+
+        index = self._wbs_index
+        watch_blocks = list(index["all"].get(None, ()))
+        watch_blocks.extend(index["dn"].get(mce.dn, ()))
+        class_id = mce.class_id
+        if class_id is not None:
+            watch_blocks.extend(index["class_id"].get(class_id.lower(), ()))
+        return watch_blocks
+
+    @property
+    def last_event_id(self):
+        """
+        id of the last event received on the event channel
+        """
+        return self._last_event_id
+
+    def _track_event_id(self, event_id):
+        """
+        Requests a resync when events were missed: the ids of the events of
+        a channel follow each other.
+        """
+
+        try:
+            event_id = int(event_id)
+        except (TypeError, ValueError):
+            return
+
+        last = self._last_event_id
+        self._last_event_id = event_id
+        if last is None or event_id in (last, last + 1):
+            return
+        if event_id > last:
+            self._request_resync("events %d to %d were missed" % (
+                last + 1, event_id - 1))
+        else:
+            self._request_resync("event id went back from %d to %d" % (
+                last, event_id))
+
+    def _request_resync(self, reason):
+        log.info("Event channel of %s: %s, resyncing." % (
+            self._handle.uri, reason))
+        with self._condition:
+            self._resync_needed = True
+        self._notify_to_dequeue()
+
+    def _on_subscribed(self):
+        """
+        Called once the server accepted an event subscription.
+        """
+
+        if self._subscribed.is_set():
+            # events may have been missed while the channel was down, the
+            # resync covers them whatever the next event id
+            self._last_event_id = None
+            self._request_resync("event channel resubscribed")
+        self._subscribed.set()
+
     def _process_event_channel_resp(self, resp):
-        enqueued = False
+        """
+        Hands the events of a message of the event channel to the watch
+        blocks.
+
+        Returns:
+            True if the watch blocks have anything new to process
+        """
 
-        for mo_elem in self._get_mo_elem(resp):
-            gmo = ucsmo.generic_mo_from_xml_elem(mo_elem[0])
-            mce = MoChangeEvent(event_id=mo_elem[1],
-                                mo=gmo.to_mo(),
-                                change_list=gmo.properties.keys())
+        enqueued = False
 
-            for watch_block in self._wbs:
+        for mce in mo_change_events_from_xml(resp):
+            self._track_event_id(mce.event_id)
+            for watch_block in self._matching_watch_blocks(mce):
                 if watch_block.fmce(mce):
                     watch_block.enqueue(mce)
+                    with self._condition:
+                        self._add_pending(watch_block)
                     enqueued = True
 
         if enqueued:
             self._notify_to_dequeue()
+        return enqueued or self._resync_needed
+
+    def _read_event_channel(self):
+        try:
+            while self._can_enqueue():
+                resp = self._event_chan_resp.readline()
+                if not resp:
+                    log.info("Event channel of %s closed by the server." %
+                             self._handle.uri)
+                    return
+                resp = self._event_chan_resp.read(int(resp))
+                self._process_event_channel_resp(resp)
+        except Exception as e:
+            log.info("Event channel of %s dropped: %s" % (self._handle.uri,
+                                                          str(e)))
+        finally:
+            if self._event_chan_resp is not None:
+                self._event_chan_resp.close()
+            self._event_chan_resp = None
 
     def _enqueue_function(self):
         """
         Internal method used by add_event_handler.
         Provides functionality of enqueue/dequeue of the events and
         triggering callbacks.
+
+        The event channel is subscribed to again whenever it drops, as long
+        as there are watch blocks.
         """
 
-        try:
-            xml_query = '<eventSubscribe cookie="%s"/>' % self._handle.cookie
-            self._event_chan_resp = self._handle.post_xml(
-                xml_str=xml_query.encode(), read=False)
-        except Exception:
-            raise
+        delay = _RESUBSCRIBE_MIN_SEC
+        while len(self._wbs) and self._handle.cookie is not None:
+            try:
+                xml_query = '<eventSubscribe cookie="%s"/>' % \
+                    self._handle.cookie
+                self._event_chan_resp = self._handle.post_xml(
+                    xml_str=xml_query.encode(), read=False)
+            except Exception as e:
+                log.info("eventSubscribe to %s failed: %s" % (
+                    self._handle.uri, str(e)))
+            else:
+                self._on_subscribed()
+                delay = _RESUBSCRIBE_MIN_SEC
+                self._read_event_channel()
 
-        try:
-            while self._can_enqueue():
-                resp = self._event_chan_resp.readline()
-                resp = self._event_chan_resp.read(int(resp))
-                self._process_event_channel_resp(resp)
+            if len(self._wbs):
+                time.sleep(delay)
+                delay = min(delay * 2, _RESUBSCRIBE_MAX_SEC)
 
-            if len(self._wbs) == 0:
-                self._condition.acquire()
-                self._condition.notify()
-                self._condition.release()
-        except:
-            raise
+        if len(self._wbs) == 0:
+            self._condition.acquire()
+            self._condition.notify()
+            self._condition.release()
 
     def _thread_enqueue_start(self):
         """
@@ -205,26 +426,35 @@ class UcsEventHandle(object):
         self._enqueue_thread.daemon = True
         self._enqueue_thread.start()
 
-    def _time_left(self, watch_block):
-        timeout_sec = watch_block.params["timeout_sec"]
-        start_time = watch_block.params["start_time"]
-        time_diff = datetime.datetime.now() - start_time
-        if time_diff.seconds < timeout_sec:
-            return timeout_sec - time_diff.seconds
-        else:
-            return 0
-        # return 2147483647
-
-    def _dequeue_mce(self, time_left, watch_block):
-        if time_left and time_left > 0:
-            if self._lowest_timeout is None or \
-                    self._lowest_timeout > time_left:
-                self._lowest_timeout = time_left
-            mce = watch_block.dequeue(time_left)
-        else:
-            mce = watch_block.dequeue(2147483647)
+    def _schedule_timer(self, timers, deadline, watch_block):
+        with self._condition:
+            heapq.heappush(timers, (deadline, next(self._timer_seq),
+                                    watch_block))
+
+    def _add_pending(self, watch_block):
+        # called with _condition held
+        if watch_block not in self._wbs_pending_set:
+            self._wbs_pending_set.add(watch_block)
+            self._wbs_pending.append(watch_block)
+
+    def _pop_timers(self, timers, until):
+        """
+        Pops the watch blocks of the timers due by until, skipping those of
+        removed watch blocks. Called with _condition held.
+        """
+
+        watch_blocks = []
+        while timers and timers[0][0] <= until:
+            watch_block = heapq.heappop(timers)[2]
+            if not watch_block.removed:
+                watch_blocks.append(watch_block)
+        return watch_blocks
 
-        return mce
+    def _next_timer(self, timers):
+        # removed watch blocks do not keep waking up the dequeue
+        while timers and timers[0][2].removed:
+            heapq.heappop(timers)
+        return timers[0][0] if timers else None
 
     def _get_ucs_prop_name(self, mo, python_prop):
         if isinstance(mo, ucsmo.GenericMo):
@@ -270,39 +500,80 @@ class UcsEventHandle(object):
 
         return self._is_property_in_success_values(prop_val, success_values)
 
+    def _event_prop_val_match(self, mce, mo, prop, success_values):
+        """
+        Matches the property of the watched managed object against the raw
+        attributes of the event, the managed object of the event is not
+        created.
+        """
+
+        if mce.properties is None:
+            return self._prop_val_match(mce.mo, prop, success_values,
+                                        mce.change_list)
+
+        ucs_prop = self._get_ucs_prop_name(mo, prop)
+        if self._should_skip_prop_match(ucs_prop, mce.change_list):
+            return False
+
+        return self._is_property_in_success_values(
+            mce.properties.get(ucs_prop), success_values)
+
     def _invoke_callback_and_set_done(self, wb, mce):
+        ctxt = wb.params['context']
+        if ctxt:
+            ctxt["done"] = True
         if wb.callback:
-            ctxt = wb.params['context']
-            if ctxt:
-                ctxt["done"] = True
             wb.callback(mce)
 
-    def _dequeue_mo_prop_poll(self, mo, prop, poll_sec, watch_block,
-                              timeout_sec=None, time_left=None):
-
-        success_value = watch_block.params["success_value"]
+    def _dequeue_mo_prop_poll(self, watch_blocks, now):
+        """
+        Polls the managed objects of the watch blocks whose poll tick is
+        due, all of them in as few configResolveDns as possible.
+        """
 
-        if not success_value or len(success_value) < 1:
-            raise ValueError("success_value is missing.")
+        from .ucsqueryplan import UcsQueryPlanner
 
-        pmo = self._handle.query_dn(mo.dn)
-        if pmo is None:
-            UcsWarning('Mo ' + pmo.dn + ' not found.')
-            return
+        planner = UcsQueryPlanner(self._handle)
+        indexes = {}
+        polled = []
+        for watch_block in watch_blocks:
+            success_value = watch_block.params["success_value"]
+            if not success_value or len(success_value) < 1:
+                log.info("success_value is missing.")
+                self._wb_to_remove.append(watch_block)
+                continue
 
-        if timeout_sec is not None and time_left is not None and time_left > 0:
-            if time_left < poll_sec:
-                poll_sec = timeout_sec - time_left
+            dn = watch_block.params["managed_object"].dn
+            if dn not in indexes:
+                indexes[dn] = planner.add_dn(dn)
+            polled.append(watch_block)
 
-        if self._lowest_timeout is None or self._lowest_timeout > poll_sec:
-            self._lowest_timeout = poll_sec
+        if not polled:
+            return
+        try:
+            results = planner.execute()
+        except Exception as e:
+            log.info(str(e))
+            self._wb_to_remove.extend(polled)
+            return
 
-        if self._prop_val_match(pmo, prop, success_value):
-            mce = MoChangeEvent(mo=pmo)
-            self._invoke_callback_and_set_done(watch_block, mce)
-            self._wb_to_remove.append(watch_block)
+        for watch_block in polled:
+            params = watch_block.params
+            dn = params["managed_object"].dn
+            pmo = results[indexes[dn]]
+            if pmo is None:
+                log.info('Mo ' + dn + ' not found.')
+                self._wb_to_remove.append(watch_block)
+            elif self._prop_val_match(pmo, params["prop"],
+                                      params["success_value"]):
+                mce = MoChangeEvent(mo=pmo)
+                self._invoke_callback_and_set_done(watch_block, mce)
+                self._wb_to_remove.append(watch_block)
+            else:
+                self._schedule_timer(self._polls, now + params["poll_sec"],
+                                     watch_block)
 
-    def _dequeue_mo_prop_event(self, prop, watch_block, time_left=None):
+    def _dequeue_mo_prop_event(self, prop, watch_block):
 
         success_value = watch_block.params["success_value"]
 
@@ -310,20 +581,20 @@ class UcsEventHandle(object):
             raise ValueError("success_value is missing.")
 
         # dequeue mce
-        mce = self._dequeue_mce(time_left, watch_block)
+        mce = watch_block.dequeue(0)
         if mce is None:
             return
 
         # checks if prop value exist in success value(s)
-        attributes = mce.change_list
-        if self._prop_val_match(mce.mo, prop, success_value, attributes):
+        mo = watch_block.params["managed_object"]
+        if self._event_prop_val_match(mce, mo, prop, success_value):
             self._invoke_callback_and_set_done(watch_block, mce)
             self._wb_to_remove.append(watch_block)
 
-    def _dequeue_mo_until_removed(self, watch_block, time_left=None):
+    def _dequeue_mo_until_removed(self, watch_block):
 
         # dequeue mce
-        mce = self._dequeue_mce(time_left, watch_block)
+        mce = watch_block.dequeue(0)
         if mce is None:
             return
 
@@ -331,13 +602,17 @@ class UcsEventHandle(object):
             watch_block.callback(mce)
 
         # watch mo until gets deleted
-        if mce.mo.status == "deleted":
+        if mce.properties is not None:
+            status = mce.properties.get("status")
+        else:
+            status = mce.mo.status
+        if status == "deleted":
             self._wb_to_remove.append(watch_block)
 
-    def _dequeue_all_class_id(self, watch_block, time_left=None):
+    def _dequeue_all_class_id(self, watch_block):
 
         # dequeue mce
-        mce = self._dequeue_mce(time_left, watch_block)
+        mce = watch_block.dequeue(0)
         if mce is not None and watch_block.callback is not None:
             watch_block.callback(mce)
 
@@ -346,61 +621,142 @@ class UcsEventHandle(object):
         Internal method to dequeue to events.
         """
         while len(self._wbs):
-            self._lowest_timeout = None
-            self._wb_to_remove = []
+            timeout = self._dequeue_pass()
+
+            # wait for more events only if watch_block exists, and nothing
+            # happened while the watch blocks were processed
+            with self._condition:
+                if len(self._wbs) and not self._notified:
+                    self._condition.wait(timeout)
+                self._notified = False
+        return
+
+    def _dequeue_watch_block(self, watch_block):
+        params = watch_block.params
+        mo = params.get("managed_object")
+        prop = params.get("prop")
+
+        while watch_block.queue_size() > 0 and \
+                watch_block not in self._wb_to_remove:
+            if mo is None:
+                # watch all event or specific to class_id
+                self._dequeue_all_class_id(watch_block)
+            elif prop is not None:
+                # watch mo until prop_val changed to desired value
+                self._dequeue_mo_prop_event(prop, watch_block)
+            else:
+                # watch mo until it is removed
+                self._dequeue_mo_until_removed(watch_block)
+
+    def _dequeue_pass(self):
+        """
+        Internal method to process the queued events, the expired
+        timeouts and the due poll ticks once. Only the watch blocks with
+        queued events or a due timer are visited.
+
+        Returns:
+            seconds until the next timeout or poll tick, None if only a new
+            event can make a difference
+        """
+
+        self._wb_to_remove = []
+        with self._condition:
+            resync, self._resync_needed = self._resync_needed, False
+        if resync:
+            self._resync()
 
+        now = time.time()
+        with self._condition:
+            pending, self._wbs_pending = self._wbs_pending, []
+            self._wbs_pending_set.clear()
+            self._wb_to_remove.extend(self._pop_timers(self._timeouts, now))
+            polls = self._pop_timers(self._polls, now + _POLL_WINDOW)
+
+        timed_out = set(self._wb_to_remove)
+        polls = [wb for wb in polls if wb not in timed_out]
+        if polls:
+            self._dequeue_mo_prop_poll(polls, now)
+
+        for watch_block in pending:
+            if watch_block.removed or watch_block in timed_out:
+                continue
             try:
-                for watch_block in self._wbs:
-                    mo = watch_block.params["managed_object"]
-                    prop = watch_block.params["prop"]
-                    poll_sec = watch_block.params["poll_sec"]
-                    timeout_sec = watch_block.params["timeout_sec"]
-
-                    # checks if watch_block is not timed out, else remove
-                    time_left = None
-                    if timeout_sec is not None:
-                        time_left = self._time_left(watch_block)
-                        if time_left <= 0:
-                            self._wb_to_remove.append(watch_block)
-                            continue
-                    if self._lowest_timeout is None:
-                        self._lowest_timeout = time_left
-                    elif self._lowest_timeout < time_left:
-                        self._lowest_timeout = time_left
-
-
-                    # Dequeue any change events for a specified watch_block
-                    # poll for mo. Not to monitor event.
-                    if poll_sec is not None and mo is not None:
-                        self._dequeue_mo_prop_poll(mo, prop, poll_sec,
-                                                   watch_block, timeout_sec,
-                                                   time_left)
-                    elif mo is not None:
-                        while watch_block.queue_size() > 0:
-                            # watch mo until prop_val changed to desired value
-                            if prop is not None:
-                                self._dequeue_mo_prop_event(prop, watch_block,
-                                                            time_left)
-                            # watch mo until it is removed
-                            else:
-                                self._dequeue_mo_until_removed(watch_block,
-                                                               time_left)
-                    elif mo is None:
-                        while watch_block.queue_size() > 0:
-                            # watch all event or specific to class_id
-                            self._dequeue_all_class_id(watch_block, time_left)
+                self._dequeue_watch_block(watch_block)
             except Exception as e:
                 log.info(str(e))
                 self._wb_to_remove.append(watch_block)
 
-            # remove any watch blocks in to_remove list
-            self._process_wb_remove_list()
+        # remove any watch blocks in to_remove list
+        self._process_wb_remove_list()
 
-            # wait for more events only if watch_block exists
-            if len(self._wbs):
-                with self._condition:
-                    self._condition.wait(self._lowest_timeout)
-        return
+        with self._condition:
+            deadlines = [deadline for deadline in
+                         (self._next_timer(self._timeouts),
+                          self._next_timer(self._polls))
+                         if deadline is not None]
+        if deadlines:
+            self._lowest_timeout = max(0, min(deadlines) - time.time())
+        else:
+            self._lowest_timeout = None
+        return self._lowest_timeout
+
+    def _resync(self):
+        """
+        Resolves again the dns and the class ids the watch blocks cover,
+        and hands their current state to the watch blocks as events. A
+        watched dn which does not exist anymore is handed as deleted.
+
+        The watch blocks of all the events cannot be resynced.
+        """
+
+        from .ucsqueryplan import UcsQueryPlanner
+
+        for callback in list(self._resync_callbacks):
+            try:
+                callback()
+            except Exception as e:
+                log.info(str(e))
+
+        with self._wbs_lock:
+            dns = dict((dn, watch_blocks[0].params["managed_object"])
+                       for dn, watch_blocks in self._wbs_index["dn"].items()
+                       if watch_blocks)
+            class_ids = [class_id for class_id, watch_blocks in
+                         self._wbs_index["class_id"].items() if watch_blocks]
+            if self._wbs_index["all"].get(None):
+                log.info("Watch blocks of all the events are not resynced.")
+
+        planner = UcsQueryPlanner(self._handle)
+        dn_indexes = dict((dn, planner.add_dn(dn)) for dn in dns)
+        class_indexes = dict((class_id, planner.add_classid(class_id))
+                             for class_id in class_ids)
+        try:
+            results = planner.execute()
+        except Exception as e:
+            log.info("Resync failed: %s" % str(e))
+            return
+
+        mces = []
+        for dn, index in dn_indexes.items():
+            mo = results[index]
+            if mo is None:
+                tag = ucsgenutils.word_l(dns[dn].get_class_id())
+                mo_elem = xc.Element(tag, dn=dn, status="deleted")
+                mces.append(("dn", dn, MoChangeEvent(mo_elem=mo_elem)))
+            else:
+                mces.append(("dn", dn, MoChangeEvent(mo=mo)))
+        for class_id, index in class_indexes.items():
+            for mo in results[index]:
+                mces.append(("class_id", class_id, MoChangeEvent(mo=mo)))
+
+        log.debug("Resynced %d dns and %d classes" % (len(dn_indexes),
+                                                      len(class_indexes)))
+        for index, key, mce in mces:
+            for watch_block in list(self._wbs_index[index].get(key, ())):
+                if watch_block.fmce(mce):
+                    watch_block.enqueue(mce)
+                    with self._condition:
+                        self._add_pending(watch_block)
 
     def _process_wb_remove_list(self):
         if len(self._wb_to_remove) == 0:
@@ -408,16 +764,27 @@ class UcsEventHandle(object):
 
         self._wbs_lock.acquire()
 
+        # the watch blocks removed before their success value was seen,
+        # missing, failing to poll or timed out, are marked failed
+        done_contexts = []
         for wb in self._wb_to_remove:
             if "context" in wb.params:
                 ctxt = wb.params['context']
                 if ctxt:
+                    if not ctxt["done"]:
+                        ctxt["failed"] = True
                     ctxt["done"] = True
+                    done_contexts.append(ctxt)
             self.watch_block_remove(wb)
         self._wb_to_remove = []
 
         self._wbs_lock.release()
 
+        for ctxt in done_contexts:
+            on_done = ctxt.get("on_done")
+            if on_done is not None:
+                on_done(ctxt)
+
     def _thread_dequeue_start(self):
         """
         Internal method to start dequeue thread.
@@ -449,7 +816,17 @@ class UcsEventHandle(object):
             watch_block.callback = watch_block.dequeue_default_callback
 
         self._wbs.append(watch_block)
+        self._index_watch_block(watch_block)
         self._wbs_lock.release()
+
+        now = time.time()
+        if params.get("timeout_sec") is not None:
+            self._schedule_timer(self._timeouts, now + params["timeout_sec"],
+                                 watch_block)
+        if params.get("poll_sec") is not None and \
+                params.get("managed_object") is not None:
+            self._schedule_timer(self._polls, now, watch_block)
+        self._notify_to_dequeue()
         return watch_block
 
     def watch_block_remove(self, watch_block):
@@ -459,6 +836,8 @@ class UcsEventHandle(object):
         """
         if watch_block in self._wbs:
             self._wbs.remove(watch_block)
+            self._unindex_watch_block(watch_block)
+            watch_block.removed = True
 
     def _add_class_id_watch(self, class_id):
         if ucscoreutils.find_class_id_in_mo_meta_ignore_case(class_id) is None:
@@ -469,7 +848,8 @@ class UcsEventHandle(object):
             """
             Callback method to work on events with a specific class_id.
             """
-            if mce.mo.get_class_id().lower() == class_id.lower():
+            if mce.class_id is not None and \
+                    mce.class_id.lower() == class_id.lower():
                 return True
             return False
 
@@ -500,7 +880,7 @@ class UcsEventHandle(object):
                 Callback method to work on events specific to respective
                 managed object.
                 """
-                if mce.mo.dn == managed_object.dn:
+                if mce.dn == managed_object.dn:
                     return True
                 return False
             return watch_mo_filter
@@ -572,7 +952,9 @@ class UcsEventHandle(object):
                                            filter_callback=filter_callback,
                                            callback=call_back)
 
-        if watch_block is not None and len(self._wbs) == 1:
+        if watch_block is not None and self._reactor is not None:
+            self._reactor.add(self, subscribe=poll_sec is None)
+        elif watch_block is not None and len(self._wbs) == 1:
             if poll_sec is None:
                 self._thread_enqueue_start()
             self._thread_dequeue_start()
@@ -590,6 +972,7 @@ class UcsEventHandle(object):
         else:
             UcsWarning("Event handler not found")
         self._wbs_lock.release()
+        self._release_reactor()
 
     def clean(self):
         """
@@ -597,9 +980,14 @@ class UcsEventHandle(object):
         """
 
         self._wbs_lock.acquire()
-        for each in self._wbs:
+        for each in list(self._wbs):
             self.watch_block_remove(each)
         self._wbs_lock.release()
+        self._release_reactor()
+
+    def _release_reactor(self):
+        if self._reactor is not None and len(self._wbs) == 0:
+            self._reactor.remove(self)
 
     def get(self):
         """
@@ -656,3 +1044,158 @@ def wait(handle, mo, prop, value, cb, timeout_sec=None, poll_sec=None):
     # wait for the event to occur
     while not context["done"]:
         time.sleep(1)
+
+
+# seconds wait_many waits for the event subscription before polling instead
+_SUBSCRIBE_TIMEOUT = 10
+# polling interval in seconds of wait_many without an event subscription
+_FALLBACK_POLL_SEC = 5
+
+
+def _add_conditions(ueh, conditions, indexes, callbacks, make_context,
+                    timeout_sec, poll_sec):
+    watch_blocks = {}
+    try:
+        for index in indexes:
+            mo, prop, value = conditions[index]
+            watch_blocks[index] = ueh.add(
+                managed_object=mo,
+                prop=prop,
+                success_value=value,
+                call_back=callbacks[index],
+                timeout_sec=timeout_sec,
+                poll_sec=poll_sec,
+                context=make_context(index))
+    except Exception:
+        ueh.clean()
+        raise
+    return watch_blocks
+
+
+def wait_many(handle, conditions, cb=None, timeout_sec=None, poll_sec=None,
+              reactor=None):
+    """
+    Waits for `mo.prop in values` for all the conditions, with a single
+    event subscription, or with polls of all the managed objects in one
+    configResolveDns per poll interval.
+
+    In event mode, the current values are checked with one
+    configResolveDns once the subscription is accepted. If the event
+    channel cannot be subscribed to, polling is used instead.
+
+    Args:
+        handle(UcsHandle): connection handle to the server
+        conditions (list): list of (mo, prop, value) tuples, value being a
+            value or a list of values
+        cb(function): callback on every condition met, called with the
+            condition and the mo change event
+        timeout_sec (int): timeout
+        poll_sec (int): polling interval in seconds
+        reactor (UcsEventReactor): reactor running the event handle
+
+    Returns:
+        list of the conditions not met: timed out, or whose managed object
+        was not found or could not be polled
+
+    Example:
+        This method is called from UcsHandle class,
+        wait_for_events method
+    """
+
+    requested = list(conditions)
+    for mo, prop, value in requested:
+        if mo is None:
+            raise ValueError("Provide mo for every condition.")
+    conditions = [(mo, prop, value if isinstance(value, list) else [value])
+                  for mo, prop, value in requested]
+
+    deadline = None
+    if timeout_sec is not None:
+        deadline = time.time() + timeout_sec
+
+    lock = Condition()
+    met = [False] * len(conditions)
+    failed = [False] * len(conditions)
+    left = [len(conditions)]
+
+    def condition_met(index, mce):
+        with lock:
+            if met[index] or failed[index]:
+                return
+            met[index] = True
+            left[0] -= 1
+            lock.notify_all()
+        if cb is not None:
+            cb(requested[index], mce)
+
+    def condition_failed(index):
+        with lock:
+            if met[index] or failed[index]:
+                return
+            failed[index] = True
+            left[0] -= 1
+            lock.notify_all()
+
+    def make_callback(index):
+        return lambda mce: condition_met(index, mce)
+
+    def make_context(index):
+        # called once the watch block of the condition is removed
+        def on_done(context):
+            if context.get("failed"):
+                condition_failed(index)
+        return {"done": False, "on_done": on_done}
+
+    callbacks = [make_callback(index) for index in range(len(conditions))]
+    indexes = list(range(len(conditions)))
+
+    ueh = UcsEventHandle(handle, reactor=reactor)
+    watch_blocks = _add_conditions(ueh, conditions, indexes, callbacks,
+                                   make_context, timeout_sec, poll_sec)
+
+    if poll_sec is None and conditions:
+        subscribe_timeout = _SUBSCRIBE_TIMEOUT
+        if timeout_sec is not None:
+            subscribe_timeout = min(subscribe_timeout, timeout_sec)
+
+        # Event.wait returns None before python 2.7
+        ueh._subscribed.wait(subscribe_timeout)
+        if ueh._subscribed.is_set():
+            # the values may have been reached before the subscription
+            from .ucsqueryplan import UcsQueryPlanner
+            planner = UcsQueryPlanner(handle)
+            for mo, _, _ in conditions:
+                planner.add_dn(mo.dn)
+            results = planner.execute()
+            for index, (mo, prop, value) in enumerate(conditions):
+                pmo = results[index]
+                if pmo is not None and ueh._prop_val_match(pmo, prop, value):
+                    ueh.remove(watch_blocks[index])
+                    condition_met(index, MoChangeEvent(mo=pmo))
+        else:
+            log.info("Event subscription failed, polling instead.")
+            ueh.clean()
+            remaining = None
+            if deadline is not None:
+                remaining = max(0, deadline - time.time())
+            ueh = UcsEventHandle(handle, reactor=reactor)
+            with lock:
+                indexes = [index for index in indexes if not met[index]]
+            _add_conditions(ueh, conditions, indexes, callbacks,
+                            make_context, remaining, _FALLBACK_POLL_SEC)
+
+    # wait for the events to occur
+    with lock:
+        while left[0]:
+            if deadline is None:
+                lock.wait()
+                continue
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            lock.wait(remaining)
+        timed_out = [requested[index] for index in range(len(requested))
+                     if not met[index]]
+
+    ueh.clean()
+    return timed_out
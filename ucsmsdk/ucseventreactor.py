@@ -0,0 +1,669 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the event reactor, which reads the event channels of
+many UcsHandles from a single thread and runs their event handlers on a
+bounded pool of worker threads. It requires python 3.4+, for selectors.
+"""
+
+import heapq
+import itertools
+import logging
+import selectors
+import socket
+import ssl
+import threading
+import time
+from queue import Queue
+from urllib.parse import urlparse
+
+from .ucsexception import UcsConnectionError
+from .ucseventhandler import _RESUBSCRIBE_MIN_SEC, _RESUBSCRIBE_MAX_SEC
+
+log = logging.getLogger('ucs')
+
+_READ_SIZE = 65536
+# bound in seconds of the connection, the tls handshake and the response
+# headers of an eventSubscribe request
+_SUBSCRIBE_TIMEOUT_SEC = 30
+# failed attempts in a row after which an event channel is given up
+_RESUBSCRIBE_MAX_ATTEMPTS = 10
+
+
+def _redirect_location(head):
+    """
+    Returns the location of a 301 or 302 response, None for other responses.
+    """
+
+    lines = head.decode("latin-1").split("\r\n")
+    status = lines[0].split(None, 2)
+    if len(status) < 2 or status[1] not in ("301", "302"):
+        return None
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        if name.strip().lower() == "location":
+            return value.strip()
+    raise UcsConnectionError("eventSubscribe redirected without a location")
+
+
+class _EventStream(object):
+    """
+    Incremental decoder of the response to an eventSubscribe request.
+
+    The response is a http response, chunked or not, whose body is a
+    sequence of "<length>\\n<xml message>" records.
+    """
+
+    def __init__(self):
+        self.__buf = b""
+        self.__body = b""
+        self.__headers_read = False
+        self.__chunked = False
+        self.closed = False
+
+    @property
+    def headers_read(self):
+        return self.__headers_read
+
+    def feed(self, data):
+        """
+        Decodes the bytes received on the event channel.
+
+        Args:
+            data (bytes): bytes read from the socket
+
+        Returns:
+            list of the xml messages completed by the data
+        """
+
+        self.__buf += data
+        if not self.__headers_read:
+            end = self.__buf.find(b"\r\n\r\n")
+            if end < 0:
+                return []
+            self.__read_headers(self.__buf[:end].decode("latin-1"))
+            self.__buf = self.__buf[end + 4:]
+
+        if self.__chunked:
+            self.__read_chunks()
+        else:
+            self.__body += self.__buf
+            self.__buf = b""
+        return self.__read_messages()
+
+    def __read_headers(self, head):
+        lines = head.split("\r\n")
+        status = lines[0].split(None, 2)
+        if len(status) < 2 or status[1] != "200":
+            raise UcsConnectionError("eventSubscribe failed: %s" % lines[0])
+
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            if name.strip().lower() == "transfer-encoding" and \
+                    "chunked" in value.lower():
+                self.__chunked = True
+        self.__headers_read = True
+
+    def __read_chunks(self):
+        buf = self.__buf
+        pos = 0
+        while True:
+            line_end = buf.find(b"\r\n", pos)
+            if line_end < 0:
+                break
+            size = int(buf[pos:line_end].split(b";")[0], 16)
+            if size == 0:
+                self.closed = True
+                break
+            end = line_end + 2 + size
+            # a chunk is only taken once it is complete, with its CRLF
+            if len(buf) < end + 2:
+                break
+            self.__body += buf[line_end + 2:end]
+            pos = end + 2
+        self.__buf = buf[pos:]
+
+    def __read_messages(self):
+        body = self.__body
+        messages = []
+        pos = 0
+        while True:
+            line_end = body.find(b"\n", pos)
+            if line_end < 0:
+                break
+            length = body[pos:line_end].strip()
+            if not length:
+                pos = line_end + 1
+                continue
+            end = line_end + 1 + int(length)
+            if len(body) < end:
+                break
+            messages.append(body[line_end + 1:end])
+            pos = end
+        self.__body = body[pos:]
+        return messages
+
+
+class _Channel(object):
+    """
+    The event channel of an event handle, and the state of its dequeue.
+    """
+
+    def __init__(self, event_handle):
+        self.event_handle = event_handle
+        self.sock = None
+        self.stream = None
+        self.subscribe = False
+        self.deadline = None
+        self.retry_at = None
+        self.retry_delay = _RESUBSCRIBE_MIN_SEC
+        # failed attempts to subscribe since the last accepted subscription
+        self.attempts = 0
+        # set while a thread opens the event channel, outside of lock
+        self.subscribing = False
+        # uri the eventSubscribe requests were redirected to, and whether
+        # the server only speaks TLSv1
+        self.uri = None
+        self.tls1 = False
+        self.lock = threading.Lock()
+        self.scheduled = False
+        self.again = False
+
+
+class UcsEventReactor(object):
+    """
+    Runs the event handles of many UcsHandles on a constant number of
+    threads.
+
+    One thread waits on the eventSubscribe streams of all the event handles
+    with a selector, over non-blocking sockets, and routes the events to
+    their watch blocks. The watch blocks, their callbacks and polls are
+    processed by a pool of max_workers threads. The watch blocks of an
+    event handle are never processed by two workers at once, so that its
+    callbacks are still called in the order of the events. An event
+    channel which drops is subscribed to again, with an increasing delay,
+    until _RESUBSCRIBE_MAX_ATTEMPTS attempts in a row failed or the handle
+    logged out.
+
+    Event channels are opened directly to the address of the handle, a
+    proxy is not supported. They are opened on the calling thread or on
+    the workers, never on the thread of the selector, so an unreachable
+    server only delays the events of its own handles. Like UcsHandle, they
+    follow a 301 or 302 redirection of the eventSubscribe request, and fall
+    back to TLSv1 for the servers which do not support a later version.
+
+    Args:
+        max_workers (int): number of threads running the callbacks
+
+    Example:
+        reactor = UcsEventReactor(max_workers=8)\n
+        for handle in handles:\n
+            ueh = UcsEventHandle(handle, reactor=reactor)\n
+            ueh.add(class_id="FaultInst", call_back=on_fault)\n
+        ...\n
+        reactor.stop()\n
+    """
+
+    def __init__(self, max_workers=4):
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        self.__max_workers = max_workers
+        self.__channels = {}
+        self.__lock = threading.Lock()
+        self.__selector = None
+        self.__wakeup = None
+        self.__thread = None
+        self.__workers = []
+        self.__tasks = Queue()
+        self.__running = False
+        # heap of (deadline, seq, channel, action), action being "dequeue"
+        # or "subscribe". An entry is stale once the deadline or retry_at
+        # of its channel changed
+        self.__timers = []
+        self.__timer_seq = itertools.count()
+
+    def __len__(self):
+        return len(self.__channels)
+
+    def __start(self):
+        if self.__running:
+            return
+
+        self.__selector = selectors.DefaultSelector()
+        self.__wakeup = socket.socketpair()
+        for sock in self.__wakeup:
+            sock.setblocking(False)
+        self.__selector.register(self.__wakeup[0], selectors.EVENT_READ)
+
+        self.__running = True
+        self.__thread = threading.Thread(name="ucs_event_reactor",
+                                         target=self.__run)
+        self.__thread.daemon = True
+        self.__thread.start()
+        self.__workers = []
+        for index in range(self.__max_workers):
+            worker = threading.Thread(name="ucs_event_worker-%d" % index,
+                                      target=self.__work)
+            worker.daemon = True
+            worker.start()
+            self.__workers.append(worker)
+
+    def __wake(self):
+        try:
+            self.__wakeup[1].send(b"\0")
+        except (IOError, OSError):
+            # the wakeup is already pending
+            pass
+
+    def add(self, event_handle, subscribe=True):
+        """
+        Starts running an event handle. Called by UcsEventHandle.add.
+
+        Args:
+            event_handle (UcsEventHandle): event handle
+            subscribe (bool): if True, opens the event channel of its handle
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            self.__start()
+            channel = self.__channels.get(event_handle)
+            if channel is None:
+                channel = _Channel(event_handle)
+                self.__channels[event_handle] = channel
+
+        if subscribe:
+            channel.subscribe = True
+            # a new watch block gives a given up channel another chance
+            channel.attempts = 0
+            self.__resubscribe(channel)
+        self.schedule(event_handle)
+
+    def remove(self, event_handle):
+        """
+        Stops running an event handle and closes its event channel.
+        Called once the event handle has no watch block left.
+
+        Args:
+            event_handle (UcsEventHandle): event handle
+
+        Returns:
+            None
+        """
+
+        with self.__lock:
+            channel = self.__channels.pop(event_handle, None)
+            if channel is not None:
+                channel.deadline = None
+                channel.retry_at = None
+        if channel is not None:
+            self.__close(channel)
+            self.__wake()
+
+    def stop(self):
+        """
+        Closes all the event channels and stops the threads.
+        """
+
+        with self.__lock:
+            channels = list(self.__channels.values())
+            self.__channels.clear()
+            self.__timers = []
+            running, self.__running = self.__running, False
+
+        for channel in channels:
+            self.__close(channel)
+        if not running:
+            return
+
+        self.__wake()
+        for _ in self.__workers:
+            self.__tasks.put(None)
+        current = threading.current_thread()
+        for thread in [self.__thread] + self.__workers:
+            if thread is not current:
+                thread.join()
+        self.__selector.close()
+        for sock in self.__wakeup:
+            sock.close()
+
+    @staticmethod
+    def __connect(uri, tls1):
+        secure = uri.scheme == "https"
+        port = uri.port or (443 if secure else 80)
+        sock = socket.create_connection((uri.hostname, port),
+                                        _SUBSCRIBE_TIMEOUT_SEC)
+        if not secure:
+            return sock
+
+        from .ucsdriver import TLSConnection, TLS1Connection
+        conn_class = TLS1Connection if tls1 else TLSConnection
+        try:
+            return conn_class.create_ssl_context().wrap_socket(
+                sock, server_hostname=uri.hostname)
+        except Exception:
+            sock.close()
+            raise
+
+    @staticmethod
+    def __send_subscribe(sock, uri, cookie):
+        """
+        Sends the eventSubscribe request and reads the response headers.
+
+        Returns:
+            (headers, all the bytes read)
+        """
+
+        body = ('<eventSubscribe cookie="%s"/>' % cookie).encode()
+        request = ("POST %s HTTP/1.1\r\n"
+                   "Host: %s\r\n"
+                   "Content-Type: application/x-www-form-urlencoded\r\n"
+                   "Content-Length: %d\r\n\r\n" % (uri.path or "/",
+                                                   uri.netloc, len(body)))
+        sock.sendall(request.encode() + body)
+
+        data = b""
+        while True:
+            end = data.find(b"\r\n\r\n")
+            if end >= 0:
+                return data[:end], data
+            read = sock.recv(_READ_SIZE)
+            if not read:
+                raise UcsConnectionError("eventSubscribe closed without a "
+                                         "response")
+            data += read
+
+    def __open(self, channel):
+        """
+        Opens the event channel of an event handle, following a redirection
+        and falling back to TLSv1 like UcsDriver. Called without channel.lock
+        held, blocks for at most _SUBSCRIBE_TIMEOUT_SEC per connection.
+
+        Returns:
+            (non-blocking socket, bytes read from it)
+        """
+
+        handle = channel.event_handle._handle
+        uri = channel.uri or handle.uri + "/nuova"
+        redirected = False
+        while True:
+            parsed = urlparse(uri)
+            try:
+                sock = self.__connect(parsed, channel.tls1)
+            except ssl.SSLError:
+                if channel.tls1:
+                    raise
+                # Fallback to TLSv1 for this server
+                channel.tls1 = True
+                sock = self.__connect(parsed, True)
+
+            try:
+                head, data = self.__send_subscribe(sock, parsed,
+                                                   handle.cookie)
+                location = _redirect_location(head)
+            except Exception:
+                sock.close()
+                raise
+            if location is None:
+                break
+            sock.close()
+            if redirected:
+                raise UcsConnectionError("eventSubscribe redirected more "
+                                         "than once")
+            redirected = True
+            uri = location
+
+        channel.uri = uri
+        sock.setblocking(False)
+        return sock, data
+
+    def __resubscribe(self, channel):
+        event_handle = channel.event_handle
+        if self.__channels.get(event_handle) is not channel:
+            return
+
+        with channel.lock:
+            if channel.sock is not None or channel.subscribing:
+                return
+            channel.subscribing = True
+
+        sock = None
+        try:
+            sock, data = self.__open(channel)
+        except Exception as e:
+            log.info("eventSubscribe to %s failed: %s" % (
+                event_handle._handle.uri, str(e)))
+
+        with channel.lock:
+            channel.subscribing = False
+            current = sock is not None and channel.sock is None and \
+                self.__channels.get(event_handle) is channel
+            if current:
+                channel.stream = _EventStream()
+                channel.sock = sock
+
+        if sock is None:
+            self.__retry_later(channel)
+            return
+        if not current:
+            sock.close()
+            return
+
+        log.debug("Subscribed to the events of %s" % event_handle._handle.uri)
+        enqueued = self.__feed(channel, data)
+        with channel.lock:
+            # not registered if the channel was closed in the meantime
+            if channel.sock is sock:
+                self.__selector.register(sock, selectors.EVENT_READ, channel)
+        self.__wake()
+        if enqueued:
+            self.schedule(event_handle)
+
+    def __retry_later(self, channel):
+        handle = channel.event_handle._handle
+        if handle.cookie is None:
+            return
+        if channel.attempts >= _RESUBSCRIBE_MAX_ATTEMPTS:
+            log.warning("Event channel of %s given up after %d failed "
+                        "attempts." % (handle.uri, channel.attempts))
+            return
+
+        channel.attempts += 1
+        deadline = time.time() + channel.retry_delay
+        channel.retry_delay = min(channel.retry_delay * 2,
+                                  _RESUBSCRIBE_MAX_SEC)
+        self.__push_timer(channel, deadline, "subscribe")
+
+    def __push_timer(self, channel, deadline, action):
+        with self.__lock:
+            if action == "dequeue":
+                channel.deadline = deadline
+            else:
+                channel.retry_at = deadline
+            heapq.heappush(self.__timers, (deadline, next(self.__timer_seq),
+                                           channel, action))
+        self.__wake()
+
+    def __close(self, channel, reason=None):
+        with channel.lock:
+            sock, channel.sock = channel.sock, None
+        if sock is None:
+            return
+        try:
+            self.__selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        sock.close()
+        if reason is None:
+            return
+
+        log.info("Event channel of %s closed: %s" % (
+            channel.event_handle._handle.uri, reason))
+        if channel.subscribe and len(channel.event_handle._wbs) and \
+                self.__channels.get(channel.event_handle) is channel:
+            self.__retry_later(channel)
+
+    def __run(self):
+        while self.__running:
+            for key, _ in self.__selector.select(self.__next_timeout()):
+                if key.data is None:
+                    self.__drain_wakeup()
+                else:
+                    self.__read(key.data)
+            self.__run_timers()
+
+    def __drain_wakeup(self):
+        try:
+            while self.__wakeup[0].recv(_READ_SIZE):
+                pass
+        except (IOError, OSError):
+            pass
+
+    @staticmethod
+    def __is_current(timer):
+        deadline, _, channel, action = timer
+        if action == "dequeue":
+            return channel.deadline == deadline
+        return channel.retry_at == deadline
+
+    def __next_timeout(self):
+        with self.__lock:
+            timers = self.__timers
+            while timers and not self.__is_current(timers[0]):
+                heapq.heappop(timers)
+            if not timers:
+                return None
+            return max(0, timers[0][0] - time.time())
+
+    def __run_timers(self):
+        now = time.time()
+        due = []
+        with self.__lock:
+            timers = self.__timers
+            while timers and timers[0][0] <= now:
+                timer = heapq.heappop(timers)
+                if not self.__is_current(timer):
+                    continue
+                if timer[3] == "dequeue":
+                    timer[2].deadline = None
+                else:
+                    timer[2].retry_at = None
+                due.append(timer)
+        for _, _, channel, action in due:
+            if action == "dequeue":
+                self.schedule(channel.event_handle)
+            else:
+                self.__tasks.put((self.__resubscribe, channel))
+
+    def __read(self, channel):
+        enqueued = False
+        while channel.sock is not None:
+            try:
+                data = channel.sock.recv(_READ_SIZE)
+            except (ssl.SSLWantReadError, BlockingIOError):
+                break
+            except (IOError, OSError) as e:
+                self.__close(channel, e)
+                break
+
+            if not data:
+                self.__close(channel, "connection closed by the server")
+                break
+            if self.__feed(channel, data):
+                enqueued = True
+
+        if enqueued:
+            self.schedule(channel.event_handle)
+
+    def __feed(self, channel, data):
+        """
+        Decodes the bytes read on an event channel.
+
+        Returns:
+            True if the watch blocks have anything new to process
+        """
+
+        event_handle = channel.event_handle
+        enqueued = False
+        accepted = channel.stream.headers_read
+        try:
+            messages = channel.stream.feed(data)
+        except Exception as e:
+            self.__close(channel, e)
+            return False
+        if not accepted and channel.stream.headers_read:
+            channel.retry_delay = _RESUBSCRIBE_MIN_SEC
+            channel.attempts = 0
+            event_handle._on_subscribed()
+            enqueued = True
+        for message in messages:
+            if event_handle._process_event_channel_resp(message):
+                enqueued = True
+        if channel.stream.closed:
+            self.__close(channel, "end of the event stream")
+        return enqueued
+
+    def schedule(self, event_handle):
+        """
+        Queues the processing of the watch blocks of an event handle on the
+        worker pool.
+
+        Args:
+            event_handle (UcsEventHandle): event handle
+
+        Returns:
+            None
+        """
+
+        channel = self.__channels.get(event_handle)
+        if channel is None:
+            return
+        with channel.lock:
+            if channel.scheduled:
+                channel.again = True
+                return
+            channel.scheduled = True
+        self.__tasks.put((self.__dequeue, channel))
+
+    def __work(self):
+        while True:
+            task = self.__tasks.get()
+            if task is None:
+                return
+            func, channel = task
+            func(channel)
+
+    def __dequeue(self, channel):
+        event_handle = channel.event_handle
+        timeout = None
+        while True:
+            with channel.lock:
+                channel.again = False
+            try:
+                timeout = event_handle._dequeue_pass()
+            except Exception as e:
+                log.info(str(e))
+            with channel.lock:
+                if not channel.again:
+                    channel.scheduled = False
+                    break
+
+        if len(event_handle._wbs) == 0:
+            self.remove(event_handle)
+            return
+        if timeout is not None:
+            self.__push_timer(channel, time.time() + timeout, "dequeue")
@@ -13,6 +13,7 @@
 
 
 import re
+import threading
 
 import pyparsing as pp
 
@@ -30,134 +31,232 @@ types = {"eq": "EqFilter",
          "re": "WcardFilter"
          }
 
+_operators = {"not": NotFilter,
+              "and": AndFilter,
+              "or": OrFilter}
 
-class ParseFilter(object):
+# max number of compiled filters kept by generate_infilter
+FILTER_CACHE_SIZE = 256
+
+_grammar = None
+_grammar_lock = threading.Lock()
+
+
+def _leaf_node(toks):
     """
-    Supporting class to parse filter expression.
+    parse action for a single (prop, value, type, flag) expression
     """
 
-    def __init__(self, class_id, is_meta_classid):
-        self.class_id = class_id
-        self.is_meta_classid = is_meta_classid
+    type_ = "re"
+    if "type_exp" in toks[0]:
+        type_ = toks[0]["type_exp"]["types"]
 
-    def parse_filter_obj(self, toks):
-        """
-        Supporting class to parse filter expression.
-        """
+    flag_ = "C"
+    if "flag_exp" in toks[0]:
+        flag_ = toks[0]["flag_exp"]["flags"]
 
-        # print toks[0] #logger
+    return ("leaf", toks[0]["prop"], toks[0]["value"], type_, flag_)
 
-        prop_ = toks[0]["prop"]
-        value_ = toks[0]["value"]
 
-        type_ = "re"
-        if "type_exp" in toks[0]:
-            type_ = toks[0]["type_exp"]["types"]
+def _operand(tok):
+    # a parenthesized sub expression comes wrapped in its own results
+    while isinstance(tok, pp.ParseResults):
+        tok = tok[0]
+    return tok
 
-        flag_ = "C"
-        if "flag_exp" in toks[0]:
-            flag_ = toks[0]["flag_exp"]["flags"]
 
-        # print prop_, value_, type_, flag_ #logger
+def _not_node(toks):
+    return ("not", tuple(_operand(tok) for tok in toks[0][1:]))
 
-        if flag_ == "I":
-            value_ = re.sub(
-                r"[a-zA-Z]",
-                lambda x: "[" +
-                x.group().upper() +
-                x.group().lower() +
-                "]",
-                value_)
 
-        if self.is_meta_classid:
-            class_obj = ucscoreutils.load_class(self.class_id)
-            prop_mo_meta = class_obj.prop_meta[prop_]
-            if prop_mo_meta:
-                prop_ = prop_mo_meta.xml_attribute
+def _and_node(toks):
+    return ("and", tuple(_operand(tok) for tok in toks[0][0::2]))
 
-        sub_filter = create_basic_filter(types[type_],
-                                         class_=ucsgenutils.word_l(
-                                             self.class_id),
-                                         property=prop_,
-                                         value=value_)
 
-        return sub_filter
+def _or_node(toks):
+    return ("or", tuple(_operand(tok) for tok in toks[0][0::2]))
 
-    @staticmethod
-    def and_operator(toks):
-        """
-        method to support logical 'and' operator expression
-        """
 
-        # print  str, loc, toks
-        # print toks[0][0::2]
-        and_filter = AndFilter()
-        for op_filter in toks[0][0::2]:
-            and_filter.child_add(op_filter)
-        return and_filter
+def _build_grammar():
+    """
+    Builds the filter expression grammar. Parsing yields a tree of tuples
+    that does not depend on the class being queried.
+    """
 
-    @staticmethod
-    def or_operator(toks):
-        """
-        method to support logical 'or' operator expression
-        """
+    prop = pp.WordStart(pp.alphas) + pp.Word(pp.alphanums +
+                                             "_").setResultsName("prop")
+    value = (pp.QuotedString("'") | pp.QuotedString('"') | pp.Word(
+        pp.printables, excludeChars=",")).setResultsName("value")
+    types_ = pp.oneOf("re eq ne gt ge lt le").setResultsName("types")
+    flags = pp.oneOf("C I").setResultsName("flags")
+    comma = pp.Literal(',')
+    quote = (pp.Literal("'") | pp.Literal('"')).setResultsName("quote")
+
+    type_exp = pp.Group(pp.Literal("type") + pp.Literal(
+        "=") + quote + types_ + quote).setResultsName("type_exp")
+    flag_exp = pp.Group(pp.Literal("flag") + pp.Literal(
+        "=") + quote + flags + quote).setResultsName("flag_exp")
+
+    semi_expression = pp.Forward()
+    semi_expression << pp.Group(pp.Literal("(") +
+                                prop + comma + value +
+                                pp.Optional(comma + type_exp) +
+                                pp.Optional(comma + flag_exp) +
+                                pp.Literal(")")
+                                ).setParseAction(
+        _leaf_node).setResultsName("semi_expression")
+
+    infix_notation = getattr(pp, "infixNotation", None) or \
+        pp.operatorPrecedence
+    expr = pp.Forward()
+    expr << infix_notation(semi_expression, [
+        ("not", 1, pp.opAssoc.RIGHT, _not_node),
+        ("and", 2, pp.opAssoc.LEFT, _and_node),
+        ("or", 2, pp.opAssoc.LEFT, _or_node)
+    ])
+    return expr
+
+
+def _parse(filter_str):
+    """
+    Parses the filter string with the grammar shared by all the requests.
+    """
 
-        # print  str, loc, toks
-        # print toks[0][0::2]
-        or_filter = OrFilter()
-        for op_filter in toks[0][0::2]:
-            or_filter.child_add(op_filter)
-        return or_filter
+    global _grammar
+
+    with _grammar_lock:
+        if _grammar is None:
+            _grammar = _build_grammar()
+        return _operand(_grammar.parseString(filter_str)[0])
 
-    @staticmethod
-    def not_operator(toks):
-        """
-        method to support logical 'and' operator expression
-        """
 
-        not_filter = NotFilter()
+def _compile(node, class_id, is_meta_class_id):
+    """
+    Resolves the parsed tree for the class, so that filter objects can be
+    created from it without looking anything up.
+    """
+
+    if node[0] != "leaf":
+        return (_operators[node[0]],
+                tuple(_compile(child, class_id, is_meta_class_id)
+                      for child in node[1]))
+
+    prop_, value_, type_, flag_ = node[1:]
+    if flag_ == "I":
+        value_ = re.sub(
+            r"[a-zA-Z]",
+            lambda x: "[" +
+            x.group().upper() +
+            x.group().lower() +
+            "]",
+            value_)
+
+    if is_meta_class_id:
+        class_obj = ucscoreutils.load_class(class_id)
+        prop_mo_meta = class_obj.prop_meta[prop_]
+        if prop_mo_meta:
+            prop_ = prop_mo_meta.xml_attribute
+
+    filter_class = load_filter_class(types[type_])
+    return (filter_class, {"class_": ucsgenutils.word_l(class_id),
+                           "property": prop_,
+                           "value": value_})
+
+
+def _instantiate(compiled):
+    """
+    Creates a new filter object tree from a compiled filter.
+    """
+
+    filter_class, arg = compiled
+    filter_obj = filter_class()
+    if isinstance(arg, dict):
+        filter_obj.create(**arg)
+    else:
+        for child in arg:
+            filter_obj.child_add(_instantiate(child))
+    return filter_obj
+
+
+class _FilterCache(object):
+    """
+    LRU cache of compiled filters keyed by
+    (class_id, filter_str, is_meta_class_id)
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.__compiled = {}
+        # keys, least recently used first
+        self.__order = []
+        self.__lock = threading.Lock()
+
+    def get(self, key):
+        with self.__lock:
+            compiled = self.__compiled.get(key)
+            if compiled is not None:
+                self.__order.remove(key)
+                self.__order.append(key)
+            return compiled
+
+    def put(self, key, compiled):
+        with self.__lock:
+            if key in self.__compiled:
+                self.__order.remove(key)
+            self.__compiled[key] = compiled
+            self.__order.append(key)
+            while len(self.__order) > self.size:
+                del self.__compiled[self.__order.pop(0)]
+
+    def clear(self):
+        with self.__lock:
+            self.__compiled.clear()
+            del self.__order[:]
+
+    def __len__(self):
+        return len(self.__compiled)
 
-        for op_filter in toks[0][1:]:
-            not_filter.child_add(op_filter)
-        return not_filter
+
+_filter_cache = _FilterCache(FILTER_CACHE_SIZE)
+
+
+def clear_filter_cache():
+    """
+    Drops the compiled filters kept by generate_infilter.
+    """
+
+    _filter_cache.clear()
+
+
+def compile_filter(class_id, filter_str, is_meta_class_id):
+    """
+    Parses and resolves a filter expression, using the cache.
+    """
+
+    key = (class_id, filter_str, is_meta_class_id)
+    compiled = _filter_cache.get(key)
+    if compiled is None:
+        compiled = _compile(_parse(filter_str), class_id, is_meta_class_id)
+        _filter_cache.put(key, compiled)
+    return compiled
+
+
+class ParseFilter(object):
+    """
+    Supporting class to parse filter expression.
+    """
+
+    def __init__(self, class_id, is_meta_classid):
+        self.class_id = class_id
+        self.is_meta_classid = is_meta_classid
 
     def parse_filter_str(self, filter_str):
         """
         method to parse filter string
         """
 
-        prop = pp.WordStart(pp.alphas) + pp.Word(pp.alphanums +
-                                                 "_").setResultsName("prop")
-        value = (pp.QuotedString("'") | pp.QuotedString('"') | pp.Word(
-            pp.printables, excludeChars=",")).setResultsName("value")
-        types_ = pp.oneOf("re eq ne gt ge lt le").setResultsName("types")
-        flags = pp.oneOf("C I").setResultsName("flags")
-        comma = pp.Literal(',')
-        quote = (pp.Literal("'") | pp.Literal('"')).setResultsName("quote")
-
-        type_exp = pp.Group(pp.Literal("type") + pp.Literal(
-            "=") + quote + types_ + quote).setResultsName("type_exp")
-        flag_exp = pp.Group(pp.Literal("flag") + pp.Literal(
-            "=") + quote + flags + quote).setResultsName("flag_exp")
-
-        semi_expression = pp.Forward()
-        semi_expression << pp.Group(pp.Literal("(") +
-                                    prop + comma + value +
-                                    pp.Optional(comma + type_exp) +
-                                    pp.Optional(comma + flag_exp) +
-                                    pp.Literal(")")
-                                    ).setParseAction(
-            self.parse_filter_obj).setResultsName("semi_expression")
-
-        expr = pp.Forward()
-        expr << pp.operatorPrecedence(semi_expression, [
-            ("not", 1, pp.opAssoc.RIGHT, self.not_operator),
-            ("and", 2, pp.opAssoc.LEFT, self.and_operator),
-            ("or", 2, pp.opAssoc.LEFT, self.or_operator)
-        ])
-
-        result = expr.parseString(filter_str)
-        return result
+        return [_instantiate(compile_filter(self.class_id, filter_str,
+                                            self.is_meta_classid))]
 
 
 def generate_infilter(class_id, filter_str, is_meta_class_id):
@@ -178,11 +277,56 @@ def generate_infilter(class_id, filter_str, is_meta_class_id):
                            True)
     """
 
-    parse_filter = ParseFilter(class_id=class_id,
-                               is_meta_classid=is_meta_class_id)
-    result = parse_filter.parse_filter_str(filter_str)
+    compiled = compile_filter(class_id, filter_str, is_meta_class_id)
     in_filter = FilterFilter()
-    in_filter.child_add(result[0])
+    in_filter.child_add(_instantiate(compiled))
+    return in_filter
+
+
+def generate_page_infilter(class_id, filter_str, is_meta_class_id,
+                           after_dn=None):
+    """
+    Create the FilterFilter object of a page of a paged query, which only
+    matches the objects of the filter expression placed after a given dn.
+
+    Args:
+        class_id (str): class_id
+        filter_str (str): filter expression, or None
+        is_meta_class_id (bool)
+        after_dn (str): dn of the last object of the previous page, or None
+            for the first page
+
+    Returns:
+        FilterFilter object, or None if there is nothing to filter
+
+    Example:
+        generate_page_infilter("FaultInst", '(severity, "major")', True,
+                               "sys/chassis-1/fault-F0174")
+    """
+
+    from .ucsfiltertype import AndFilter, GtFilter
+
+    children = []
+    if filter_str:
+        children.append(_instantiate(
+            compile_filter(class_id, filter_str, is_meta_class_id)))
+    if after_dn is not None:
+        after_filter = GtFilter()
+        after_filter.create(class_=ucsgenutils.word_l(class_id),
+                            property="dn", value=after_dn)
+        children.append(after_filter)
+
+    if not children:
+        return None
+
+    in_filter = FilterFilter()
+    if len(children) == 1:
+        in_filter.child_add(children[0])
+    else:
+        and_filter = AndFilter()
+        for child in children:
+            and_filter.child_add(child)
+        in_filter.child_add(and_filter)
     return in_filter
 
 
@@ -231,7 +375,7 @@ def handle_filter_max_component_limit(handle, l_filter):
     return handle_filter_max_component_limit(handle, result_filter)
 
 
-def create_basic_filter(filter_name, **kwargs):
+def load_filter_class(filter_name):
     """
     Loads filter class
     """
@@ -240,6 +384,14 @@ def create_basic_filter(filter_name, **kwargs):
     fq_module_name = ucsmeta.OTHER_TYPE_CLASS_ID[filter_name]
     module_import = __import__(fq_module_name, globals(), locals(),
                                [filter_name], level=1)
-    filter_obj = getattr(module_import, filter_name)()
+    return getattr(module_import, filter_name)
+
+
+def create_basic_filter(filter_name, **kwargs):
+    """
+    Creates a filter object
+    """
+
+    filter_obj = load_filter_class(filter_name)()
     filter_obj.create(**kwargs)
     return filter_obj
@@ -18,10 +18,8 @@ import threading
 
 from . import ucsgenutils
 from . import ucscoreutils
-from .ucsexception import UcsException
-from .ucsconstants import NamingId
+from .ucsexception import UcsException, UcsOperationError
 from .ucssession import UcsSession
-from .ucsmethodfactory import config_resolve_classes
 
 log = logging.getLogger('ucs')
 
@@ -53,6 +51,7 @@ class UcsHandle(UcsSession):
         UcsSession.__init__(self, ip, username, password, port, secure, proxy)
         self.__commit_buf = {}
         self.__commit_buf_tagged = {}
+        self.__mo_cache = None
 
     def set_dump_xml(self):
         """
@@ -93,6 +92,77 @@ class UcsHandle(UcsSession):
         """
         return self.threaded
 
+    def set_mode_concurrent_reads(self):
+        """
+        Allows read-only queries(query_dn, query_classid, query_children
+        etc.) issued from multiple threads on this handle to be in flight
+        at the same time.
+        Configuration changes and session maintenance requests like
+        aaaRefresh are still serialized with respect to every other request
+        on the handle.
+        """
+        self._set_mode_concurrent_reads(enable=True)
+
+    def unset_mode_concurrent_reads(self):
+        """
+        Unsets the concurrent reads mode of operation.
+        Every request on the handle is serialized in this mode.
+        """
+        self._set_mode_concurrent_reads(enable=False)
+
+    def is_concurrent_reads_enabled(self):
+        """
+        returns if concurrent reads mode is set
+        """
+        return self.concurrent_reads
+
+    def set_mode_direct_xml(self):
+        """
+        Writes the configConfMos request of commit straight to bytes,
+        without creating the element tree of the request first. The request
+        sent is the same, only faster to create for large commits.
+        """
+        self._set_mode_direct_xml(enable=True)
+
+    def unset_mode_direct_xml(self):
+        """
+        Unsets the direct xml mode of operation.
+        """
+        self._set_mode_direct_xml(enable=False)
+
+    def is_direct_xml_enabled(self):
+        """
+        returns if direct xml mode is set
+        """
+        return self.direct_xml
+
+    def set_connection_pool(self, pool_size=4, idle_timeout=60,
+                            health_check=True):
+        """
+        Configures the pool of persistent(keep-alive) connections used to
+        send the requests to the server. Connections are pooled by default.
+
+        Args:
+            pool_size (int): max number of idle connections kept open
+            idle_timeout (int): idle time in seconds after which a
+                connection is not reused anymore
+            health_check (bool): if True, checks that an idle connection has
+                not been closed by the server before reusing it
+
+        Returns:
+            None
+
+        Example:
+            handle.set_connection_pool(pool_size=8, idle_timeout=30)
+        """
+        self._set_connection_pool(pool_size, idle_timeout, health_check)
+
+    def unset_connection_pool(self):
+        """
+        Sends every request over a new connection.
+        """
+        self._unset_connection_pool()
+
     def login(self, auto_refresh=False, force=False):
         """
         Initiates a connection to the server referenced by the UcsHandle.
@@ -134,6 +204,7 @@ class UcsHandle(UcsSession):
             where handle is UcsHandle()
         """
 
+        self.disable_cache()
         return self._logout()
 
     def process_xml_elem(self, elem):
@@ -190,6 +261,7 @@ class UcsHandle(UcsSession):
 
         """
 
+        from .ucsconstants import NamingId
         from .ucsmethodfactory import aaa_get_n_compute_auth_token_by_dn
 
         auth_token = None
@@ -285,6 +357,7 @@ class UcsHandle(UcsSession):
         # ToDo - How to handle unknown class_id
         from .ucsbasetype import ClassIdSet, ClassId
         from .ucsmeta import MO_CLASS_ID
+        from .ucsmethodfactory import config_resolve_classes
 
         if not class_ids:
             raise ValueError("Provide a list or Comma Separated string of \
@@ -325,6 +398,90 @@ class UcsHandle(UcsSession):
 
         return class_id_dict
 
+    def query_planner(self, max_batch_size=100, min_folded_parents=4):
+        """
+        Returns a query planner, which queues many lookups by dn, by class id
+        and of children, and resolves them all with the fewest
+        configResolveDns and configResolveClasses requests.
+
+        Args:
+            max_batch_size (int): maximum number of dns or class ids per
+                request
+            min_folded_parents (int): number of parents from which the
+                children of a class are queried with the whole class
+
+        Returns:
+            UcsQueryPlanner object
+
+        Example:
+            planner = handle.query_planner()\n
+            blade = planner.add_dn("sys/chassis-1/blade-1")\n
+            adaptors = planner.add_children("sys/chassis-1/blade-1",
+                                            class_id="AdaptorUnit")\n
+            results = planner.execute()\n
+            print(results[blade].serial, len(results[adaptors]))\n
+        """
+
+        from .ucsqueryplan import UcsQueryPlanner
+
+        return UcsQueryPlanner(self, max_batch_size, min_folded_parents)
+
+    def enable_cache(self, class_ids=(), dns=(), max_age=None,
+                     max_objects=None, reactor=None):
+        """
+        Loads the objects of the given classes and subtrees in memory, keeps
+        them current from the event channel, and serves query_dn,
+        query_classid and query_children on them without a request, as long
+        as no filter and no hierarchy is asked for.
+
+        Args:
+            class_ids (list): class ids of the objects to cache
+            dns (list): dns of the subtrees to cache
+            max_age (float): seconds after which a class or subtree is
+                reloaded on its next query, None to only rely on the events
+            max_objects (int or dict): maximum number of objects of a class
+                or subtree, or dict of the maximum of every class id or dn.
+                A class or subtree above its maximum is not cached.
+            reactor (UcsEventReactor): reactor which runs the event handle
+                of the cache
+
+        Returns:
+            UcsMoCache object
+
+        Example:
+            cache = handle.enable_cache(class_ids=["LsServer",
+                                                   "ComputeBlade"],
+                                        max_age=3600)\n
+            sps = handle.query_classid("LsServer")\n
+            print(cache.stats())\n
+            handle.disable_cache()\n
+        """
+
+        from .ucsmocache import UcsMoCache
+
+        self.disable_cache()
+        mo_cache = UcsMoCache(self, class_ids, dns, max_age, max_objects,
+                              reactor)
+        mo_cache.start()
+        self.__mo_cache = mo_cache
+        return mo_cache
+
+    def disable_cache(self):
+        """
+        Drops the managed object cache, all the queries go to the server.
+        """
+
+        mo_cache, self.__mo_cache = self.__mo_cache, None
+        if mo_cache is not None:
+            mo_cache.stop()
+
+    @property
+    def mo_cache(self):
+        """
+        UcsMoCache object of the handle, None unless enable_cache is called
+        """
+        return self.__mo_cache
+
     def query_dn(self, dn, hierarchy=False, need_response=False):
         """
         Finds an object using it's distinguished name.
@@ -355,6 +512,12 @@ class UcsHandle(UcsSession):
         if not dn:
             raise ValueError("Provide dn.")
 
+        mo_cache = self.__mo_cache
+        if mo_cache is not None and not hierarchy and not need_response:
+            found, mo = mo_cache.lookup_dn(dn)
+            if found:
+                return mo
+
         dn_set = DnSet()
         dn_obj = Dn()
         dn_obj.value = dn
@@ -382,7 +545,7 @@ class UcsHandle(UcsSession):
         return mo
 
     def query_classid(self, class_id=None, filter_str=None, hierarchy=False,
-                      need_response=False):
+                      need_response=False, records=False):
         """
         Finds an object using it's class id.
 
@@ -408,17 +571,23 @@ class UcsHandle(UcsSession):
                              hierarchical objects.
             need_response(bool): if set to True will return only response
                                 object.
+            records(bool): if set to True will return read-only records,
+                            which take a fraction of the memory of managed
+                            objects. record.to_mo() returns the managed
+                            object of a record.
 
 
         Returns:
             managedobjectlist or None   by default\n
             managedobjectlist or None   if hierarchy=True\n
             methodresponse              if need_response=True\n
+            MoRecord list               if records=True\n
 
         Example:
             obj = handle.query_classid(class_id="LsServer")\n
             obj = handle.query_classid(class_id="LsServer", hierarchy=True)\n
             obj = handle.query_classid(class_id="LsServer", need_response=True)\n
+            faults = handle.query_classid(class_id="FaultInst", records=True)\n
 
             filter_str = '(dn,"org-root/ls-C1_B1", type="eq") or (name, "event", type="re", flag="I")'\n
             obj = handle.query_classid(class_id="LsServer", filter_str=filter_str)\n
@@ -426,44 +595,237 @@ class UcsHandle(UcsSession):
 
         # ToDo - How to handle unknown class_id
 
-        from .ucsfilter import generate_infilter
-        from .ucsmethodfactory import config_resolve_class
+        if records and need_response:
+            raise ValueError("records and need_response are exclusive")
 
-        if not class_id:
-            raise ValueError("Provide Parameter class_id")
+        mo_cache = self.__mo_cache
+        if mo_cache is not None and class_id and not filter_str and \
+                not hierarchy and not need_response and not records:
+            found, mo_list = mo_cache.lookup_classid(class_id)
+            if found:
+                return mo_list
+
+        elem = self.__config_resolve_class_elem(class_id, filter_str,
+                                                hierarchy)
+        if records:
+            return self.__query_records(elem, hierarchy)
+
+        response = self.post_elem(elem)
+        if response.error_code != 0:
+            raise UcsException(response.error_code, response.error_descr)
+
+        if need_response:
+            return response
+
+        out_mo_list = ucscoreutils.extract_molist_from_method_response(
+            response,
+            hierarchy)
+        return out_mo_list
+
+    def __query_records(self, elem, hierarchy):
+        """
+        Internal method sending a query and decoding the response into
+        records while it is received.
+        """
+
+        from . import ucsxmlcodec as xc
+
+        stream = self._post_elem_stream(elem)
+        try:
+            return list(xc.iter_records_from_xml(stream, hierarchy))
+        finally:
+            stream.close()
+
+    def __resolve_class_id(self, class_id):
+        """
+        Internal method returning the class id to query, and whether it is
+        known to the meta.
+        """
 
         meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
             class_id)
         if meta_class_id:
-            is_meta_class_id = True
-        else:
-            meta_class_id = class_id
-            is_meta_class_id = False
+            return meta_class_id, True
+        return class_id, False
+
+    def __config_resolve_class_elem(self, class_id, filter_str, hierarchy):
+        """
+        Internal method to build the configResolveClass request of a class
+        query.
+        """
+
+        from .ucsfilter import generate_infilter
+        from .ucsmethodfactory import config_resolve_class
 
+        if not class_id:
+            raise ValueError("Provide Parameter class_id")
+
+        meta_class_id, is_meta_class_id = self.__resolve_class_id(class_id)
         if filter_str:
             in_filter = generate_infilter(meta_class_id, filter_str,
                                           is_meta_class_id)
         else:
             in_filter = None
 
-        elem = config_resolve_class(cookie=self.cookie,
+        return config_resolve_class(cookie=self.cookie,
                                     class_id=meta_class_id,
                                     in_filter=in_filter,
                                     in_hierarchical=hierarchy)
-        response = self.post_elem(elem)
-        if response.error_code != 0:
-            raise UcsException(response.error_code, response.error_descr)
 
-        if need_response:
-            return response
+    def __iter_pages(self, class_id, filter_str, hierarchy, page_size,
+                     in_dn=None):
+        """
+        Internal method yielding the objects of a class, or of the children
+        of in_dn of a class, one page of page_size objects per request.
+        Pages are requested sorted by dn, every page starts after the
+        highest dn of the previous one, until a page is empty: the server
+        may send fewer objects than page_size.
+        """
 
-        out_mo_list = ucscoreutils.extract_molist_from_method_response(
-            response,
-            hierarchy)
-        return out_mo_list
+        from . import ucsxmlcodec as xc
+        from .ucsfilter import generate_page_infilter
+        from .ucsmethodfactory import config_resolve_class_sorted, \
+            config_resolve_children_sorted
+
+        if page_size < 1:
+            raise ValueError("page_size must be a positive integer")
+
+        meta_class_id, is_meta_class_id = self.__resolve_class_id(class_id)
+        after_dn = None
+        while True:
+            in_filter = generate_page_infilter(meta_class_id, filter_str,
+                                               is_meta_class_id, after_dn)
+            if in_dn is None:
+                elem = config_resolve_class_sorted(cookie=self.cookie,
+                                                   class_id=meta_class_id,
+                                                   in_filter=in_filter,
+                                                   in_size=page_size,
+                                                   in_hierarchical=hierarchy)
+            else:
+                elem = config_resolve_children_sorted(
+                    cookie=self.cookie,
+                    class_id=meta_class_id,
+                    in_dn=in_dn,
+                    in_filter=in_filter,
+                    in_size=page_size,
+                    in_hierarchical=hierarchy)
+
+            last_dn = after_dn
+            stream = self._post_elem_stream(elem)
+            try:
+                for mo in xc.iter_mos_from_xml(stream, self):
+                    # the gt filter of the next page compares the dns as
+                    # strings, the order of python strings is assumed to be
+                    # the order of the server
+                    if after_dn is None or mo.dn > after_dn:
+                        after_dn = mo.dn
+                    if not hierarchy:
+                        yield mo
+                        continue
+                    for each in ucscoreutils.flatten_mo_tree(mo):
+                        yield each
+            finally:
+                stream.close()
+
+            # an empty page, or a page without any dn after the previous
+            # one, ends the iteration
+            if after_dn == last_dn:
+                break
+
+    def iter_classid(self, class_id=None, filter_str=None, hierarchy=False,
+                     page_size=None):
+        """
+        Finds objects using their class id, like query_classid, but decodes
+        the response while it is received and yields the objects one at a
+        time. Memory stays flat even for 100k+ objects, provided that the
+        caller does not keep them all.
+
+        Args:
+            class_id (str): class id of the object to be queried for.
+            filter_str(str): query objects with specific property with
+                specific value or pattern specifying value.
+                Same syntax as in query_classid.
+            hierarchy(bool): if set to True will also yield all the child
+                hierarchical objects, detached from their parent. Every
+                object is followed by its own descendants.
+            page_size(int): if set, the objects are requested in pages of
+                page_size objects sorted by dn, each page being a separate
+                configResolveClassSorted request, so that no response grows
+                beyond a page. By default, a single request is sent.
+
+        Returns:
+            generator of managed objects
+
+        Example:
+            for fault in handle.iter_classid(class_id="FaultInst"):\n
+                print(fault.dn)\n
+            for fault in handle.iter_classid(class_id="FaultInst",
+                                             page_size=1000):\n
+                print(fault.dn)\n
+        """
+
+        from . import ucsxmlcodec as xc
+
+        if page_size is not None:
+            if not class_id:
+                raise ValueError("Provide Parameter class_id")
+            for mo in self.__iter_pages(class_id, filter_str, hierarchy,
+                                        page_size):
+                yield mo
+            return
+
+        elem = self.__config_resolve_class_elem(class_id, filter_str,
+                                                hierarchy)
+        stream = self._post_elem_stream(elem)
+        try:
+            for mo in xc.iter_mos_from_xml(stream, self, hierarchy):
+                yield mo
+        finally:
+            stream.close()
+
+    def iter_children(self, in_mo=None, in_dn=None, class_id=None,
+                      filter_str=None, hierarchy=False, page_size=1000):
+        """
+        Finds children of a given managed object or distinguished name, like
+        query_children, and yields them one page at a time. Every page of
+        page_size children sorted by dn is a separate
+        configResolveChildrenSorted request.
+
+        Args:
+            in_mo (managed object): query children managed object under this
+                                        object.
+            in_dn (dn string): query children managed object for a
+                                given managed object of the respective dn.
+            class_id(str): class id of the children to query, required to
+                            page through them.
+            filter_str(str): query objects with specific property with
+                specific value or pattern specifying value.
+                Same syntax as in query_children.
+            hierarchy(bool): if set to True will also yield all the child
+                hierarchical objects, detached from their parent.
+            page_size(int): number of children requested at a time.
+
+        Returns:
+            generator of managed objects
+
+        Example:
+            for sp in handle.iter_children(in_dn="org-root",
+                                           class_id="LsServer"):\n
+                print(sp.dn)\n
+        """
+
+        if not in_mo and not in_dn:
+            raise ValueError('[Error]: GetChild: Provide in_mo or in_dn.')
+        if not class_id:
+            raise ValueError("Provide Parameter class_id")
+
+        parent_dn = in_mo.dn if in_mo else in_dn
+        for mo in self.__iter_pages(class_id, filter_str, hierarchy,
+                                    page_size, in_dn=parent_dn):
+            yield mo
 
     def query_children(self, in_mo=None, in_dn=None, class_id=None,
-                       filter_str=None, hierarchy=False):
+                       filter_str=None, hierarchy=False, records=False):
         """
         Finds children of a given managed object or distinguished name.
         Arguments can be specified to query only a specific type(class_id)
@@ -503,10 +865,13 @@ class UcsHandle(UcsSession):
                                 object.
             hierarchy(bool): if set to True will return all the child
                               hierarchical objects.
+            records(bool): if set to True will return read-only records
+                            instead of managed objects, as query_classid.
 
         Returns:
             managedobjectlist or None   by default\n
             managedobjectlist or None   if hierarchy=True\n
+            MoRecord list               if records=True\n
 
         Example:
             mo_list = handle.query_children(in_mo=mo)\n
@@ -530,6 +895,13 @@ class UcsHandle(UcsSession):
         elif in_dn:
             parent_dn = in_dn
 
+        mo_cache = self.__mo_cache
+        if mo_cache is not None and not filter_str and not hierarchy and \
+                not records:
+            found, mo_list = mo_cache.lookup_children(parent_dn, class_id)
+            if found:
+                return mo_list
+
         in_filter = None
 
         if class_id:
@@ -552,6 +924,9 @@ class UcsHandle(UcsSession):
                                        in_dn=parent_dn,
                                        in_filter=in_filter,
                                        in_hierarchical=hierarchy)
+        if records:
+            return self.__query_records(elem, hierarchy)
+
         response = self.post_elem(elem)
         if response.error_code != 0:
             raise UcsException(response.error_code, response.error_descr)
@@ -863,62 +1238,340 @@ class UcsHandle(UcsSession):
                         msg_buf[l_type].append(params)
         return json.dumps(msg_buf, indent=4)
 
-    def commit(self, tag=None):
+    def commit(self, tag=None, chunk_size=None, chunk_bytes=None,
+               refresh=True, progress=None):
         """
         Commit the buffer to the server. Pushes all the configuration changes
         so far to the server.
         Configuration could be added to the commit buffer using add_mo(),
         set_mo(), remove_mo() prior to making a handle.commit()
 
+        The buffer is sent in one request, unless chunk_size or chunk_bytes
+        is given. It is then split in chunks, sent one after the other,
+        parents before their children. Every chunk is a transaction of its
+        own: if one fails, the chunks before it stay committed, and the
+        objects not committed stay in the buffer.
+
         Args:
-            None
+            tag (str): transaction tag of the commit buffer, the current
+                tag context if None
+            chunk_size (int): most objects sent in a request, their
+                modified children included
+            chunk_bytes (int): most bytes of objects sent in a request. An
+                object larger than this, with its children, is sent alone.
+            refresh (bool): if True, the modified children of the committed
+                objects are read back from the server. The objects of the
+                buffer are updated from the response of the commit anyway.
+            progress (ucsgenutils.Progress): its update(total, size) is
+                called after every request, with the number of objects of
+                the buffer and of the request
 
         Returns:
             None
 
         Example:
             handle.commit()\n
+            handle.commit(chunk_size=500, refresh=False, progress=Progress())\n
         """
 
-        from .ucsbasetype import ConfigMap, Dn, DnSet, Pair
-        from .ucsmethodfactory import config_resolve_dns
-        from .ucsmethodfactory import config_conf_mos
-
         tag = self._auto_set_tag_context(tag)
+        self.__commit(tag, chunk_size, chunk_bytes, refresh, progress)
+
+    def commit_many(self, tags, max_workers=4, chunk_size=None,
+                    chunk_bytes=None, refresh=True):
+        """
+        Commits the buffers of several transaction tags, concurrently.
+
+        Up to max_workers buffers are committed at the same time, their
+        requests share the session lock. Two buffers changing the same
+        subtree, a dn of one being a dn of the other or below it, are never
+        committed at the same time: the tag given first is committed first.
+        If its commit fails, the later one is not committed: its error is a
+        UcsOperationError and its buffer is kept.
+
+        Args:
+            tags (list): transaction tags of the commit buffers, the tags
+                without a buffer commit nothing
+            max_workers (int): most buffers committed at the same time
+            chunk_size (int): as in commit(), for every buffer
+            chunk_bytes (int): as in commit(), for every buffer
+            refresh (bool): as in commit(), for every buffer
+
+        Returns:
+            dict of tag -> None if its buffer was committed, or the
+            exception its commit raised, or the UcsOperationError of a
+            buffer not committed because an earlier buffer failed
+
+        Example:
+            errors = handle.commit_many(["trans_1", "trans_2"])\n
+            failed = [tag for tag in errors if errors[tag] is not None]\n
+        """
+
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer")
+
+        unique_tags = []
+        for tag in tags:
+            if tag not in unique_tags:
+                unique_tags.append(tag)
+        tags = unique_tags
+        depends = self.__commit_dependencies(tags)
+        pending = list(tags)
+        done = set()
+        errors = {}
+        cond = threading.Condition()
+
+        def next_tag():
+            # the first pending tag whose dependencies are committed
+            with cond:
+                while pending:
+                    for tag in pending:
+                        if depends[tag] <= done:
+                            pending.remove(tag)
+                            return tag
+                    cond.wait()
+                return None
+
+        def work():
+            tag = next_tag()
+            while tag is not None:
+                error = None
+                failed = [other for other in tags
+                          if other in depends[tag] and
+                          errors[other] is not None]
+                if failed:
+                    # the buffer is kept, to be committed again
+                    error = UcsOperationError(
+                        "Commit of tag %s" % tag,
+                        "the commit of the tags changing the same subtree "
+                        "before it failed: %s" % ", ".join(
+                            str(other) for other in failed))
+                else:
+                    try:
+                        if self.__commit_buf_of(tag):
+                            self.__commit(tag, chunk_size, chunk_bytes,
+                                          refresh, None, shared=True)
+                    except Exception as commit_error:
+                        error = commit_error
+                if error is not None:
+                    log.debug("commit_many: commit of tag %s failed: %s" % (
+                        tag, error))
+                with cond:
+                    errors[tag] = error
+                    done.add(tag)
+                    cond.notify_all()
+                tag = next_tag()
+
+        workers = [threading.Thread(name="ucs_commit_worker-%d" % index,
+                                    target=work)
+                   for index in range(min(max_workers, len(tags)))]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        return errors
+
+    def __commit_buf_of(self, tag):
+        """
+        Internal method returning the commit buffer of a tag, empty if the
+        tag has none.
+        """
+
+        if tag is None:
+            return self.__commit_buf
+        return self.__commit_buf_tagged.get(tag, {})
+
+    def __commit_dependencies(self, tags):
+        """
+        Internal method returning tag -> the tags given before it whose
+        commit buffers change the same subtree.
+        """
+
+        # dn -> indexes of the tags whose buffers have it
+        owners = {}
+        for index, tag in enumerate(tags):
+            for mo_dn in self.__commit_buf_of(tag):
+                owners.setdefault(mo_dn, set()).add(index)
+
+        depends = dict((tag, set()) for tag in tags)
+        for mo_dn, indexes in owners.items():
+            # the owners of the dn and of every dn above it overlap
+            related = set(indexes)
+            parent_dn = mo_dn
+            while "/" in parent_dn:
+                parent_dn = parent_dn.rsplit("/", 1)[0]
+                related.update(owners.get(parent_dn, ()))
+            for index in indexes:
+                depends[tags[index]].update(
+                    tags[other] for other in related if other < index)
+            for other in related:
+                depends[tags[other]].update(
+                    tags[index] for index in indexes if index < other)
+        return depends
+
+    def __commit(self, tag, chunk_size, chunk_bytes, refresh, progress,
+                 shared=False):
+        """
+        Internal method committing the buffer of a tag, see commit().
+        The requests of a shared commit share the session lock.
+        """
 
-        refresh_dict = {}
         mo_dict = self._get_commit_buf(tag)
         if not mo_dict:
             return None
 
-        config_map = ConfigMap()
+        # dn -> modified children of the object
+        children = {}
         for mo_dn in mo_dict:
             mo = mo_dict[mo_dn]
+            children[mo_dn] = dirty_children = []
             child_list = mo.child
             while len(child_list) > 0:
                 current_child_list = child_list
                 child_list = []
                 for child_mo in current_child_list:
                     if child_mo.is_dirty():
-                        refresh_dict[child_mo.dn] = child_mo
+                        dirty_children.append(child_mo)
                     child_list.extend(child_mo.child)
 
-            pair = Pair()
-            pair.key = mo_dn
-            pair.child_add(mo_dict[mo_dn])
-            config_map.child_add(pair)
+        chunked = chunk_size is not None or chunk_bytes is not None
+        if chunked:
+            chunks, pairs = self.__commit_chunks(mo_dict, children,
+                                                 chunk_size, chunk_bytes)
+        else:
+            chunks, pairs = [list(mo_dict)], None
+
+        total = len(mo_dict) + sum(len(dirty_children)
+                                   for dirty_children in children.values())
+        for index, chunk in enumerate(chunks):
+            try:
+                self.__commit_chunk(mo_dict, chunk, pairs, children, refresh,
+                                    shared)
+            except UcsException:
+                # the objects of a chunked commit that are not committed
+                # stay in the buffer
+                if not chunked:
+                    self.commit_buffer_discard(tag)
+                raise
+            size = len(chunk) + sum(len(children[mo_dn]) for mo_dn in chunk)
+            log.debug("commit: chunk %d/%d of %d objects committed" % (
+                index + 1, len(chunks), size))
+            if progress is not None:
+                progress.update(total, size)
 
-        elem = config_conf_mos(self.cookie, config_map,
-                               False)
-        response = self.post_elem(elem)
+        self.commit_buffer_discard(tag)
+
+    def __commit_chunks(self, mo_dict, children, chunk_size, chunk_bytes):
+        """
+        Internal method to split the commit buffer in chunks of at most
+        chunk_size objects and chunk_bytes bytes, parents first.
+        Returns the dns of every chunk, and dn -> xml bytes of its pair if
+        direct xml is enabled, None otherwise.
+        """
+
+        from . import ucsxmlcodec as xc
+
+        for name, limit in (("chunk_size", chunk_size),
+                            ("chunk_bytes", chunk_bytes)):
+            if limit is not None and limit < 1:
+                raise ValueError("%s must be at least 1, not %s" % (
+                    name, limit))
+
+        pairs = {} if self.direct_xml else None
+        chunks = []
+        chunk, count, size = [], 0, 0
+        # the dn of a parent has fewer separators than the dns below it, the
+        # objects of the same depth stay in the order of the buffer
+        for mo_dn in sorted(mo_dict, key=lambda dn: dn.count("/")):
+            mo_count = 1 + len(children[mo_dn])
+            mo_size = 0
+            if pairs is not None:
+                pairs[mo_dn] = xc.conf_mos_pair_to_xml_bytes(mo_dn,
+                                                             mo_dict[mo_dn])
+                mo_size = len(pairs[mo_dn])
+            elif chunk_bytes is not None:
+                pair = self.__commit_pair(mo_dn, mo_dict[mo_dn])
+                mo_size = len(xc.to_xml_str(pair.to_xml()))
+            if chunk and (
+                    (chunk_size is not None and
+                     count + mo_count > chunk_size) or
+                    (chunk_bytes is not None and
+                     size + mo_size > chunk_bytes)):
+                chunks.append(chunk)
+                chunk, count, size = [], 0, 0
+            chunk.append(mo_dn)
+            count += mo_count
+            size += mo_size
+        chunks.append(chunk)
+        return chunks, pairs
+
+    def __commit_pair(self, mo_dn, mo):
+        """
+        Internal method returning the pair of an object of the commit buffer.
+        """
+
+        from .ucsbasetype import Pair
+
+        pair = Pair()
+        pair.key = mo_dn
+        pair.child_add(mo)
+        return pair
+
+    def __commit_chunk(self, mo_dict, chunk, pairs, children, refresh,
+                       shared):
+        """
+        Internal method to commit the objects of the buffer whose dns are
+        in chunk, in one configConfMos request. The committed objects are
+        removed from the buffer.
+        """
+
+        from .ucsbasetype import ConfigMap, Dn, DnSet
+        from .ucsmethodfactory import config_resolve_dns
+        from .ucsmethodfactory import config_conf_mos
+        from . import ucsxmlcodec as xc
+
+        if pairs is not None:
+            response = self._post_bytes(
+                "configConfMos",
+                lambda cookie: xc.conf_mos_pairs_to_xml_bytes(
+                    cookie, [pairs[mo_dn] for mo_dn in chunk]),
+                shared)
+        elif self.direct_xml:
+            response = self._post_bytes(
+                "configConfMos",
+                lambda cookie: xc.conf_mos_to_xml_bytes(cookie, mo_dict),
+                shared)
+        else:
+            config_map = ConfigMap()
+            for mo_dn in chunk:
+                config_map.child_add(self.__commit_pair(mo_dn,
+                                                        mo_dict[mo_dn]))
+            elem = config_conf_mos(self.cookie, config_map,
+                                   False)
+            response = self.post_elem(elem, shared)
         if response.error_code != 0:
-            self.commit_buffer_discard(tag)
             raise UcsException(response.error_code, response.error_descr)
 
         for pair_ in response.out_configs.child:
             for out_mo in pair_.child:
                 out_mo.sync_mo(mo_dict[out_mo.dn])
 
+        committed = []
+        for mo_dn in chunk:
+            committed.append(mo_dict.pop(mo_dn))
+            committed.extend(children[mo_dn])
+        mo_cache = self.__mo_cache
+        if mo_cache is not None:
+            mo_cache.invalidate_mos(committed)
+
+        if not refresh:
+            return
+
+        refresh_dict = {}
+        for mo_dn in chunk:
+            for child_mo in children[mo_dn]:
+                refresh_dict[child_mo.dn] = child_mo
+
         if refresh_dict:
             dn_set = DnSet()
             for dn_ in refresh_dict:
@@ -936,8 +1589,6 @@ class UcsHandle(UcsSession):
             for out_mo in response.out_configs.child:
                 out_mo.sync_mo(refresh_dict[out_mo.dn])
 
-        self.commit_buffer_discard(tag)
-
     def commit_buffer_discard(self, tag=None):
         """
         Discard the configuration changes in the commit buffer.
@@ -1000,6 +1651,37 @@ class UcsHandle(UcsSession):
 
         wait(self, mo, prop, value, cb, timeout_sec=timeout, poll_sec=poll_sec)
 
+    def wait_for_events(self, conditions, cb=None, timeout=None,
+                        poll_sec=None):
+        """
+        Waits for `mo.prop == value` for many managed objects at once, with
+        a single event subscription, or with one configResolveDns per poll
+        interval for all of them in poll mode. Returns once every condition
+        is met or failed, or at the timeout.
+
+        Args:
+            conditions (list): list of (mo, prop, value) tuples, value being
+                a value or a list of values
+            cb(function): callback on every condition met, called with the
+                condition and the mo change event
+            timeout (int): timeout
+            poll_sec (int): polling interval in seconds
+
+        Returns:
+            list of the conditions not met: timed out, or whose managed
+            object was not found or could not be polled
+
+        Example:
+            sp_mos = handle.query_classid("LsServer")
+            conditions = [(sp, "assoc_state", "associated")
+                          for sp in sp_mos]
+            timed_out = handle.wait_for_events(conditions, timeout=1800)
+        """
+        from .ucseventhandler import wait_many
+
+        return wait_many(self, conditions, cb=cb, timeout_sec=timeout,
+                         poll_sec=poll_sec)
+
     def freeze(self):
         return self._freeze()
 
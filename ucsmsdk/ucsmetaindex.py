@@ -0,0 +1,1814 @@
+# Copyright 2015 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This is an auto-generated module containing the compact index of the
+ManagedObject Meta information, generated by bin/gen_meta_index.py.
+
+class_id -> (xml_attribute, rn, version, inp_out, mask, field_names, access,
+             parents, children, verbs)
+where version is the name of the UcsVersion in ucsmeta.VersionMeta.
+"""
+
+MO_CLASS_INDEX = {
+    'AaaAuthRealm': ('aaaAuthRealm', 'auth-realm', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('topSystem',), ('aaaAuthRealmFsm', 'aaaConsoleAuth', 'aaaDefaultAuth', 'aaaDomain', 'aaaRealmFsm', 'aaaRealmFsmTask', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'AaaAuthRealmFsm': ('aaaAuthRealmFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaAuthRealm',), ('aaaAuthRealmFsmStage',), (None,)),
+    'AaaAuthRealmFsmStage': ('aaaAuthRealmFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaAuthRealmFsm',), (), (None,)),
+    'AaaCimcSession': ('aaaCimcSession', 'cimc-term-[id]', 'Version212a', 'InputOutput', 1, (), ('admin',), ('aaaEpUser', 'aaaRemoteUser', 'aaaUser', 'commSnmpUser', 'storageEpUser'), (), ('Get', 'Set')),
+    'AaaConsoleAuth': ('aaaConsoleAuth', 'console-auth', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaAuthRealm',), ('faultInst',), ('Get', 'Set')),
+    'AaaDefaultAuth': ('aaaDefaultAuth', 'default-auth', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaAuthRealm',), ('faultInst',), ('Get', 'Set')),
+    'AaaDomain': ('aaaDomain', 'domain-[name]', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaAuthRealm',), ('aaaDomainAuth', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaDomainAuth': ('aaaDomainAuth', 'domain-auth', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaDomain',), ('faultInst',), ('Get', 'Set')),
+    'AaaEpAuthProfile': ('aaaEpAuthProfile', 'auth-profile-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin', 'ls-security', 'ls-security-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'orgOrg'), ('aaaEpUser',), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaEpFsm': ('aaaEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaLdapEp', 'aaaRadiusEp', 'aaaTacacsPlusEp'), ('aaaEpFsmStage',), (None,)),
+    'AaaEpFsmStage': ('aaaEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaEpFsm',), (), (None,)),
+    'AaaEpFsmTask': ('aaaEpFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('aaaLdapEp', 'aaaRadiusEp', 'aaaTacacsPlusEp'), (), (None,)),
+    'AaaEpLogin': ('aaaEpLogin', 'ep-login-[name]-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('aaaUserEp',), (), ('Get',)),
+    'AaaEpUser': ('aaaEpUser', 'user-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin', 'ls-security', 'ls-security-policy'), ('aaaEpAuthProfile', 'computeServerUnit'), ('aaaCimcSession',), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaExtMgmtCutThruTkn': ('aaaExtMgmtCutThruTkn', '-[token]', 'Version102d', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUserEp',), (), ('Get',)),
+    'AaaLdapEp': ('aaaLdapEp', 'ldap-ext', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('topSystem',), ('aaaEpFsm', 'aaaEpFsmTask', 'aaaLdapEpFsm', 'aaaLdapGroup', 'aaaLdapGroupRule', 'aaaLdapProvider', 'aaaProviderGroup', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'AaaLdapEpFsm': ('aaaLdapEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaLdapEp',), ('aaaLdapEpFsmStage',), (None,)),
+    'AaaLdapEpFsmStage': ('aaaLdapEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaLdapEpFsm',), (), (None,)),
+    'AaaLdapGroup': ('aaaLdapGroup', 'ldapgroup-[name]', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaLdapEp',), ('aaaUserLocale', 'aaaUserRole'), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaLdapGroupRule': ('aaaLdapGroupRule', 'ldapgroup-rule', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaLdapEp', 'aaaLdapProvider'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaLdapProvider': ('aaaLdapProvider', 'provider-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaLdapEp',), ('aaaLdapGroupRule',), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaLocalMgmtCmdLog': ('aaaLocalMgmtCmdLog', '', 'Version312b', 'InputOutput', 1, (), ('admin',), (), (), (None,)),
+    'AaaLocale': ('aaaLocale', 'locale-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUserEp',), ('aaaOrg', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaLog': ('aaaLog', 'aaa-log', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin', 'operations'), ('topRoot',), ('aaaModLR', 'aaaSessionLR'), ('Get',)),
+    'AaaModLR': ('aaaModLR', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('aaaLog',), (), ('Get',)),
+    'AaaOrg': ('aaaOrg', 'org-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaLocale',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'AaaPreLoginBanner': ('aaaPreLoginBanner', 'pre-login-banner', 'Version201m', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUserEp',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaProviderGroup': ('aaaProviderGroup', 'providergroup-[name]', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaLdapEp', 'aaaRadiusEp', 'aaaTacacsPlusEp'), ('aaaProviderRef', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaProviderRef': ('aaaProviderRef', 'provider-ref-[name]', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaProviderGroup',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaPwdProfile': ('aaaPwdProfile', 'pwd-profile', 'Version201m', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUserEp',), (), ('Get', 'Set')),
+    'AaaRadiusEp': ('aaaRadiusEp', 'radius-ext', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('topSystem',), ('aaaEpFsm', 'aaaEpFsmTask', 'aaaProviderGroup', 'aaaRadiusEpFsm', 'aaaRadiusProvider', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'AaaRadiusEpFsm': ('aaaRadiusEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaRadiusEp',), ('aaaRadiusEpFsmStage',), (None,)),
+    'AaaRadiusEpFsmStage': ('aaaRadiusEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaRadiusEpFsm',), (), (None,)),
+    'AaaRadiusProvider': ('aaaRadiusProvider', 'provider-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaRadiusEp',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaRealmFsm': ('aaaRealmFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaAuthRealm',), ('aaaRealmFsmStage',), (None,)),
+    'AaaRealmFsmStage': ('aaaRealmFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaRealmFsm',), (), (None,)),
+    'AaaRealmFsmTask': ('aaaRealmFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('aaaAuthRealm',), (), (None,)),
+    'AaaRemoteUser': ('aaaRemoteUser', 'remoteuser-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUserEp',), ('aaaCimcSession', 'aaaSession', 'aaaUserLocale', 'aaaUserRole'), ('Get', 'Remove')),
+    'AaaRole': ('aaaRole', 'role-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUserEp',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaSession': ('aaaSession', 'term-[id]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaRemoteUser', 'aaaUser'), (), ('Get', 'Remove')),
+    'AaaSessionInfo': ('aaaSessionInfo', 'term-[id]', 'Version212a', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaSessionInfoTable',), (), (None,)),
+    'AaaSessionInfoTable': ('aaaSessionInfoTable', 'session-table', 'Version212a', 'InputOutput', 1, (), ('aaa', 'admin'), ('topSystem',), ('aaaSessionInfo',), (None,)),
+    'AaaSessionLR': ('aaaSessionLR', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('aaaLog',), (), (None,)),
+    'AaaShellLogin': ('aaaShellLogin', 'sh-login-[name]-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('aaaUserEp',), (), (None,)),
+    'AaaSshAuth': ('aaaSshAuth', 'sshauth', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUser',), (), ('Get', 'Set')),
+    'AaaTacacsPlusEp': ('aaaTacacsPlusEp', 'tacacs-ext', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('topSystem',), ('aaaEpFsm', 'aaaEpFsmTask', 'aaaProviderGroup', 'aaaTacacsPlusEpFsm', 'aaaTacacsPlusProvider', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'AaaTacacsPlusEpFsm': ('aaaTacacsPlusEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaTacacsPlusEp',), ('aaaTacacsPlusEpFsmStage',), (None,)),
+    'AaaTacacsPlusEpFsmStage': ('aaaTacacsPlusEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaTacacsPlusEpFsm',), (), (None,)),
+    'AaaTacacsPlusProvider': ('aaaTacacsPlusProvider', 'provider-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaTacacsPlusEp',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaUser': ('aaaUser', 'user-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUserEp',), ('aaaCimcSession', 'aaaSession', 'aaaSshAuth', 'aaaUserData', 'aaaUserLocale', 'aaaUserRole', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaUserData': ('aaaUserData', 'user-data', 'Version201m', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaUser',), (), ('Get',)),
+    'AaaUserEp': ('aaaUserEp', 'user-ext', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('topSystem',), ('aaaEpLogin', 'aaaExtMgmtCutThruTkn', 'aaaLocale', 'aaaPreLoginBanner', 'aaaPwdProfile', 'aaaRemoteUser', 'aaaRole', 'aaaShellLogin', 'aaaUser', 'aaaUserEpFsm', 'aaaUserEpFsmTask', 'aaaWebLogin', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'AaaUserEpFsm': ('aaaUserEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaUserEp',), ('aaaUserEpFsmStage',), (None,)),
+    'AaaUserEpFsmStage': ('aaaUserEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('aaaUserEpFsm',), (), (None,)),
+    'AaaUserEpFsmTask': ('aaaUserEpFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('aaaUserEp',), (), (None,)),
+    'AaaUserLocale': ('aaaUserLocale', 'locale-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaLdapGroup', 'aaaRemoteUser', 'aaaUser'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaUserRole': ('aaaUserRole', 'role-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('aaaLdapGroup', 'aaaRemoteUser', 'aaaUser'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'AaaWebLogin': ('aaaWebLogin', 'web-login-[name]-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('aaaUserEp',), (), ('Get',)),
+    'AdaptorCapQual': ('adaptorCapQual', 'cap-[type]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('adaptorQual',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AdaptorCapSpec': ('adaptorCapSpec', 'cap-[type]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorDiagCap': ('adaptorDiagCap', 'diag', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorDynamicConfigCap': ('adaptorDynamicConfigCap', 'cap-dynamic-config', 'Version302c', 'InputOutput', 1, (), ('admin', 'pn-policy', 'read-only'), ('adaptorFruCapProvider',), (), (None,)),
+    'AdaptorEthAdvFilterProfile': ('adaptorEthAdvFilterProfile', 'eth-adv-filter', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AdaptorEthArfsProfile': ('adaptorEthArfsProfile', 'eth-arfs', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile'), (), ('Get', 'Set')),
+    'AdaptorEthCompQueueProfile': ('adaptorEthCompQueueProfile', 'eth-comp-q', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get', 'Set')),
+    'AdaptorEthFailoverProfile': ('adaptorEthFailoverProfile', 'eth-failover', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get', 'Set')),
+    'AdaptorEthInterruptProfile': ('adaptorEthInterruptProfile', 'eth-int', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get', 'Set')),
+    'AdaptorEthInterruptScalingProfile': ('adaptorEthInterruptScalingProfile', 'eth-interrupt-scaling', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AdaptorEthNVGREProfile': ('adaptorEthNVGREProfile', 'eth-nvgre', 'Version223a', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile'), (), ('Get', 'Set')),
+    'AdaptorEthOffloadProfile': ('adaptorEthOffloadProfile', 'eth-offload', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get', 'Set')),
+    'AdaptorEthPortBySizeLargeStats': ('adaptorEthPortBySizeLargeStats', 'eth-port-by-size-large-stats-[traffic_direction]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorExtEthIf', 'adaptorHostEthIf', 'vmNic'), ('adaptorEthPortBySizeLargeStatsHist',), ('Get',)),
+    'AdaptorEthPortBySizeLargeStatsHist': ('adaptorEthPortBySizeLargeStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorEthPortBySizeLargeStats',), (), ('Get',)),
+    'AdaptorEthPortBySizeSmallStats': ('adaptorEthPortBySizeSmallStats', 'eth-port-by-size-small-stats-[traffic_direction]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorExtEthIf', 'adaptorHostEthIf', 'vmNic'), ('adaptorEthPortBySizeSmallStatsHist',), ('Get',)),
+    'AdaptorEthPortBySizeSmallStatsHist': ('adaptorEthPortBySizeSmallStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorEthPortBySizeSmallStats',), (), ('Get',)),
+    'AdaptorEthPortErrStats': ('adaptorEthPortErrStats', 'eth-port-err-stats-[traffic_direction]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorExtEthIf', 'adaptorHostEthIf', 'vmNic'), ('adaptorEthPortErrStatsHist',), ('Get',)),
+    'AdaptorEthPortErrStatsHist': ('adaptorEthPortErrStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorEthPortErrStats',), (), ('Get',)),
+    'AdaptorEthPortMcastStats': ('adaptorEthPortMcastStats', 'eth-port-mcast-stats-[traffic_direction]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorExtEthIf', 'adaptorHostEthIf', 'vmNic'), ('adaptorEthPortMcastStatsHist',), ('Get',)),
+    'AdaptorEthPortMcastStatsHist': ('adaptorEthPortMcastStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorEthPortMcastStats',), (), ('Get',)),
+    'AdaptorEthPortOutsizedStats': ('adaptorEthPortOutsizedStats', 'eth-port-outsized-stats-[traffic_direction]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorExtEthIf', 'adaptorHostEthIf', 'vmNic'), ('adaptorEthPortOutsizedStatsHist',), ('Get',)),
+    'AdaptorEthPortOutsizedStatsHist': ('adaptorEthPortOutsizedStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorEthPortOutsizedStats',), (), ('Get',)),
+    'AdaptorEthPortStats': ('adaptorEthPortStats', 'eth-port-stats-[traffic_direction]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorExtEthIf', 'adaptorHostEthIf', 'vmNic'), ('adaptorEthPortStatsHist',), ('Get',)),
+    'AdaptorEthPortStatsHist': ('adaptorEthPortStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorEthPortStats',), (), ('Get',)),
+    'AdaptorEthRecvQueueProfile': ('adaptorEthRecvQueueProfile', 'eth-rcv-q', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get', 'Set')),
+    'AdaptorEthRoCEProfile': ('adaptorEthRoCEProfile', 'eth-roce', 'Version223a', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile'), (), ('Get', 'Set')),
+    'AdaptorEthVxLANProfile': ('adaptorEthVxLANProfile', 'eth-vxlan', 'Version223a', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile'), (), ('Get', 'Set')),
+    'AdaptorEthWorkQueueProfile': ('adaptorEthWorkQueueProfile', 'eth-work-q', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get', 'Set')),
+    'AdaptorEtherIfStats': ('adaptorEtherIfStats', 'ether-if-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorVlan',), ('adaptorEtherIfStatsHist',), ('Get',)),
+    'AdaptorEtherIfStatsHist': ('adaptorEtherIfStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorEtherIfStats',), (), ('Get',)),
+    'AdaptorExtEthIf': ('adaptorExtEthIf', 'ext-eth-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance', 'read-only'), ('adaptorUnit',), ('adaptorEthPortBySizeLargeStats', 'adaptorEthPortBySizeSmallStats', 'adaptorEthPortErrStats', 'adaptorEthPortMcastStats', 'adaptorEthPortOutsizedStats', 'adaptorEthPortStats', 'adaptorExtEthIfFsm', 'adaptorExtEthIfFsmTask', 'dcxVIf', 'eventInst', 'fabricEthMonSrcEp', 'faultInst'), ('Get', 'Set')),
+    'AdaptorExtEthIfFsm': ('adaptorExtEthIfFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('adaptorExtEthIf',), ('adaptorExtEthIfFsmStage',), (None,)),
+    'AdaptorExtEthIfFsmStage': ('adaptorExtEthIfFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('adaptorExtEthIfFsm',), (), (None,)),
+    'AdaptorExtEthIfFsmTask': ('adaptorExtEthIfFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('adaptorExtEthIf',), (), (None,)),
+    'AdaptorExtEthIfPc': ('adaptorExtEthIfPc', 'pc-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance'), ('fabricLocale',), ('adaptorExtEthIfPcEp',), ('Get',)),
+    'AdaptorExtEthIfPcEp': ('adaptorExtEthIfPcEp', 'ep-slot-[slot_id]-port-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance'), ('adaptorExtEthIfPc',), (), ('Get',)),
+    'AdaptorExtIpV6RssHashProfile': ('adaptorExtIpV6RssHashProfile', 'ext-ipv6-rss-hash', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get',)),
+    'AdaptorFamilyTypeDef': ('adaptorFamilyTypeDef', 'family-type', 'Version202m', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider', 'equipmentLocalDiskControllerCapProvider'), (), ('Get',)),
+    'AdaptorFcCdbWorkQueueProfile': ('adaptorFcCdbWorkQueueProfile', 'fc-cdb-work-q', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFcErrorRecoveryProfile': ('adaptorFcErrorRecoveryProfile', 'fc-err-rec', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFcFnicProfile': ('adaptorFcFnicProfile', 'fc-fnic', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'AdaptorFcIfEventStats': ('adaptorFcIfEventStats', 'fc-if-event-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorHostFcIf',), ('adaptorFcIfEventStatsHist',), ('Get',)),
+    'AdaptorFcIfEventStatsHist': ('adaptorFcIfEventStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorFcIfEventStats',), (), ('Get',)),
+    'AdaptorFcIfFC4Stats': ('adaptorFcIfFC4Stats', 'fc-if-fc4-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorHostFcIf',), ('adaptorFcIfFC4StatsHist',), ('Get',)),
+    'AdaptorFcIfFC4StatsHist': ('adaptorFcIfFC4StatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorFcIfFC4Stats',), (), ('Get',)),
+    'AdaptorFcIfFrameStats': ('adaptorFcIfFrameStats', 'fc-if-frame-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorHostFcIf',), ('adaptorFcIfFrameStatsHist',), ('Get',)),
+    'AdaptorFcIfFrameStatsHist': ('adaptorFcIfFrameStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorFcIfFrameStats',), (), ('Get',)),
+    'AdaptorFcInterruptProfile': ('adaptorFcInterruptProfile', 'fc-int', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFcOEIf': ('adaptorFcOEIf', 'fcoe', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorHostEthIf', 'adaptorHostFcIf'), ('dcxVIf',), ('Get',)),
+    'AdaptorFcPortFLogiProfile': ('adaptorFcPortFLogiProfile', 'fc-port-flogi', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFcPortPLogiProfile': ('adaptorFcPortPLogiProfile', 'fc-port-plogi', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFcPortProfile': ('adaptorFcPortProfile', 'fc-port', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFcPortStats': ('adaptorFcPortStats', 'fc-port-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorHostFcIf', 'vmNic'), ('adaptorFcPortStatsHist',), ('Get',)),
+    'AdaptorFcPortStatsHist': ('adaptorFcPortStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorFcPortStats',), (), ('Get',)),
+    'AdaptorFcRecvQueueProfile': ('adaptorFcRecvQueueProfile', 'fc-rcv-q', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFcWorkQueueProfile': ('adaptorFcWorkQueueProfile', 'fc-work-q', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('adaptorHostFcIf', 'adaptorHostFcIfProfile'), (), ('Get', 'Set')),
+    'AdaptorFruCapProvider': ('adaptorFruCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('adaptorCapSpec', 'adaptorDiagCap', 'adaptorDynamicConfigCap', 'adaptorFamilyTypeDef', 'adaptorFwCapProvider', 'adaptorHostMgmtCap', 'adaptorHostPortCap', 'adaptorHostVnicHwAddrCap', 'adaptorHostethHwAddrCap', 'adaptorHostfcHwAddrCap', 'adaptorIScsiCap', 'adaptorLanCap', 'adaptorLldpCap', 'adaptorMgmtVnicEthConfig', 'adaptorNwMgmtCap', 'adaptorNwStatsMgmtCap', 'adaptorRnicCapSpec', 'adaptorSanCap', 'adaptorUplinkHwAddrCap', 'equipmentAdaptorDef', 'equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPciDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPortGroupAggregationDef', 'equipmentPortGroupDef', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareSpec', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'AdaptorFruCapRef': ('adaptorFruCapRef', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version141i', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'AdaptorFwCapProvider': ('adaptorFwCapProvider', 'fw-vendor-[vendor]-model-[model]-version-[version]', 'Version101e', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorHostEthIf': ('adaptorHostEthIf', 'host-eth-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance', 'read-only'), ('adaptorUnit',), ('adaptorEthAdvFilterProfile', 'adaptorEthArfsProfile', 'adaptorEthCompQueueProfile', 'adaptorEthFailoverProfile', 'adaptorEthInterruptProfile', 'adaptorEthInterruptScalingProfile', 'adaptorEthNVGREProfile', 'adaptorEthOffloadProfile', 'adaptorEthPortBySizeLargeStats', 'adaptorEthPortBySizeSmallStats', 'adaptorEthPortErrStats', 'adaptorEthPortMcastStats', 'adaptorEthPortOutsizedStats', 'adaptorEthPortStats', 'adaptorEthRecvQueueProfile', 'adaptorEthRoCEProfile', 'adaptorEthVxLANProfile', 'adaptorEthWorkQueueProfile', 'adaptorExtIpV6RssHashProfile', 'adaptorFcOEIf', 'adaptorHostEthIfFsm', 'adaptorHostEthIfFsmTask', 'adaptorIpV4RssHashProfile', 'adaptorIpV6RssHashProfile', 'adaptorRssProfile', 'adaptorUsnicConnDef', 'adaptorVlan', 'adaptorVnicStats', 'dcxVIf', 'dhcpAcquired', 'eventInst', 'faultInst', 'firmwareBootDefinition', 'firmwareRunning', 'mgmtIf', 'networkIfStats'), ('Get', 'Set')),
+    'AdaptorHostEthIfFsm': ('adaptorHostEthIfFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('adaptorHostEthIf',), ('adaptorHostEthIfFsmStage',), (None,)),
+    'AdaptorHostEthIfFsmStage': ('adaptorHostEthIfFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('adaptorHostEthIfFsm',), (), (None,)),
+    'AdaptorHostEthIfFsmTask': ('adaptorHostEthIfFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('adaptorHostEthIf',), (), (None,)),
+    'AdaptorHostEthIfProfile': ('adaptorHostEthIfProfile', 'eth-profile-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('orgOrg', 'policySystemEp'), ('adaptorEthAdvFilterProfile', 'adaptorEthArfsProfile', 'adaptorEthCompQueueProfile', 'adaptorEthFailoverProfile', 'adaptorEthInterruptProfile', 'adaptorEthInterruptScalingProfile', 'adaptorEthNVGREProfile', 'adaptorEthOffloadProfile', 'adaptorEthRecvQueueProfile', 'adaptorEthRoCEProfile', 'adaptorEthVxLANProfile', 'adaptorEthWorkQueueProfile', 'adaptorExtIpV6RssHashProfile', 'adaptorIpV4RssHashProfile', 'adaptorIpV6RssHashProfile', 'adaptorRssProfile'), ('Add', 'Get', 'Remove', 'Set')),
+    'AdaptorHostFcIf': ('adaptorHostFcIf', 'host-fc-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance', 'read-only'), ('adaptorUnit',), ('adaptorFcCdbWorkQueueProfile', 'adaptorFcErrorRecoveryProfile', 'adaptorFcFnicProfile', 'adaptorFcIfEventStats', 'adaptorFcIfFC4Stats', 'adaptorFcIfFrameStats', 'adaptorFcInterruptProfile', 'adaptorFcOEIf', 'adaptorFcPortFLogiProfile', 'adaptorFcPortPLogiProfile', 'adaptorFcPortProfile', 'adaptorFcPortStats', 'adaptorFcRecvQueueProfile', 'adaptorFcWorkQueueProfile', 'adaptorHostFcIfFsm', 'adaptorHostFcIfFsmTask', 'adaptorVnicStats', 'adaptorVsan', 'dcxVIf', 'eventInst', 'faultInst', 'firmwareBootDefinition', 'firmwareRunning', 'networkIfStats'), ('Get', 'Set')),
+    'AdaptorHostFcIfFsm': ('adaptorHostFcIfFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('adaptorHostFcIf',), ('adaptorHostFcIfFsmStage',), (None,)),
+    'AdaptorHostFcIfFsmStage': ('adaptorHostFcIfFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('adaptorHostFcIfFsm',), (), (None,)),
+    'AdaptorHostFcIfFsmTask': ('adaptorHostFcIfFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('adaptorHostFcIf',), (), (None,)),
+    'AdaptorHostFcIfProfile': ('adaptorHostFcIfProfile', 'fc-profile-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage'), ('orgOrg',), ('adaptorFcCdbWorkQueueProfile', 'adaptorFcErrorRecoveryProfile', 'adaptorFcFnicProfile', 'adaptorFcInterruptProfile', 'adaptorFcPortFLogiProfile', 'adaptorFcPortPLogiProfile', 'adaptorFcPortProfile', 'adaptorFcRecvQueueProfile', 'adaptorFcWorkQueueProfile'), ('Add', 'Get', 'Remove', 'Set')),
+    'AdaptorHostIfConfig': ('adaptorHostIfConfig', 'host-if-config-[id]', 'Version227b', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'AdaptorHostIscsiIf': ('adaptorHostIscsiIf', 'host-iscsi-[id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance', 'read-only'), ('adaptorUnit',), ('adaptorIscsiProt', 'adaptorIscsiTargetIf', 'adaptorProtocolProfile', 'adaptorVlan', 'adaptorVnicStats', 'fabricNetflowIPv4Addr', 'faultInst', 'networkIfStats', 'vnicIPv4Dhcp', 'vnicIPv4Dns', 'vnicIPv4IscsiAddr', 'vnicIPv4PooledIscsiAddr', 'vnicIPv4StaticRoute', 'vnicIpV4MgmtPooledAddr', 'vnicIpV4PooledAddr', 'vnicIpV4ProfDerivedAddr', 'vnicIpV4StaticAddr'), ('Get',)),
+    'AdaptorHostIscsiIfProfile': ('adaptorHostIscsiIfProfile', 'iscsi-profile-[name]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('orgOrg',), ('adaptorProtocolProfile',), ('Add', 'Get', 'Remove', 'Set')),
+    'AdaptorHostMgmtCap': ('adaptorHostMgmtCap', 'host-mgmt', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorHostPort': ('adaptorHostPort', 'host-port-[id]', 'Version223a', 'InputOutput', 1, (), ('read-only',), ('adaptorUnit',), (), ('Get',)),
+    'AdaptorHostPortCap': ('adaptorHostPortCap', 'max-host-port', 'Version223a', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorHostScsiIf': ('adaptorHostScsiIf', 'host-scsi-[id]', 'Version251a', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance', 'read-only'), ('adaptorUnit',), ('adaptorHostScsiLunRef', 'adaptorVnicStats', 'faultInst', 'networkIfStats'), ('Get',)),
+    'AdaptorHostScsiLunRef': ('adaptorHostScsiLunRef', 'host-scsi-lun-[lun_order]', 'Version251a', 'InputOutput', 1, (), ('admin',), ('adaptorHostScsiIf',), (), ('Get',)),
+    'AdaptorHostServiceEthIf': ('adaptorHostServiceEthIf', 'host-service-eth-[id]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance', 'read-only'), ('adaptorUnit',), ('adaptorVlan', 'adaptorVnicStats', 'dcxVIf', 'faultInst', 'networkIfStats'), ('Get', 'Set')),
+    'AdaptorHostVnicHwAddrCap': ('adaptorHostVnicHwAddrCap', 'hwaddr-hostvnic', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), (None,)),
+    'AdaptorHostethHwAddrCap': ('adaptorHostethHwAddrCap', 'hwaddr-hosteth', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorHostfcHwAddrCap': ('adaptorHostfcHwAddrCap', 'hwaddr-hostfc', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorIScsiCap': ('adaptorIScsiCap', 'iscsi', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorIpV4RssHashProfile': ('adaptorIpV4RssHashProfile', 'ipv4-rss-hash', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get',)),
+    'AdaptorIpV6RssHashProfile': ('adaptorIpV6RssHashProfile', 'ipv6-rss-hash', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get',)),
+    'AdaptorIscsiAuth': ('adaptorIscsiAuth', 'iscsi-auth', 'Version201m', 'InputOutput', 1, (), ('read-only',), (), (), ('Get',)),
+    'AdaptorIscsiProt': ('adaptorIscsiProt', 'iscsi-prot', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('adaptorHostIscsiIf',), (), (None,)),
+    'AdaptorIscsiTargetIf': ('adaptorIscsiTargetIf', 'iscsi-target[priority]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('adaptorHostIscsiIf',), (), (None,)),
+    'AdaptorLanCap': ('adaptorLanCap', 'lan', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorLldpCap': ('adaptorLldpCap', 'lldp', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorMenloBaseErrorStats': ('adaptorMenloBaseErrorStats', 'menlo-base-error-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), (), ('adaptorMenloBaseErrorStatsHist',), ('Get',)),
+    'AdaptorMenloBaseErrorStatsHist': ('adaptorMenloBaseErrorStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloBaseErrorStats',), (), ('Get',)),
+    'AdaptorMenloDcePortStats': ('adaptorMenloDcePortStats', 'menlo-dce-port-stats-[menlo_port_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloDcePortStatsHist',), ('Get',)),
+    'AdaptorMenloDcePortStatsHist': ('adaptorMenloDcePortStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloDcePortStats',), (), ('Get',)),
+    'AdaptorMenloEthErrorStats': ('adaptorMenloEthErrorStats', 'menlo-eth-error-stats-[menlo_eth_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloEthErrorStatsHist',), ('Get',)),
+    'AdaptorMenloEthErrorStatsHist': ('adaptorMenloEthErrorStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloEthErrorStats',), (), ('Get',)),
+    'AdaptorMenloEthStats': ('adaptorMenloEthStats', 'menlo-eth-stats-[menlo_eth_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloEthStatsHist',), ('Get',)),
+    'AdaptorMenloEthStatsHist': ('adaptorMenloEthStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloEthStats',), (), ('Get',)),
+    'AdaptorMenloFcErrorStats': ('adaptorMenloFcErrorStats', 'menlo-fc-error-stats-[menlo_fc_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloFcErrorStatsHist',), ('Get',)),
+    'AdaptorMenloFcErrorStatsHist': ('adaptorMenloFcErrorStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloFcErrorStats',), (), ('Get',)),
+    'AdaptorMenloFcStats': ('adaptorMenloFcStats', 'menlo-fc-stats-[menlo_fc_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloFcStatsHist',), ('Get',)),
+    'AdaptorMenloFcStatsHist': ('adaptorMenloFcStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloFcStats',), (), ('Get',)),
+    'AdaptorMenloHostPortStats': ('adaptorMenloHostPortStats', 'menlo-host-port-stats-[menlo_port_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloHostPortStatsHist',), ('Get',)),
+    'AdaptorMenloHostPortStatsHist': ('adaptorMenloHostPortStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloHostPortStats',), (), ('Get',)),
+    'AdaptorMenloMcpuErrorStats': ('adaptorMenloMcpuErrorStats', 'menlo-mcpu-error-stats-[menlo_mcpu_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloMcpuErrorStatsHist',), ('Get',)),
+    'AdaptorMenloMcpuErrorStatsHist': ('adaptorMenloMcpuErrorStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloMcpuErrorStats',), (), ('Get',)),
+    'AdaptorMenloMcpuStats': ('adaptorMenloMcpuStats', 'menlo-mcpu-stats-[menlo_mcpu_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloMcpuStatsHist',), ('Get',)),
+    'AdaptorMenloMcpuStatsHist': ('adaptorMenloMcpuStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloMcpuStats',), (), ('Get',)),
+    'AdaptorMenloNetEgStats': ('adaptorMenloNetEgStats', 'menlo-net-eg-stats-[menlo_net_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloNetEgStatsHist',), ('Get',)),
+    'AdaptorMenloNetEgStatsHist': ('adaptorMenloNetEgStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloNetEgStats',), (), ('Get',)),
+    'AdaptorMenloNetInStats': ('adaptorMenloNetInStats', 'menlo-net-in-stats-[menlo_net_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloNetInStatsHist',), ('Get',)),
+    'AdaptorMenloNetInStatsHist': ('adaptorMenloNetInStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloNetInStats',), (), ('Get',)),
+    'AdaptorMenloQErrorStats': ('adaptorMenloQErrorStats', 'menlo-q-error-stats-comp-[menlo_queue_component]index-[menlo_queue_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloQErrorStatsHist',), ('Get',)),
+    'AdaptorMenloQErrorStatsHist': ('adaptorMenloQErrorStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloQErrorStats',), (), ('Get',)),
+    'AdaptorMenloQStats': ('adaptorMenloQStats', 'menlo-q-stats-comp-[menlo_queue_component]index-[menlo_queue_index]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorUnit',), ('adaptorMenloQStatsHist',), ('Get',)),
+    'AdaptorMenloQStatsHist': ('adaptorMenloQStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorMenloQStats',), (), ('Get',)),
+    'AdaptorMgmtVnicEthConfig': ('adaptorMgmtVnicEthConfig', 'mgmt-vnic', 'Version224b', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), (None,)),
+    'AdaptorNwMgmtCap': ('adaptorNwMgmtCap', 'nw-mgmt', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorNwStatsMgmtCap': ('adaptorNwStatsMgmtCap', 'nw-stats-mgmt', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), (None,)),
+    'AdaptorProtocolProfile': ('adaptorProtocolProfile', 'iscsi-prot-profile', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostIscsiIf', 'adaptorHostIscsiIfProfile'), (), ('Add', 'Get', 'Set')),
+    'AdaptorQual': ('adaptorQual', 'adaptor', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), ('adaptorCapQual',), ('Add', 'Get', 'Remove')),
+    'AdaptorRnicCapSpec': ('adaptorRnicCapSpec', 'cap-[type]', 'Version224b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorRssProfile': ('adaptorRssProfile', 'rss', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-network', 'ls-server-policy'), ('adaptorHostEthIf', 'adaptorHostEthIfProfile', 'adaptorUsnicConnDef'), (), ('Get', 'Set')),
+    'AdaptorSanCap': ('adaptorSanCap', 'san', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorUnit': ('adaptorUnit', 'adaptor-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('adaptorExtEthIf', 'adaptorHostEthIf', 'adaptorHostFcIf', 'adaptorHostIscsiIf', 'adaptorHostPort', 'adaptorHostScsiIf', 'adaptorHostServiceEthIf', 'adaptorMenloDcePortStats', 'adaptorMenloEthErrorStats', 'adaptorMenloEthStats', 'adaptorMenloFcErrorStats', 'adaptorMenloFcStats', 'adaptorMenloHostPortStats', 'adaptorMenloMcpuErrorStats', 'adaptorMenloMcpuStats', 'adaptorMenloNetEgStats', 'adaptorMenloNetInStats', 'adaptorMenloQErrorStats', 'adaptorMenloQStats', 'adaptorUnitExtn', 'dcxNs', 'equipmentPOST', 'equipmentPciDef', 'faultInst', 'mgmtController'), ('Get',)),
+    'AdaptorUnitAssocCtx': ('adaptorUnitAssocCtx', 'adaptorunit-assoc-ctx-[id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('lsServerAssocCtx',), (), ('Get',)),
+    'AdaptorUnitExtn': ('adaptorUnitExtn', 'adaptor-extn-[id]', 'Version202m', 'InputOutput', 1, (), ('read-only',), ('adaptorUnit',), ('faultInst',), ('Get',)),
+    'AdaptorUplinkHwAddrCap': ('adaptorUplinkHwAddrCap', 'hwaddr-uplink', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'AdaptorUplinkPortStats': ('adaptorUplinkPortStats', '', 'Version251a', 'InputOutput', 1, (), ('read-only',), (), (), ('Get',)),
+    'AdaptorUsnicConnDef': ('adaptorUsnicConnDef', 'usnic-conn-def-[con_policy_name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'read-only'), ('adaptorHostEthIf',), ('adaptorEthCompQueueProfile', 'adaptorEthFailoverProfile', 'adaptorEthInterruptProfile', 'adaptorEthInterruptScalingProfile', 'adaptorEthOffloadProfile', 'adaptorEthRecvQueueProfile', 'adaptorEthWorkQueueProfile', 'adaptorExtIpV6RssHashProfile', 'adaptorIpV4RssHashProfile', 'adaptorIpV6RssHashProfile', 'adaptorRssProfile'), (None,)),
+    'AdaptorVlan': ('adaptorVlan', 'vlan-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorHostEthIf', 'adaptorHostIscsiIf', 'adaptorHostServiceEthIf'), ('adaptorEtherIfStats', 'fabricNetflowIPv4Addr', 'faultInst', 'vnicIPv4Dhcp', 'vnicIPv4Dns', 'vnicIPv4IscsiAddr', 'vnicIPv4PooledIscsiAddr', 'vnicIPv4StaticRoute', 'vnicIScsiAutoTargetIf', 'vnicIScsiStaticTargetIf', 'vnicIpV4MgmtPooledAddr', 'vnicIpV4PooledAddr', 'vnicIpV4ProfDerivedAddr', 'vnicIpV4StaticAddr'), ('Get',)),
+    'AdaptorVnicStats': ('adaptorVnicStats', 'vnic-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('adaptorHostEthIf', 'adaptorHostFcIf', 'adaptorHostIscsiIf', 'adaptorHostScsiIf', 'adaptorHostServiceEthIf', 'vmNic'), ('adaptorVnicStatsHist',), ('Get',)),
+    'AdaptorVnicStatsHist': ('adaptorVnicStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorVnicStats',), (), ('Get',)),
+    'AdaptorVsan': ('adaptorVsan', 'vsan-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorHostFcIf',), (), ('Get',)),
+    'ApeAttribute': ('apeAttribute', 'attribute-[id]', 'Version224b', 'InputOutput', 1, (), ('read-only',), ('apeMcTable',), (), (None,)),
+    'ApeControllerChassis': ('apeControllerChassis', 'Chassis-[index]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeControllerManager',), ('apeControllerEeprom',), (None,)),
+    'ApeControllerEeprom': ('apeControllerEeprom', 'Eeprom-[side]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeControllerChassis',), (), (None,)),
+    'ApeControllerManager': ('apeControllerManager', 'Controller', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeManager',), ('apeControllerChassis',), (None,)),
+    'ApeDcosAgManager': ('apeDcosAgManager', 'DcosAgManager', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('apeManager',), ('apeSwitchFirmwareInv',), (None,)),
+    'ApeFru': ('apeFru', 'fru-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeMcTable',), (), (None,)),
+    'ApeHostAgent': ('apeHostAgent', 'hostagent-[chassis_id]-[slot_id]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('apeManager',), (), (None,)),
+    'ApeLANBoot': ('apeLANBoot', 'lanboot-[vnic_name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('apeManager',), (), (None,)),
+    'ApeLocalDiskBoot': ('apeLocalDiskBoot', 'localdiskboot-[chassis_id]-[slot_id]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('apeManager',), (), (None,)),
+    'ApeManager': ('apeManager', 'ape', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('apeControllerManager', 'apeDcosAgManager', 'apeHostAgent', 'apeLANBoot', 'apeLocalDiskBoot', 'apeMc', 'apeNicAgManager', 'apeSANBoot', 'apeVirtualMediaBoot'), (None,)),
+    'ApeMc': ('apeMc', 'mc-[ip]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeManager',), ('apeMcTable',), (None,)),
+    'ApeMcStats': ('apeMcStats', '', 'Version312b', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'ApeMcTable': ('apeMcTable', 'mctable-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeMc',), ('apeAttribute', 'apeFru', 'apeParam', 'apeReading', 'apeSdr'), (None,)),
+    'ApeMenlo': ('apeMenlo', 'Menlo-[mac1]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeNicAgManager',), ('apeMenloVnic', 'apePaloVnic'), (None,)),
+    'ApeMenloVnic': ('apeMenloVnic', 'AdapterVnic-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeMenlo', 'apePalo'), ('apeMenloVnicStats', 'apePaloVnicStats'), (None,)),
+    'ApeMenloVnicStats': ('apeMenloVnicStats', 'menlostats', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeMenloVnic', 'apePaloVnic'), (), (None,)),
+    'ApeNicAgManager': ('apeNicAgManager', 'NicAgManager', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeManager',), ('apeMenlo', 'apePalo'), (None,)),
+    'ApePalo': ('apePalo', 'Palo-[mac1]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeNicAgManager',), ('apeMenloVnic', 'apePaloVnic'), (None,)),
+    'ApePaloVnic': ('apePaloVnic', 'AdapterVnic-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('apeMenlo', 'apePalo'), ('apeMenloVnicStats', 'apePaloVnicStats'), (None,)),
+    'ApePaloVnicStats': ('apePaloVnicStats', 'palostats', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('apeMenloVnic', 'apePaloVnic'), (), (None,)),
+    'ApeParam': ('apeParam', 'param-[key]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeMcTable',), (), (None,)),
+    'ApeReading': ('apeReading', 'reading-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeMcTable',), (), (None,)),
+    'ApeSANBoot': ('apeSANBoot', 'sanboot-[target_wwn]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('apeManager',), (), (None,)),
+    'ApeSdr': ('apeSdr', 'sdr-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('apeMcTable',), (), (None,)),
+    'ApeSwitchFirmwareInv': ('apeSwitchFirmwareInv', 'SwitchFirmwareInv-[fabric]', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('apeDcosAgManager',), (), (None,)),
+    'ApeVirtualMediaBoot': ('apeVirtualMediaBoot', 'virtualmediaboot-[chassis_id]-[slot_id]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('apeManager',), (), (None,)),
+    'BiosBOT': ('biosBOT', 'bdgep', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('biosUnit',), ('biosBootDevGrp',), ('Get',)),
+    'BiosBootDev': ('biosBootDev', '[order]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('biosBootDevGrp',), (), ('Get',)),
+    'BiosBootDevGrp': ('biosBootDevGrp', 'bdg-[order]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('biosBOT',), ('biosBootDev',), ('Get',)),
+    'BiosFeatureRef': ('biosFeatureRef', 'feature-ref-[name]', 'Version131c', 'InputOutput', 1, (), ('',), ('biosRef',), ('biosParameterRef',), ('Get',)),
+    'BiosParameterRef': ('biosParameterRef', 'parameter-ref-[name]', 'Version131c', 'InputOutput', 1, (), ('',), ('biosFeatureRef',), ('biosSettingRef',), ('Get',)),
+    'BiosRef': ('biosRef', 'bios-ref', 'Version131c', 'InputOutput', 1, (), ('',), ('equipmentBladeBiosCapProvider',), ('biosFeatureRef',), ('Get',)),
+    'BiosSettingRef': ('biosSettingRef', 'setting-ref-[name]', 'Version131c', 'InputOutput', 1, (), ('',), ('biosParameterRef',), (), ('Get',)),
+    'BiosSettings': ('biosSettings', 'bios-settings', 'Version131c', 'InputOutput', 1, (), ('',), ('biosUnit', 'computeDefaults', 'computePlatform'), ('biosVfACPI10Support', 'biosVfASPMSupport', 'biosVfAllUSBDevices', 'biosVfAltitude', 'biosVfAssertNMIOnPERR', 'biosVfAssertNMIOnSERR', 'biosVfBootOptionRetry', 'biosVfCPUHardwarePowerManagement', 'biosVfCPUPerformance', 'biosVfCPUPowerManagement', 'biosVfConsistentDeviceNameControl', 'biosVfConsoleRedirection', 'biosVfCoreMultiProcessing', 'biosVfDDR3VoltageSelection', 'biosVfDRAMClockThrottling', 'biosVfDirectCacheAccess', 'biosVfDramRefreshRate', 'biosVfEnergyPerformanceTuning', 'biosVfEnhancedIntelSpeedStepTech', 'biosVfEnhancedPowerCappingSupport', 'biosVfExecuteDisableBit', 'biosVfFRB2Timer', 'biosVfFrequencyFloorOverride', 'biosVfFrontPanelLockout', 'biosVfIOEMezz1OptionROM', 'biosVfIOENVMe1OptionROM', 'biosVfIOENVMe2OptionROM', 'biosVfIOESlot1OptionROM', 'biosVfIOESlot2OptionROM', 'biosVfIntegratedGraphics', 'biosVfIntegratedGraphicsApertureSize', 'biosVfIntelEntrySASRAIDModule', 'biosVfIntelHyperThreadingTech', 'biosVfIntelTrustedExecutionTechnology', 'biosVfIntelTurboBoostTech', 'biosVfIntelVTForDirectedIO', 'biosVfIntelVirtualizationTechnology', 'biosVfInterleaveConfiguration', 'biosVfLocalX2Apic', 'biosVfLvDIMMSupport', 'biosVfMaxVariableMTRRSetting', 'biosVfMaximumMemoryBelow4GB', 'biosVfMemoryMappedIOAbove4GB', 'biosVfMirroringMode', 'biosVfNUMAOptimized', 'biosVfOSBootWatchdogTimer', 'biosVfOSBootWatchdogTimerPolicy', 'biosVfOSBootWatchdogTimerTimeout', 'biosVfOnboardGraphics', 'biosVfOnboardSATAController', 'biosVfOnboardStorage', 'biosVfOptionROMEnable', 'biosVfOptionROMLoad', 'biosVfOutOfBandManagement', 'biosVfPCHSATAMode', 'biosVfPCILOMPortsConfiguration', 'biosVfPCIROMCLP', 'biosVfPCISlotLinkSpeed', 'biosVfPCISlotOptionROMEnable', 'biosVfPOSTErrorPause', 'biosVfPSTATECoordination', 'biosVfPackageCStateLimit', 'biosVfProcessorC1E', 'biosVfProcessorC3Report', 'biosVfProcessorC6Report', 'biosVfProcessorC7Report', 'biosVfProcessorCMCI', 'biosVfProcessorCState', 'biosVfProcessorEnergyConfiguration', 'biosVfProcessorPrefetchConfig', 'biosVfQPILinkFrequencySelect', 'biosVfQPISnoopMode', 'biosVfQuietBoot', 'biosVfRedirectionAfterBIOSPOST', 'biosVfResumeOnACPowerLoss', 'biosVfSBMezz1OptionROM', 'biosVfSBNVMe1OptionROM', 'biosVfSIOC1OptionROM', 'biosVfSIOC2OptionROM', 'biosVfScrubPolicies', 'biosVfSelectMemoryRASConfiguration', 'biosVfSerialPortAEnable', 'biosVfSparingMode', 'biosVfSriovConfig', 'biosVfTPMPendingOperation', 'biosVfTPMSupport', 'biosVfTrustedPlatformModule', 'biosVfUCSMBootModeControl', 'biosVfUCSMBootOrderRuleControl', 'biosVfUEFIOSUseLegacyVideo', 'biosVfUSBBootConfig', 'biosVfUSBConfiguration', 'biosVfUSBFrontPanelAccessLock', 'biosVfUSBPortConfiguration', 'biosVfUSBSystemIdlePowerOptimizingSetting', 'biosVfVGAPriority', 'biosVfWorkloadConfiguration'), ('Get',)),
+    'BiosUnit': ('biosUnit', 'bios', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeExtBoard', 'computeRackUnit', 'computeServerUnit'), ('biosBOT', 'biosSettings', 'firmwareBootDefinition', 'firmwareRunning', 'firmwareUpdatable'), ('Get',)),
+    'BiosVIdentityParams': ('biosVIdentityParams', 'bios-videntity-params', 'Version201m', 'InputOutput', 1, (), ('',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'BiosVProfile': ('biosVProfile', 'bios-prof-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('orgOrg',), ('biosVfACPI10Support', 'biosVfASPMSupport', 'biosVfAllUSBDevices', 'biosVfAltitude', 'biosVfAssertNMIOnPERR', 'biosVfAssertNMIOnSERR', 'biosVfBootOptionRetry', 'biosVfCPUHardwarePowerManagement', 'biosVfCPUPerformance', 'biosVfCPUPowerManagement', 'biosVfConsistentDeviceNameControl', 'biosVfConsoleRedirection', 'biosVfCoreMultiProcessing', 'biosVfDDR3VoltageSelection', 'biosVfDRAMClockThrottling', 'biosVfDirectCacheAccess', 'biosVfDramRefreshRate', 'biosVfEnergyPerformanceTuning', 'biosVfEnhancedIntelSpeedStepTech', 'biosVfEnhancedPowerCappingSupport', 'biosVfExecuteDisableBit', 'biosVfFRB2Timer', 'biosVfFrequencyFloorOverride', 'biosVfFrontPanelLockout', 'biosVfIOEMezz1OptionROM', 'biosVfIOENVMe1OptionROM', 'biosVfIOENVMe2OptionROM', 'biosVfIOESlot1OptionROM', 'biosVfIOESlot2OptionROM', 'biosVfIntegratedGraphics', 'biosVfIntegratedGraphicsApertureSize', 'biosVfIntelEntrySASRAIDModule', 'biosVfIntelHyperThreadingTech', 'biosVfIntelTrustedExecutionTechnology', 'biosVfIntelTurboBoostTech', 'biosVfIntelVTForDirectedIO', 'biosVfIntelVirtualizationTechnology', 'biosVfInterleaveConfiguration', 'biosVfLocalX2Apic', 'biosVfLvDIMMSupport', 'biosVfMaxVariableMTRRSetting', 'biosVfMaximumMemoryBelow4GB', 'biosVfMemoryMappedIOAbove4GB', 'biosVfMirroringMode', 'biosVfNUMAOptimized', 'biosVfOSBootWatchdogTimer', 'biosVfOSBootWatchdogTimerPolicy', 'biosVfOSBootWatchdogTimerTimeout', 'biosVfOnboardGraphics', 'biosVfOnboardSATAController', 'biosVfOnboardStorage', 'biosVfOptionROMEnable', 'biosVfOptionROMLoad', 'biosVfOutOfBandManagement', 'biosVfPCHSATAMode', 'biosVfPCILOMPortsConfiguration', 'biosVfPCIROMCLP', 'biosVfPCISlotLinkSpeed', 'biosVfPCISlotOptionROMEnable', 'biosVfPOSTErrorPause', 'biosVfPSTATECoordination', 'biosVfPackageCStateLimit', 'biosVfProcessorC1E', 'biosVfProcessorC3Report', 'biosVfProcessorC6Report', 'biosVfProcessorC7Report', 'biosVfProcessorCMCI', 'biosVfProcessorCState', 'biosVfProcessorEnergyConfiguration', 'biosVfProcessorPrefetchConfig', 'biosVfQPILinkFrequencySelect', 'biosVfQPISnoopMode', 'biosVfQuietBoot', 'biosVfRedirectionAfterBIOSPOST', 'biosVfResumeOnACPowerLoss', 'biosVfSBMezz1OptionROM', 'biosVfSBNVMe1OptionROM', 'biosVfSIOC1OptionROM', 'biosVfSIOC2OptionROM', 'biosVfScrubPolicies', 'biosVfSelectMemoryRASConfiguration', 'biosVfSerialPortAEnable', 'biosVfSparingMode', 'biosVfSriovConfig', 'biosVfTPMPendingOperation', 'biosVfTPMSupport', 'biosVfTrustedPlatformModule', 'biosVfUCSMBootModeControl', 'biosVfUCSMBootOrderRuleControl', 'biosVfUEFIOSUseLegacyVideo', 'biosVfUSBBootConfig', 'biosVfUSBConfiguration', 'biosVfUSBFrontPanelAccessLock', 'biosVfUSBPortConfiguration', 'biosVfUSBSystemIdlePowerOptimizingSetting', 'biosVfVGAPriority', 'biosVfWorkloadConfiguration'), ('Add', 'Get', 'Remove', 'Set')),
+    'BiosVfACPI10Support': ('biosVfACPI10Support', 'ACPI10-Support', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfASPMSupport': ('biosVfASPMSupport', 'ASPM-Support', 'Version251a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfAllUSBDevices': ('biosVfAllUSBDevices', 'All-USB-Devices', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfAltitude': ('biosVfAltitude', 'Altitude', 'Version223a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfAssertNMIOnPERR': ('biosVfAssertNMIOnPERR', 'Assert-NMI-on-PERR', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfAssertNMIOnSERR': ('biosVfAssertNMIOnSERR', 'Assert-NMI-on-SERR', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfBootOptionRetry': ('biosVfBootOptionRetry', 'Boot-option-retry', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfCPUHardwarePowerManagement': ('biosVfCPUHardwarePowerManagement', 'CPU-Hardware-Power-Management', 'Version311e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfCPUPerformance': ('biosVfCPUPerformance', 'CPU-Performance', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfCPUPowerManagement': ('biosVfCPUPowerManagement', 'CPU-Power-Management', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfConsistentDeviceNameControl': ('biosVfConsistentDeviceNameControl', 'Consistent-Device-Name-Control', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfConsoleRedirection': ('biosVfConsoleRedirection', 'Console-redirection', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfCoreMultiProcessing': ('biosVfCoreMultiProcessing', 'Core-MultiProcessing', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfDDR3VoltageSelection': ('biosVfDDR3VoltageSelection', 'DDR3-Voltage-Selection', 'Version251a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfDRAMClockThrottling': ('biosVfDRAMClockThrottling', 'DRAM-Clock-Throttling', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfDirectCacheAccess': ('biosVfDirectCacheAccess', 'Direct-Cache-Access', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfDramRefreshRate': ('biosVfDramRefreshRate', 'Dram-Refresh-Rate', 'Version205a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfEnergyPerformanceTuning': ('biosVfEnergyPerformanceTuning', 'Energy-Performance-Tuning', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfEnhancedIntelSpeedStepTech': ('biosVfEnhancedIntelSpeedStepTech', 'Enhanced-Intel-SpeedStep-Tech', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfEnhancedPowerCappingSupport': ('biosVfEnhancedPowerCappingSupport', 'Enhanced-PowerCapping-Support', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfExecuteDisableBit': ('biosVfExecuteDisableBit', 'Execute-Disable-Bit', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfFRB2Timer': ('biosVfFRB2Timer', 'FRB-2-Timer', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfFrequencyFloorOverride': ('biosVfFrequencyFloorOverride', 'Frequency-Floor-Override', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfFrontPanelLockout': ('biosVfFrontPanelLockout', 'Front-panel-lockout', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIOEMezz1OptionROM': ('biosVfIOEMezz1OptionROM', 'IOEMezz1-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIOENVMe1OptionROM': ('biosVfIOENVMe1OptionROM', 'IOENVMe1-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIOENVMe2OptionROM': ('biosVfIOENVMe2OptionROM', 'IOENVMe2-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIOESlot1OptionROM': ('biosVfIOESlot1OptionROM', 'IOESlot1-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIOESlot2OptionROM': ('biosVfIOESlot2OptionROM', 'IOESlot2-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntegratedGraphics': ('biosVfIntegratedGraphics', 'Integrated-Graphics', 'Version311e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntegratedGraphicsApertureSize': ('biosVfIntegratedGraphicsApertureSize', 'Integrated-Graphics-Aperture-Size', 'Version311e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntelEntrySASRAIDModule': ('biosVfIntelEntrySASRAIDModule', 'Intel-entry-SAS-RAID-module', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntelHyperThreadingTech': ('biosVfIntelHyperThreadingTech', 'Intel-HyperThreading-Tech', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntelTrustedExecutionTechnology': ('biosVfIntelTrustedExecutionTechnology', 'Intel-Trusted-Execution-Technology', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntelTurboBoostTech': ('biosVfIntelTurboBoostTech', 'Intel-Turbo-Boost-Tech', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntelVTForDirectedIO': ('biosVfIntelVTForDirectedIO', 'Intel-VT-for-directed-IO', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfIntelVirtualizationTechnology': ('biosVfIntelVirtualizationTechnology', 'Intel-Virtualization-Technology', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfInterleaveConfiguration': ('biosVfInterleaveConfiguration', 'Interleave-Configuration', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfLocalX2Apic': ('biosVfLocalX2Apic', 'Local-X2-Apic', 'Version213a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfLvDIMMSupport': ('biosVfLvDIMMSupport', 'LvDIMM-Support', 'Version131c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfMaxVariableMTRRSetting': ('biosVfMaxVariableMTRRSetting', 'Max-Variable-MTRR-Setting', 'Version142b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfMaximumMemoryBelow4GB': ('biosVfMaximumMemoryBelow4GB', 'Maximum-memory-below-4GB', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfMemoryMappedIOAbove4GB': ('biosVfMemoryMappedIOAbove4GB', 'Memory-mapped-IO-above-4GB', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfMirroringMode': ('biosVfMirroringMode', 'Mirroring-Mode', 'Version131c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfNUMAOptimized': ('biosVfNUMAOptimized', 'NUMA-optimized', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfOSBootWatchdogTimer': ('biosVfOSBootWatchdogTimer', 'OS-Boot-Watchdog-Timer', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfOSBootWatchdogTimerPolicy': ('biosVfOSBootWatchdogTimerPolicy', 'OS-Boot-Watchdog-Timer-Policy', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfOSBootWatchdogTimerTimeout': ('biosVfOSBootWatchdogTimerTimeout', 'OS-Boot-Watchdog-Timer-Timeout', 'Version203a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfOnboardGraphics': ('biosVfOnboardGraphics', 'Onboard-Graphics', 'Version311e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfOnboardSATAController': ('biosVfOnboardSATAController', 'Onboard-SATA-controller', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfOnboardStorage': ('biosVfOnboardStorage', 'Onboard-Storage', 'Version203a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfOptionROMEnable': ('biosVfOptionROMEnable', 'OptionROM-Enable', 'Version202m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfOptionROMLoad': ('biosVfOptionROMLoad', 'OptionROM-load', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfOutOfBandManagement': ('biosVfOutOfBandManagement', 'Out-of-Band-Management', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfPCHSATAMode': ('biosVfPCHSATAMode', 'PCH-SATA-Mode', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfPCILOMPortsConfiguration': ('biosVfPCILOMPortsConfiguration', 'PCI-LOM-Ports-Configuration', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfPCIROMCLP': ('biosVfPCIROMCLP', 'PCI-ROM-CLP', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfPCISlotLinkSpeed': ('biosVfPCISlotLinkSpeed', 'PCI-Slot-Link-Speed', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfPCISlotOptionROMEnable': ('biosVfPCISlotOptionROMEnable', 'PCI-Slot-OptionROM-Enable', 'Version202m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfPOSTErrorPause': ('biosVfPOSTErrorPause', 'POST-error-pause', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfPSTATECoordination': ('biosVfPSTATECoordination', 'P-STATE-Coordination', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfPackageCStateLimit': ('biosVfPackageCStateLimit', 'Package-C-State-Limit', 'Version202m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorC1E': ('biosVfProcessorC1E', 'Processor-C1E', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorC3Report': ('biosVfProcessorC3Report', 'Processor-C3-Report', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorC6Report': ('biosVfProcessorC6Report', 'Processor-C6-Report', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorC7Report': ('biosVfProcessorC7Report', 'Processor-C7-Report', 'Version202m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorCMCI': ('biosVfProcessorCMCI', 'Processor-CMCI', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorCState': ('biosVfProcessorCState', 'Processor-C-State', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorEnergyConfiguration': ('biosVfProcessorEnergyConfiguration', 'Processor-Energy-Configuration', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfProcessorPrefetchConfig': ('biosVfProcessorPrefetchConfig', 'Processor-Prefetch-Config', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfQPILinkFrequencySelect': ('biosVfQPILinkFrequencySelect', 'QPI-Link-Frequency-Select', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfQPISnoopMode': ('biosVfQPISnoopMode', 'QPI-Snoop-Mode', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfQuietBoot': ('biosVfQuietBoot', 'Quiet-Boot', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfRedirectionAfterBIOSPOST': ('biosVfRedirectionAfterBIOSPOST', 'Redirection-After-BIOS-POST', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfResumeOnACPowerLoss': ('biosVfResumeOnACPowerLoss', 'Resume-on-AC-power-loss', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSBMezz1OptionROM': ('biosVfSBMezz1OptionROM', 'SBMezz1-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSBNVMe1OptionROM': ('biosVfSBNVMe1OptionROM', 'SBNVMe1-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSIOC1OptionROM': ('biosVfSIOC1OptionROM', 'SIOC1-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSIOC2OptionROM': ('biosVfSIOC2OptionROM', 'SIOC2-OptionROM', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfScrubPolicies': ('biosVfScrubPolicies', 'Scrub-Policies', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSelectMemoryRASConfiguration': ('biosVfSelectMemoryRASConfiguration', 'SelectMemory-RAS-configuration', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSerialPortAEnable': ('biosVfSerialPortAEnable', 'Serial-port-A-enable', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSparingMode': ('biosVfSparingMode', 'Sparing-Mode', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfSriovConfig': ('biosVfSriovConfig', 'Sriov-Config', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), (None,)),
+    'BiosVfTPMPendingOperation': ('biosVfTPMPendingOperation', 'TPM-Pending-Operation', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfTPMSupport': ('biosVfTPMSupport', 'TPM-Support', 'Version223a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfTrustedPlatformModule': ('biosVfTrustedPlatformModule', 'Trusted-Platform-Module', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfUCSMBootModeControl': ('biosVfUCSMBootModeControl', 'UCSM-Boot-Mode-Control', 'Version213a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfUCSMBootOrderRuleControl': ('biosVfUCSMBootOrderRuleControl', 'UCSM-Boot-Order-Rule-Control', 'Version142b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get',)),
+    'BiosVfUEFIOSUseLegacyVideo': ('biosVfUEFIOSUseLegacyVideo', 'UEFI-OS-use-legacy-video', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfUSBBootConfig': ('biosVfUSBBootConfig', 'USB-Boot-Config', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfUSBConfiguration': ('biosVfUSBConfiguration', 'USB-Configuration', 'Version223a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfUSBFrontPanelAccessLock': ('biosVfUSBFrontPanelAccessLock', 'USB-Front-Panel-Access-Lock', 'Version142b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfUSBPortConfiguration': ('biosVfUSBPortConfiguration', 'USB-port-configuration', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfUSBSystemIdlePowerOptimizingSetting': ('biosVfUSBSystemIdlePowerOptimizingSetting', 'USB-System-Idle-Power-Optimizing-Setting', 'Version142b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfVGAPriority': ('biosVfVGAPriority', 'VGA-Priority', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BiosVfWorkloadConfiguration': ('biosVfWorkloadConfiguration', 'Workload-Configuration', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-policy', 'pn-policy'), ('biosSettings', 'biosVProfile'), (), ('Get', 'Set')),
+    'BmcSELCounter': ('bmcSELCounter', 'Counter-[local_id]', 'Version111j', 'InputOutput', 1, (), ('read-only',), ('equipmentPOSTCodeReporter',), (), ('Get',)),
+    'CallhomeAnonymousReporting': ('callhomeAnonymousReporting', 'anonymousreporting', 'Version223a', 'InputOutput', 1, (), ('admin',), ('callhomeEp',), (), ('Get', 'Set')),
+    'CallhomeDest': ('callhomeDest', 'email-[email]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('callhomeProfile',), (), ('Add', 'Get', 'Remove')),
+    'CallhomeEp': ('callhomeEp', 'call-home', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('topRoot',), ('callhomeAnonymousReporting', 'callhomeEpFsm', 'callhomeEpFsmTask', 'callhomePeriodicSystemInventory', 'callhomePolicy', 'callhomeProfile', 'callhomeSmtp', 'callhomeSource', 'callhomeTestAlert', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'CallhomeEpFsm': ('callhomeEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('callhomeEp',), ('callhomeEpFsmStage',), (None,)),
+    'CallhomeEpFsmStage': ('callhomeEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('callhomeEpFsm',), (), (None,)),
+    'CallhomeEpFsmTask': ('callhomeEpFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('callhomeEp',), (), (None,)),
+    'CallhomePeriodicSystemInventory': ('callhomePeriodicSystemInventory', 'periodicsysteminventory', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('callhomeEp',), (), ('Get', 'Set')),
+    'CallhomePolicy': ('callhomePolicy', 'policy-[cause]', 'Version101e', 'InputOutput', 1, (), ('admin', 'fault'), ('callhomeEp',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'CallhomeProfile': ('callhomeProfile', 'profile-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('callhomeEp',), ('callhomeDest',), ('Add', 'Get', 'Remove', 'Set')),
+    'CallhomeSmtp': ('callhomeSmtp', 'smtp', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('callhomeEp',), (), ('Get', 'Set')),
+    'CallhomeSource': ('callhomeSource', 'source', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('callhomeEp',), (), ('Get', 'Set')),
+    'CallhomeTestAlert': ('callhomeTestAlert', 'testalert', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('callhomeEp',), (), ('Get', 'Set')),
+    'CapabilityCatalogue': ('capabilityCatalogue', 'capabilities', 'Version101e', 'InputOutput', 1, (), ('',), ('topRoot',), ('adaptorFruCapProvider', 'capabilityCatalogueFsm', 'capabilityCatalogueFsmTask', 'capabilityEp', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentHwCapDerivativeProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentPOSTCodeReporter', 'equipmentPOSTCodeTemplate', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider', 'eventInst', 'faultInst', 'featureDefinition', 'featureProvider', 'firmwareBootDefinition', 'firmwareBundleTypeCapProvider', 'firmwarePlatformBundleTypeCapProvider', 'firmwareRunning', 'licenseFeatureCapProvider'), ('Get',)),
+    'CapabilityCatalogueFsm': ('capabilityCatalogueFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('capabilityCatalogue',), ('capabilityCatalogueFsmStage',), (None,)),
+    'CapabilityCatalogueFsmStage': ('capabilityCatalogueFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('capabilityCatalogueFsm',), (), (None,)),
+    'CapabilityCatalogueFsmTask': ('capabilityCatalogueFsmTask', 'task-[item]', 'Version131c', 'OutputOnly', 1, (), ('',), ('capabilityCatalogue',), (), (None,)),
+    'CapabilityEp': ('capabilityEp', 'ep', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('capabilityCatalogue',), ('capabilityMgmtExtension', 'capabilityUpdate', 'capabilityUpdater'), ('Get',)),
+    'CapabilityFeatureLimits': ('capabilityFeatureLimits', 'feature-[platform]-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('capabilityNetworkLimits', 'capabilityStorageLimits', 'capabilitySystemLimits'), (), (None,)),
+    'CapabilityMgmtExtension': ('capabilityMgmtExtension', 'mgmt-ext', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('capabilityEp',), ('capabilityMgmtExtensionFsm', 'capabilityMgmtExtensionFsmTask', 'eventInst', 'faultInst', 'firmwareBootDefinition', 'firmwareRunning'), ('Get',)),
+    'CapabilityMgmtExtensionFsm': ('capabilityMgmtExtensionFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('capabilityMgmtExtension',), ('capabilityMgmtExtensionFsmStage',), (None,)),
+    'CapabilityMgmtExtensionFsmStage': ('capabilityMgmtExtensionFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('capabilityMgmtExtensionFsm',), (), (None,)),
+    'CapabilityMgmtExtensionFsmTask': ('capabilityMgmtExtensionFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('capabilityMgmtExtension',), (), (None,)),
+    'CapabilityNetworkLimits': ('capabilityNetworkLimits', 'network-limits', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topSysDefaults',), ('capabilityFeatureLimits',), (None,)),
+    'CapabilityStorageLimits': ('capabilityStorageLimits', 'storage-limits', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topSysDefaults',), ('capabilityFeatureLimits',), (None,)),
+    'CapabilitySystemLimits': ('capabilitySystemLimits', 'system-limits', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topSysDefaults',), ('capabilityFeatureLimits',), (None,)),
+    'CapabilityUpdate': ('capabilityUpdate', 'update-[version]', 'Version131c', 'InputOutput', 1, (), ('admin',), ('capabilityEp',), (), ('Get',)),
+    'CapabilityUpdater': ('capabilityUpdater', 'updater-[file_name]', 'Version131c', 'InputOutput', 1, (), ('admin',), ('capabilityEp',), ('capabilityUpdaterFsm', 'capabilityUpdaterFsmTask', 'eventInst', 'faultInst'), ('Get',)),
+    'CapabilityUpdaterFsm': ('capabilityUpdaterFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('capabilityUpdater',), ('capabilityUpdaterFsmStage',), (None,)),
+    'CapabilityUpdaterFsmStage': ('capabilityUpdaterFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('capabilityUpdaterFsm',), (), (None,)),
+    'CapabilityUpdaterFsmTask': ('capabilityUpdaterFsmTask', 'task-[item]', 'Version131c', 'OutputOnly', 1, (), ('',), ('capabilityUpdater',), (), (None,)),
+    'ChangeChangedObjectRef': ('changeChangedObjectRef', 'ChangedObjectRef[id]', 'Version212a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'CimcvmediaActualMountEntry': ('cimcvmediaActualMountEntry', 'actual-mount-entry-[virtual_disk_id]', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('cimcvmediaActualMountList',), ('faultInst',), ('Get',)),
+    'CimcvmediaActualMountList': ('cimcvmediaActualMountList', 'actual-mount-list', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('mgmtController',), ('cimcvmediaActualMountEntry', 'cimcvmediaExtMgmtRuleEntry'), ('Get',)),
+    'CimcvmediaConfigMountEntry': ('cimcvmediaConfigMountEntry', 'cfg-mnt-entry-[mapping_name]', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('cimcvmediaMountConfigDef', 'cimcvmediaMountConfigPolicy'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'CimcvmediaExtMgmtRuleEntry': ('cimcvmediaExtMgmtRuleEntry', 'ext-mgmt-rule-[mapping_name]', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('cimcvmediaActualMountList',), (), ('Get',)),
+    'CimcvmediaMountConfigDef': ('cimcvmediaMountConfigDef', 'mnt-cfg-def', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'lsServer'), ('cimcvmediaConfigMountEntry',), ('Add', 'Get', 'Remove', 'Set')),
+    'CimcvmediaMountConfigPolicy': ('cimcvmediaMountConfigPolicy', 'mnt-cfg-policy-[name]', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('cimcvmediaConfigMountEntry',), ('Add', 'Get', 'Remove', 'Set')),
+    'ClitestTypeTest': ('clitestTypeTest', 'tt-', 'Version101e', 'InputOutput', 1, (), ('admin',), ('topRoot',), (), ('Get',)),
+    'ClitestTypeTest2': ('clitestTypeTest2', 'tt2-', 'Version101e', 'InputOutput', 1, (), ('admin',), ('topRoot',), (), ('Get',)),
+    'ClitestTypeTestChild': ('clitestTypeTestChild', 'tt-child', 'Version101e', 'InputOutput', 1, (), ('admin',), (), (), ('Get',)),
+    'CommCimcWebService': ('commCimcWebService', 'cimc-web-svc', 'Version221b', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), (None,)),
+    'CommCimxml': ('commCimxml', 'cimxml-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get', 'Set')),
+    'CommDateTime': ('commDateTime', 'datetime-svc', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-security', 'operations'), ('commLocale', 'commSvcEp', 'commSvcPolicy'), ('commNtpProvider', 'faultInst'), ('Get', 'Set')),
+    'CommDns': ('commDns', 'dns-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin', 'ext-lan-config'), ('commLocale', 'commSvcEp', 'commSvcPolicy'), ('commDnsProvider',), ('Get', 'Set')),
+    'CommDnsProvider': ('commDnsProvider', 'dns-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin', 'ext-lan-config'), ('commDns',), (), ('Add', 'Get', 'Remove')),
+    'CommEvtChannel': ('commEvtChannel', 'svc-evt-channel', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get',)),
+    'CommHttp': ('commHttp', 'http-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get', 'Set')),
+    'CommHttps': ('commHttps', 'https-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get', 'Set')),
+    'CommLocale': ('commLocale', 'locale-[name]', 'Version302c', 'InputOutput', 1, (), ('read-only',), (), ('commDateTime', 'commDns', 'commSyslog'), (None,)),
+    'CommNtpProvider': ('commNtpProvider', 'ntp-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-security', 'operations'), ('commDateTime',), (), ('Add', 'Get', 'Remove')),
+    'CommShellSvcLimits': ('commShellSvcLimits', 'shell-svc-limits', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get',)),
+    'CommSmashCLP': ('commSmashCLP', 'smashclp-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get',)),
+    'CommSnmp': ('commSnmp', 'snmp-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), ('commSnmpTrap', 'commSnmpUser', 'faultInst'), ('Get', 'Set')),
+    'CommSnmpTrap': ('commSnmpTrap', 'snmp-trap[hostname]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSnmp',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'CommSnmpUser': ('commSnmpUser', 'snmpv3-user-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSnmp',), ('aaaCimcSession', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'CommSsh': ('commSsh', 'ssh-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get',)),
+    'CommSvcEp': ('commSvcEp', 'svc-ext', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('topSystem',), ('commCimcWebService', 'commCimxml', 'commDateTime', 'commDns', 'commEvtChannel', 'commHttp', 'commHttps', 'commShellSvcLimits', 'commSmashCLP', 'commSnmp', 'commSsh', 'commSvcEpFsm', 'commSvcEpFsmTask', 'commSyslog', 'commTelnet', 'commWebChannel', 'commWebSvcLimits', 'commWsman', 'commXmlClConnPolicy', 'eventInst', 'faultInst'), ('Get',)),
+    'CommSvcEpFsm': ('commSvcEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('commSvcEp',), ('commSvcEpFsmStage',), (None,)),
+    'CommSvcEpFsmStage': ('commSvcEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('commSvcEpFsm',), (), (None,)),
+    'CommSvcEpFsmTask': ('commSvcEpFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('commSvcEp',), (), (None,)),
+    'CommSvcPolicy': ('commSvcPolicy', 'comm-pol-[name]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('orgOrg',), ('commDateTime', 'commDns', 'commSyslog'), (None,)),
+    'CommSyslog': ('commSyslog', 'syslog', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('commLocale', 'commSvcEp', 'commSvcPolicy'), ('commSyslogClient', 'commSyslogConsole', 'commSyslogFile', 'commSyslogMonitor', 'commSyslogSource'), ('Get', 'Set')),
+    'CommSyslogClient': ('commSyslogClient', 'client-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('commSyslog',), (), ('Get', 'Set')),
+    'CommSyslogConsole': ('commSyslogConsole', 'console', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('commSyslog',), (), ('Get', 'Set')),
+    'CommSyslogFile': ('commSyslogFile', 'file', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('commSyslog',), (), ('Get', 'Set')),
+    'CommSyslogMonitor': ('commSyslogMonitor', 'monitor', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('commSyslog',), (), ('Get', 'Set')),
+    'CommSyslogSource': ('commSyslogSource', 'source', 'Version141i', 'InputOutput', 1, (), ('admin', 'operations'), ('commSyslog',), (), ('Get', 'Set')),
+    'CommTelnet': ('commTelnet', 'telnet-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get', 'Set')),
+    'CommWebChannel': ('commWebChannel', 'svc-web-channel', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get',)),
+    'CommWebSvcLimits': ('commWebSvcLimits', 'web-svc-limits', 'Version141i', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get', 'Set')),
+    'CommWsman': ('commWsman', 'wsman-svc', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get',)),
+    'CommXmlClConnPolicy': ('commXmlClConnPolicy', 'xmlclconnpolicy-[client_type]', 'Version131c', 'InputOutput', 1, (), ('aaa', 'admin'), ('commSvcEp',), (), ('Get',)),
+    'ComputeAutoconfigPolicy': ('computeAutoconfigPolicy', 'autoconfig-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('faultInst',), ('Get', 'Set')),
+    'ComputeBlade': ('computeBlade', 'blade-[slot_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassis',), ('aaaEpAuthProfile', 'aaaEpUser', 'adaptorHostIfConfig', 'adaptorUnit', 'biosUnit', 'biosVIdentityParams', 'cimcvmediaMountConfigDef', 'computeBladeFsm', 'computeBladeFsmTask', 'computeBoard', 'computeBoardConnector', 'computeBoardController', 'computeExtBoard', 'computeFactoryResetOperation', 'computeFwSyncAck', 'computeKvmMgmtPolicy', 'computeMemoryConfiguration', 'computePhysicalFsm', 'computePhysicalFsmTask', 'computePnuOSImage', 'computePoolable', 'computeScrubPolicy', 'diagSrvCtrl', 'equipmentBeaconLed', 'equipmentHealthLed', 'equipmentIOExpander', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'equipmentPOST', 'eventInst', 'fabricLocale', 'faultInst', 'faultSuppressTask', 'firmwareImageLock', 'firmwareStatus', 'lsIdentityInfo', 'lsbootDef', 'memoryRuntime', 'mgmtController', 'osAgent', 'osInstance', 'pciEquipSlot', 'pciUnit', 'powerBudget', 'processorRuntime', 'solIf', 'storageEnclosure', 'storageVirtualDriveContainer'), ('Get', 'Set')),
+    'ComputeBladeDiscPolicy': ('computeBladeDiscPolicy', 'blade-discovery[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy', 'read-only'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputeBladeEp': ('computeBladeEp', 'blade-ep-[id]', 'Version302c', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'ComputeBladeFsm': ('computeBladeFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeBlade',), ('computeBladeFsmStage',), (None,)),
+    'ComputeBladeFsmStage': ('computeBladeFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeBladeFsm',), (), (None,)),
+    'ComputeBladeFsmTask': ('computeBladeFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('computeBlade',), (), (None,)),
+    'ComputeBladeInheritPolicy': ('computeBladeInheritPolicy', 'blade-inherit-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputeBoard': ('computeBoard', 'board', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('computeIOHub', 'computeMbPowerStats', 'computeMbTempStats', 'computePCIeFatalCompletionStats', 'computePCIeFatalProtocolStats', 'computePCIeFatalReceiveStats', 'computePCIeFatalStats', 'computeRackUnitMbTempStats', 'computeRtcBattery', 'equipmentTpm', 'faultInst', 'graphicsCard', 'memoryArray', 'memoryBufferUnit', 'processorUnit', 'securityUnit', 'storageController', 'storageFlexFlashController', 'storageLocalDiskSlotEp', 'storageSasExpander'), ('Get',)),
+    'ComputeBoardConnector': ('computeBoardConnector', 'board-conn', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('computeBlade',), (), ('Get',)),
+    'ComputeBoardController': ('computeBoardController', 'boardController', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeExtBoard', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentSystemIOController'), ('mgmtController',), ('Get',)),
+    'ComputeCartridge': ('computeCartridge', 'cartridge-[slot_id]', 'Version251a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassis',), ('computeServerUnit',), ('Get', 'Set')),
+    'ComputeChassisConnPolicy': ('computeChassisConnPolicy', 'chassis-conn-policy-chassis-[chassis_id]-fabric-[switch_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), (), ('Get', 'Set')),
+    'ComputeChassisDiscPolicy': ('computeChassisDiscPolicy', 'chassis-discovery', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), (), ('Get', 'Set')),
+    'ComputeChassisQual': ('computeChassisQual', 'chassis-from-[min_id]-to-[max_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), ('computeSlotQual',), ('Add', 'Get', 'Remove')),
+    'ComputeConstraintDef': ('computeConstraintDef', 'cons-def-[name]', 'Version302c', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), (None,)),
+    'ComputeDefaults': ('computeDefaults', 'compute-defaults', 'Version131c', 'InputOutput', 1, (), ('',), ('topRoot',), ('biosSettings', 'computePlatform'), ('Get',)),
+    'ComputeExtBoard': ('computeExtBoard', 'ext-board-[id]', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('biosUnit', 'computeBoardController', 'computeMbPowerStats', 'computeMbTempStats', 'equipmentHealthLed', 'equipmentLocatorLed', 'faultInst', 'mgmtController', 'powerBudget'), ('Get',)),
+    'ComputeFactoryResetOperation': ('computeFactoryResetOperation', 'factory-reset', 'Version227b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputeFwSyncAck': ('computeFwSyncAck', 'fwsyncack', 'Version221b', 'InputOutput', 1, (), ('admin',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('faultInst', 'trigLocalSched'), ('Get', 'Set')),
+    'ComputeHealthLedSensorAlarm': ('computeHealthLedSensorAlarm', 'sensor-alarm-[sensor_id]', 'Version212a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentHealthLed',), (), ('Get',)),
+    'ComputeIOHub': ('computeIOHub', 'iohub', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), ('computeIOHubEnvStats', 'faultInst'), ('Get',)),
+    'ComputeIOHubEnvStats': ('computeIOHubEnvStats', 'iohub-stats', 'Version131c', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeIOHub',), ('computeIOHubEnvStatsHist',), ('Get',)),
+    'ComputeIOHubEnvStatsHist': ('computeIOHubEnvStatsHist', '[id]', 'Version131c', 'OutputOnly', 1, (), ('read-only',), ('computeIOHubEnvStats',), (), ('Get',)),
+    'ComputeInstanceIdQual': ('computeInstanceIdQual', 'inst-from-[min_id]-to-[max_id]', 'Version251a', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeSlotQual',), (), ('Add', 'Get', 'Remove')),
+    'ComputeKvmMgmtPolicy': ('computeKvmMgmtPolicy', 'kvm-mgmt-policy-[name]', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-ext-access', 'ls-server', 'ls-server-oper', 'ls-server-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'orgOrg'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputeMbPowerStats': ('computeMbPowerStats', 'power-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBoard', 'computeExtBoard'), ('computeMbPowerStatsHist',), ('Get',)),
+    'ComputeMbPowerStatsHist': ('computeMbPowerStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('computeMbPowerStats',), (), ('Get',)),
+    'ComputeMbTempStats': ('computeMbTempStats', 'temp-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBoard', 'computeExtBoard'), ('computeMbTempStatsHist',), ('Get',)),
+    'ComputeMbTempStatsHist': ('computeMbTempStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('computeMbTempStats',), (), ('Get',)),
+    'ComputeMemoryConfigPolicy': ('computeMemoryConfigPolicy', 'memory-config-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-server-policy', 'pn-policy'), ('orgOrg',), (), ('Get', 'Set')),
+    'ComputeMemoryConfiguration': ('computeMemoryConfiguration', 'memmory-config', 'Version221b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get', 'Set')),
+    'ComputeMemoryUnitConstraintDef': ('computeMemoryUnitConstraintDef', 'dc-[name]', 'Version102d', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'ComputePCIeFatalCompletionStats': ('computePCIeFatalCompletionStats', 'pciefat-completion-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBoard',), (), ('Get',)),
+    'ComputePCIeFatalProtocolStats': ('computePCIeFatalProtocolStats', 'pciefat-protocol-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBoard',), (), ('Get',)),
+    'ComputePCIeFatalReceiveStats': ('computePCIeFatalReceiveStats', 'pciefat-receive-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBoard',), (), ('Get',)),
+    'ComputePCIeFatalStats': ('computePCIeFatalStats', 'pciefat-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBoard',), (), ('Get',)),
+    'ComputePciCap': ('computePciCap', 'pci', 'Version111j', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider'), ('computePciSlotScanDef',), ('Get',)),
+    'ComputePciSlotScanDef': ('computePciSlotScanDef', 'slot-[slot_id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('computePciCap',), (), (None,)),
+    'ComputePhysicalAssocCtx': ('computePhysicalAssocCtx', 'pn-assoc-ctx', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('lsServerAssocCtx',), (), ('Get',)),
+    'ComputePhysicalFsm': ('computePhysicalFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('computePhysicalFsmStage',), (None,)),
+    'ComputePhysicalFsmStage': ('computePhysicalFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('computePhysicalFsm',), (), (None,)),
+    'ComputePhysicalFsmTask': ('computePhysicalFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), (None,)),
+    'ComputePhysicalQual': ('computePhysicalQual', 'physical', 'Version131c', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputePlatform': ('computePlatform', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version131c', 'InputOutput', 1, (), ('',), ('computeDefaults',), ('biosSettings',), ('Get',)),
+    'ComputePnuOSImage': ('computePnuOSImage', 'pnuos', 'Version202m', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'ComputePool': ('computePool', 'compute-pool-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('computePooledEnclosureComputeSlot', 'computePooledRackUnit', 'computePooledSlot', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputePoolPolicyRef': ('computePoolPolicyRef', 'poolref-[id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('computePoolable',), (), ('Get',)),
+    'ComputePoolable': ('computePoolable', 'pool-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('computePoolPolicyRef',), ('Get',)),
+    'ComputePooledEnclosureComputeSlot': ('computePooledEnclosureComputeSlot', 'server-[chassis_id]-[slot_id]-[server_instance_id]', 'Version251a', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computePool',), (), ('Add', 'Get', 'Remove')),
+    'ComputePooledRackUnit': ('computePooledRackUnit', 'rack-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computePool',), (), ('Add', 'Get', 'Remove')),
+    'ComputePooledSlot': ('computePooledSlot', 'blade-[chassis_id]-[slot_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computePool',), (), ('Add', 'Get', 'Remove')),
+    'ComputePoolingPolicy': ('computePoolingPolicy', 'pooling-policy-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputePowerSyncDef': ('computePowerSyncDef', 'power-sync-def', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config-policy', 'ls-server', 'ls-server-policy'), ('lsServer',), (), ('Get', 'Set')),
+    'ComputePowerSyncPolicy': ('computePowerSyncPolicy', 'power-sync-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config-policy', 'ls-server', 'ls-server-policy'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputePsuControl': ('computePsuControl', 'psu-contr', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('equipmentChassis',), (), ('Get',)),
+    'ComputePsuPolicy': ('computePsuPolicy', 'psu-policy', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-policy'), ('orgOrg',), (), ('Get', 'Set')),
+    'ComputeQual': ('computeQual', 'blade-qualifier-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('adaptorQual', 'computeChassisQual', 'computePhysicalQual', 'computeRackQual', 'memoryQual', 'powerGroupQual', 'processorQual', 'storageQual'), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputeRackQual': ('computeRackQual', 'rack-from-[min_id]-to-[max_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), (), ('Add', 'Get', 'Remove')),
+    'ComputeRackUnit': ('computeRackUnit', 'rack-unit-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('topSystem',), ('aaaEpAuthProfile', 'aaaEpUser', 'adaptorHostIfConfig', 'adaptorUnit', 'biosUnit', 'biosVIdentityParams', 'cimcvmediaMountConfigDef', 'computeBoard', 'computeBoardController', 'computeExtBoard', 'computeFactoryResetOperation', 'computeFwSyncAck', 'computeKvmMgmtPolicy', 'computeMemoryConfiguration', 'computePhysicalFsm', 'computePhysicalFsmTask', 'computePnuOSImage', 'computePoolable', 'computeRackUnitFsm', 'computeRackUnitFsmTask', 'computeScrubPolicy', 'diagSrvCtrl', 'equipmentBeaconLed', 'equipmentFanModule', 'equipmentHealthLed', 'equipmentIOExpander', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'equipmentPOST', 'equipmentPsu', 'eventInst', 'fabricLocale', 'faultInst', 'faultSuppressTask', 'firmwareImageLock', 'firmwareStatus', 'lsIdentityInfo', 'lsbootDef', 'mgmtController', 'osAgent', 'osInstance', 'pciEquipSlot', 'pciUnit', 'powerBudget', 'solIf', 'storageEnclosure', 'storageVirtualDriveContainer'), ('Get', 'Set')),
+    'ComputeRackUnitFsm': ('computeRackUnitFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeRackUnit',), ('computeRackUnitFsmStage',), (None,)),
+    'ComputeRackUnitFsmStage': ('computeRackUnitFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeRackUnitFsm',), (), (None,)),
+    'ComputeRackUnitFsmTask': ('computeRackUnitFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('computeRackUnit',), (), (None,)),
+    'ComputeRackUnitMbTempStats': ('computeRackUnitMbTempStats', 'temp-stats', 'Version141i', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBoard',), ('computeRackUnitMbTempStatsHist',), ('Get',)),
+    'ComputeRackUnitMbTempStatsHist': ('computeRackUnitMbTempStatsHist', '[id]', 'Version141i', 'OutputOnly', 1, (), ('read-only',), ('computeRackUnitMbTempStats',), (), ('Get',)),
+    'ComputeRtcBattery': ('computeRtcBattery', 'rtc-battery', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), ('faultInst',), ('Get',)),
+    'ComputeScrubPolicy': ('computeScrubPolicy', 'scrub-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'orgOrg'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ComputeServerDiscPolicy': ('computeServerDiscPolicy', 'server-discovery', 'Version141i', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('computeServerDiscPolicyFsm', 'computeServerDiscPolicyFsmTask', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'ComputeServerDiscPolicyFsm': ('computeServerDiscPolicyFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeServerDiscPolicy',), ('computeServerDiscPolicyFsmStage',), (None,)),
+    'ComputeServerDiscPolicyFsmStage': ('computeServerDiscPolicyFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeServerDiscPolicyFsm',), (), (None,)),
+    'ComputeServerDiscPolicyFsmTask': ('computeServerDiscPolicyFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('computeServerDiscPolicy',), (), (None,)),
+    'ComputeServerMgmtPolicy': ('computeServerMgmtPolicy', 'server-mgmt-policy', 'Version211a', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), (), ('Get', 'Set')),
+    'ComputeServerTypeCap': ('computeServerTypeCap', 'server-type', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), (None,)),
+    'ComputeServerUnit': ('computeServerUnit', 'server-[server_instance_id]', 'Version251a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('computeCartridge',), ('aaaEpAuthProfile', 'aaaEpUser', 'adaptorHostIfConfig', 'adaptorUnit', 'biosUnit', 'biosVIdentityParams', 'cimcvmediaMountConfigDef', 'computeBoard', 'computeBoardController', 'computeExtBoard', 'computeFactoryResetOperation', 'computeFwSyncAck', 'computeKvmMgmtPolicy', 'computeMemoryConfiguration', 'computePhysicalFsm', 'computePhysicalFsmTask', 'computePnuOSImage', 'computePoolable', 'computeScrubPolicy', 'computeServerUnitFsm', 'computeServerUnitFsmTask', 'diagSrvCtrl', 'equipmentBeaconLed', 'equipmentHealthLed', 'equipmentIOExpander', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'equipmentPOST', 'eventInst', 'fabricLocale', 'faultInst', 'faultSuppressTask', 'firmwareImageLock', 'firmwareStatus', 'lsIdentityInfo', 'lsbootDef', 'mgmtController', 'osAgent', 'osInstance', 'pciEquipSlot', 'pciUnit', 'powerBudget', 'solIf', 'storageEnclosure', 'storageVirtualDriveContainer'), ('Get', 'Set')),
+    'ComputeServerUnitFsm': ('computeServerUnitFsm', 'fsm', 'Version251a', 'OutputOnly', 1, (), ('',), ('computeServerUnit',), ('computeServerUnitFsmStage',), (None,)),
+    'ComputeServerUnitFsmStage': ('computeServerUnitFsmStage', 'stage-[name]', 'Version251a', 'OutputOnly', 1, (), ('',), ('computeServerUnitFsm',), (), (None,)),
+    'ComputeServerUnitFsmTask': ('computeServerUnitFsmTask', 'task-[item]', 'Version251a', 'OutputOnly', 1, (), ('',), ('computeServerUnit',), (), (None,)),
+    'ComputeSlotQual': ('computeSlotQual', 'slot-from-[min_id]-to-[max_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeChassisQual',), ('computeInstanceIdQual',), ('Add', 'Get', 'Remove')),
+    'ConfigImpact': ('configImpact', 'impact-[name]', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('configManagedEpImpactResponse',), (), (None,)),
+    'ConfigManagedEpImpactResponse': ('configManagedEpImpactResponse', 'ManagedEpapp-id-[app_connector_id]src-id-[source_connector_id]', 'Version212a', 'InputOutput', 1, (), ('read-only',), (), ('configImpact',), (None,)),
+    'ConfigSorter': ('configSorter', 'class-[sort_class]prop-[sort_prop]', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'ControllerHaController': ('controllerHaController', 'HaController', 'Version312b', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('controllerOperationalVersionHolder', 'controllerPreferedVersionHolder'), ('Get', 'Set')),
+    'ControllerOperationalVersionHolder': ('controllerOperationalVersionHolder', 'OpVersHolder-[serial]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('controllerHaController',), (), ('Get',)),
+    'ControllerPreferedVersionHolder': ('controllerPreferedVersionHolder', 'PrefVersHolder-[serial]', 'Version312b', 'InputOutput', 1, (), ('admin',), ('controllerHaController',), (), ('Get',)),
+    'CpmaintAck': ('cpmaintAck', 'ack', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassisProfile',), ('faultInst', 'trigLocalSched'), ('Get', 'Set')),
+    'CpmaintMaintPolicy': ('cpmaintMaintPolicy', 'chassis-profile-maint-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'DcxFcoeVifEp': ('dcxFcoeVifEp', 'fcoevif-[id]', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('swFcoeEstcEp', 'swFcoeSanEp', 'swFcoeSanPc'), ('swVsan',), ('Get',)),
+    'DcxNs': ('dcxNs', 'dcxns-[switch_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorUnit',), ('faultInst',), ('Get',)),
+    'DcxUniverse': ('dcxUniverse', 'dcxns', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricEp',), ('dcxVifEp',), ('Get',)),
+    'DcxVIf': ('dcxVIf', 'vif-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorExtEthIf', 'adaptorFcOEIf', 'adaptorHostEthIf', 'adaptorHostFcIf', 'adaptorHostServiceEthIf'), ('faultInst',), ('Get',)),
+    'DcxVc': ('dcxVc', 'vc-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricLocale', 'fabricPath', 'swEthLanFlowMon', 'swEthMon', 'swFcMon'), ('faultInst', 'swCmclan', 'swNetflowMonitorRef', 'swUlan', 'swVlan', 'swVsan'), ('Get',)),
+    'DcxVifEp': ('dcxVifEp', 'vif-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('dcxUniverse', 'swFcoeEstcEp', 'swFcoeSanEp', 'swFcoeSanPc'), ('swVsan',), ('Get',)),
+    'DhcpAcquired': ('dhcpAcquired', 'lease', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('adaptorHostEthIf', 'mgmtIf'), (), ('Get',)),
+    'DhcpInst': ('dhcpInst', 'dhcp', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('dhcpLease',), ('Get',)),
+    'DhcpLease': ('dhcpLease', 'lease-[ip]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('dhcpInst',), (), ('Get',)),
+    'DiagBladeTest': ('diagBladeTest', 'blade-test-[order]', 'Version131c', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('diagRunPolicy',), (), ('Get',)),
+    'DiagNetworkTest': ('diagNetworkTest', 'network-test-[order]', 'Version131c', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('diagRunPolicy',), (), ('Get',)),
+    'DiagRslt': ('diagRslt', 'rslt-[id]', 'Version111j', 'InputOutput', 1, (), ('',), ('diagSrvCtrl',), (), ('Get',)),
+    'DiagRunPolicy': ('diagRunPolicy', 'diag-policy-[name]', 'Version131c', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('diagSrvCtrl', 'orgOrg'), ('diagBladeTest', 'diagNetworkTest'), ('Get',)),
+    'DiagSrvCapProvider': ('diagSrvCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version111j', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'DiagSrvCtrl': ('diagSrvCtrl', 'diag', 'Version111j', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance'), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('diagRslt', 'diagRunPolicy', 'etherServerIntFIo'), ('Get',)),
+    'DomainEnvironmentFeature': ('domainEnvironmentFeature', 'env-feature-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeatureCont', 'domainNetworkFeatureCont', 'domainServerFeatureCont', 'domainStorageFeatureCont'), ('domainEnvironmentParam', 'domainNetworkParam', 'domainServerParam', 'domainStorageParam'), (None,)),
+    'DomainEnvironmentFeatureCont': ('domainEnvironmentFeatureCont', 'env-feature-cont', 'Version221b', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (None,)),
+    'DomainEnvironmentParam': ('domainEnvironmentParam', 'env-param-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (), (None,)),
+    'DomainNetworkFeature': ('domainNetworkFeature', 'network-feature-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeatureCont', 'domainNetworkFeatureCont', 'domainServerFeatureCont', 'domainStorageFeatureCont'), ('domainEnvironmentParam', 'domainNetworkParam', 'domainServerParam', 'domainStorageParam'), (None,)),
+    'DomainNetworkFeatureCont': ('domainNetworkFeatureCont', 'network-feature-cont', 'Version221b', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (None,)),
+    'DomainNetworkParam': ('domainNetworkParam', 'network-param-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (), (None,)),
+    'DomainServerFeature': ('domainServerFeature', 'server-feature-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeatureCont', 'domainNetworkFeatureCont', 'domainServerFeatureCont', 'domainStorageFeatureCont'), ('domainEnvironmentParam', 'domainNetworkParam', 'domainServerParam', 'domainStorageParam'), (None,)),
+    'DomainServerFeatureCont': ('domainServerFeatureCont', 'server-feature-cont', 'Version221b', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (None,)),
+    'DomainServerParam': ('domainServerParam', 'server-param-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (), (None,)),
+    'DomainStorageFeature': ('domainStorageFeature', 'storage-feature-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeatureCont', 'domainNetworkFeatureCont', 'domainServerFeatureCont', 'domainStorageFeatureCont'), ('domainEnvironmentParam', 'domainNetworkParam', 'domainServerParam', 'domainStorageParam'), (None,)),
+    'DomainStorageFeatureCont': ('domainStorageFeatureCont', 'storage-feature-cont', 'Version221b', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (None,)),
+    'DomainStorageParam': ('domainStorageParam', 'storage-param-[name]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('domainEnvironmentFeature', 'domainNetworkFeature', 'domainServerFeature', 'domainStorageFeature'), (), (None,)),
+    'DpsecMac': ('dpsecMac', 'mac-sec', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('nwctrlDefinition',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'DupeScope': ('dupeScope', 'scope-[id]', 'Version302c', 'InputOutput', 1, (), ('admin',), (), (), (None,)),
+    'DupeScopeResult': ('dupeScopeResult', 'result', 'Version302c', 'InputOutput', 1, (), ('admin',), (), (), (None,)),
+    'EpqosDefinition': ('epqosDefinition', 'ep-qos-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'ls-qos-policy', 'read-only'), ('orgOrg',), ('epqosDefinitionFsm', 'epqosDefinitionFsmTask', 'epqosEgress', 'eventInst', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'EpqosDefinitionDelTask': ('epqosDefinitionDelTask', 'ep-qos-deletion-[def_int_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'ls-qos-policy', 'read-only'), ('orgOrg',), ('epqosDefinitionDelTaskFsm', 'epqosDefinitionDelTaskFsmTask', 'eventInst', 'faultInst'), (None,)),
+    'EpqosDefinitionDelTaskFsm': ('epqosDefinitionDelTaskFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('epqosDefinitionDelTask',), ('epqosDefinitionDelTaskFsmStage',), (None,)),
+    'EpqosDefinitionDelTaskFsmStage': ('epqosDefinitionDelTaskFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('epqosDefinitionDelTaskFsm',), (), (None,)),
+    'EpqosDefinitionDelTaskFsmTask': ('epqosDefinitionDelTaskFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('epqosDefinitionDelTask',), (), (None,)),
+    'EpqosDefinitionFsm': ('epqosDefinitionFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('epqosDefinition',), ('epqosDefinitionFsmStage',), (None,)),
+    'EpqosDefinitionFsmStage': ('epqosDefinitionFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('epqosDefinitionFsm',), (), (None,)),
+    'EpqosDefinitionFsmTask': ('epqosDefinitionFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('epqosDefinition',), (), (None,)),
+    'EpqosEgress': ('epqosEgress', 'egress', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'ls-qos-policy', 'read-only'), ('epqosDefinition',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'EquipmentAdaptorConnDef': ('equipmentAdaptorConnDef', 'adaptor-port-[adaptor_ep]-iom-port-[iom_ep]', 'Version202m', 'InputOutput', 1, (), ('',), ('equipmentBladeIOMConnDef', 'equipmentBladeSwitchConnDef'), (), ('Get',)),
+    'EquipmentAdaptorDef': ('equipmentAdaptorDef', 'adaptor', 'Version101e', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'EquipmentAdvancedBootOrder': ('equipmentAdvancedBootOrder', 'advbootordsupp-[is_supported]', 'Version221b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentAutoconfigPolicy': ('equipmentAutoconfigPolicy', 'chassis-autoconfig-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('faultInst',), (None,)),
+    'EquipmentBaseBoardCapProvider': ('equipmentBaseBoardCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentBeaconCapProvider': ('equipmentBeaconCapProvider', 'beacon-cap', 'Version201m', 'InputOutput', 1, (), ('',), ('equipmentGemCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider'), (), ('Get',)),
+    'EquipmentBeaconLed': ('equipmentBeaconLed', 'beacon', 'Version201m', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFanModule', 'equipmentFex', 'equipmentIOCard', 'equipmentPsu', 'equipmentSwitchCard'), ('equipmentBeaconLedFsm', 'equipmentBeaconLedFsmTask', 'eventInst', 'faultInst'), ('Get',)),
+    'EquipmentBeaconLedFsm': ('equipmentBeaconLedFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentBeaconLed',), ('equipmentBeaconLedFsmStage',), (None,)),
+    'EquipmentBeaconLedFsmStage': ('equipmentBeaconLedFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentBeaconLedFsm',), (), (None,)),
+    'EquipmentBeaconLedFsmTask': ('equipmentBeaconLedFsmTask', 'task-[item]', 'Version201m', 'OutputOnly', 1, (), ('',), ('equipmentBeaconLed',), (), (None,)),
+    'EquipmentBinding': ('equipmentBinding', 'chassis', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy', 'read-only'), ('equipmentChassisProfile',), (), ('Get', 'Set')),
+    'EquipmentBiosDef': ('equipmentBiosDef', 'bios-def', 'Version202m', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider'), (), ('Get',)),
+    'EquipmentBladeAGLibrary': ('equipmentBladeAGLibrary', 'library-[name]', 'Version141i', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider'), (), ('Get',)),
+    'EquipmentBladeAggregationCapRef': ('equipmentBladeAggregationCapRef', 'blade-aggr', 'Version222c', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider',), ('equipmentPhysDevicesPerBoard',), ('Get',)),
+    'EquipmentBladeBiosCapProvider': ('equipmentBladeBiosCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('biosRef', 'equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentBladeCapProvider': ('equipmentBladeCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('adaptorFruCapRef', 'computeConstraintDef', 'computeMemoryUnitConstraintDef', 'computePciCap', 'computeServerTypeCap', 'equipmentAdvancedBootOrder', 'equipmentBiosDef', 'equipmentBladeAGLibrary', 'equipmentBladeAggregationCapRef', 'equipmentBladeCapProviderTypeDef', 'equipmentBladeConnDef', 'equipmentBoardControllerDef', 'equipmentBootDeviceConstraints', 'equipmentCimcVmedia', 'equipmentCiscoOsOpenGate', 'equipmentDimmMapping', 'equipmentDiscoveryCap', 'equipmentFruVariant', 'equipmentGraphicsCardCapRef', 'equipmentHDDFaultMonDef', 'equipmentHwRevisionModifier', 'equipmentInbandMgmtCap', 'equipmentKvmMgmtCap', 'equipmentLocalDiskControllerCapRef', 'equipmentManufacturingDef', 'equipmentPciSlotIdMapping', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPowerCapDef', 'equipmentSecureBoot', 'equipmentServerCorrectUuidBehavior', 'equipmentServerFeatureCap', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'equipmentStorageControllerSlotDef', 'equipmentUuidFeatureCap', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint', 'storageEnclosureCap'), ('Get',)),
+    'EquipmentBladeCapProviderTypeDef': ('equipmentBladeCapProviderTypeDef', 'blade-provider-type', 'Version224b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider',), (), ('Get',)),
+    'EquipmentBladeConnDef': ('equipmentBladeConnDef', 'adaptor-type-[adaptor_type]-family-[adaptor_family]-slot-[adaptor_slot_number]', 'Version202m', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentServerUnitCapProvider'), ('equipmentBladeIOMConnDef', 'equipmentBladeSwitchConnDef'), ('Get',)),
+    'EquipmentBladeIOMConnDef': ('equipmentBladeIOMConnDef', '-iom-type-[iocard_type]', 'Version203a', 'InputOutput', 1, (), ('',), ('equipmentBladeConnDef',), ('equipmentAdaptorConnDef',), ('Get',)),
+    'EquipmentBladeSwitchConnDef': ('equipmentBladeSwitchConnDef', '-switch-type-[switch_type]', 'Version302c', 'InputOutput', 1, (), ('',), ('equipmentBladeConnDef',), ('equipmentAdaptorConnDef',), (None,)),
+    'EquipmentBoardControllerDef': ('equipmentBoardControllerDef', 'board-controller', 'Version131c', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider'), ('equipmentDowngradeConstraint', 'equipmentFirmwareConstraint', 'equipmentVersionConstraint'), ('Get',)),
+    'EquipmentBootDeviceConstraints': ('equipmentBootDeviceConstraints', 'bootdevconstr-[boot_dev_type]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), (None,)),
+    'EquipmentBreakoutCap': ('equipmentBreakoutCap', 'breakout-cap', 'Version311e', 'InputOutput', 1, (), ('',), ('equipmentSwitchCapProvider',), (), (None,)),
+    'EquipmentCapModSpec': ('equipmentCapModSpec', 'modspec-[path]', 'Version227b', 'InputOutput', 1, (), ('',), ('equipmentHwCapDerivativeProvider',), (), ('Get',)),
+    'EquipmentCatalogCapProvider': ('equipmentCatalogCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version131c', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentChassis': ('equipmentChassis', 'chassis-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('topSystem',), ('computeBlade', 'computeBoardController', 'computeCartridge', 'computePsuControl', 'equipmentBeaconLed', 'equipmentChassisFsm', 'equipmentChassisFsmTask', 'equipmentChassisStats', 'equipmentFanModule', 'equipmentHealthLed', 'equipmentIOCard', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'equipmentPoolable', 'equipmentPsu', 'equipmentSharedIOModule', 'equipmentSwitchIOCard', 'equipmentSystemIOController', 'eventInst', 'fabricLocale', 'faultInst', 'faultSuppressTask', 'firmwareActivity', 'firmwareActivityTrigger', 'firmwareImageLock', 'firmwareStatus', 'mgmtController', 'powerBudget', 'sesEnclosure', 'storageController', 'storageEnclosure', 'storageSasExpander', 'storageVirtualDriveContainer', 'vnicRackServerDiscoveryProfile'), ('Get', 'Set')),
+    'EquipmentChassisAssocCtx': ('equipmentChassisAssocCtx', 'cp-assoc-ctx', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('equipmentChassisProfileAssocCtx',), (), (None,)),
+    'EquipmentChassisCapProvider': ('equipmentChassisCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPowerCapDef', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint', 'storageEnclosureCap', 'storageSasLinkDescriptor', 'storageSasPortDescriptor'), ('Get',)),
+    'EquipmentChassisFsm': ('equipmentChassisFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentChassis',), ('equipmentChassisFsmStage',), (None,)),
+    'EquipmentChassisFsmStage': ('equipmentChassisFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentChassisFsm',), (), (None,)),
+    'EquipmentChassisFsmTask': ('equipmentChassisFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('equipmentChassis',), (), (None,)),
+    'EquipmentChassisInheritPolicy': ('equipmentChassisInheritPolicy', 'chassis-inherit-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('faultInst',), (None,)),
+    'EquipmentChassisIssues': ('equipmentChassisIssues', 'config-issue', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassisProfile',), ('faultInst',), ('Get',)),
+    'EquipmentChassisProfile': ('equipmentChassisProfile', 'cp-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentTier', 'orgOrg'), ('cpmaintAck', 'equipmentBinding', 'equipmentChassisIssues', 'equipmentChassisProfileAssocCtx', 'equipmentChassisProfileFsm', 'equipmentChassisProfileFsmTask', 'equipmentRequirement', 'eventInst', 'faultInst', 'lstorageDiskZoningConfigDef'), ('Add', 'Get', 'Remove', 'Set')),
+    'EquipmentChassisProfileAssocCtx': ('equipmentChassisProfileAssocCtx', 'cp-assoc-ctx', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('equipmentChassisProfile',), ('equipmentChassisAssocCtx',), ('Get',)),
+    'EquipmentChassisProfileFsm': ('equipmentChassisProfileFsm', 'fsm', 'Version312b', 'OutputOnly', 1, (), ('',), ('equipmentChassisProfile',), ('equipmentChassisProfileFsmStage',), (None,)),
+    'EquipmentChassisProfileFsmStage': ('equipmentChassisProfileFsmStage', 'stage-[name]', 'Version312b', 'OutputOnly', 1, (), ('',), ('equipmentChassisProfileFsm',), (), (None,)),
+    'EquipmentChassisProfileFsmTask': ('equipmentChassisProfileFsmTask', 'task-[item]', 'Version312b', 'OutputOnly', 1, (), ('',), ('equipmentChassisProfile',), (), (None,)),
+    'EquipmentChassisQual': ('equipmentChassisQual', 'chassis-from-[min_id]-to-[max_id]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('equipmentQual',), (), (None,)),
+    'EquipmentChassisStats': ('equipmentChassisStats', 'stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentChassis',), ('equipmentChassisStatsHist',), ('Get',)),
+    'EquipmentChassisStatsHist': ('equipmentChassisStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('equipmentChassisStats',), (), ('Get',)),
+    'EquipmentCimcVmedia': ('equipmentCimcVmedia', 'cimcvmediasupp-[is_supported]', 'Version222c', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentCiscoOsOpenGate': ('equipmentCiscoOsOpenGate', 'ciscoosopengate-[is_supported]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), (None,)),
+    'EquipmentDbgPluginCapProvider': ('equipmentDbgPluginCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version141i', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentDimmEntry': ('equipmentDimmEntry', 'dimm-entry[id]', 'Version202m', 'InputOutput', 1, (), ('',), ('equipmentDimmMapping',), (), ('Get',)),
+    'EquipmentDimmMapping': ('equipmentDimmMapping', 'dimm-mapping', 'Version202m', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider'), ('equipmentDimmEntry',), ('Get',)),
+    'EquipmentDiscoveryCap': ('equipmentDiscoveryCap', 'disccap', 'Version142b', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentDowngradeConstraint': ('equipmentDowngradeConstraint', 'fw-dngrd-constr', 'Version213a', 'InputOutput', 1, (), ('',), ('equipmentBoardControllerDef',), (), ('Get',)),
+    'EquipmentEmbeddedStorageDef': ('equipmentEmbeddedStorageDef', 'embedded-storage', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentLocalDiskControllerCapProvider',), (), (None,)),
+    'EquipmentFan': ('equipmentFan', 'fan-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('equipmentFanModule', 'equipmentFex', 'networkElement'), ('equipmentFanStats', 'equipmentNetworkElementFanStats', 'equipmentRackUnitFanStats', 'faultInst'), ('Get',)),
+    'EquipmentFanModule': ('equipmentFanModule', 'fan-module-[tray]-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeRackUnit', 'equipmentChassis', 'networkElement'), ('equipmentBeaconLed', 'equipmentFan', 'equipmentFanModuleStats', 'equipmentHealthLed', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'faultInst'), ('Get',)),
+    'EquipmentFanModuleCapProvider': ('equipmentFanModuleCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFanModuleDef', 'equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentFanModuleDef': ('equipmentFanModuleDef', 'fanmod', 'Version201m', 'InputOutput', 1, (), ('',), ('equipmentFanModuleCapProvider',), (), ('Get',)),
+    'EquipmentFanModuleStats': ('equipmentFanModuleStats', 'stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentFanModule',), ('equipmentFanModuleStatsHist',), ('Get',)),
+    'EquipmentFanModuleStatsHist': ('equipmentFanModuleStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('equipmentFanModuleStats',), (), ('Get',)),
+    'EquipmentFanStats': ('equipmentFanStats', 'stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentFan',), ('equipmentFanStatsHist',), ('Get',)),
+    'EquipmentFanStatsHist': ('equipmentFanStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('equipmentFanStats',), (), ('Get',)),
+    'EquipmentFex': ('equipmentFex', 'fex-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('topSystem',), ('equipmentBeaconLed', 'equipmentFan', 'equipmentFexEnvStats', 'equipmentFexFsm', 'equipmentFexFsmTask', 'equipmentFexPowerSummary', 'equipmentFexSystemStats', 'equipmentHealthLed', 'equipmentIOCard', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'equipmentPOST', 'equipmentPsu', 'eventInst', 'fabricLocale', 'faultInst', 'faultSuppressTask', 'mgmtController', 'powerBudget'), ('Get', 'Set')),
+    'EquipmentFexCapProvider': ('equipmentFexCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version141i', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPortGroupAggregationDef', 'equipmentPortGroupDef', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentFexEnvStats': ('equipmentFexEnvStats', 'env-stats', 'Version141i', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentFex',), ('equipmentFexEnvStatsHist',), ('Get',)),
+    'EquipmentFexEnvStatsHist': ('equipmentFexEnvStatsHist', '[id]', 'Version141i', 'OutputOnly', 1, (), ('read-only',), ('equipmentFexEnvStats',), (), ('Get',)),
+    'EquipmentFexFsm': ('equipmentFexFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentFex',), ('equipmentFexFsmStage',), (None,)),
+    'EquipmentFexFsmStage': ('equipmentFexFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentFexFsm',), (), (None,)),
+    'EquipmentFexFsmTask': ('equipmentFexFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('equipmentFex',), (), (None,)),
+    'EquipmentFexPowerSummary': ('equipmentFexPowerSummary', 'power-summary', 'Version141i', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentFex',), ('equipmentFexPowerSummaryHist',), ('Get',)),
+    'EquipmentFexPowerSummaryHist': ('equipmentFexPowerSummaryHist', '[id]', 'Version141i', 'OutputOnly', 1, (), ('read-only',), ('equipmentFexPowerSummary',), (), ('Get',)),
+    'EquipmentFexPsuInputStats': ('equipmentFexPsuInputStats', 'fex-psu-input-stats', 'Version141i', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentPsu',), ('equipmentFexPsuInputStatsHist',), ('Get',)),
+    'EquipmentFexPsuInputStatsHist': ('equipmentFexPsuInputStatsHist', '[id]', 'Version141i', 'OutputOnly', 1, (), ('read-only',), ('equipmentFexPsuInputStats',), (), ('Get',)),
+    'EquipmentFexSystemStats': ('equipmentFexSystemStats', 'sys-stats', 'Version311e', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentFex',), ('equipmentFexSystemStatsHist',), (None,)),
+    'EquipmentFexSystemStatsHist': ('equipmentFexSystemStatsHist', '[id]', 'Version311e', 'OutputOnly', 1, (), ('read-only',), ('equipmentFexSystemStats',), (), (None,)),
+    'EquipmentFirmwareConstraint': ('equipmentFirmwareConstraint', 'fw-constr', 'Version212a', 'InputOutput', 1, (), ('',), ('equipmentBoardControllerDef',), (), ('Get',)),
+    'EquipmentFlashLife': ('equipmentFlashLife', '[suport_type][card_param_type]', 'Version222c', 'InputOutput', 1, (), ('',), ('equipmentLocalDiskControllerCapProvider',), (), ('Get',)),
+    'EquipmentFruVariant': ('equipmentFruVariant', 'fruVariant-[type]', 'Version312b', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), (), ('Get',)),
+    'EquipmentGemCapProvider': ('equipmentGemCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentBeaconCapProvider', 'equipmentFruVariant', 'equipmentGemPortCap', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServerPortCapProvider', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'equipmentUnifiedPortCapProvider', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentGemPortCap': ('equipmentGemPortCap', 'gem-port-cap-[port_number]', 'Version141i', 'InputOutput', 1, (), ('',), ('equipmentGemCapProvider',), (), ('Get',)),
+    'EquipmentGraphicsCardCapProvider': ('equipmentGraphicsCardCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version213a', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPciDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentGraphicsCardCapRef': ('equipmentGraphicsCardCapRef', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version213a', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentHDDFaultMonDef': ('equipmentHDDFaultMonDef', '[controller_fw_version][hdd_mon_support]', 'Version201m', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentServerUnitCapProvider'), (), ('Get',)),
+    'EquipmentHealthLed': ('equipmentHealthLed', 'health-led', 'Version212a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('computeBlade', 'computeExtBoard', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFanModule', 'equipmentFex', 'equipmentIOCard', 'equipmentPsu'), ('computeHealthLedSensorAlarm', 'faultInst'), ('Get',)),
+    'EquipmentHostIfCapProvider': ('equipmentHostIfCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentHwCapDerivativeProvider': ('equipmentHwCapDerivativeProvider', 'derivative-[vendor]-model-[model]-revision-[revision]', 'Version227b', 'InputOutput', 1, (), ('',), ('capabilityCatalogue',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCapModSpec', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), ('Get',)),
+    'EquipmentHwRevisionModifier': ('equipmentHwRevisionModifier', 'hw-rev-modifier-[hw_type]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentIOCard': ('equipmentIOCard', 'slot-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassis', 'equipmentFex'), ('equipmentBeaconLed', 'equipmentHealthLed', 'equipmentIOCardBaseFsm', 'equipmentIOCardBaseFsmTask', 'equipmentIOCardFsm', 'equipmentIOCardFsmTask', 'equipmentIOCardStats', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'equipmentPOST', 'eventInst', 'faultInst', 'faultSuppressTask', 'firmwareStatus', 'mgmtController', 'portGroup'), ('Get', 'Set')),
+    'EquipmentIOCardBaseFsm': ('equipmentIOCardBaseFsm', 'fsm', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentIOCard', 'equipmentSwitchIOCard'), ('equipmentIOCardBaseFsmStage',), (None,)),
+    'EquipmentIOCardBaseFsmStage': ('equipmentIOCardBaseFsmStage', 'stage-[name]', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentIOCardBaseFsm',), (), (None,)),
+    'EquipmentIOCardBaseFsmTask': ('equipmentIOCardBaseFsmTask', 'task-[item]', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentIOCard', 'equipmentSwitchIOCard'), (), (None,)),
+    'EquipmentIOCardCapProvider': ('equipmentIOCardCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentIOCardTypeDef', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPortGroupAggregationDef', 'equipmentPortGroupDef', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentIOCardFsm': ('equipmentIOCardFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentIOCard',), ('equipmentIOCardFsmStage',), (None,)),
+    'EquipmentIOCardFsmStage': ('equipmentIOCardFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentIOCardFsm',), (), (None,)),
+    'EquipmentIOCardFsmTask': ('equipmentIOCardFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('equipmentIOCard',), (), (None,)),
+    'EquipmentIOCardStats': ('equipmentIOCardStats', 'stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentIOCard', 'equipmentSwitchIOCard'), ('equipmentIOCardStatsHist',), ('Get',)),
+    'EquipmentIOCardStatsHist': ('equipmentIOCardStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('equipmentIOCardStats',), (), ('Get',)),
+    'EquipmentIOCardTypeDef': ('equipmentIOCardTypeDef', 'type', 'Version202m', 'InputOutput', 1, (), ('',), ('equipmentIOCardCapProvider', 'equipmentSwitchIOCardCapProvider'), (), ('Get',)),
+    'EquipmentIOExpander': ('equipmentIOExpander', 'io-expander-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'EquipmentIOExpanderCapProvider': ('equipmentIOExpanderCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version312b', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentInbandMgmtCap': ('equipmentInbandMgmtCap', 'ib-mgmt-cap', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), (None,)),
+    'EquipmentIndicatorLed': ('equipmentIndicatorLed', 'indicator-led-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy', 'read-only'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFanModule', 'equipmentFex', 'equipmentIOCard', 'equipmentPsu'), (), ('Get',)),
+    'EquipmentKvmMgmtCap': ('equipmentKvmMgmtCap', 'kvm-mgmt-cap', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentLocalDiskCapProvider': ('equipmentLocalDiskCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentLocalDiskDef', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentLocalDiskControllerCapProvider': ('equipmentLocalDiskControllerCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('adaptorFamilyTypeDef', 'equipmentEmbeddedStorageDef', 'equipmentFlashLife', 'equipmentFruVariant', 'equipmentLocalDiskControllerDef', 'equipmentLocalDiskControllerTypeDef', 'equipmentManufacturingDef', 'equipmentOnboardDeviceDef', 'equipmentPciDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentRaidDef', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'equipmentStorageLimitCap', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentLocalDiskControllerCapRef': ('equipmentLocalDiskControllerCapRef', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version142b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentLocalDiskControllerDef': ('equipmentLocalDiskControllerDef', 'disk-controller', 'Version131c', 'InputOutput', 1, (), ('',), ('equipmentLocalDiskControllerCapProvider',), (), ('Get',)),
+    'EquipmentLocalDiskControllerTypeDef': ('equipmentLocalDiskControllerTypeDef', 'controller-type', 'Version224b', 'InputOutput', 1, (), ('',), ('equipmentLocalDiskControllerCapProvider',), (), ('Get',)),
+    'EquipmentLocalDiskDef': ('equipmentLocalDiskDef', 'disk', 'Version101e', 'InputOutput', 1, (), ('',), ('equipmentLocalDiskCapProvider',), (), ('Get',)),
+    'EquipmentLocatorLed': ('equipmentLocatorLed', 'locator-led', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy', 'read-only'), ('computeBlade', 'computeExtBoard', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFanModule', 'equipmentFex', 'equipmentIOCard', 'equipmentPsu', 'networkElement', 'storageLocalDisk'), ('equipmentLocatorLedFsm', 'equipmentLocatorLedFsmTask', 'eventInst', 'faultInst'), ('Get', 'Set')),
+    'EquipmentLocatorLedFsm': ('equipmentLocatorLedFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentLocatorLed',), ('equipmentLocatorLedFsmStage',), (None,)),
+    'EquipmentLocatorLedFsmStage': ('equipmentLocatorLedFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('equipmentLocatorLedFsm',), (), (None,)),
+    'EquipmentLocatorLedFsmTask': ('equipmentLocatorLedFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('equipmentLocatorLed',), (), (None,)),
+    'EquipmentManufacturingDef': ('equipmentManufacturingDef', 'manufacturing', 'Version101e', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), (), ('Get',)),
+    'EquipmentMemoryUnitCapProvider': ('equipmentMemoryUnitCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentMemoryUnitDiscoveryModifierDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentMemoryUnitDiscoveryModifierDef': ('equipmentMemoryUnitDiscoveryModifierDef', 'discmod-[name]', 'Version102d', 'InputOutput', 1, (), ('',), ('equipmentMemoryUnitCapProvider',), (), ('Get',)),
+    'EquipmentMgmtCapProvider': ('equipmentMgmtCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentMgmtExtCapProvider': ('equipmentMgmtExtCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version141i', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentNetworkElementFanStats': ('equipmentNetworkElementFanStats', 'stats', 'Version201m', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentFan',), ('equipmentNetworkElementFanStatsHist',), ('Get',)),
+    'EquipmentNetworkElementFanStatsHist': ('equipmentNetworkElementFanStatsHist', '[id]', 'Version201m', 'OutputOnly', 1, (), ('read-only',), ('equipmentNetworkElementFanStats',), (), ('Get',)),
+    'EquipmentNonCopperPassiveCap': ('equipmentNonCopperPassiveCap', 'non-copper-passive-cap', 'Version311e', 'InputOutput', 1, (), ('',), ('equipmentSwitchCapProvider',), (), (None,)),
+    'EquipmentOnboardDeviceDef': ('equipmentOnboardDeviceDef', 'onboard-device-[device]', 'Version227b', 'InputOutput', 1, (), ('',), ('equipmentLocalDiskControllerCapProvider', 'equipmentStorageSasExpanderCapProvider'), ('firmwareType',), (None,)),
+    'EquipmentPOST': ('equipmentPOST', 'code-[global_id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('adaptorUnit', 'computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentFex', 'equipmentIOCard'), (), ('Get',)),
+    'EquipmentPOSTCode': ('equipmentPOSTCode', 'code-[local_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('equipmentPOSTCodeReporter', 'equipmentPOSTCodeTemplate'), (), ('Get',)),
+    'EquipmentPOSTCodeReporter': ('equipmentPOSTCodeReporter', 'POST-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('capabilityCatalogue',), ('bmcSELCounter', 'equipmentPOSTCode'), ('Get',)),
+    'EquipmentPOSTCodeTemplate': ('equipmentPOSTCodeTemplate', 'POST-[name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('capabilityCatalogue',), ('equipmentPOSTCode',), ('Get',)),
+    'EquipmentPciDef': ('equipmentPciDef', 'pci-[name]', 'Version141i', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'adaptorUnit', 'equipmentGraphicsCardCapProvider', 'equipmentLocalDiskControllerCapProvider'), (), ('Get',)),
+    'EquipmentPciSlotIdEntry': ('equipmentPciSlotIdEntry', 'pci-slotid-entry-[name]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentPciSlotIdMapping',), (), ('Get',)),
+    'EquipmentPciSlotIdMapping': ('equipmentPciSlotIdMapping', 'pci-slotid-mapping', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), ('equipmentPciSlotIdEntry',), ('Get',)),
+    'EquipmentPciSlotSubOEMIdEntry': ('equipmentPciSlotSubOEMIdEntry', 'pci-slot-suboemid-entry-[name]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentStorageControllerConfig',), (), ('Get',)),
+    'EquipmentPfcMmuCap': ('equipmentPfcMmuCap', 'pfc-mmu-cap', 'Version311e', 'InputOutput', 1, (), ('',), ('equipmentSwitchCapProvider',), (), (None,)),
+    'EquipmentPhysDevicesPerBoard': ('equipmentPhysDevicesPerBoard', 'phys-dev-per-board', 'Version222c', 'InputOutput', 1, (), ('',), ('equipmentBladeAggregationCapRef',), (), ('Get',)),
+    'EquipmentPhysicalDef': ('equipmentPhysicalDef', 'physical', 'Version101e', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), (), ('Get',)),
+    'EquipmentPhysicalQual': ('equipmentPhysicalQual', 'physicalqual', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('equipmentQual',), (), (None,)),
+    'EquipmentPicture': ('equipmentPicture', 'picture-[type]', 'Version141i', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), (), ('Get',)),
+    'EquipmentPool': ('equipmentPool', 'equipment-pool-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('equipmentPooledChassis',), (None,)),
+    'EquipmentPoolPolicyRef': ('equipmentPoolPolicyRef', 'chassis-poolref-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('equipmentPoolable',), (), (None,)),
+    'EquipmentPoolable': ('equipmentPoolable', 'chassis-pool-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('equipmentChassis',), ('equipmentPoolPolicyRef',), (None,)),
+    'EquipmentPooledChassis': ('equipmentPooledChassis', 'chassis-[chassis_id]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('equipmentPool',), (), (None,)),
+    'EquipmentPoolingPolicy': ('equipmentPoolingPolicy', 'chassis-pooling-policy-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), (), (None,)),
+    'EquipmentPortCap': ('equipmentPortCap', 'port-cap-start-[start_port_id]-end-[end_port_id]', 'Version302c', 'InputOutput', 1, (), ('',), ('equipmentSwitchCap', 'equipmentSwitchIOCardCapProvider'), (), (None,)),
+    'EquipmentPortGroupAggregationDef': ('equipmentPortGroupAggregationDef', 'port-group-aggr-def-[type]', 'Version201m', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'equipmentFexCapProvider', 'equipmentIOCardCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider'), (), ('Get',)),
+    'EquipmentPortGroupDef': ('equipmentPortGroupDef', 'port-group-def[type]', 'Version141i', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'equipmentFexCapProvider', 'equipmentIOCardCapProvider', 'equipmentSwitchIOCardCapProvider'), (), ('Get',)),
+    'EquipmentPortGroupSwComplexDef': ('equipmentPortGroupSwComplexDef', 'port-group-sw-complex-def[asic]', 'Version201m', 'InputOutput', 1, (), ('',), ('equipmentSwitchCapProvider',), ('equipmentPortSwComplexRef',), ('Get',)),
+    'EquipmentPortSwComplexRef': ('equipmentPortSwComplexRef', 'port-sw-complex-ref-[sw_complex_id]', 'Version201m', 'InputOutput', 1, (), ('',), ('equipmentPortGroupSwComplexDef',), (), ('Get',)),
+    'EquipmentPowerCapDef': ('equipmentPowerCapDef', 'powercap', 'Version302c', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentChassisCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentProcessorUnitCapProvider': ('equipmentProcessorUnitCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentProcessorUnitDef', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentProcessorUnitDef': ('equipmentProcessorUnitDef', 'cpu', 'Version101e', 'InputOutput', 1, (), ('',), ('equipmentProcessorUnitCapProvider',), (), ('Get',)),
+    'EquipmentPsu': ('equipmentPsu', 'psu-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeRackUnit', 'equipmentChassis', 'equipmentFex', 'networkElement'), ('equipmentBeaconLed', 'equipmentFexPsuInputStats', 'equipmentHealthLed', 'equipmentIndicatorLed', 'equipmentLocatorLed', 'equipmentPsuFsm', 'equipmentPsuFsmTask', 'equipmentPsuInputStats', 'equipmentPsuOutputStats', 'equipmentPsuStats', 'equipmentRackUnitPsuStats', 'eventInst', 'faultInst', 'firmwareBootDefinition', 'firmwareRunning', 'firmwareStatus', 'firmwareUpdatable'), ('Get',)),
+    'EquipmentPsuCapProvider': ('equipmentPsuCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPsuDef', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentPsuDef': ('equipmentPsuDef', '[psu_type]', 'Version201m', 'InputOutput', 1, (), ('',), ('equipmentPsuCapProvider',), (), ('Get',)),
+    'EquipmentPsuFsm': ('equipmentPsuFsm', 'fsm', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentPsu',), ('equipmentPsuFsmStage',), (None,)),
+    'EquipmentPsuFsmStage': ('equipmentPsuFsmStage', 'stage-[name]', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentPsuFsm',), (), (None,)),
+    'EquipmentPsuFsmTask': ('equipmentPsuFsmTask', 'task-[item]', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentPsu',), (), (None,)),
+    'EquipmentPsuInputStats': ('equipmentPsuInputStats', 'input-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentPsu',), ('equipmentPsuInputStatsHist',), ('Get',)),
+    'EquipmentPsuInputStatsHist': ('equipmentPsuInputStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('equipmentPsuInputStats',), (), ('Get',)),
+    'EquipmentPsuOutputStats': ('equipmentPsuOutputStats', 'output-stats', 'Version201m', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentPsu',), ('equipmentPsuOutputStatsHist',), ('Get',)),
+    'EquipmentPsuOutputStatsHist': ('equipmentPsuOutputStatsHist', '[id]', 'Version201m', 'OutputOnly', 1, (), ('read-only',), ('equipmentPsuOutputStats',), (), ('Get',)),
+    'EquipmentPsuStats': ('equipmentPsuStats', 'stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentPsu',), ('equipmentPsuStatsHist',), ('Get',)),
+    'EquipmentPsuStatsHist': ('equipmentPsuStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('equipmentPsuStats',), (), ('Get',)),
+    'EquipmentQual': ('equipmentQual', 'chassis-qualifier-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('equipmentChassisQual', 'equipmentPhysicalQual'), (None,)),
+    'EquipmentRackFanModuleDef': ('equipmentRackFanModuleDef', 'rack-fan-module', 'Version212a', 'InputOutput', 1, (), ('',), ('equipmentRackUnitCapProvider',), (), (None,)),
+    'EquipmentRackUnitCapProvider': ('equipmentRackUnitCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version141i', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('adaptorFruCapRef', 'computeConstraintDef', 'computeMemoryUnitConstraintDef', 'computePciCap', 'computeServerTypeCap', 'equipmentAdvancedBootOrder', 'equipmentBiosDef', 'equipmentBladeAGLibrary', 'equipmentBoardControllerDef', 'equipmentBootDeviceConstraints', 'equipmentCimcVmedia', 'equipmentCiscoOsOpenGate', 'equipmentDimmMapping', 'equipmentDiscoveryCap', 'equipmentFruVariant', 'equipmentGraphicsCardCapRef', 'equipmentHwRevisionModifier', 'equipmentInbandMgmtCap', 'equipmentKvmMgmtCap', 'equipmentLocalDiskControllerCapRef', 'equipmentManufacturingDef', 'equipmentPciSlotIdMapping', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPowerCapDef', 'equipmentRackFanModuleDef', 'equipmentSecureBoot', 'equipmentServerCorrectUuidBehavior', 'equipmentServerFeatureCap', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'equipmentStorageControllerSlotDef', 'equipmentStorageSasExpanderCapRef', 'equipmentUuidFeatureCap', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint', 'storageEnclosureCap'), ('Get',)),
+    'EquipmentRackUnitFanStats': ('equipmentRackUnitFanStats', 'stats', 'Version141i', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentFan',), ('equipmentRackUnitFanStatsHist',), ('Get',)),
+    'EquipmentRackUnitFanStatsHist': ('equipmentRackUnitFanStatsHist', '[id]', 'Version141i', 'OutputOnly', 1, (), ('read-only',), ('equipmentRackUnitFanStats',), (), ('Get',)),
+    'EquipmentRackUnitPsuStats': ('equipmentRackUnitPsuStats', 'rackunit-power-stats', 'Version141i', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentPsu',), ('equipmentRackUnitPsuStatsHist',), ('Get',)),
+    'EquipmentRackUnitPsuStatsHist': ('equipmentRackUnitPsuStatsHist', '[id]', 'Version141i', 'OutputOnly', 1, (), ('read-only',), ('equipmentRackUnitPsuStats',), (), ('Get',)),
+    'EquipmentRaidDef': ('equipmentRaidDef', '[level]', 'Version141i', 'InputOutput', 1, (), ('',), ('equipmentLocalDiskControllerCapProvider',), (), ('Get',)),
+    'EquipmentRequirement': ('equipmentRequirement', 'chassis-req', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy', 'read-only'), ('equipmentChassisProfile',), ('faultInst',), (None,)),
+    'EquipmentSecureBoot': ('equipmentSecureBoot', 'secBoot', 'Version221b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentSecurityUnitCapProvider': ('equipmentSecurityUnitCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version227b', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), (None,)),
+    'EquipmentServerCorrectUuidBehavior': ('equipmentServerCorrectUuidBehavior', 'server-correct-uuid', 'Version227b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), (None,)),
+    'EquipmentServerFeatureCap': ('equipmentServerFeatureCap', 'server-feature-cap', 'Version202m', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider'), (), ('Get',)),
+    'EquipmentServerPortCapProvider': ('equipmentServerPortCapProvider', 'server-port-cap', 'Version311e', 'InputOutput', 1, (), ('',), ('equipmentGemCapProvider', 'equipmentSwitchIOCardCapProvider'), (), (None,)),
+    'EquipmentServerUnitCapProvider': ('equipmentServerUnitCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version251a', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('computePciCap', 'equipmentBiosDef', 'equipmentBladeAGLibrary', 'equipmentBladeConnDef', 'equipmentBoardControllerDef', 'equipmentDimmMapping', 'equipmentFruVariant', 'equipmentHDDFaultMonDef', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServerFeatureCap', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentServiceDef': ('equipmentServiceDef', 'service', 'Version101e', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), (), ('Get',)),
+    'EquipmentSharedIOModule': ('equipmentSharedIOModule', 'shared-io-module', 'Version251a', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassis', 'equipmentSystemIOController'), ('faultInst', 'mgmtController', 'portGroup'), ('Get', 'Set')),
+    'EquipmentSiocTempStats': ('equipmentSiocTempStats', 'temp-stats', 'Version312b', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('equipmentSystemIOController',), ('equipmentSiocTempStatsHist',), ('Get',)),
+    'EquipmentSiocTempStatsHist': ('equipmentSiocTempStatsHist', '[id]', 'Version312b', 'OutputOnly', 1, (), ('read-only',), ('equipmentSiocTempStats',), (), ('Get',)),
+    'EquipmentSlotArray': ('equipmentSlotArray', '[selector]', 'Version101e', 'InputOutput', 1, (), ('',), ('diagSrvCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentSwitchCapProvider'), (), ('Get',)),
+    'EquipmentSlotArrayRef': ('equipmentSlotArrayRef', 'ref-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), (), ('Get',)),
+    'EquipmentStorageControllerConfig': ('equipmentStorageControllerConfig', 'ven-[vendor]-dev-[device]-subven-[subvendor]-subdev-[subdevice]', 'Version225a', 'InputOutput', 1, (), ('',), ('diagSrvCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentSwitchCapProvider'), ('equipmentPciSlotSubOEMIdEntry',), ('Get',)),
+    'EquipmentStorageControllerSlotDef': ('equipmentStorageControllerSlotDef', 'controller-slot-def-[slot_num]', 'Version224b', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), (None,)),
+    'EquipmentStorageEncCapProvider': ('equipmentStorageEncCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version312b', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentStorageLimitCap': ('equipmentStorageLimitCap', 'storage-limit', 'Version251a', 'InputOutput', 1, (), ('read-only',), ('equipmentLocalDiskControllerCapProvider',), (), ('Get',)),
+    'EquipmentStorageSasExpanderCapProvider': ('equipmentStorageSasExpanderCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version226c', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentOnboardDeviceDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'equipmentStorageSasExpanderDef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentStorageSasExpanderCapRef': ('equipmentStorageSasExpanderCapRef', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version226c', 'InputOutput', 1, (), ('',), ('equipmentRackUnitCapProvider',), (), ('Get',)),
+    'EquipmentStorageSasExpanderDef': ('equipmentStorageSasExpanderDef', 'sas-expander-def', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentStorageSasExpanderCapProvider',), (), ('Get',)),
+    'EquipmentSwitchCap': ('equipmentSwitchCap', 'switch-cap', 'Version111j', 'InputOutput', 1, (), ('',), ('equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider'), ('equipmentPortCap',), ('Get',)),
+    'EquipmentSwitchCapProvider': ('equipmentSwitchCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentBeaconCapProvider', 'equipmentBreakoutCap', 'equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentNonCopperPassiveCap', 'equipmentPfcMmuCap', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPortGroupAggregationDef', 'equipmentPortGroupSwComplexDef', 'equipmentServiceDef', 'equipmentSlotArray', 'equipmentSlotArrayRef', 'equipmentStorageControllerConfig', 'equipmentSwitchCap', 'equipmentUnifiedPortCapProvider', 'firmwareConstraints', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentSwitchCard': ('equipmentSwitchCard', 'slot-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('equipmentBeaconLed', 'faultInst', 'portGroup'), ('Get',)),
+    'EquipmentSwitchIOCard': ('equipmentSwitchIOCard', 'sw-slot-[id]', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassis',), ('equipmentIOCardBaseFsm', 'equipmentIOCardBaseFsmTask', 'equipmentIOCardStats', 'equipmentSwitchIOCardFsm', 'equipmentSwitchIOCardFsmTask', 'eventInst', 'faultInst', 'mgmtController', 'portGroup'), (None,)),
+    'EquipmentSwitchIOCardCapProvider': ('equipmentSwitchIOCardCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version302c', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentBeaconCapProvider', 'equipmentFruVariant', 'equipmentIOCardTypeDef', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentPortCap', 'equipmentPortGroupAggregationDef', 'equipmentPortGroupDef', 'equipmentServerPortCapProvider', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'equipmentSwitchCap', 'equipmentUnifiedPortCapProvider', 'firmwareType', 'firmwareUpgradeConstraint'), (None,)),
+    'EquipmentSwitchIOCardFsm': ('equipmentSwitchIOCardFsm', 'fsm', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentSwitchIOCard',), ('equipmentSwitchIOCardFsmStage',), (None,)),
+    'EquipmentSwitchIOCardFsmStage': ('equipmentSwitchIOCardFsmStage', 'stage-[name]', 'Version302c', 'OutputOnly', 1, (), ('',), ('equipmentSwitchIOCardFsm',), (), (None,)),
+    'EquipmentSwitchIOCardFsmTask': ('equipmentSwitchIOCardFsmTask', 'task-[item]', 'Version311e', 'OutputOnly', 1, (), ('',), ('equipmentSwitchIOCard',), (), (None,)),
+    'EquipmentSwitchTypeDef': ('equipmentSwitchTypeDef', 'type', 'Version302c', 'InputOutput', 1, (), ('',), (), (), (None,)),
+    'EquipmentSystemIOController': ('equipmentSystemIOController', 'slot-[id]', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassis',), ('computeBoardController', 'equipmentSharedIOModule', 'equipmentSiocTempStats', 'equipmentSystemIOControllerFsm', 'equipmentSystemIOControllerFsmTask', 'eventInst', 'faultInst', 'mgmtController'), ('Get', 'Set')),
+    'EquipmentSystemIOControllerFsm': ('equipmentSystemIOControllerFsm', 'fsm', 'Version312b', 'OutputOnly', 1, (), ('',), ('equipmentSystemIOController',), ('equipmentSystemIOControllerFsmStage',), (None,)),
+    'EquipmentSystemIOControllerFsmStage': ('equipmentSystemIOControllerFsmStage', 'stage-[name]', 'Version312b', 'OutputOnly', 1, (), ('',), ('equipmentSystemIOControllerFsm',), (), (None,)),
+    'EquipmentSystemIOControllerFsmTask': ('equipmentSystemIOControllerFsmTask', 'task-[item]', 'Version312b', 'OutputOnly', 1, (), ('',), ('equipmentSystemIOController',), (), (None,)),
+    'EquipmentTier': ('equipmentTier', 'cp-tier-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy'), ('orgOrg',), ('equipmentChassisProfile',), (None,)),
+    'EquipmentTpm': ('equipmentTpm', 'Tpm-[id]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('computeBoard',), ('faultInst',), ('Get',)),
+    'EquipmentTpmCapProvider': ('equipmentTpmCapProvider', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version221b', 'InputOutput', 1, (), ('',), ('capabilityCatalogue', 'equipmentHwCapDerivativeProvider'), ('equipmentFruVariant', 'equipmentManufacturingDef', 'equipmentPhysicalDef', 'equipmentPicture', 'equipmentServiceDef', 'equipmentSlotArrayRef', 'firmwareType', 'firmwareUpgradeConstraint'), ('Get',)),
+    'EquipmentUnifiedPortCapProvider': ('equipmentUnifiedPortCapProvider', 'unified-port-cap', 'Version201m', 'InputOutput', 1, (), ('',), ('equipmentGemCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider'), (), ('Get',)),
+    'EquipmentUuidFeatureCap': ('equipmentUuidFeatureCap', 'uuid-feature-cap', 'Version223a', 'InputOutput', 1, (), ('read-only',), ('equipmentBladeCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'EquipmentVersionConstraint': ('equipmentVersionConstraint', 'ver-constr', 'Version212a', 'InputOutput', 1, (), ('',), ('equipmentBoardControllerDef',), (), ('Get',)),
+    'EquipmentXcvr': ('equipmentXcvr', 'transceiver', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('etherPIo', 'etherServerIntFIo', 'etherSwitchIntFIo', 'fcPIo'), (), ('Get',)),
+    'EtherErrStats': ('etherErrStats', 'err-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('etherPIo', 'etherServerIntFIo', 'fabricEthEstcPc', 'fabricEthLanPc'), ('etherErrStatsHist',), ('Get',)),
+    'EtherErrStatsHist': ('etherErrStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('etherErrStats',), (), ('Get',)),
+    'EtherFcoeInterfaceStats': ('etherFcoeInterfaceStats', 'fcoe-interface-stats', 'Version211a', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('fabricFcoeEstcEp', 'fabricFcoeSanEp', 'fabricFcoeSanPc'), ('etherFcoeInterfaceStatsHist',), ('Get',)),
+    'EtherFcoeInterfaceStatsHist': ('etherFcoeInterfaceStatsHist', '[id]', 'Version211a', 'OutputOnly', 1, (), ('read-only',), ('etherFcoeInterfaceStats',), (), ('Get',)),
+    'EtherLossStats': ('etherLossStats', 'loss-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('etherPIo', 'etherServerIntFIo', 'fabricEthEstcPc', 'fabricEthLanPc'), ('etherLossStatsHist',), ('Get',)),
+    'EtherLossStatsHist': ('etherLossStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('etherLossStats',), (), ('Get',)),
+    'EtherNiErrStats': ('etherNiErrStats', 'ni-err-stats', 'Version223a', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('etherPIo', 'etherSwitchIntFIo', 'etherSwitchIntFIoPc'), ('etherNiErrStatsHist',), ('Get',)),
+    'EtherNiErrStatsHist': ('etherNiErrStatsHist', '[id]', 'Version223a', 'OutputOnly', 1, (), ('read-only',), ('etherNiErrStats',), (), ('Get',)),
+    'EtherNicIfConfig': ('etherNicIfConfig', 'if-config', 'Version101e', 'InputOutput', 1, (), ('read-only',), (), (), ('Get',)),
+    'EtherPIo': ('etherPIo', 'port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('portGroup', 'portSubGroup'), ('equipmentXcvr', 'etherErrStats', 'etherLossStats', 'etherNiErrStats', 'etherPIoEndPoint', 'etherPIoFsm', 'etherPauseStats', 'etherRxStats', 'etherTxStats', 'eventInst', 'faultInst', 'lldpAcquired', 'networkIfStats', 'portDomainEp', 'portPIoFsm', 'portPIoFsmTask'), ('Get',)),
+    'EtherPIoEndPoint': ('etherPIoEndPoint', 'EndPointDn-cloud-[ep_cloud_type]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('etherPIo',), (), (None,)),
+    'EtherPIoFsm': ('etherPIoFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('etherPIo',), ('etherPIoFsmStage',), (None,)),
+    'EtherPIoFsmStage': ('etherPIoFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('etherPIoFsm',), (), (None,)),
+    'EtherPauseStats': ('etherPauseStats', 'pause-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('etherPIo', 'etherServerIntFIo', 'fabricEthEstcPc', 'fabricEthLanPc'), ('etherPauseStatsHist',), ('Get',)),
+    'EtherPauseStatsHist': ('etherPauseStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('etherPauseStats',), (), ('Get',)),
+    'EtherPortChanIdElem': ('etherPortChanIdElem', 'pchanid-[id]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('etherPortChanIdUniverse',), (), ('Get',)),
+    'EtherPortChanIdUniverse': ('etherPortChanIdUniverse', 'pchanid-universe', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('fabricEp',), ('etherPortChanIdElem',), ('Get',)),
+    'EtherRxStats': ('etherRxStats', 'rx-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('etherPIo', 'etherServerIntFIo', 'fabricEthEstcPc', 'fabricEthLanPc'), ('etherRxStatsHist',), ('Get',)),
+    'EtherRxStatsHist': ('etherRxStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('etherRxStats',), (), ('Get',)),
+    'EtherServerIntFIo': ('etherServerIntFIo', 'port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('diagSrvCtrl', 'portGroup'), ('equipmentXcvr', 'etherErrStats', 'etherLossStats', 'etherPauseStats', 'etherRxStats', 'etherServerIntFIoFsm', 'etherServerIntFIoFsmTask', 'etherTxStats', 'eventInst', 'faultInst', 'lldpAcquired', 'portDomainEp', 'portTrustMode', 'swUlan'), ('Get',)),
+    'EtherServerIntFIoFsm': ('etherServerIntFIoFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('etherServerIntFIo',), ('etherServerIntFIoFsmStage',), (None,)),
+    'EtherServerIntFIoFsmStage': ('etherServerIntFIoFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('etherServerIntFIoFsm',), (), (None,)),
+    'EtherServerIntFIoFsmTask': ('etherServerIntFIoFsmTask', 'task-[item]', 'Version202m', 'OutputOnly', 1, (), ('',), ('etherServerIntFIo',), (), (None,)),
+    'EtherServerIntFIoPc': ('etherServerIntFIoPc', 'pc-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance'), ('portGroup',), ('etherServerIntFIoPcEp',), ('Get',)),
+    'EtherServerIntFIoPcEp': ('etherServerIntFIoPcEp', 'ep-slot-[slot_id]-port-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance'), ('etherServerIntFIoPc',), (), ('Get',)),
+    'EtherSwIfConfig': ('etherSwIfConfig', 'if-config', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricDceSrv', 'fabricEthLan'), (), ('Get',)),
+    'EtherSwitchIntFIo': ('etherSwitchIntFIo', 'port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('portGroup',), ('equipmentXcvr', 'etherNiErrStats', 'faultInst', 'portDomainEp'), ('Get',)),
+    'EtherSwitchIntFIoPc': ('etherSwitchIntFIoPc', 'pc-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance'), ('portGroup',), ('etherNiErrStats', 'etherSwitchIntFIoPcEp', 'faultInst'), ('Get',)),
+    'EtherSwitchIntFIoPcEp': ('etherSwitchIntFIoPcEp', 'ep-slot-[slot_id]-port-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'pn-equipment', 'pn-maintenance'), ('etherSwitchIntFIoPc',), (), ('Get',)),
+    'EtherTxStats': ('etherTxStats', 'tx-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('etherPIo', 'etherServerIntFIo', 'fabricEthEstcPc', 'fabricEthLanPc'), ('etherTxStatsHist',), ('Get',)),
+    'EtherTxStatsHist': ('etherTxStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('etherTxStats',), (), ('Get',)),
+    'EventEpCtrl': ('eventEpCtrl', 'evctrl', 'Version101e', 'InputOutput', 1, (), ('admin', 'fault', 'operations'), (), (), ('Get',)),
+    'EventHolder': ('eventHolder', 'event', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('eventPolicy',), ('Get',)),
+    'EventInst': ('eventInst', 'event-[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('aaaAuthRealm', 'aaaLdapEp', 'aaaRadiusEp', 'aaaTacacsPlusEp', 'aaaUserEp', 'adaptorExtEthIf', 'adaptorHostEthIf', 'adaptorHostFcIf', 'callhomeEp', 'capabilityCatalogue', 'capabilityMgmtExtension', 'capabilityUpdater', 'commSvcEp', 'computeBlade', 'computeRackUnit', 'computeServerDiscPolicy', 'computeServerUnit', 'epqosDefinition', 'epqosDefinitionDelTask', 'equipmentBeaconLed', 'equipmentChassis', 'equipmentChassisProfile', 'equipmentFex', 'equipmentIOCard', 'equipmentLocatorLed', 'equipmentPsu', 'equipmentSwitchIOCard', 'equipmentSystemIOController', 'etherPIo', 'etherServerIntFIo', 'extpolEp', 'extpolProvider', 'extpolRegistry', 'extvmmEp', 'extvmmKeyStore', 'extvmmMasterExtKey', 'extvmmNetworkSets', 'extvmmProvider', 'extvmmSwitchDelTask', 'fabricCartridgeSlotEp', 'fabricComputeMSlotEp', 'fabricComputeSlotEp', 'fabricEpMgr', 'fabricLanCloud', 'fabricSanCloud', 'fabricVnetEpSyncEp', 'fcPIo', 'firmwareDistributable', 'firmwareDownloader', 'firmwareImage', 'firmwareSystem', 'gmetaHolder', 'identIdentRequest', 'identMetaSystem', 'licenseDownloader', 'licenseFile', 'licenseInstance', 'lsServer', 'mgmtBackup', 'mgmtBackupPolicy', 'mgmtCfgExportPolicy', 'mgmtController', 'mgmtIPv6IfAddr', 'mgmtIf', 'mgmtImporter', 'morefImportRoot', 'nfsMountDef', 'nfsMountInst', 'observeObserved', 'pkiEp', 'policyControlEp', 'policyControlledType', 'policyPolicyScope', 'qosclassDefinition', 'statsCollectionPolicy', 'storageEnclosure', 'storageFlexFlashController', 'storageLocalDisk', 'storageSystem', 'swAccessDomain', 'swEthLanBorder', 'swEthLanFlowMon', 'swEthMon', 'swExtUtility', 'swFcMon', 'swFcSanBorder', 'swPhys', 'swUtilityDomain', 'syntheticFsObj', 'sysdebugAutoCoreFileExportTarget', 'sysdebugCore', 'sysdebugLogControlEp', 'sysdebugLogExportPolicy', 'sysdebugManualCoreFileExportTarget', 'sysdebugTechSupport', 'sysfileMutation', 'vmLifeCyclePolicy', 'vnicProfileSet'), (), ('Get',)),
+    'EventLog': ('eventLog', 'event-log', 'Version101e', 'InputOutput', 1, (), ('admin', 'fault', 'operations'), ('topRoot',), ('eventRecord',), ('Get',)),
+    'EventPolicy': ('eventPolicy', 'event-policy', 'Version101e', 'InputOutput', 1, (), ('admin', 'read-only'), ('eventHolder',), (), ('Get',)),
+    'EventRecord': ('eventRecord', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('eventLog',), (), ('Get',)),
+    'ExtmgmtArpTargets': ('extmgmtArpTargets', 'arp-target-policy', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('extmgmtIfMonPolicy',), ('faultInst',), ('Get', 'Set')),
+    'ExtmgmtGatewayPing': ('extmgmtGatewayPing', 'gw-ping-policy', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('extmgmtIfMonPolicy',), (), ('Get',)),
+    'ExtmgmtIf': ('extmgmtIf', 'extmgmt-intf', 'Version141i', 'InputOutput', 1, (), ('admin',), ('networkElement',), ('faultInst',), ('Get',)),
+    'ExtmgmtIfMonPolicy': ('extmgmtIfMonPolicy', 'extmgmt-intf-monitor-policy', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('topSystem',), ('extmgmtArpTargets', 'extmgmtGatewayPing', 'extmgmtMiiStatus', 'extmgmtNdiscTargets'), ('Get', 'Set')),
+    'ExtmgmtMiiStatus': ('extmgmtMiiStatus', 'mii-status-policy', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('extmgmtIfMonPolicy',), (), ('Get', 'Set')),
+    'ExtmgmtNdiscTargets': ('extmgmtNdiscTargets', 'ndisc-target-policy', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('extmgmtIfMonPolicy',), ('faultInst',), ('Get', 'Set')),
+    'ExtpolClient': ('extpolClient', 'client-[id]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolClientCont',), ('faultInst', 'observeObserved', 'policyPolicyScopeCont'), ('Get',)),
+    'ExtpolClientCont': ('extpolClientCont', 'clients', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolRegistry',), ('extpolClient',), ('Get',)),
+    'ExtpolController': ('extpolController', 'contro-[id]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolControllerCont',), ('observeObserved', 'policyPolicyScopeCont'), ('Get',)),
+    'ExtpolControllerCont': ('extpolControllerCont', 'controllers', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolRegistry',), ('extpolController',), ('Get',)),
+    'ExtpolEp': ('extpolEp', 'extpol', 'Version211a', 'InputOutput', 1, (), ('admin',), ('topRoot',), ('eventInst', 'extpolEpFsm', 'extpolEpFsmTask', 'extpolRegistry', 'faultInst'), ('Get',)),
+    'ExtpolEpFsm': ('extpolEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolEp',), ('extpolEpFsmStage',), (None,)),
+    'ExtpolEpFsmStage': ('extpolEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolEpFsm',), (), (None,)),
+    'ExtpolEpFsmTask': ('extpolEpFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolEp',), (), (None,)),
+    'ExtpolProvider': ('extpolProvider', 'prov-[type]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolProviderCont',), ('eventInst', 'extpolProviderFsm', 'extpolProviderFsmTask', 'fabricVnetEpSyncEp', 'faultInst', 'observeObserved', 'policyPolicyScopeCont'), ('Get',)),
+    'ExtpolProviderCont': ('extpolProviderCont', 'providers', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolRegistry',), ('extpolProvider',), ('Get',)),
+    'ExtpolProviderFsm': ('extpolProviderFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolProvider',), ('extpolProviderFsmStage',), (None,)),
+    'ExtpolProviderFsmStage': ('extpolProviderFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolProviderFsm',), (), (None,)),
+    'ExtpolProviderFsmTask': ('extpolProviderFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolProvider',), (), (None,)),
+    'ExtpolRegistry': ('extpolRegistry', 'reg', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolEp',), ('eventInst', 'extpolClientCont', 'extpolControllerCont', 'extpolProviderCont', 'extpolRegistryFsm', 'extpolRegistryFsmTask', 'faultInst', 'observeObserved', 'policyPolicyScopeCont'), ('Get',)),
+    'ExtpolRegistryFsm': ('extpolRegistryFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolRegistry',), ('extpolRegistryFsmStage',), (None,)),
+    'ExtpolRegistryFsmStage': ('extpolRegistryFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolRegistryFsm',), (), (None,)),
+    'ExtpolRegistryFsmTask': ('extpolRegistryFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extpolRegistry',), (), (None,)),
+    'ExtpolSystemContext': ('extpolSystemContext', 'sysctx', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'ExtvmmEp': ('extvmmEp', 'extvm-mgmt', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'pn-policy'), ('topSystem',), ('eventInst', 'extvmmEpFsm', 'extvmmEpFsmTask', 'extvmmKeyStore', 'extvmmMasterExtKey', 'extvmmProvider', 'extvmmSwitchDelTask', 'extvmmSwitchSet', 'faultInst'), ('Get',)),
+    'ExtvmmEpFsm': ('extvmmEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmEp',), ('extvmmEpFsmStage',), (None,)),
+    'ExtvmmEpFsmStage': ('extvmmEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmEpFsm',), (), (None,)),
+    'ExtvmmEpFsmTask': ('extvmmEpFsmTask', 'task-[item]', 'Version201m', 'OutputOnly', 1, (), ('',), ('extvmmEp',), (), (None,)),
+    'ExtvmmFNDReference': ('extvmmFNDReference', 'fnd-ref-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('extvmmUpLinkPP',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'ExtvmmFabricNetwork': ('extvmmFabricNetwork', 'fabric-network-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('extvmmNetworkSets',), ('extvmmFabricNetworkDefinition',), ('Add', 'Get', 'Remove', 'Set')),
+    'ExtvmmFabricNetworkDefinition': ('extvmmFabricNetworkDefinition', 'fabric-network-def-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('extvmmFabricNetwork',), ('extvmmVMNetworkDefinition',), ('Add', 'Get', 'Remove', 'Set')),
+    'ExtvmmKeyInst': ('extvmmKeyInst', 'key-[inst]', 'Version111j', 'InputOutput', 1, (), ('read-only',), ('extvmmProvider',), (), ('Get',)),
+    'ExtvmmKeyRing': ('extvmmKeyRing', 'keyring-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'pn-policy'), ('extvmmKeyStore',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ExtvmmKeyStore': ('extvmmKeyStore', 'key-store', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'pn-policy'), ('extvmmEp',), ('eventInst', 'extvmmKeyRing', 'extvmmKeyStoreFsm', 'extvmmKeyStoreFsmTask', 'faultInst'), ('Get',)),
+    'ExtvmmKeyStoreFsm': ('extvmmKeyStoreFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmKeyStore',), ('extvmmKeyStoreFsmStage',), (None,)),
+    'ExtvmmKeyStoreFsmStage': ('extvmmKeyStoreFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmKeyStoreFsm',), (), (None,)),
+    'ExtvmmKeyStoreFsmTask': ('extvmmKeyStoreFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('extvmmKeyStore',), (), (None,)),
+    'ExtvmmMasterExtKey': ('extvmmMasterExtKey', 'ext-key', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'pn-policy'), ('extvmmEp',), ('eventInst', 'extvmmMasterExtKeyFsm', 'extvmmMasterExtKeyFsmTask', 'faultInst'), ('Get', 'Set')),
+    'ExtvmmMasterExtKeyFsm': ('extvmmMasterExtKeyFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmMasterExtKey',), ('extvmmMasterExtKeyFsmStage',), (None,)),
+    'ExtvmmMasterExtKeyFsmStage': ('extvmmMasterExtKeyFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmMasterExtKeyFsm',), (), (None,)),
+    'ExtvmmMasterExtKeyFsmTask': ('extvmmMasterExtKeyFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('extvmmMasterExtKey',), (), (None,)),
+    'ExtvmmNetworkSets': ('extvmmNetworkSets', 'network-sets', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricLanCloud',), ('eventInst', 'extvmmFabricNetwork', 'extvmmNetworkSetsFsm', 'extvmmNetworkSetsFsmTask', 'faultInst', 'ippoolPool'), ('Get',)),
+    'ExtvmmNetworkSetsFsm': ('extvmmNetworkSetsFsm', 'fsm', 'Version221b', 'OutputOnly', 1, (), ('',), ('extvmmNetworkSets',), ('extvmmNetworkSetsFsmStage',), (None,)),
+    'ExtvmmNetworkSetsFsmStage': ('extvmmNetworkSetsFsmStage', 'stage-[name]', 'Version221b', 'OutputOnly', 1, (), ('',), ('extvmmNetworkSetsFsm',), (), (None,)),
+    'ExtvmmNetworkSetsFsmTask': ('extvmmNetworkSetsFsmTask', 'task-[item]', 'Version221b', 'OutputOnly', 1, (), ('',), ('extvmmNetworkSets',), (), (None,)),
+    'ExtvmmProvider': ('extvmmProvider', 'vm-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('extvmmEp',), ('eventInst', 'extvmmKeyInst', 'extvmmProviderFsm', 'extvmmProviderFsmTask', 'faultInst', 'vmDC', 'vmDCOrg', 'vmSwitch'), ('Add', 'Get', 'Remove', 'Set')),
+    'ExtvmmProviderFsm': ('extvmmProviderFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmProvider',), ('extvmmProviderFsmStage',), (None,)),
+    'ExtvmmProviderFsmStage': ('extvmmProviderFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmProviderFsm',), (), (None,)),
+    'ExtvmmProviderFsmTask': ('extvmmProviderFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('extvmmProvider',), (), (None,)),
+    'ExtvmmSwitchDelTask': ('extvmmSwitchDelTask', 'vsw-deltask-[sw_int_id]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('extvmmEp',), ('eventInst', 'extvmmSwitchDelTaskFsm', 'extvmmSwitchDelTaskFsmTask', 'faultInst'), ('Get', 'Remove')),
+    'ExtvmmSwitchDelTaskFsm': ('extvmmSwitchDelTaskFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmSwitchDelTask',), ('extvmmSwitchDelTaskFsmStage',), (None,)),
+    'ExtvmmSwitchDelTaskFsmStage': ('extvmmSwitchDelTaskFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('extvmmSwitchDelTaskFsm',), (), (None,)),
+    'ExtvmmSwitchDelTaskFsmTask': ('extvmmSwitchDelTaskFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('extvmmSwitchDelTask',), (), ('Get',)),
+    'ExtvmmSwitchSet': ('extvmmSwitchSet', 'virtual-switches', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('extvmmEp',), ('vmSwitch',), ('Get',)),
+    'ExtvmmUpLinkPP': ('extvmmUpLinkPP', 'uplinkpp-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('vmSwitch',), ('extvmmFNDReference',), ('Add', 'Get', 'Remove', 'Set')),
+    'ExtvmmVMNDRef': ('extvmmVMNDRef', 'vm-network-def-ref[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('extvmmVMNetwork',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'ExtvmmVMNetwork': ('extvmmVMNetwork', 'vm-network-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('extvmmVMNetworkSets',), ('extvmmVMNDRef', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'ExtvmmVMNetworkDefinition': ('extvmmVMNetworkDefinition', 'vm-network-def-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('extvmmFabricNetworkDefinition',), ('faultInst', 'vnicEtherIf'), ('Add', 'Get', 'Remove', 'Set')),
+    'ExtvmmVMNetworkSets': ('extvmmVMNetworkSets', 'vm-network-sets', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricLanCloud',), ('extvmmVMNetwork',), ('Get',)),
+    'FabricBHVlan': ('fabricBHVlan', 'bhnet', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcEstcCloud',), (), ('Get',)),
+    'FabricBreakout': ('fabricBreakout', 'breakout-slot-[slot_id]-port-[port_id]', 'Version311e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'ext-san-config', 'ext-san-policy'), ('fabricCablingSw',), (), ('Add', 'Get', 'Remove')),
+    'FabricCabling': ('fabricCabling', 'Cabling', 'Version311e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'ext-san-config', 'ext-san-policy'), ('fabricEp',), ('fabricCablingSw', 'statsThresholdPolicy'), (None,)),
+    'FabricCablingSw': ('fabricCablingSw', '[id]', 'Version311e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'ext-san-config', 'ext-san-policy'), ('fabricCabling',), ('fabricBreakout',), ('Get',)),
+    'FabricCartridgePhEp': ('fabricCartridgePhEp', 'cart-ep-ven-[vendor]-mod-[model]-ser-[serial]', 'Version251a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('fabricDceSrv',), ('fabricLastAckedSlot', 'faultInst'), ('Get', 'Set')),
+    'FabricCartridgeSlotEp': ('fabricCartridgeSlotEp', 'cart-slot-[slot_id]', 'Version251a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('fabricChassisEp',), ('eventInst', 'fabricCartridgeSlotEpFsm', 'fabricCartridgeSlotEpFsmTask', 'fabricComputeMSlotEp', 'fabricIf', 'faultInst'), ('Get', 'Set')),
+    'FabricCartridgeSlotEpFsm': ('fabricCartridgeSlotEpFsm', 'fsm', 'Version251a', 'OutputOnly', 1, (), ('',), ('fabricCartridgeSlotEp',), ('fabricCartridgeSlotEpFsmStage',), (None,)),
+    'FabricCartridgeSlotEpFsmStage': ('fabricCartridgeSlotEpFsmStage', 'stage-[name]', 'Version251a', 'OutputOnly', 1, (), ('',), ('fabricCartridgeSlotEpFsm',), (), (None,)),
+    'FabricCartridgeSlotEpFsmTask': ('fabricCartridgeSlotEpFsmTask', 'task-[item]', 'Version251a', 'OutputOnly', 1, (), ('',), ('fabricCartridgeSlotEp',), (), (None,)),
+    'FabricCdpLinkPolicy': ('fabricCdpLinkPolicy', '', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'read-only'), (), (), (None,)),
+    'FabricChangedObjectRef': ('fabricChangedObjectRef', 'ChangedObjectRef[id]', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('fabricVnetEpSyncEp',), (), (None,)),
+    'FabricChassisEp': ('fabricChassisEp', 'chassis-[chassis_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricDceSrv',), ('fabricCartridgeSlotEp', 'fabricComputeSlotEp', 'faultInst'), ('Get',)),
+    'FabricComputeMSlotEp': ('fabricComputeMSlotEp', 'ins-[server_instance_id]', 'Version251a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('fabricCartridgeSlotEp',), ('eventInst', 'fabricComputeMSlotEpFsm', 'fabricComputeMSlotEpFsmTask', 'fabricIf', 'faultInst'), ('Get', 'Set')),
+    'FabricComputeMSlotEpFsm': ('fabricComputeMSlotEpFsm', 'fsm', 'Version251a', 'OutputOnly', 1, (), ('',), ('fabricComputeMSlotEp',), ('fabricComputeMSlotEpFsmStage',), (None,)),
+    'FabricComputeMSlotEpFsmStage': ('fabricComputeMSlotEpFsmStage', 'stage-[name]', 'Version251a', 'OutputOnly', 1, (), ('',), ('fabricComputeMSlotEpFsm',), (), (None,)),
+    'FabricComputeMSlotEpFsmTask': ('fabricComputeMSlotEpFsmTask', 'task-[item]', 'Version251a', 'OutputOnly', 1, (), ('',), ('fabricComputeMSlotEp',), (), (None,)),
+    'FabricComputePhEp': ('fabricComputePhEp', 'compute-ep-ven-[vendor]-mod-[model]-ser-[serial]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('fabricDceSrv',), ('fabricLastAckedSlot', 'faultInst'), ('Get', 'Set')),
+    'FabricComputeSlotEp': ('fabricComputeSlotEp', 'slot-[slot_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('fabricChassisEp',), ('eventInst', 'fabricComputeSlotEpFsm', 'fabricComputeSlotEpFsmTask', 'fabricIf', 'faultInst'), ('Get', 'Set')),
+    'FabricComputeSlotEpFsm': ('fabricComputeSlotEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricComputeSlotEp',), ('fabricComputeSlotEpFsmStage',), (None,)),
+    'FabricComputeSlotEpFsmStage': ('fabricComputeSlotEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricComputeSlotEpFsm',), (), (None,)),
+    'FabricComputeSlotEpFsmTask': ('fabricComputeSlotEpFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('fabricComputeSlotEp',), (), (None,)),
+    'FabricDceSrv': ('fabricDceSrv', 'server', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('fabricEp',), ('etherSwIfConfig', 'fabricCartridgePhEp', 'fabricChassisEp', 'fabricComputePhEp', 'fabricDceSwSrv', 'fabricSwChPhEp', 'statsThresholdPolicy'), ('Get',)),
+    'FabricDceSwSrv': ('fabricDceSwSrv', 'sw-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('fabricDceSrv',), ('fabricDceSwSrvEp', 'fabricDceSwSrvPc', 'fabricSubGroup'), ('Get',)),
+    'FabricDceSwSrvEp': ('fabricDceSwSrvEp', 'slot-[slot_id]-port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricDceSwSrv', 'fabricSubGroup'), ('fabricEthMonSrcEp', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricDceSwSrvPc': ('fabricDceSwSrvPc', 'pc-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricDceSwSrv',), ('fabricDceSwSrvPcEp', 'fabricSubGroup', 'faultInst'), ('Get',)),
+    'FabricDceSwSrvPcEp': ('fabricDceSwSrvPcEp', 'ep-slot-[slot_id]-port-[port_id]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricDceSwSrvPc', 'fabricSubGroup'), ('faultInst',), ('Get', 'Set')),
+    'FabricEp': ('fabricEp', 'fabric', 'Version101e', 'InputOutput', 1, (), ('admin',), ('topRoot',), ('dcxUniverse', 'etherPortChanIdUniverse', 'fabricCabling', 'fabricDceSrv', 'fabricEpMgr', 'fabricEthEstcCloud', 'fabricFcEstcCloud', 'fabricLanAccessMgr', 'fabricLanCloud', 'fabricLanMonCloud', 'fabricSanCloud', 'fabricSanMonCloud', 'fabricZoneIdUniverse'), ('Get',)),
+    'FabricEpMgr': ('fabricEpMgr', '[id]', 'Version201m', 'InputOutput', 1, (), ('admin',), ('fabricEp',), ('eventInst', 'fabricEpMgrFsm', 'fabricEpMgrFsmTask', 'faultInst'), ('Get',)),
+    'FabricEpMgrFsm': ('fabricEpMgrFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricEpMgr',), ('fabricEpMgrFsmStage',), (None,)),
+    'FabricEpMgrFsmStage': ('fabricEpMgrFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricEpMgrFsm',), (), (None,)),
+    'FabricEpMgrFsmTask': ('fabricEpMgrFsmTask', 'task-[item]', 'Version201m', 'OutputOnly', 1, (), ('',), ('fabricEpMgr',), (), (None,)),
+    'FabricEthEstc': ('fabricEthEstc', '[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricEthEstcCloud',), ('fabricEthEstcEp', 'fabricEthEstcPc', 'fabricSubGroup', 'fabricVlan'), ('Get',)),
+    'FabricEthEstcCloud': ('fabricEthEstcCloud', 'eth-estc', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEp',), ('fabricEthEstc', 'fabricVlan', 'nwctrlDefinition', 'statsThresholdPolicy'), ('Get',)),
+    'FabricEthEstcEp': ('fabricEthEstcEp', 'phys-eth-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthEstc', 'fabricSubGroup'), ('fabricEthMonSrcEp', 'fabricEthTargetEp', 'fabricVlanEp', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthEstcPc': ('fabricEthEstcPc', 'pc-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthEstc',), ('etherErrStats', 'etherLossStats', 'etherPauseStats', 'etherRxStats', 'etherTxStats', 'fabricEthEstcPcEp', 'fabricEthMonSrcEp', 'fabricEthTargetEp', 'fabricSubGroup', 'fabricVlanEp', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthEstcPcEp': ('fabricEthEstcPcEp', 'ep-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthEstcPc', 'fabricSubGroup'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthFlowMonLan': ('fabricEthFlowMonLan', '[id]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), (), (None,)),
+    'FabricEthLan': ('fabricEthLan', '[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricLanCloud',), ('etherSwIfConfig', 'fabricEthLanEp', 'fabricEthLanPc', 'fabricNetGroup', 'fabricSubGroup', 'fabricVlan', 'faultInst'), ('Get',)),
+    'FabricEthLanEp': ('fabricEthLanEp', 'phys-slot-[slot_id]-port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLan', 'fabricSubGroup'), ('fabricEthMonSrcEp', 'fabricVlanEp', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthLanFlowMonitoring': ('fabricEthLanFlowMonitoring', 'eth-flow-monitoring', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricLanMonCloud',), ('fabricEthFlowMonLan', 'fabricFlowMonDefinition', 'fabricFlowMonExporterProfile', 'fabricNetflowCollector', 'fabricNetflowMonExporter', 'fabricNetflowMonSession', 'fabricNetflowMonitor', 'fabricNetflowTimeoutPolicy'), (None,)),
+    'FabricEthLanPc': ('fabricEthLanPc', 'pc-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLan',), ('etherErrStats', 'etherLossStats', 'etherPauseStats', 'etherRxStats', 'etherTxStats', 'fabricEthLanPcEp', 'fabricEthMonSrcEp', 'fabricSubGroup', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthLanPcEp': ('fabricEthLanPcEp', 'ep-slot-[slot_id]-port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanPc', 'fabricSubGroup'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthLinkProfile': ('fabricEthLinkProfile', 'eth-link-prof-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricLanCloud',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthMon': ('fabricEthMon', 'eth-mon-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthMonLan',), ('fabricEthMonDestEp', 'fabricEthMonFiltRef', 'fabricEthMonSrcRef', 'fabricSubGroup', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthMonDestEp': ('fabricEthMonDestEp', 'dest-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'ext-san-config', 'ext-san-policy'), ('fabricEthMon', 'fabricFcMon', 'fabricSubGroup'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthMonFiltEp': ('fabricEthMonFiltEp', '', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricVlan',), (), ('Get',)),
+    'FabricEthMonFiltRef': ('fabricEthMonFiltRef', '', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('fabricEthMon',), (), ('Get',)),
+    'FabricEthMonLan': ('fabricEthMonLan', '[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricLanMonCloud',), ('fabricEthMon',), ('Get',)),
+    'FabricEthMonSrcEp': ('fabricEthMonSrcEp', 'mon-src-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('adaptorExtEthIf', 'fabricDceSwSrvEp', 'fabricEthEstcEp', 'fabricEthEstcPc', 'fabricEthLanEp', 'fabricEthLanPc', 'fabricFcoeEstcEp', 'fabricFcoeSanEp', 'fabricFcoeSanPc', 'fabricVlan', 'vmNic', 'vnicEther', 'vnicFc', 'vnicIScsi', 'vnicIScsiLCP', 'vnicIpc', 'vnicScsi'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthMonSrcRef': ('fabricEthMonSrcRef', 'src-ref-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthMon',), (), ('Get',)),
+    'FabricEthTargetEp': ('fabricEthTargetEp', 'eth-target-ep-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthEstcEp', 'fabricEthEstcPc'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthVlanPc': ('fabricEthVlanPc', 'pc-switch-[switch_id]-pc-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricNetGroup', 'fabricVlan'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricEthVlanPortEp': ('fabricEthVlanPortEp', 'phys-switch-[switch_id]-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricNetGroup', 'fabricSwSubGroup', 'fabricVlan'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcEndpoint': ('fabricFcEndpoint', 'endpoint-[wwpn]', 'Version312b', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcUserZone',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcEstc': ('fabricFcEstc', '[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcEstcCloud',), ('fabricFcEstcEp', 'fabricFcoeEstcEp', 'fabricSubGroup', 'fabricVsan'), ('Get',)),
+    'FabricFcEstcCloud': ('fabricFcEstcCloud', 'fc-estc', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricEp',), ('fabricBHVlan', 'fabricFcEstc', 'fabricFcZoneProfile', 'fabricVsan', 'statsThresholdPolicy'), ('Get',)),
+    'FabricFcEstcEp': ('fabricFcEstcEp', 'phys-fc-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcEstc',), ('fabricFcMonSrcEp', 'fabricVsanEp', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcMon': ('fabricFcMon', 'fc-mon-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcMonSan',), ('fabricEthMonDestEp', 'fabricFcMonDestEp', 'fabricFcMonFiltRef', 'fabricFcMonSrcRef', 'fabricSubGroup', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcMonDestEp': ('fabricFcMonDestEp', 'dest-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcMon',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcMonFiltEp': ('fabricFcMonFiltEp', '', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricVsan',), (), ('Get',)),
+    'FabricFcMonFiltRef': ('fabricFcMonFiltRef', '', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('fabricFcMon',), (), ('Get',)),
+    'FabricFcMonSan': ('fabricFcMonSan', '[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricSanMonCloud',), ('fabricFcMon',), ('Get',)),
+    'FabricFcMonSrcEp': ('fabricFcMonSrcEp', 'mon-src-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcEstcEp', 'fabricFcSanEp', 'fabricFcSanPc', 'fabricVsan', 'vmNic', 'vnicEther', 'vnicFc', 'vnicIScsi', 'vnicIScsiLCP', 'vnicIpc', 'vnicScsi'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcMonSrcRef': ('fabricFcMonSrcRef', 'src-ref-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricFcMon',), (), ('Get',)),
+    'FabricFcSan': ('fabricFcSan', '[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricSanCloud',), ('fabricFcSanEp', 'fabricFcSanPc', 'fabricFcoeSanEp', 'fabricFcoeSanPc', 'fabricSubGroup', 'fabricVsan', 'faultInst'), ('Get', 'Set')),
+    'FabricFcSanEp': ('fabricFcSanEp', 'phys-slot-[slot_id]-port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcSan',), ('fabricFcMonSrcEp', 'fabricVsanEp', 'fabricVsanMembership', 'faultInst'), ('Add', 'Get', 'Set')),
+    'FabricFcSanPc': ('fabricFcSanPc', 'pc-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcSan',), ('fabricFcMonSrcEp', 'fabricFcSanPcEp', 'fabricVsanEp', 'fabricVsanMembership', 'faultInst', 'fcErrStats', 'fcStats'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcSanPcEp': ('fabricFcSanPcEp', 'ep-slot-[slot_id]-port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcSanPc',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcUserZone': ('fabricFcUserZone', 'zone-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcZoneProfile',), ('fabricFcEndpoint', 'faultInst', 'storageVsanRef'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcVsanPc': ('fabricFcVsanPc', 'pc-switch-[switch_id]-pc-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricVsan',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcVsanPortEp': ('fabricFcVsanPortEp', 'phys-switch-[switch_id]-slot-[slot_id]-port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricVsan',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcZoneProfile': ('fabricFcZoneProfile', 'zone-profile-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcEstcCloud',), ('fabricFcUserZone', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcoeEstcEp': ('fabricFcoeEstcEp', 'phys-fcoe-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcEstc', 'fabricSubGroup'), ('etherFcoeInterfaceStats', 'fabricEthMonSrcEp', 'fabricVsanEp', 'fabricVsanMembership', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcoeSanEp': ('fabricFcoeSanEp', 'phys-fcoesanep-slot-[slot_id]-port-[port_id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcSan', 'fabricSubGroup'), ('etherFcoeInterfaceStats', 'fabricEthMonSrcEp', 'fabricVsanEp', 'fabricVsanMembership', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcoeSanPc': ('fabricFcoeSanPc', 'fcoesanpc-[port_id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcSan',), ('etherFcoeInterfaceStats', 'fabricEthMonSrcEp', 'fabricFcoeSanPcEp', 'fabricSubGroup', 'fabricVsanEp', 'fabricVsanMembership', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcoeSanPcEp': ('fabricFcoeSanPcEp', 'fcoesanpcep-slot-[slot_id]-port-[port_id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcoeSanPc', 'fabricSubGroup'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFcoeVsanPc': ('fabricFcoeVsanPc', 'fcoepc-switch-[switch_id]-fcoepc-[port_id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricVsan',), ('faultInst',), ('Add', 'Get', 'Set')),
+    'FabricFcoeVsanPortEp': ('fabricFcoeVsanPortEp', 'phys-fcoe-switch-[switch_id]-slot-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricSwSubGroup', 'fabricVsan'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricFlowMonDefinition': ('fabricFlowMonDefinition', 'flow-record-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), (), ('Get',)),
+    'FabricFlowMonExporterProfile': ('fabricFlowMonExporterProfile', 'flow-exporter-profile-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), ('vnicEtherIf',), (None,)),
+    'FabricIf': ('fabricIf', 'mgmt-if-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricCartridgeSlotEp', 'fabricComputeMSlotEp', 'fabricComputeSlotEp'), (), ('Get',)),
+    'FabricLacpPolicy': ('fabricLacpPolicy', 'lacp-[name]', 'Version222c', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricLanAccessMgr': ('fabricLanAccessMgr', 'lan-access', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEp',), (), (None,)),
+    'FabricLanCloud': ('fabricLanCloud', 'lan', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEp',), ('eventInst', 'extvmmNetworkSets', 'extvmmVMNetworkSets', 'fabricEthLan', 'fabricEthLinkProfile', 'fabricLanCloudFsm', 'fabricLanCloudFsmTask', 'fabricLanPinGroup', 'fabricNetGroup', 'fabricUdldLinkPolicy', 'fabricVlan', 'faultInst', 'flowctrlDefinition', 'mgmtInbandProfile', 'qosclassDefinition', 'statsThresholdPolicy', 'vnicProfileSet'), ('Get', 'Set')),
+    'FabricLanCloudFsm': ('fabricLanCloudFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricLanCloud',), ('fabricLanCloudFsmStage',), (None,)),
+    'FabricLanCloudFsmStage': ('fabricLanCloudFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricLanCloudFsm',), (), (None,)),
+    'FabricLanCloudFsmTask': ('fabricLanCloudFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('fabricLanCloud',), (), (None,)),
+    'FabricLanCloudPolicy': ('fabricLanCloudPolicy', 'lan-policy', 'Version227b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('orgOrg',), (), ('Get',)),
+    'FabricLanMonCloud': ('fabricLanMonCloud', 'lanmon', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEp',), ('fabricEthLanFlowMonitoring', 'fabricEthMonLan', 'statsThresholdPolicy'), ('Get',)),
+    'FabricLanPinGroup': ('fabricLanPinGroup', 'lan-pin-group-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricLanCloud',), ('fabricLanPinTarget', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricLanPinTarget': ('fabricLanPinTarget', 'target-[fabric_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricLanPinGroup',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricLastAckedSlot': ('fabricLastAckedSlot', 'last-acked-slot', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricCartridgePhEp', 'fabricComputePhEp'), (), ('Get',)),
+    'FabricLocale': ('fabricLocale', 'fabric-[switch_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFex', 'mgmtController'), ('adaptorExtEthIfPc', 'dcxVc', 'fabricPath'), ('Get',)),
+    'FabricMulticastPolicy': ('fabricMulticastPolicy', 'mc-policy-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('orgOrg',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricNetGroup': ('fabricNetGroup', 'net-group-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLan', 'fabricLanCloud'), ('fabricEthVlanPc', 'fabricEthVlanPortEp', 'fabricPooledVlan', 'fabricSwSubGroup', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricNetflowCollector': ('fabricNetflowCollector', 'flow-collector-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), ('ipIpV4StaticTargetAddr',), (None,)),
+    'FabricNetflowIPv4Addr': ('fabricNetflowIPv4Addr', 'ipv4-addr-[fabric_id]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('adaptorHostIscsiIf', 'adaptorVlan', 'swVlan', 'vnicEtherIf', 'vnicIPv4If'), (), (None,)),
+    'FabricNetflowMonExporter': ('fabricNetflowMonExporter', 'lanFlowMonExporter-eth-netflow-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), ('faultInst',), (None,)),
+    'FabricNetflowMonExporterRef': ('fabricNetflowMonExporterRef', 'flow-exporter-[nf_mon_exporter_name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricNetflowMonitor',), ('faultInst',), (None,)),
+    'FabricNetflowMonSession': ('fabricNetflowMonSession', 'netflow-mon-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), ('fabricNetflowMonSrcRef', 'fabricNetflowMonitorRef', 'faultInst'), (None,)),
+    'FabricNetflowMonSrcEp': ('fabricNetflowMonSrcEp', 'flow-mon-src-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('vnicEther', 'vnicFc', 'vnicIScsi', 'vnicIScsiLCP', 'vnicIpc', 'vnicProfile', 'vnicScsi'), (), (None,)),
+    'FabricNetflowMonSrcRef': ('fabricNetflowMonSrcRef', 'flow-mon-src-ref-[id]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricNetflowMonSession',), (), (None,)),
+    'FabricNetflowMonitor': ('fabricNetflowMonitor', 'lanflowmon-eth-netflow-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), ('fabricNetflowMonExporterRef', 'faultInst'), ('Get',)),
+    'FabricNetflowMonitorRef': ('fabricNetflowMonitorRef', 'flow-monitor-[nf_monitor_name]-dir-[direction]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricNetflowMonSession',), ('faultInst',), (None,)),
+    'FabricNetflowTimeoutPolicy': ('fabricNetflowTimeoutPolicy', 'flow-timeout-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthLanFlowMonitoring',), (), (None,)),
+    'FabricOrgVlanPolicy': ('fabricOrgVlanPolicy', 'org-vlan-policy', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-network'), ('orgOrg',), (), ('Get', 'Set')),
+    'FabricPath': ('fabricPath', 'path-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricLocale',), ('dcxVc', 'fabricPathConn', 'fabricPathEp'), ('Get',)),
+    'FabricPathConn': ('fabricPathConn', 'xc-[c_type]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricPath',), ('fabricPathEp',), ('Get',)),
+    'FabricPathEp': ('fabricPathEp', 'ep-[c_type]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricPath', 'fabricPathConn'), ('portTrustMode',), ('Get',)),
+    'FabricPoolableVlan': ('fabricPoolableVlan', 'pool-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('fabricVlan',), (), (None,)),
+    'FabricPooledVlan': ('fabricPooledVlan', 'net-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricNetGroup',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'FabricSanCloud': ('fabricSanCloud', 'san', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricEp',), ('eventInst', 'fabricFcSan', 'fabricSanCloudFsm', 'fabricSanCloudFsmTask', 'fabricSanPinGroup', 'fabricVsan', 'faultInst', 'statsThresholdPolicy'), ('Get', 'Set')),
+    'FabricSanCloudFsm': ('fabricSanCloudFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricSanCloud',), ('fabricSanCloudFsmStage',), (None,)),
+    'FabricSanCloudFsmStage': ('fabricSanCloudFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('fabricSanCloudFsm',), (), (None,)),
+    'FabricSanCloudFsmTask': ('fabricSanCloudFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('fabricSanCloud',), (), (None,)),
+    'FabricSanMonCloud': ('fabricSanMonCloud', 'sanmon', 'Version141i', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricEp',), ('fabricFcMonSan', 'statsThresholdPolicy'), ('Get',)),
+    'FabricSanPinGroup': ('fabricSanPinGroup', 'san-pin-group-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricSanCloud',), ('fabricSanPinTarget', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricSanPinTarget': ('fabricSanPinTarget', 'target-[fabric_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricSanPinGroup',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricSubGroup': ('fabricSubGroup', 'slot-[slot_id]-aggr-port-[aggr_port_id]', 'Version302c', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'ext-san-config', 'ext-san-policy', 'ls-network', 'ls-network-policy'), ('fabricDceSwSrv', 'fabricDceSwSrvPc', 'fabricEthEstc', 'fabricEthEstcPc', 'fabricEthLan', 'fabricEthLanPc', 'fabricEthMon', 'fabricFcEstc', 'fabricFcMon', 'fabricFcSan', 'fabricFcoeSanPc'), ('fabricDceSwSrvEp', 'fabricDceSwSrvPcEp', 'fabricEthEstcEp', 'fabricEthEstcPcEp', 'fabricEthLanEp', 'fabricEthLanPcEp', 'fabricEthMonDestEp', 'fabricFcoeEstcEp', 'fabricFcoeSanEp', 'fabricFcoeSanPcEp'), ('Add', 'Get')),
+    'FabricSwChPhEp': ('fabricSwChPhEp', 'chassis-ep-ven-[vendor]-mod[model]-ser-[serial]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('fabricDceSrv',), ('faultInst',), ('Get', 'Set')),
+    'FabricSwSubGroup': ('fabricSwSubGroup', 'sw-[switch_id]-slot-[slot_id]-aggr-port-[aggr_port_id]', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricNetGroup', 'fabricVlan', 'fabricVsan'), ('fabricEthVlanPortEp', 'fabricFcoeVsanPortEp'), (None,)),
+    'FabricUdldLinkPolicy': ('fabricUdldLinkPolicy', 'udld-link-pol-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'read-only'), ('fabricLanCloud',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricUdldPolicy': ('fabricUdldPolicy', 'udld-policy', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('orgOrg',), (), ('Get', 'Set')),
+    'FabricVCon': ('fabricVCon', 'vcon-[id]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ext-lan-policy', 'ls-config-policy', 'ls-network', 'ls-network-policy', 'ls-server-policy', 'ls-storage-policy'), ('fabricVConProfile', 'lsServer'), (), ('Add', 'Get', 'Set')),
+    'FabricVConProfile': ('fabricVConProfile', 'vcon-profile-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ext-lan-policy', 'ls-network', 'ls-network-policy', 'ls-server-policy', 'ls-storage-policy'), ('orgOrg',), ('fabricVCon',), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricVlan': ('fabricVlan', 'net-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricEthEstc', 'fabricEthEstcCloud', 'fabricEthLan', 'fabricLanCloud'), ('fabricEthMonFiltEp', 'fabricEthMonSrcEp', 'fabricEthVlanPc', 'fabricEthVlanPortEp', 'fabricPoolableVlan', 'fabricSwSubGroup', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricVlanEp': ('fabricVlanEp', 'vlan-[id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('fabricEthEstcEp', 'fabricEthEstcPc', 'fabricEthLanEp'), (), ('Get',)),
+    'FabricVlanGroupReq': ('fabricVlanGroupReq', 'vlan-group-req-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-network'), ('orgOrg',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'FabricVlanPermit': ('fabricVlanPermit', 'perm-[cloud]sw-[switch_id]net-[name]', 'Version211a', 'InputOutput', 1, (), ('',), ('orgOrg',), (), (None,)),
+    'FabricVlanReq': ('fabricVlanReq', 'vlan-req-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-network'), ('orgOrg',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'FabricVnetEpSyncEp': ('fabricVnetEpSyncEp', 'syncEp', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('extpolProvider',), ('eventInst', 'fabricChangedObjectRef', 'fabricVnetEpSyncEpFsm', 'fabricVnetEpSyncEpFsmTask', 'faultInst'), (None,)),
+    'FabricVnetEpSyncEpFsm': ('fabricVnetEpSyncEpFsm', 'fsm', 'Version212a', 'OutputOnly', 1, (), ('',), ('fabricVnetEpSyncEp',), ('fabricVnetEpSyncEpFsmStage',), (None,)),
+    'FabricVnetEpSyncEpFsmStage': ('fabricVnetEpSyncEpFsmStage', 'stage-[name]', 'Version212a', 'OutputOnly', 1, (), ('',), ('fabricVnetEpSyncEpFsm',), (), (None,)),
+    'FabricVnetEpSyncEpFsmTask': ('fabricVnetEpSyncEpFsmTask', 'task-[item]', 'Version212a', 'OutputOnly', 1, (), ('',), ('fabricVnetEpSyncEp',), (), (None,)),
+    'FabricVsan': ('fabricVsan', 'net-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy'), ('fabricFcEstc', 'fabricFcEstcCloud', 'fabricFcSan', 'fabricSanCloud'), ('fabricFcMonFiltEp', 'fabricFcMonSrcEp', 'fabricFcVsanPc', 'fabricFcVsanPortEp', 'fabricFcoeVsanPc', 'fabricFcoeVsanPortEp', 'fabricSwSubGroup', 'faultInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'FabricVsanEp': ('fabricVsanEp', 'vsan-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fabricFcEstcEp', 'fabricFcSanEp', 'fabricFcSanPc', 'fabricFcoeEstcEp', 'fabricFcoeSanEp', 'fabricFcoeSanPc'), ('faultInst',), ('Get',)),
+    'FabricVsanMembership': ('fabricVsanMembership', 'vsanmember-[vsan_id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('fabricFcSanEp', 'fabricFcSanPc', 'fabricFcoeEstcEp', 'fabricFcoeSanEp', 'fabricFcoeSanPc'), ('faultInst',), (None,)),
+    'FabricZoneIdUniverse': ('fabricZoneIdUniverse', 'zone-id-universe', 'Version211a', 'InputOutput', 1, (), ('admin',), ('fabricEp',), (), (None,)),
+    'FaultAffectedClass': ('faultAffectedClass', 'fault-[mo_class_id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'fault'), ('faultSuppressPolicy',), (), (None,)),
+    'FaultHolder': ('faultHolder', 'fault', 'Version101e', 'InputOutput', 1, (), ('admin', 'fault'), ('topRoot',), ('faultLocalTypedHolder', 'faultPolicy', 'faultSuppressPolicy', 'faultSuppressTask'), ('Get',)),
+    'FaultInst': ('faultInst', 'fault-[code]', 'Version111j', 'OutputOnly', 1, (), ('admin', 'fault', 'operations'), ('aaaAuthRealm', 'aaaConsoleAuth', 'aaaDefaultAuth', 'aaaDomain', 'aaaDomainAuth', 'aaaLdapEp', 'aaaLocale', 'aaaOrg', 'aaaProviderGroup', 'aaaRadiusEp', 'aaaRole', 'aaaTacacsPlusEp', 'aaaUser', 'aaaUserEp', 'aaaUserLocale', 'aaaUserRole', 'adaptorExtEthIf', 'adaptorHostEthIf', 'adaptorHostFcIf', 'adaptorHostIscsiIf', 'adaptorHostScsiIf', 'adaptorHostServiceEthIf', 'adaptorUnit', 'adaptorUnitExtn', 'adaptorVlan', 'callhomeEp', 'capabilityCatalogue', 'capabilityMgmtExtension', 'capabilityUpdater', 'cimcvmediaActualMountEntry', 'commDateTime', 'commSnmp', 'commSnmpUser', 'commSvcEp', 'computeAutoconfigPolicy', 'computeBlade', 'computeBladeInheritPolicy', 'computeBoard', 'computeExtBoard', 'computeFwSyncAck', 'computeIOHub', 'computePool', 'computeRackUnit', 'computeRtcBattery', 'computeServerDiscPolicy', 'computeServerUnit', 'cpmaintAck', 'dcxNs', 'dcxVIf', 'dcxVc', 'epqosDefinition', 'epqosDefinitionDelTask', 'equipmentAutoconfigPolicy', 'equipmentBeaconLed', 'equipmentChassis', 'equipmentChassisInheritPolicy', 'equipmentChassisIssues', 'equipmentChassisProfile', 'equipmentFan', 'equipmentFanModule', 'equipmentFex', 'equipmentHealthLed', 'equipmentIOCard', 'equipmentLocatorLed', 'equipmentPsu', 'equipmentRequirement', 'equipmentSharedIOModule', 'equipmentSwitchCard', 'equipmentSwitchIOCard', 'equipmentSystemIOController', 'equipmentTpm', 'etherPIo', 'etherServerIntFIo', 'etherSwitchIntFIo', 'etherSwitchIntFIoPc', 'extmgmtArpTargets', 'extmgmtIf', 'extmgmtNdiscTargets', 'extpolClient', 'extpolEp', 'extpolProvider', 'extpolRegistry', 'extvmmEp', 'extvmmFNDReference', 'extvmmKeyStore', 'extvmmMasterExtKey', 'extvmmNetworkSets', 'extvmmProvider', 'extvmmSwitchDelTask', 'extvmmVMNDRef', 'extvmmVMNetwork', 'extvmmVMNetworkDefinition', 'fabricCartridgePhEp', 'fabricCartridgeSlotEp', 'fabricChassisEp', 'fabricComputeMSlotEp', 'fabricComputePhEp', 'fabricComputeSlotEp', 'fabricDceSwSrvEp', 'fabricDceSwSrvPc', 'fabricDceSwSrvPcEp', 'fabricEpMgr', 'fabricEthEstcEp', 'fabricEthEstcPc', 'fabricEthEstcPcEp', 'fabricEthLan', 'fabricEthLanEp', 'fabricEthLanPc', 'fabricEthLanPcEp', 'fabricEthLinkProfile', 'fabricEthMon', 'fabricEthMonDestEp', 'fabricEthTargetEp', 'fabricEthVlanPc', 'fabricEthVlanPortEp', 'fabricFcEstcEp', 'fabricFcMon', 'fabricFcMonDestEp', 'fabricFcSan', 'fabricFcSanEp', 'fabricFcSanPc', 'fabricFcSanPcEp', 'fabricFcUserZone', 'fabricFcVsanPc', 'fabricFcVsanPortEp', 'fabricFcZoneProfile', 'fabricFcoeEstcEp', 'fabricFcoeSanEp', 'fabricFcoeSanPc', 'fabricFcoeSanPcEp', 'fabricFcoeVsanPc', 'fabricFcoeVsanPortEp', 'fabricLanCloud', 'fabricLanPinGroup', 'fabricLanPinTarget', 'fabricMulticastPolicy', 'fabricNetGroup', 'fabricNetflowMonExporter', 'fabricNetflowMonExporterRef', 'fabricNetflowMonSession', 'fabricNetflowMonitor', 'fabricNetflowMonitorRef', 'fabricPooledVlan', 'fabricSanCloud', 'fabricSanPinGroup', 'fabricSanPinTarget', 'fabricSwChPhEp', 'fabricVlan', 'fabricVlanGroupReq', 'fabricVlanReq', 'fabricVnetEpSyncEp', 'fabricVsan', 'fabricVsanEp', 'fabricVsanMembership', 'faultSuppressTask', 'fcPIo', 'fcpoolAddr', 'fcpoolInitiators', 'firmwareAck', 'firmwareAutoSyncPolicy', 'firmwareBootUnit', 'firmwareDistributable', 'firmwareDownloader', 'firmwareImage', 'firmwareInfra', 'firmwarePackItem', 'firmwareStatus', 'firmwareSystem', 'firmwareUpdatable', 'flowctrlItem', 'gmetaHolder', 'identIdentRequest', 'identMetaSystem', 'ippoolAddr', 'ippoolIpV6Addr', 'ippoolPool', 'iqnpoolAddr', 'iqnpoolPool', 'licenseDownloader', 'licenseFile', 'licenseInstance', 'lsBinding', 'lsIdentityInfo', 'lsIssues', 'lsRequirement', 'lsServer', 'lsmaintAck', 'lsmaintMaintPolicy', 'lstorageDasScsiLun', 'lstorageProfileBinding', 'macpoolAddr', 'macpoolPool', 'memoryArray', 'memoryBufferUnit', 'memoryUnit', 'mgmtBackup', 'mgmtBackupPolicy', 'mgmtBackupPolicyConfig', 'mgmtCfgExportPolicy', 'mgmtConnection', 'mgmtController', 'mgmtEntity', 'mgmtHealthStatus', 'mgmtIPv6IfAddr', 'mgmtIf', 'mgmtImporter', 'mgmtInterface', 'mgmtMgmtDbState', 'mgmtPmonEntry', 'morefImportRoot', 'networkElement', 'networkOperLevel', 'nfsMountDef', 'nfsMountInst', 'observeObserved', 'pkiEp', 'pkiKeyRing', 'pkiTP', 'policyControlEp', 'policyControlledType', 'policyPolicyScope', 'powerBudget', 'powerChassisMember', 'powerGroup', 'powerPolicy', 'processorUnit', 'qosclassDefinition', 'statsCollectionPolicy', 'storageConnectionDef', 'storageConnectionPolicy', 'storageController', 'storageEnclosure', 'storageEnclosureDiskSlotEp', 'storageFlexFlashCard', 'storageFlexFlashController', 'storageFlexFlashDrive', 'storageFlexFlashVirtualDrive', 'storageIniGroup', 'storageInitiator', 'storageItem', 'storageLocalDisk', 'storageLocalDiskSlotEp', 'storageMezzFlashLife', 'storageRaidBattery', 'storageSasExpander', 'storageSystem', 'storageVDMemberEp', 'storageVirtualDrive', 'storageVsanRef', 'swAccessDomain', 'swEthLanBorder', 'swEthLanFlowMon', 'swEthMon', 'swEthTargetEp', 'swExtUtility', 'swFcMon', 'swFcSanBorder', 'swPhys', 'swSystemStats', 'swUtilityDomain', 'swVlan', 'swVlanPortNs', 'syntheticFsObj', 'sysdebugAutoCoreFileExportTarget', 'sysdebugCore', 'sysdebugLogControlEp', 'sysdebugLogExportPolicy', 'sysdebugLogExportStatus', 'sysdebugMEpLog', 'sysdebugManualCoreFileExportTarget', 'sysdebugTechSupport', 'sysfileMutation', 'trigTest', 'uuidpoolAddr', 'uuidpoolPool', 'vmLifeCyclePolicy', 'vmNic', 'vmVif', 'vnicConnDef', 'vnicDynamicConPolicyRef', 'vnicEthConfig', 'vnicEther', 'vnicEtherIf', 'vnicFc', 'vnicFcGroupDef', 'vnicFcGroupTempl', 'vnicFcIf', 'vnicFcNode', 'vnicIPv4PooledIscsiAddr', 'vnicIScsi', 'vnicIScsiBootVnic', 'vnicIScsiConfig', 'vnicIScsiLCP', 'vnicIScsiNode', 'vnicIScsiStaticTargetIf', 'vnicIpV4MgmtPooledAddr', 'vnicIpV4PooledAddr', 'vnicIpV6MgmtPooledAddr', 'vnicIpc', 'vnicLanConnTempl', 'vnicProfile', 'vnicProfileSet', 'vnicSanConnTempl', 'vnicScsi', 'vnicUsnicConPolicyRef', 'vnicVmqConPolicyRef'), (), ('Get',)),
+    'FaultLocalTypedHolder': ('faultLocalTypedHolder', 'type-[type]', 'Version211a', 'InputOutput', 1, (), ('admin', 'fault'), ('faultHolder',), (), (None,)),
+    'FaultPolicy': ('faultPolicy', 'fault-policy', 'Version101e', 'InputOutput', 1, (), ('admin', 'fault'), ('faultHolder',), (), ('Get', 'Set')),
+    'FaultSuppressPolicy': ('faultSuppressPolicy', 'fault-suppress-policy-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('faultHolder',), ('faultAffectedClass', 'faultSuppressPolicyItem'), (None,)),
+    'FaultSuppressPolicyItem': ('faultSuppressPolicyItem', 'item-[type]-[cause]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('faultSuppressPolicy',), (), (None,)),
+    'FaultSuppressTask': ('faultSuppressTask', 'fault-suppress-task-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'fault'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFex', 'equipmentIOCard', 'faultHolder', 'lsServer', 'orgOrg'), ('faultInst', 'trigLocalSched'), ('Add', 'Get', 'Remove', 'Set')),
+    'FcErrStats': ('fcErrStats', 'err-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('fabricFcSanPc', 'fcPIo'), ('fcErrStatsHist',), ('Get',)),
+    'FcErrStatsHist': ('fcErrStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('fcErrStats',), (), ('Get',)),
+    'FcNicIfConfig': ('fcNicIfConfig', 'if-config', 'Version101e', 'InputOutput', 1, (), ('read-only',), (), (), ('Get',)),
+    'FcPIo': ('fcPIo', 'port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('portGroup', 'portSubGroup'), ('equipmentXcvr', 'eventInst', 'faultInst', 'fcErrStats', 'fcPIoFsm', 'fcStats', 'lldpAcquired', 'networkIfStats', 'portDomainEp', 'portPIoFsm', 'portPIoFsmTask'), ('Get',)),
+    'FcPIoFsm': ('fcPIoFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('fcPIo',), ('fcPIoFsmStage',), (None,)),
+    'FcPIoFsmStage': ('fcPIoFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('fcPIoFsm',), (), (None,)),
+    'FcStats': ('fcStats', 'stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('fabricFcSanPc', 'fcPIo'), ('fcStatsHist',), ('Get',)),
+    'FcStatsHist': ('fcStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('fcStats',), (), ('Get',)),
+    'FcSwIfConfig': ('fcSwIfConfig', 'if-config', 'Version101e', 'InputOutput', 1, (), ('read-only',), (), (), ('Get',)),
+    'FcpoolAddr': ('fcpoolAddr', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fcpoolUniverse',), ('faultInst', 'fcpoolPoolable'), ('Get',)),
+    'FcpoolBlock': ('fcpoolBlock', 'block-[r_from]-[to]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-storage-policy'), ('fcpoolInitiators',), ('fcpoolBootTarget',), ('Add', 'Get', 'Remove')),
+    'FcpoolBootTarget': ('fcpoolBootTarget', 'target-[type]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-storage-policy'), ('fcpoolBlock', 'fcpoolInitiator'), (), ('Get',)),
+    'FcpoolFormat': ('fcpoolFormat', 'format-[format]-[mask]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy', 'ls-storage', 'ls-storage-policy'), ('fcpoolUniverse',), (), ('Get',)),
+    'FcpoolInitiator': ('fcpoolInitiator', '[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-storage-policy'), ('fcpoolInitiators',), ('fcpoolBootTarget', 'fcpoolInitiatorEp'), ('Add', 'Get', 'Remove', 'Set')),
+    'FcpoolInitiatorEp': ('fcpoolInitiatorEp', '[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('fcpoolInitiator',), (), (None,)),
+    'FcpoolInitiators': ('fcpoolInitiators', 'wwn-pool-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-storage-policy'), ('orgOrg',), ('faultInst', 'fcpoolBlock', 'fcpoolInitiator'), ('Add', 'Get', 'Remove', 'Set')),
+    'FcpoolPoolable': ('fcpoolPoolable', 'pool-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('fcpoolAddr',), (), ('Get',)),
+    'FcpoolUniverse': ('fcpoolUniverse', 'wwn', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('fcpoolAddr', 'fcpoolFormat'), ('Get',)),
+    'FeatureContextEp': ('featureContextEp', 'contexts', 'Version302c', 'InputOutput', 1, (), ('',), ('topSystem',), ('featureDefinitionInstance', 'featureFruCapProviderInstance', 'featureProviderInstance'), (None,)),
+    'FeatureDefinition': ('featureDefinition', 'feature-[name]-revision-[revision]', 'Version302c', 'InputOutput', 1, (), ('',), ('capabilityCatalogue',), (), (None,)),
+    'FeatureDefinitionInstance': ('featureDefinitionInstance', 'feature-[name]-revision-[revision]', 'Version302c', 'InputOutput', 1, (), ('',), ('featureContextEp',), (), (None,)),
+    'FeatureDefinitionRef': ('featureDefinitionRef', 'feature-[name]-revision-[revision]', 'Version302c', 'InputOutput', 1, (), ('',), ('featureProvider',), (), (None,)),
+    'FeatureFruCapProviderInstance': ('featureFruCapProviderInstance', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version302c', 'InputOutput', 1, (), ('',), ('featureContextEp',), (), (None,)),
+    'FeatureFruCapProviderRef': ('featureFruCapProviderRef', 'manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version302c', 'InputOutput', 1, (), ('',), ('featureProvider',), (), (None,)),
+    'FeatureProvider': ('featureProvider', 'prov-[name]', 'Version302c', 'InputOutput', 1, (), ('',), ('capabilityCatalogue',), ('featureDefinitionRef', 'featureFruCapProviderRef'), (None,)),
+    'FeatureProviderInstance': ('featureProviderInstance', 'inst-[name]', 'Version302c', 'InputOutput', 1, (), ('',), ('featureContextEp',), (), (None,)),
+    'FirmwareAck': ('firmwareAck', 'ack', 'Version211a', 'InputOutput', 1, (), ('admin',), ('firmwareSystem',), ('faultInst', 'trigLocalSched'), ('Get', 'Set')),
+    'FirmwareActivity': ('firmwareActivity', 'fw-activity', 'Version251a', 'InputOutput', 1, (), ('admin',), ('equipmentChassis',), (), (None,)),
+    'FirmwareActivityTrigger': ('firmwareActivityTrigger', 'fw-activity-trigger', 'Version312b', 'InputOutput', 1, (), ('admin',), ('equipmentChassis',), (), ('Get',)),
+    'FirmwareAutoSyncPolicy': ('firmwareAutoSyncPolicy', 'fw-auto-sync', 'Version221b', 'InputOutput', 1, (), ('admin',), ('orgOrg',), ('faultInst',), ('Get', 'Set')),
+    'FirmwareBlade': ('firmwareBlade', 'fw-blade', 'Version211a', 'InputOutput', 1, (), ('admin',), ('firmwareHost',), (), ('Get',)),
+    'FirmwareBootDefinition': ('firmwareBootDefinition', 'fw-boot-def', 'Version101e', 'InputOutput', 1, (), ('admin',), ('adaptorHostEthIf', 'adaptorHostFcIf', 'biosUnit', 'capabilityCatalogue', 'capabilityMgmtExtension', 'equipmentPsu', 'graphicsCard', 'mgmtController', 'storageController', 'storageLocalDisk', 'storageOnboardDevice', 'storageSasExpander'), ('firmwareBootUnit', 'firmwareUcscInfo'), ('Get',)),
+    'FirmwareBootUnit': ('firmwareBootUnit', 'bootunit-[type]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('firmwareBootDefinition',), ('faultInst', 'firmwareInstallable'), ('Get', 'Set')),
+    'FirmwareBundleInfo': ('firmwareBundleInfo', 'bundle-[type]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy'), (), (), (None,)),
+    'FirmwareBundleInfoDigest': ('firmwareBundleInfoDigest', 'bundleinfo-[type]-version-[version]', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'FirmwareBundleType': ('firmwareBundleType', '-type-[type]', 'Version141i', 'InputOutput', 1, (), ('',), ('firmwareBundleTypeCapProvider', 'firmwarePlatformBundleTypeCapProvider'), (), ('Get',)),
+    'FirmwareBundleTypeCapProvider': ('firmwareBundleTypeCapProvider', 'bundle-type-cap', 'Version141i', 'InputOutput', 1, (), ('',), ('capabilityCatalogue',), ('firmwareBundleType', 'firmwareChassisComponentSpec', 'firmwareComponentSpec'), ('Get',)),
+    'FirmwareCatalogPack': ('firmwareCatalogPack', 'fw-catalog-pack-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'operations'), ('orgOrg',), ('firmwarePackItem',), ('Get', 'Set')),
+    'FirmwareCatalogue': ('firmwareCatalogue', 'fw-catalogue', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('firmwareCompSource', 'firmwareDistributable', 'firmwareDownloader', 'firmwareImage', 'firmwareUcscInfo'), (None,)),
+    'FirmwareChassisComponentSpec': ('firmwareChassisComponentSpec', 'chassis-component-spec-[type]', 'Version312b', 'InputOutput', 1, (), ('',), ('firmwareBundleTypeCapProvider',), (), ('Get',)),
+    'FirmwareChassisPack': ('firmwareChassisPack', 'fw-chassis-pack-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('orgOrg',), ('firmwareExcludeChassisComponent', 'firmwarePackItem'), ('Add', 'Get', 'Remove', 'Set')),
+    'FirmwareCompSource': ('firmwareCompSource', 'source-[inv_tag]-ver-[version]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('firmwareCatalogue',), ('firmwareCompTarget',), (None,)),
+    'FirmwareCompTarget': ('firmwareCompTarget', 'target-[inv_tag]-ver-[version]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('firmwareCompSource',), (), (None,)),
+    'FirmwareComponentSpec': ('firmwareComponentSpec', 'component-spec-[type]', 'Version227b', 'InputOutput', 1, (), ('',), ('firmwareBundleTypeCapProvider',), (), (None,)),
+    'FirmwareComputeHostPack': ('firmwareComputeHostPack', 'fw-host-pack-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config-policy', 'ls-server-policy'), ('orgOrg',), ('firmwareExcludeServerComponent', 'firmwarePackItem'), ('Add', 'Get', 'Remove', 'Set')),
+    'FirmwareComputeMgmtPack': ('firmwareComputeMgmtPack', 'fw-mgmt-pack-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy'), ('orgOrg',), ('firmwarePackItem',), ('Add', 'Get', 'Remove', 'Set')),
+    'FirmwareConstraints': ('firmwareConstraints', 'fw-constraints', 'Version223a', 'InputOutput', 1, (), ('',), ('diagSrvCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentRackUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentSwitchCapProvider'), ('firmwarePCHStorageConfigConstraint', 'firmwareProcessorTypeConstraint', 'firmwareRackPowerCapConstraint', 'firmwareServerTypeConstraint', 'firmwareTPMConstraint', 'firmwareVicSlotConstraint', 'firmwareVnicCdnConstraint'), (None,)),
+    'FirmwareDependency': ('firmwareDependency', 'dep-[ep]-[inv_tag]-[hw_vendor]|[hw_model]|[hw_revision]', 'Version101e', 'InputOutput', 1, (), ('',), ('firmwareType',), (), ('Get',)),
+    'FirmwareDistImage': ('firmwareDistImage', 'distimage-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('firmwareDistributable',), (), ('Get',)),
+    'FirmwareDistributable': ('firmwareDistributable', 'distrib-[name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('firmwareCatalogue',), ('eventInst', 'faultInst', 'firmwareDistImage', 'firmwareDistributableFsm', 'firmwareDistributableFsmTask'), ('Get', 'Set')),
+    'FirmwareDistributableFsm': ('firmwareDistributableFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareDistributable',), ('firmwareDistributableFsmStage',), (None,)),
+    'FirmwareDistributableFsmStage': ('firmwareDistributableFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareDistributableFsm',), (), (None,)),
+    'FirmwareDistributableFsmTask': ('firmwareDistributableFsmTask', 'task-[item]', 'Version131c', 'OutputOnly', 1, (), ('',), ('firmwareDistributable',), (), (None,)),
+    'FirmwareDownloader': ('firmwareDownloader', 'dnld-[file_name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('firmwareCatalogue',), ('eventInst', 'faultInst', 'firmwareDownloaderFsm', 'firmwareDownloaderFsmTask'), ('Add', 'Get', 'Remove')),
+    'FirmwareDownloaderFsm': ('firmwareDownloaderFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareDownloader',), ('firmwareDownloaderFsmStage',), (None,)),
+    'FirmwareDownloaderFsmStage': ('firmwareDownloaderFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareDownloaderFsm',), (), (None,)),
+    'FirmwareDownloaderFsmTask': ('firmwareDownloaderFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('firmwareDownloader',), (), (None,)),
+    'FirmwareExcludeChassisComponent': ('firmwareExcludeChassisComponent', 'exclude-chassis-component-[chassis_component]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('firmwareChassisPack',), (), ('Add', 'Get', 'Remove')),
+    'FirmwareExcludeServerComponent': ('firmwareExcludeServerComponent', 'exclude-server-component-[server_component]', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config-policy', 'ls-server-policy'), ('firmwareComputeHostPack',), (), ('Add', 'Get', 'Remove')),
+    'FirmwareFileUnit': ('firmwareFileUnit', 'fileunit-[type]', 'Version302c', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'FirmwareHost': ('firmwareHost', 'fw-host', 'Version211a', 'InputOutput', 1, (), ('admin',), ('firmwareSystem',), ('firmwareBlade', 'firmwareRack'), ('Get',)),
+    'FirmwareHostPackModImpact': ('firmwareHostPackModImpact', 'fw-sys-HostPackModImpact-[key_dn]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy'), (), (), (None,)),
+    'FirmwareImage': ('firmwareImage', 'image-[name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('firmwareCatalogue',), ('eventInst', 'faultInst', 'firmwareImageFsm', 'firmwareImageFsmTask', 'firmwareInstallable'), ('Get', 'Set')),
+    'FirmwareImageFsm': ('firmwareImageFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareImage',), ('firmwareImageFsmStage',), (None,)),
+    'FirmwareImageFsmStage': ('firmwareImageFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareImageFsm',), (), (None,)),
+    'FirmwareImageFsmTask': ('firmwareImageFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('firmwareImage',), (), (None,)),
+    'FirmwareImageLock': ('firmwareImageLock', 'fw-imagelock[name]', 'Version222c', 'InputOutput', 1, (), ('admin',), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis'), (), ('Get',)),
+    'FirmwareInfra': ('firmwareInfra', 'fw-infra', 'Version211a', 'InputOutput', 1, (), ('admin',), ('firmwareSystem',), ('faultInst', 'trigLocalSched'), ('Get',)),
+    'FirmwareInfraPack': ('firmwareInfraPack', 'fw-infra-pack-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('orgOrg',), ('firmwarePackItem',), ('Get', 'Set')),
+    'FirmwareInstallImpact': ('firmwareInstallImpact', 'fw-sys-InstallImpact-[key_dn]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy'), (), (), ('Get',)),
+    'FirmwareInstallable': ('firmwareInstallable', 'installable-[vendor]|[model]|[type]|[version]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('firmwareBootUnit', 'firmwareImage', 'firmwareUpdatable'), ('firmwareUcscInfo',), ('Get',)),
+    'FirmwarePCHStorageConfigConstraint': ('firmwarePCHStorageConfigConstraint', 'constraint-pch-storage-config', 'Version227b', 'InputOutput', 1, (), ('',), ('firmwareConstraints',), (), ('Get',)),
+    'FirmwarePackItem': ('firmwarePackItem', 'pack-image-[hw_vendor]|[hw_model]|[type]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('firmwareCatalogPack', 'firmwareChassisPack', 'firmwareComputeHostPack', 'firmwareComputeMgmtPack', 'firmwareInfraPack'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FirmwarePlatformBundleTypeCapProvider': ('firmwarePlatformBundleTypeCapProvider', 'plat-bundle-type-cap-[platform_type]', 'Version302c', 'InputOutput', 1, (), ('',), ('capabilityCatalogue',), ('firmwareBundleType',), (None,)),
+    'FirmwareProcessorTypeConstraint': ('firmwareProcessorTypeConstraint', 'constraint-processor-type-[type]', 'Version224b', 'InputOutput', 1, (), ('',), ('firmwareConstraints',), (), (None,)),
+    'FirmwareRack': ('firmwareRack', 'fw-rack', 'Version211a', 'InputOutput', 1, (), ('admin',), ('firmwareHost',), (), ('Get',)),
+    'FirmwareRackPowerCapConstraint': ('firmwareRackPowerCapConstraint', 'constraint-rack-powercap-config', 'Version312b', 'InputOutput', 1, (), ('',), ('firmwareConstraints',), (), (None,)),
+    'FirmwareRunning': ('firmwareRunning', 'fw-[deployment]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorHostEthIf', 'adaptorHostFcIf', 'biosUnit', 'capabilityCatalogue', 'capabilityMgmtExtension', 'equipmentPsu', 'graphicsCard', 'mgmtController', 'storageController', 'storageFlexFlashController', 'storageLocalDisk', 'storageOnboardDevice', 'storageSasExpander'), (), ('Get',)),
+    'FirmwareServerTypeConstraint': ('firmwareServerTypeConstraint', 'constraint-server-type', 'Version311e', 'InputOutput', 1, (), ('',), ('firmwareConstraints',), (), ('Get',)),
+    'FirmwareSpec': ('firmwareSpec', 'fw-spec-bundle-version-[bundle_version]', 'Version141i', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider',), (), ('Get',)),
+    'FirmwareStatus': ('firmwareStatus', 'fw-status', 'Version211a', 'InputOutput', 1, (), ('admin',), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentIOCard', 'equipmentPsu', 'networkElement', 'topSystem'), ('faultInst',), ('Get',)),
+    'FirmwareSystem': ('firmwareSystem', 'fw-system', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy'), ('topSystem',), ('eventInst', 'faultInst', 'firmwareAck', 'firmwareHost', 'firmwareInfra', 'firmwareSystemCompCheckResult', 'firmwareSystemFsm', 'firmwareSystemFsmTask'), ('Get',)),
+    'FirmwareSystemCompCheckResult': ('firmwareSystemCompCheckResult', 'fw-sys-CompCheckRes-[key_dn]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('firmwareSystem',), (), ('Get',)),
+    'FirmwareSystemFsm': ('firmwareSystemFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareSystem',), ('firmwareSystemFsmStage',), (None,)),
+    'FirmwareSystemFsmStage': ('firmwareSystemFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareSystemFsm',), (), (None,)),
+    'FirmwareSystemFsmTask': ('firmwareSystemFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('firmwareSystem',), (), (None,)),
+    'FirmwareTPMConstraint': ('firmwareTPMConstraint', 'constraint-tpm-revision-[tpm_revision]', 'Version227b', 'InputOutput', 1, (), ('',), ('firmwareConstraints',), (), (None,)),
+    'FirmwareType': ('firmwareType', 'fw-type-[inv_tag]', 'Version101e', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentOnboardDeviceDef', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), ('firmwareDependency',), ('Get',)),
+    'FirmwareUcscInfo': ('firmwareUcscInfo', 'ucsc-info', 'Version222c', 'InputOutput', 1, (), ('admin',), ('firmwareBootDefinition', 'firmwareCatalogue', 'firmwareInstallable'), (), ('Get',)),
+    'FirmwareUpdatable': ('firmwareUpdatable', 'fw-updatable', 'Version101e', 'InputOutput', 1, (), ('admin',), ('biosUnit', 'equipmentPsu', 'mgmtController', 'storageOnboardDevice'), ('faultInst', 'firmwareInstallable'), ('Get', 'Set')),
+    'FirmwareUpgradeConstraint': ('firmwareUpgradeConstraint', 'fw-upgrd-constr', 'Version202m', 'InputOutput', 1, (), ('',), ('adaptorFruCapProvider', 'diagSrvCapProvider', 'equipmentBaseBoardCapProvider', 'equipmentBladeBiosCapProvider', 'equipmentBladeCapProvider', 'equipmentCatalogCapProvider', 'equipmentChassisCapProvider', 'equipmentDbgPluginCapProvider', 'equipmentFanModuleCapProvider', 'equipmentFexCapProvider', 'equipmentGemCapProvider', 'equipmentGraphicsCardCapProvider', 'equipmentHostIfCapProvider', 'equipmentIOCardCapProvider', 'equipmentIOExpanderCapProvider', 'equipmentLocalDiskCapProvider', 'equipmentLocalDiskControllerCapProvider', 'equipmentMemoryUnitCapProvider', 'equipmentMgmtCapProvider', 'equipmentMgmtExtCapProvider', 'equipmentProcessorUnitCapProvider', 'equipmentPsuCapProvider', 'equipmentRackUnitCapProvider', 'equipmentSecurityUnitCapProvider', 'equipmentServerUnitCapProvider', 'equipmentStorageEncCapProvider', 'equipmentStorageSasExpanderCapProvider', 'equipmentSwitchCapProvider', 'equipmentSwitchIOCardCapProvider', 'equipmentTpmCapProvider'), (), ('Get',)),
+    'FirmwareUpgradeDetail': ('firmwareUpgradeDetail', 'id-[id]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('firmwareUpgradeInfo',), (), ('Get',)),
+    'FirmwareUpgradeInfo': ('firmwareUpgradeInfo', 'validate-upgrade', 'Version211a', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('firmwareUpgradeDetail',), ('Get',)),
+    'FirmwareVicSlotConstraint': ('firmwareVicSlotConstraint', 'constraint-vic-slot-[vic_slot]', 'Version227b', 'InputOutput', 1, (), ('',), ('firmwareConstraints',), (), (None,)),
+    'FirmwareVnicCdnConstraint': ('firmwareVnicCdnConstraint', 'constraint-vnic-cdn-[type]', 'Version224b', 'InputOutput', 1, (), ('',), ('firmwareConstraints',), (), (None,)),
+    'FlowctrlDefinition': ('flowctrlDefinition', 'flowctrl', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'ls-qos-policy'), ('fabricLanCloud',), ('flowctrlItem',), ('Get', 'Set')),
+    'FlowctrlItem': ('flowctrlItem', 'policy-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'ls-qos-policy'), ('flowctrlDefinition',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'FsmStatus': ('fsmStatus', 'status-[converted_ep_ref]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topSystem',), (), (None,)),
+    'GmetaClass': ('gmetaClass', 'class-[id]', 'Version212a', 'InputOutput', 1, (), ('admin',), ('gmetaHolder',), ('gmetaProp',), (None,)),
+    'GmetaEp': ('gmetaEp', 'gmeta', 'Version212a', 'InputOutput', 1, (), ('admin',), ('topRoot',), ('gmetaHolder', 'gmetaPolicyMapHolder'), (None,)),
+    'GmetaHolder': ('gmetaHolder', 'category-[category]-provider-[provider]', 'Version212a', 'InputOutput', 1, (), ('admin',), ('gmetaEp',), ('eventInst', 'faultInst', 'gmetaClass', 'gmetaHolderFsm', 'gmetaHolderFsmTask'), (None,)),
+    'GmetaHolderFsm': ('gmetaHolderFsm', 'fsm', 'Version212a', 'OutputOnly', 1, (), ('',), ('gmetaHolder',), ('gmetaHolderFsmStage',), (None,)),
+    'GmetaHolderFsmStage': ('gmetaHolderFsmStage', 'stage-[name]', 'Version212a', 'OutputOnly', 1, (), ('',), ('gmetaHolderFsm',), (), (None,)),
+    'GmetaHolderFsmTask': ('gmetaHolderFsmTask', 'task-[item]', 'Version212a', 'OutputOnly', 1, (), ('',), ('gmetaHolder',), (), (None,)),
+    'GmetaPolicyMapElement': ('gmetaPolicyMapElement', 'policymapelem-[name]', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('gmetaPolicyMapHolder',), (), (None,)),
+    'GmetaPolicyMapHolder': ('gmetaPolicyMapHolder', 'policymapholder', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('gmetaEp',), ('gmetaPolicyMapElement',), (None,)),
+    'GmetaProp': ('gmetaProp', 'prop-[order]', 'Version212a', 'InputOutput', 1, (), ('admin',), ('gmetaClass',), (), (None,)),
+    'GraphicsCard': ('graphicsCard', 'graphics-card-[id]', 'Version213a', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), ('firmwareBootDefinition', 'firmwareRunning', 'graphicsController'), ('Get',)),
+    'GraphicsController': ('graphicsController', 'graphics-controller-[id]', 'Version213a', 'InputOutput', 1, (), ('read-only',), ('graphicsCard',), (), ('Get',)),
+    'HostimgPolicy': ('hostimgPolicy', 'img-policy-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server'), ('orgOrg',), ('hostimgTarget',), ('Get',)),
+    'HostimgTarget': ('hostimgTarget', 'target-[type]-comp-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server'), ('hostimgPolicy',), (), ('Get',)),
+    'IdentIdentCtx': ('identIdentCtx', 'IdCtx-[seq_num]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('identIdentRequest',), (), (None,)),
+    'IdentIdentRequest': ('identIdentRequest', 'IdentQ-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('identMetaSystem',), ('eventInst', 'faultInst', 'identIdentCtx', 'identIdentRequestFsm', 'identIdentRequestFsmTask'), (None,)),
+    'IdentIdentRequestFsm': ('identIdentRequestFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('identIdentRequest',), ('identIdentRequestFsmStage',), (None,)),
+    'IdentIdentRequestFsmStage': ('identIdentRequestFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('identIdentRequestFsm',), (), (None,)),
+    'IdentIdentRequestFsmTask': ('identIdentRequestFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('identIdentRequest',), (), (None,)),
+    'IdentMetaSystem': ('identMetaSystem', 'metasys', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('identMetaVerse',), ('eventInst', 'faultInst', 'identIdentRequest', 'identMetaSystemFsm', 'identMetaSystemFsmTask'), (None,)),
+    'IdentMetaSystemFsm': ('identMetaSystemFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('identMetaSystem',), ('identMetaSystemFsmStage',), (None,)),
+    'IdentMetaSystemFsmStage': ('identMetaSystemFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('identMetaSystemFsm',), (), (None,)),
+    'IdentMetaSystemFsmTask': ('identMetaSystemFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('identMetaSystem',), (), (None,)),
+    'IdentMetaVerse': ('identMetaVerse', 'metaverse', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('identMetaSystem',), (None,)),
+    'IdentRequestEp': ('identRequestEp', 'IdentQ', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('lsServer',), (), (None,)),
+    'IdentSysInfo': ('identSysInfo', '', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'ImgprovPolicy': ('imgprovPolicy', 'img-prov-policy-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server'), ('orgOrg',), ('imgprovTarget',), ('Get',)),
+    'ImgprovTarget': ('imgprovTarget', 'target-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server'), ('imgprovPolicy',), ('imgsecKey',), ('Get',)),
+    'ImgsecKey': ('imgsecKey', 'key-[type]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server'), ('imgprovTarget', 'imgsecPolicy'), (), ('Get',)),
+    'ImgsecPolicy': ('imgsecPolicy', 'img-sec-policy-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server'), ('orgOrg',), ('imgsecKey',), ('Get',)),
+    'InitiatorFcInitiatorEp': ('initiatorFcInitiatorEp', 'fc-ini-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('initiatorGroupEp',), ('storageEpUser',), (None,)),
+    'InitiatorGroupEp': ('initiatorGroupEp', 'grp-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('initiatorRequestorEp',), ('initiatorFcInitiatorEp', 'initiatorIScsiInitiatorEp', 'initiatorStoreEp', 'storageNodeEp'), (None,)),
+    'InitiatorIScsiInitiatorEp': ('initiatorIScsiInitiatorEp', 'scsi-ini-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('initiatorGroupEp',), ('storageEpUser',), (None,)),
+    'InitiatorLunEp': ('initiatorLunEp', 'lun-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('storageIScsiTargetIf',), (), (None,)),
+    'InitiatorMemberEp': ('initiatorMemberEp', 'member-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('initiatorRequestorGrpEp',), (), (None,)),
+    'InitiatorRequestorEp': ('initiatorRequestorEp', 'req-sysid-[sys_id]-id-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('lsServer', 'storageSystem', 'topSystem'), ('initiatorGroupEp',), (None,)),
+    'InitiatorRequestorGrpEp': ('initiatorRequestorGrpEp', 'req-grp-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('initiatorMemberEp', 'initiatorUnitEp'), (None,)),
+    'InitiatorStoreEp': ('initiatorStoreEp', 'store-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('initiatorGroupEp',), (), (None,)),
+    'InitiatorUnitEp': ('initiatorUnitEp', 'unit-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('initiatorRequestorGrpEp',), (), (None,)),
+    'IpDnsSuffix': ('ipDnsSuffix', 'dns-suffix-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('ippoolPool',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'IpIPv4Dns': ('ipIPv4Dns', 'ipv4-dns-[pref]', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'IpIPv4WinsServer': ('ipIPv4WinsServer', 'wins-server-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('ippoolPool',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'IpIpV4StaticAddr': ('ipIpV4StaticAddr', 'addr-[addr]', 'Version211a', 'InputOutput', 1, (), ('admin',), (), (), ('Add', 'Get', 'Remove', 'Set')),
+    'IpIpV4StaticTargetAddr': ('ipIpV4StaticTargetAddr', 'ipv4-addr', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricNetflowCollector',), (), (None,)),
+    'IpServiceIf': ('ipServiceIf', 'serv-ip-[addr]-port-[port]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('storageEtherIf',), (), (None,)),
+    'IppoolAddr': ('ippoolAddr', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('ippoolUniverse',), ('faultInst', 'ippoolPoolable'), ('Get',)),
+    'IppoolBlock': ('ippoolBlock', 'block-[r_from]-[to]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('ippoolPool',), (), ('Add', 'Get', 'Remove')),
+    'IppoolIpV6Addr': ('ippoolIpV6Addr', '[id]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('ippoolUniverse',), ('faultInst', 'ippoolPoolable'), (None,)),
+    'IppoolIpV6Block': ('ippoolIpV6Block', 'v6block-[r_from]-[to]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('ippoolPool',), (), ('Add', 'Get', 'Remove')),
+    'IppoolIpV6Pooled': ('ippoolIpV6Pooled', '[id]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('ippoolPool',), (), (None,)),
+    'IppoolPool': ('ippoolPool', 'ip-pool-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('extvmmNetworkSets', 'orgOrg'), ('faultInst', 'ipDnsSuffix', 'ipIPv4WinsServer', 'ippoolBlock', 'ippoolIpV6Block', 'ippoolIpV6Pooled', 'ippoolPooled'), ('Add', 'Get', 'Remove', 'Set')),
+    'IppoolPoolable': ('ippoolPoolable', 'pool-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('ippoolAddr', 'ippoolIpV6Addr'), (), ('Get',)),
+    'IppoolPooled': ('ippoolPooled', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('ippoolPool',), (), ('Get',)),
+    'IppoolUniverse': ('ippoolUniverse', 'ip', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('ippoolAddr', 'ippoolIpV6Addr'), ('Get',)),
+    'IqnpoolAddr': ('iqnpoolAddr', '[name]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('iqnpoolUniverse',), ('faultInst', 'iqnpoolPoolable'), ('Get',)),
+    'IqnpoolBlock': ('iqnpoolBlock', 'block-[suffix]-from-[r_from]-to-[to]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-storage-policy'), ('iqnpoolPool',), (), ('Add', 'Get', 'Remove')),
+    'IqnpoolFormat': ('iqnpoolFormat', 'format-[format]', 'Version201m', 'InputOutput', 1, (), ('admin',), ('iqnpoolUniverse',), (), ('Get',)),
+    'IqnpoolPool': ('iqnpoolPool', 'iqn-pool-[name]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-storage-policy'), ('orgOrg',), ('faultInst', 'iqnpoolBlock', 'iqnpoolPooled'), ('Add', 'Get', 'Remove', 'Set')),
+    'IqnpoolPoolable': ('iqnpoolPoolable', 'pool-[id]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('iqnpoolAddr',), (), ('Get',)),
+    'IqnpoolPooled': ('iqnpoolPooled', '[name]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('iqnpoolPool',), (), ('Get',)),
+    'IqnpoolTransportBlock': ('iqnpoolTransportBlock', 'block-[suffix]-from-[r_from]-to-[to]', 'Version222c', 'InputOutput', 1, (), ('admin', 'ls-storage-policy'), (), (), (None,)),
+    'IqnpoolUniverse': ('iqnpoolUniverse', 'iqn', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('iqnpoolAddr', 'iqnpoolFormat'), ('Get',)),
+    'IscsiAuthProfile': ('iscsiAuthProfile', 'iscsi-auth-profile-[name]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy'), ('orgOrg',), (), ('Get',)),
+    'LicenseContents': ('licenseContents', 'contents-[feature_name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('licenseFile',), ('licenseFeatureLine',), ('Get',)),
+    'LicenseDownloader': ('licenseDownloader', 'dnld-[file_name]', 'Version141i', 'InputOutput', 1, (), ('admin',), ('licenseEp',), ('eventInst', 'faultInst', 'licenseDownloaderFsm', 'licenseDownloaderFsmTask', 'licenseProp'), ('Get',)),
+    'LicenseDownloaderFsm': ('licenseDownloaderFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('licenseDownloader',), ('licenseDownloaderFsmStage',), (None,)),
+    'LicenseDownloaderFsmStage': ('licenseDownloaderFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('licenseDownloaderFsm',), (), (None,)),
+    'LicenseDownloaderFsmTask': ('licenseDownloaderFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('licenseDownloader',), (), (None,)),
+    'LicenseEp': ('licenseEp', 'license', 'Version141i', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('licenseDownloader', 'licenseFeature', 'licenseFile', 'licenseServerHostId'), ('Get',)),
+    'LicenseFeature': ('licenseFeature', 'feature-[name]-[vendor]-[version]', 'Version141i', 'InputOutput', 1, (), ('admin',), ('licenseEp',), ('licenseInstance',), ('Get',)),
+    'LicenseFeatureCapProvider': ('licenseFeatureCapProvider', 'feature-[feature_name]-[lic_vendor]|[lic_version]manufacturer-[vendor]-model-[model]-revision-[revision]', 'Version141i', 'InputOutput', 1, (), ('',), ('capabilityCatalogue',), (), ('Get',)),
+    'LicenseFeatureLine': ('licenseFeatureLine', 'FeatureLine-[id]:[type]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('licenseContents',), (), ('Get',)),
+    'LicenseFile': ('licenseFile', 'file-[scope]:[id]', 'Version141i', 'InputOutput', 1, (), ('admin',), ('licenseEp',), ('eventInst', 'faultInst', 'licenseContents', 'licenseFileFsm', 'licenseFileFsmTask', 'licenseSource'), ('Get',)),
+    'LicenseFileFsm': ('licenseFileFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('licenseFile',), ('licenseFileFsmStage',), (None,)),
+    'LicenseFileFsmStage': ('licenseFileFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('licenseFileFsm',), (), (None,)),
+    'LicenseFileFsmTask': ('licenseFileFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('licenseFile',), (), (None,)),
+    'LicenseInstance': ('licenseInstance', 'inst-[scope]', 'Version141i', 'InputOutput', 1, (), ('admin',), ('licenseFeature',), ('eventInst', 'faultInst', 'licenseInstanceFsm', 'licenseInstanceFsmTask', 'licenseProp', 'licenseSourceFile', 'licenseTarget'), ('Get',)),
+    'LicenseInstanceFsm': ('licenseInstanceFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('licenseInstance',), ('licenseInstanceFsmStage',), (None,)),
+    'LicenseInstanceFsmStage': ('licenseInstanceFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('licenseInstanceFsm',), (), (None,)),
+    'LicenseInstanceFsmTask': ('licenseInstanceFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('licenseInstance',), (), (None,)),
+    'LicenseProp': ('licenseProp', 'prop-[name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('licenseDownloader', 'licenseInstance'), (), ('Get',)),
+    'LicenseServerHostId': ('licenseServerHostId', 'server-host-id-[scope]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('licenseEp',), (), ('Get',)),
+    'LicenseSource': ('licenseSource', 'source', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('licenseFile',), (), ('Get',)),
+    'LicenseSourceFile': ('licenseSourceFile', 'src-[id]:[line]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('licenseInstance',), (), ('Get',)),
+    'LicenseTarget': ('licenseTarget', 'slot-[slot_id]-aggr-port-[aggr_port_id]-port-[port_id]', 'Version223a', 'InputOutput', 1, (), ('admin',), ('licenseInstance',), (), (None,)),
+    'LldpAcquired': ('lldpAcquired', 'lldp', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('etherPIo', 'etherServerIntFIo', 'fcPIo'), (), ('Get',)),
+    'LsAgentPolicy': ('lsAgentPolicy', 'agent-policy-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy'), ('orgOrg',), (), (None,)),
+    'LsBinding': ('lsBinding', 'pn', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'read-only'), ('lsServer',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsFcLocale': ('lsFcLocale', 'fc-local-[switch_id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-storage'), ('lsServer',), ('lsFcZoneGroup',), (None,)),
+    'LsFcZone': ('lsFcZone', 'zone-[identity]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-storage'), ('lsZoneInitiatorMember',), ('lsZoneTargetMember',), (None,)),
+    'LsFcZoneGroup': ('lsFcZoneGroup', 'zone-group-[id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-storage'), ('lsFcLocale',), ('lsZoneInitiatorMember',), (None,)),
+    'LsIdentityInfo': ('lsIdentityInfo', 'ls-identity-info', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'lsServer'), ('faultInst',), ('Get',)),
+    'LsIssues': ('lsIssues', 'config-issue', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('lsServer',), ('faultInst',), ('Get',)),
+    'LsPower': ('lsPower', 'power', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-oper', 'ls-server-policy', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('lsServer',), (), ('Get', 'Set')),
+    'LsRequirement': ('lsRequirement', 'pn-req', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'read-only'), ('lsServer',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsServer': ('lsServer', 'ls-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('orgOrg',), ('cimcvmediaMountConfigDef', 'computePowerSyncDef', 'eventInst', 'fabricVCon', 'faultInst', 'faultSuppressTask', 'identRequestEp', 'initiatorRequestorEp', 'lsBinding', 'lsFcLocale', 'lsIdentityInfo', 'lsIssues', 'lsPower', 'lsRequirement', 'lsServerAssocCtx', 'lsServerExtension', 'lsServerFsm', 'lsServerFsmTask', 'lsUuidHistory', 'lsVConAssign', 'lsVersionBeh', 'lsbootDef', 'lsmaintAck', 'lstorageProfileBinding', 'lstorageProfileDef', 'mgmtInterface', 'solConfig', 'storageIniGroup', 'storageLocalDiskConfigDef', 'storageVirtualDriveRef', 'vnicConnDef', 'vnicDefBeh', 'vnicDynamicCon', 'vnicEther', 'vnicFc', 'vnicFcNode', 'vnicIScsi', 'vnicIScsiBootParams', 'vnicIScsiLCP', 'vnicIScsiNode', 'vnicIpV4MgmtPooledAddr', 'vnicIpV4PooledAddr', 'vnicIpV4StaticAddr', 'vnicIpc', 'vnicScsi'), ('Add', 'Get', 'Remove', 'Set')),
+    'LsServerAssocCtx': ('lsServerAssocCtx', 'ls-assoc-ctx', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('lsServer',), ('adaptorUnitAssocCtx', 'computePhysicalAssocCtx', 'processorUnitAssocCtx'), ('Get',)),
+    'LsServerExtension': ('lsServerExtension', 'extension', 'Version212a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('lsServer',), (), ('Get', 'Set')),
+    'LsServerFsm': ('lsServerFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('lsServer',), ('lsServerFsmStage',), (None,)),
+    'LsServerFsmStage': ('lsServerFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('lsServerFsm',), (), (None,)),
+    'LsServerFsmTask': ('lsServerFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('lsServer',), (), (None,)),
+    'LsTier': ('lsTier', 'tier-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy'), ('orgOrg',), ('lsServer',), (None,)),
+    'LsUuidHistory': ('lsUuidHistory', 'uuid-history', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('lsServer',), (), (None,)),
+    'LsVConAssign': ('lsVConAssign', 'assign-[transport]-vnic-[vnic_name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('lsServer',), (), ('Get', 'Set')),
+    'LsVersionBeh': ('lsVersionBeh', 'ls-vers-beh', 'Version201q', 'InputOutput', 1, (), ('admin',), ('lsServer',), (), ('Get', 'Set')),
+    'LsZoneInitiatorMember': ('lsZoneInitiatorMember', 'initiator-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-storage'), ('lsFcZoneGroup',), ('lsFcZone',), (None,)),
+    'LsZoneTargetMember': ('lsZoneTargetMember', 'target-[wwpn]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-storage'), ('lsFcZone',), (), (None,)),
+    'LsbootBootSecurity': ('lsbootBootSecurity', 'boot-security', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootDef', 'lsbootPolicy'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootDef': ('lsbootDef', 'boot-policy', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'lsServer'), ('lsbootBootSecurity', 'lsbootEFIShell', 'lsbootIScsi', 'lsbootLan', 'lsbootSan', 'lsbootStorage', 'lsbootVirtualMedia'), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootDefaultLocalImage': ('lsbootDefaultLocalImage', 'local-any', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootEFIShell': ('lsbootEFIShell', 'efi-shell', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootDef', 'lsbootPolicy'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootEmbeddedLocalDiskImage': ('lsbootEmbeddedLocalDiskImage', 'embedded-local-jbod', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), ('lsbootEmbeddedLocalDiskImagePath',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootEmbeddedLocalDiskImagePath': ('lsbootEmbeddedLocalDiskImagePath', 'diskimgpath-[type]', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootEmbeddedLocalDiskImage',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootEmbeddedLocalLunImage': ('lsbootEmbeddedLocalLunImage', 'embedded-local-lun', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootIScsi': ('lsbootIScsi', 'iscsi', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootDef', 'lsbootPolicy'), ('lsbootIScsiImagePath',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootIScsiImagePath': ('lsbootIScsiImagePath', 'path-[type]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootIScsi',), ('lsbootUEFIBootParam',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootLan': ('lsbootLan', 'lan', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootDef', 'lsbootPolicy'), ('lsbootLanImagePath',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootLanImagePath': ('lsbootLanImagePath', 'path-[type]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLan',), ('lsbootUEFIBootParam', 'vnicIpV4StaticAddr'), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootLocalDiskImage': ('lsbootLocalDiskImage', 'local-jbod', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), ('lsbootLocalDiskImagePath',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootLocalDiskImagePath': ('lsbootLocalDiskImagePath', 'diskimgpath-[type]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalDiskImage',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootLocalHddImage': ('lsbootLocalHddImage', 'local-hdd', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), ('lsbootLocalLunImagePath', 'lsbootUEFIBootParam'), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootLocalLunImagePath': ('lsbootLocalLunImagePath', 'lunimgpath-[type]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalHddImage',), ('lsbootUEFIBootParam',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootLocalStorage': ('lsbootLocalStorage', 'local-storage', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootStorage',), ('lsbootDefaultLocalImage', 'lsbootEmbeddedLocalDiskImage', 'lsbootEmbeddedLocalLunImage', 'lsbootLocalDiskImage', 'lsbootLocalHddImage', 'lsbootUsbExternalImage', 'lsbootUsbFlashStorageImage', 'lsbootUsbInternalImage'), ('Add', 'Get', 'Remove')),
+    'LsbootPolicy': ('lsbootPolicy', 'boot-policy-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage-policy'), ('orgOrg', 'policySystemEp'), ('lsbootBootSecurity', 'lsbootEFIShell', 'lsbootIScsi', 'lsbootLan', 'lsbootSan', 'lsbootStorage', 'lsbootVirtualMedia'), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootSan': ('lsbootSan', 'san', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootDef', 'lsbootPolicy'), ('lsbootSanCatSanImage',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootSanCatSanImage': ('lsbootSanCatSanImage', 'sanimg-[type]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootSan',), ('lsbootSanCatSanImagePath',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootSanCatSanImagePath': ('lsbootSanCatSanImagePath', 'sanimgpath-[type]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootSanCatSanImage',), ('lsbootUEFIBootParam',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootSanImage': ('lsbootSanImage', 'san-[type]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootStorage',), ('lsbootSanImagePath',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootSanImagePath': ('lsbootSanImagePath', 'path-[type]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootSanImage',), ('lsbootUEFIBootParam',), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootStorage': ('lsbootStorage', 'storage', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootDef', 'lsbootPolicy'), ('lsbootLocalStorage', 'lsbootSanImage'), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootUEFIBootParam': ('lsbootUEFIBootParam', 'uefi-boot-param', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-config-policy', 'ls-server-policy', 'ls-storage-policy'), ('lsbootIScsiImagePath', 'lsbootLanImagePath', 'lsbootLocalHddImage', 'lsbootLocalLunImagePath', 'lsbootSanCatSanImagePath', 'lsbootSanImagePath'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootUsbExternalImage': ('lsbootUsbExternalImage', 'usb-extern', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootUsbFlashStorageImage': ('lsbootUsbFlashStorageImage', 'sd-card', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootUsbInternalImage': ('lsbootUsbInternalImage', 'usb-intern', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootLocalStorage',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsbootVirtualMedia': ('lsbootVirtualMedia', '[access]-vm', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('lsbootDef', 'lsbootPolicy'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LsmaintAck': ('lsmaintAck', 'ack', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-server-oper'), ('lsServer',), ('faultInst', 'trigLocalSched'), ('Get', 'Set')),
+    'LsmaintMaintPolicy': ('lsmaintMaintPolicy', 'maint-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy'), ('orgOrg',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageControllerDef': ('lstorageControllerDef', 'controller-def-[name]', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lstorageProfile', 'lstorageProfileDef', 'storageController'), ('lstorageControllerModeConfig', 'lstorageControllerQualifier'), ('Add', 'Get', 'Remove')),
+    'LstorageControllerModeConfig': ('lstorageControllerModeConfig', 'controller-mode-config', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lstorageControllerDef',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageControllerQualifier': ('lstorageControllerQualifier', 'controller-qual', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lstorageControllerDef',), (), (None,)),
+    'LstorageControllerRef': ('lstorageControllerRef', 'server-[server_id]-controller-[controller_type]-[controller_id]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('lstorageDiskSlot',), (), ('Add', 'Get', 'Remove')),
+    'LstorageDasScsiLun': ('lstorageDasScsiLun', 'das-scsi-lun-[name]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lstorageProfile', 'lstorageProfileDef'), ('faultInst', 'storageLocalDiskConfigDef'), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageDiskGroupConfigDef': ('lstorageDiskGroupConfigDef', 'disk-group-config', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('storageVirtualDriveRef',), ('lstorageDiskGroupQualifier', 'lstorageLocalDiskConfigRef', 'lstorageVirtualDriveDef'), ('Get',)),
+    'LstorageDiskGroupConfigPolicy': ('lstorageDiskGroupConfigPolicy', 'disk-group-config-[name]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('lstorageDiskGroupQualifier', 'lstorageLocalDiskConfigRef', 'lstorageVirtualDriveDef'), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageDiskGroupQualifier': ('lstorageDiskGroupQualifier', 'disk-group-qual', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lstorageDiskGroupConfigDef', 'lstorageDiskGroupConfigPolicy'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageDiskSlot': ('lstorageDiskSlot', 'disk-slot-[id]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('lstorageDiskZoningConfigDef', 'lstorageDiskZoningPolicy'), ('lstorageControllerRef',), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageDiskZoningConfigDef': ('lstorageDiskZoningConfigDef', 'disk-zoning-def', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('equipmentChassisProfile',), ('lstorageDiskSlot',), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageDiskZoningPolicy': ('lstorageDiskZoningPolicy', 'disk-zoning-policy-[name]', 'Version312b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('orgOrg',), ('lstorageDiskSlot',), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageLocalDiskConfigRef': ('lstorageLocalDiskConfigRef', 'slot-[slot_num]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lstorageDiskGroupConfigDef', 'lstorageDiskGroupConfigPolicy'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageLocalDiskRef': ('lstorageLocalDiskRef', 'diskref-[enclosure_id]-slot-[slot_id]', 'Version251a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'LstorageProfile': ('lstorageProfile', 'profile-[name]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('lstorageControllerDef', 'lstorageDasScsiLun'), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageProfileBinding': ('lstorageProfileBinding', 'profile-binding', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lsServer',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageProfileDef': ('lstorageProfileDef', 'profile-def', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lsServer',), ('lstorageControllerDef', 'lstorageDasScsiLun'), ('Add', 'Get', 'Remove', 'Set')),
+    'LstorageVirtualDriveDef': ('lstorageVirtualDriveDef', 'virtual-drive-def', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lstorageDiskGroupConfigDef', 'lstorageDiskGroupConfigPolicy'), (), ('Get', 'Set')),
+    'MacpoolAddr': ('macpoolAddr', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('macpoolUniverse',), ('faultInst', 'macpoolPoolable'), ('Get',)),
+    'MacpoolBlock': ('macpoolBlock', 'block-[r_from]-[to]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('macpoolPool',), (), ('Add', 'Get', 'Remove')),
+    'MacpoolFormat': ('macpoolFormat', 'format-[format]-[mask]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'ls-network', 'ls-network-policy'), ('macpoolUniverse',), (), ('Get',)),
+    'MacpoolPool': ('macpoolPool', 'mac-pool-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network-policy'), ('orgOrg',), ('faultInst', 'macpoolBlock', 'macpoolPooled'), ('Add', 'Get', 'Remove', 'Set')),
+    'MacpoolPoolable': ('macpoolPoolable', 'pool-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('macpoolAddr',), (), ('Get',)),
+    'MacpoolPooled': ('macpoolPooled', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('macpoolPool',), (), ('Get',)),
+    'MacpoolUniverse': ('macpoolUniverse', 'mac', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('macpoolAddr', 'macpoolFormat'), (None,)),
+    'MemoryArray': ('memoryArray', 'memarray-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), ('faultInst', 'memoryArrayEnvStats', 'memoryUnit'), ('Get',)),
+    'MemoryArrayEnvStats': ('memoryArrayEnvStats', 'array-env-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('memoryArray',), ('memoryArrayEnvStatsHist',), ('Get',)),
+    'MemoryArrayEnvStatsHist': ('memoryArrayEnvStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('memoryArrayEnvStats',), (), ('Get',)),
+    'MemoryBufferUnit': ('memoryBufferUnit', 'sensor-unit-[id]', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), ('faultInst', 'memoryBufferUnitEnvStats'), ('Get',)),
+    'MemoryBufferUnitEnvStats': ('memoryBufferUnitEnvStats', 'buffer-unit-env-stats', 'Version131c', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('memoryBufferUnit',), ('memoryBufferUnitEnvStatsHist',), ('Get',)),
+    'MemoryBufferUnitEnvStatsHist': ('memoryBufferUnitEnvStatsHist', '[id]', 'Version131c', 'OutputOnly', 1, (), ('read-only',), ('memoryBufferUnitEnvStats',), (), ('Get',)),
+    'MemoryErrorStats': ('memoryErrorStats', 'error-stats', 'Version131c', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('memoryUnit',), (), ('Get',)),
+    'MemoryQual': ('memoryQual', 'memory', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'MemoryRuntime': ('memoryRuntime', '[type]-mem-rt', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBlade',), ('memoryRuntimeHist',), ('Get',)),
+    'MemoryRuntimeHist': ('memoryRuntimeHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('memoryRuntime',), (), ('Get',)),
+    'MemoryUnit': ('memoryUnit', 'mem-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-maintenance', 'pn-policy'), ('memoryArray',), ('faultInst', 'memoryErrorStats', 'memoryUnitEnvStats'), ('Get',)),
+    'MemoryUnitEnvStats': ('memoryUnitEnvStats', 'dimm-env-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('memoryUnit',), ('memoryUnitEnvStatsHist',), ('Get',)),
+    'MemoryUnitEnvStatsHist': ('memoryUnitEnvStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('memoryUnitEnvStats',), (), ('Get',)),
+    'MgmtAccessPolicy': ('mgmtAccessPolicy', 'ext-access-policy', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('mgmtAccessPolicyItem',), ('Get',)),
+    'MgmtAccessPolicyItem': ('mgmtAccessPolicyItem', 'item-[subject]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('mgmtAccessPolicy',), ('mgmtAccessPort',), ('Get',)),
+    'MgmtAccessPort': ('mgmtAccessPort', '[protocol]-port-[port]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('mgmtAccessPolicyItem',), (), ('Get',)),
+    'MgmtBackup': ('mgmtBackup', 'backup-[hostname]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('eventInst', 'faultInst', 'mgmtBackupFsm', 'mgmtBackupFsmTask'), ('Add', 'Get', 'Remove')),
+    'MgmtBackupExportExtPolicy': ('mgmtBackupExportExtPolicy', 'backup-exp-policy', 'Version222c', 'InputOutput', 1, (), ('admin',), ('orgOrg',), (), ('Get', 'Set')),
+    'MgmtBackupFsm': ('mgmtBackupFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtBackup',), ('mgmtBackupFsmStage',), (None,)),
+    'MgmtBackupFsmStage': ('mgmtBackupFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtBackupFsm',), (), (None,)),
+    'MgmtBackupFsmTask': ('mgmtBackupFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('mgmtBackup',), (), (None,)),
+    'MgmtBackupPolicy': ('mgmtBackupPolicy', 'db-backup-policy-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('orgOrg',), ('eventInst', 'faultInst', 'mgmtBackupPolicyFsm', 'mgmtExportPolicyFsm', 'mgmtExportPolicyFsmTask'), ('Get', 'Set')),
+    'MgmtBackupPolicyConfig': ('mgmtBackupPolicyConfig', 'bkup-policy-cfg', 'Version222c', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('faultInst', 'trigLocalSched'), ('Get',)),
+    'MgmtBackupPolicyFsm': ('mgmtBackupPolicyFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtBackupPolicy',), ('mgmtBackupPolicyFsmStage',), (None,)),
+    'MgmtBackupPolicyFsmStage': ('mgmtBackupPolicyFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtBackupPolicyFsm',), (), (None,)),
+    'MgmtCfgExportPolicy': ('mgmtCfgExportPolicy', 'cfg-exp-policy-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('orgOrg',), ('eventInst', 'faultInst', 'mgmtCfgExportPolicyFsm', 'mgmtExportPolicyFsm', 'mgmtExportPolicyFsmTask'), ('Get', 'Set')),
+    'MgmtCfgExportPolicyFsm': ('mgmtCfgExportPolicyFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtCfgExportPolicy',), ('mgmtCfgExportPolicyFsmStage',), (None,)),
+    'MgmtCfgExportPolicyFsmStage': ('mgmtCfgExportPolicyFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtCfgExportPolicyFsm',), (), (None,)),
+    'MgmtCimcSecureBoot': ('mgmtCimcSecureBoot', 'mgmt-secure-boot', 'Version223a', 'InputOutput', 1, (), ('admin', 'ls-compute'), ('mgmtController',), (), ('Get', 'Set')),
+    'MgmtCmcSecureBoot': ('mgmtCmcSecureBoot', 'mgmt-cmc-secure-boot', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute'), ('mgmtController',), (), ('Get', 'Set')),
+    'MgmtConnection': ('mgmtConnection', 'mgmt-connection-[type]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('mgmtController',), ('faultInst',), ('Get', 'Set')),
+    'MgmtController': ('mgmtController', 'mgmt', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('adaptorUnit', 'computeBlade', 'computeBoardController', 'computeExtBoard', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFex', 'equipmentIOCard', 'equipmentSharedIOModule', 'equipmentSwitchIOCard', 'equipmentSystemIOController', 'networkElement', 'storageController', 'storageLocalDisk', 'storageSasExpander', 'topSystem'), ('cimcvmediaActualMountList', 'eventInst', 'fabricLocale', 'faultInst', 'firmwareBootDefinition', 'firmwareRunning', 'firmwareUpdatable', 'mgmtCimcSecureBoot', 'mgmtCmcSecureBoot', 'mgmtConnection', 'mgmtControllerFsm', 'mgmtControllerFsmTask', 'mgmtHealthStatus', 'mgmtIf', 'mgmtInterface', 'mgmtProfDerivedInterface', 'sysdebugMEpLog', 'vnicIpV4PooledAddr', 'vnicIpV4ProfDerivedAddr', 'vnicIpV4StaticAddr'), ('Get',)),
+    'MgmtControllerFsm': ('mgmtControllerFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtController',), ('mgmtControllerFsmStage',), (None,)),
+    'MgmtControllerFsmStage': ('mgmtControllerFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtControllerFsm',), (), (None,)),
+    'MgmtControllerFsmTask': ('mgmtControllerFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('mgmtController',), (), (None,)),
+    'MgmtEntity': ('mgmtEntity', 'mgmt-entity-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('faultInst', 'mgmtPmonEntry'), ('Get',)),
+    'MgmtExportPolicyFsm': ('mgmtExportPolicyFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtBackupPolicy', 'mgmtCfgExportPolicy'), ('mgmtExportPolicyFsmStage',), (None,)),
+    'MgmtExportPolicyFsmStage': ('mgmtExportPolicyFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtExportPolicyFsm',), (), (None,)),
+    'MgmtExportPolicyFsmTask': ('mgmtExportPolicyFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtBackupPolicy', 'mgmtCfgExportPolicy'), (), (None,)),
+    'MgmtHealthAttr': ('mgmtHealthAttr', '[name]', 'Version311e', 'InputOutput', 1, (), ('read-only',), ('mgmtHealthStatus',), (), ('Get',)),
+    'MgmtHealthStatus': ('mgmtHealthStatus', 'health', 'Version311e', 'InputOutput', 1, (), ('read-only',), ('mgmtController', 'networkElement'), ('faultInst', 'mgmtHealthAttr'), ('Get',)),
+    'MgmtIPv6IfAddr': ('mgmtIPv6IfAddr', 'if-ipv6', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('mgmtIPv6IfConfig',), ('eventInst', 'faultInst', 'mgmtIPv6IfAddrFsm', 'mgmtIPv6IfAddrFsmTask'), ('Get', 'Set')),
+    'MgmtIPv6IfAddrFsm': ('mgmtIPv6IfAddrFsm', 'fsm', 'Version221b', 'OutputOnly', 1, (), ('',), ('mgmtIPv6IfAddr',), ('mgmtIPv6IfAddrFsmStage',), (None,)),
+    'MgmtIPv6IfAddrFsmStage': ('mgmtIPv6IfAddrFsmStage', 'stage-[name]', 'Version221b', 'OutputOnly', 1, (), ('',), ('mgmtIPv6IfAddrFsm',), (), (None,)),
+    'MgmtIPv6IfAddrFsmTask': ('mgmtIPv6IfAddrFsmTask', 'task-[item]', 'Version221b', 'OutputOnly', 1, (), ('',), ('mgmtIPv6IfAddr',), (), (None,)),
+    'MgmtIPv6IfConfig': ('mgmtIPv6IfConfig', 'ifConfig-ipv6', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('mgmtIf', 'networkElement'), ('mgmtIPv6IfAddr',), ('Get',)),
+    'MgmtIf': ('mgmtIf', 'if-[id]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('adaptorHostEthIf', 'mgmtController'), ('dhcpAcquired', 'eventInst', 'faultInst', 'mgmtIPv6IfConfig', 'mgmtIfFsm', 'mgmtIfFsmTask'), ('Get',)),
+    'MgmtIfFsm': ('mgmtIfFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtIf',), ('mgmtIfFsmStage',), (None,)),
+    'MgmtIfFsmStage': ('mgmtIfFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtIfFsm',), (), (None,)),
+    'MgmtIfFsmTask': ('mgmtIfFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('mgmtIf',), (), (None,)),
+    'MgmtImporter': ('mgmtImporter', 'import-config-[hostname]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('eventInst', 'faultInst', 'mgmtImporterFsm', 'mgmtImporterFsmTask'), ('Add', 'Get', 'Remove', 'Set')),
+    'MgmtImporterFsm': ('mgmtImporterFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtImporter',), ('mgmtImporterFsmStage',), (None,)),
+    'MgmtImporterFsmStage': ('mgmtImporterFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('mgmtImporterFsm',), (), (None,)),
+    'MgmtImporterFsmTask': ('mgmtImporterFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('mgmtImporter',), (), (None,)),
+    'MgmtInbandProfile': ('mgmtInbandProfile', 'ib-profile', 'Version221b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy'), ('fabricLanCloud',), (), ('Get', 'Set')),
+    'MgmtIntAuthPolicy': ('mgmtIntAuthPolicy', 'int-mgmt-auth', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-security'), ('topSystem',), (), ('Get',)),
+    'MgmtInterface': ('mgmtInterface', 'iface-[mode]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('lsServer', 'mgmtController'), ('faultInst', 'mgmtVnet'), ('Add', 'Get', 'Remove', 'Set')),
+    'MgmtMgmtDbState': ('mgmtMgmtDbState', 'mgmt-db-state', 'Version227b', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('faultInst',), (None,)),
+    'MgmtPmonEntry': ('mgmtPmonEntry', '[name]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('mgmtEntity',), ('faultInst',), ('Get',)),
+    'MgmtProfDerivedInterface': ('mgmtProfDerivedInterface', 'spiface-[mode]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('mgmtController',), ('mgmtVnet',), ('Get',)),
+    'MgmtVnet': ('mgmtVnet', 'network', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('mgmtInterface', 'mgmtProfDerivedInterface'), ('vnicIpV4MgmtPooledAddr', 'vnicIpV4PooledAddr', 'vnicIpV4StaticAddr', 'vnicIpV6MgmtPooledAddr', 'vnicIpV6StaticAddr'), ('Add', 'Get', 'Remove', 'Set')),
+    'MorefFruRef': ('morefFruRef', '[class_name]-vendor-[vendor]-model-[model]-serial-[serial]', 'Version227b', 'InputOutput', 1, (), ('admin',), ('morefImportRoot',), ('morefProp', 'morefRef'), ('Add', 'Get', 'Remove')),
+    'MorefImportRoot': ('morefImportRoot', 'import-ref-root', 'Version227b', 'InputOutput', 1, (), ('admin',), ('topRoot',), ('eventInst', 'faultInst', 'morefFruRef', 'morefImportRootFsm', 'morefImportRootFsmTask', 'morefRef'), ('Add', 'Get', 'Remove')),
+    'MorefImportRootFsm': ('morefImportRootFsm', 'fsm', 'Version227b', 'OutputOnly', 1, (), ('',), ('morefImportRoot',), ('morefImportRootFsmStage',), (None,)),
+    'MorefImportRootFsmStage': ('morefImportRootFsmStage', 'stage-[name]', 'Version227b', 'OutputOnly', 1, (), ('',), ('morefImportRootFsm',), (), (None,)),
+    'MorefImportRootFsmTask': ('morefImportRootFsmTask', 'task-[item]', 'Version227b', 'OutputOnly', 1, (), ('',), ('morefImportRoot',), (), (None,)),
+    'MorefProp': ('morefProp', '[name]', 'Version227b', 'InputOutput', 1, (), ('admin',), ('morefFruRef', 'morefRef'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'MorefRef': ('morefRef', '[mo_rn]', 'Version227b', 'InputOutput', 1, (), ('admin',), ('morefFruRef', 'morefImportRoot', 'morefRef'), ('morefProp', 'morefRef'), ('Add', 'Get', 'Remove')),
+    'NetworkElement': ('networkElement', 'switch-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('topSystem',), ('equipmentFan', 'equipmentFanModule', 'equipmentLocatorLed', 'equipmentPsu', 'equipmentSwitchCard', 'extmgmtIf', 'faultInst', 'firmwareStatus', 'mgmtController', 'mgmtHealthStatus', 'mgmtIPv6IfConfig', 'mgmtMgmtDbState', 'networkLanNeighbors', 'networkLldpNeighbors', 'networkOperLevel', 'networkSanNeighbors', 'nfsMountInst', 'powerBudget', 'storageItem', 'swAccessDomain', 'swCardEnvStats', 'swEnvStats', 'swEthLanBorder', 'swEthLanFlowMon', 'swEthLanMon', 'swExtUtility', 'swFabricZoneNs', 'swFcSanBorder', 'swFcSanMon', 'swPhys', 'swSystemStats', 'swUtilityDomain', 'swVlanPortNs'), ('Get', 'Set')),
+    'NetworkIfStats': ('networkIfStats', 'if-stat-[type]-[units]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('adaptorHostEthIf', 'adaptorHostFcIf', 'adaptorHostIscsiIf', 'adaptorHostScsiIf', 'adaptorHostServiceEthIf', 'etherPIo', 'fcPIo'), (), ('Get',)),
+    'NetworkLanNeighborEntry': ('networkLanNeighborEntry', 'if-[local_interface]', 'Version223a', 'InputOutput', 1, (), ('read-only',), ('networkLanNeighbors',), (), ('Get',)),
+    'NetworkLanNeighbors': ('networkLanNeighbors', 'lan-neighbors', 'Version223a', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('networkLanNeighborEntry',), ('Get',)),
+    'NetworkLldpNeighborEntry': ('networkLldpNeighborEntry', 'if-[local_interface]', 'Version224b', 'InputOutput', 1, (), ('read-only',), ('networkLldpNeighbors',), (), ('Get',)),
+    'NetworkLldpNeighbors': ('networkLldpNeighbors', 'lldp-neighbors', 'Version224b', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('networkLldpNeighborEntry',), ('Get',)),
+    'NetworkOperLevel': ('networkOperLevel', 'oper-level', 'Version212a', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('networkElement',), ('faultInst',), (None,)),
+    'NetworkSanNeighborEntry': ('networkSanNeighborEntry', 'if-[local_interface]', 'Version223a', 'InputOutput', 1, (), ('read-only',), ('networkSanNeighbors',), (), ('Get',)),
+    'NetworkSanNeighbors': ('networkSanNeighbors', 'san-neighbors', 'Version223a', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('networkSanNeighborEntry',), ('Get',)),
+    'NfsEp': ('nfsEp', 'nfs-ep', 'Version211a', 'InputOutput', 1, (), ('admin',), ('topRoot',), ('nfsMountDef',), (None,)),
+    'NfsMountDef': ('nfsMountDef', 'nfs-mount-def-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('nfsEp',), ('eventInst', 'faultInst', 'nfsMountDefFsm', 'nfsMountDefFsmTask'), ('Get',)),
+    'NfsMountDefFsm': ('nfsMountDefFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('nfsMountDef',), ('nfsMountDefFsmStage',), (None,)),
+    'NfsMountDefFsmStage': ('nfsMountDefFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('nfsMountDefFsm',), (), (None,)),
+    'NfsMountDefFsmTask': ('nfsMountDefFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('nfsMountDef',), (), (None,)),
+    'NfsMountInst': ('nfsMountInst', 'nfs-mount-inst-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('networkElement',), ('eventInst', 'faultInst', 'nfsMountInstFsm', 'nfsMountInstFsmTask'), ('Get',)),
+    'NfsMountInstFsm': ('nfsMountInstFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('nfsMountInst',), ('nfsMountInstFsmStage',), (None,)),
+    'NfsMountInstFsmStage': ('nfsMountInstFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('nfsMountInstFsm',), (), (None,)),
+    'NfsMountInstFsmTask': ('nfsMountInstFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('nfsMountInst',), (), (None,)),
+    'NwctrlDefinition': ('nwctrlDefinition', 'nwctrl-[name]', 'Version102d', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricEthEstcCloud', 'orgOrg', 'policySystemEp'), ('dpsecMac',), ('Add', 'Get', 'Remove', 'Set')),
+    'ObserveFilter': ('observeFilter', 'filter-[filter_class_id]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('observeObserved',), (), (None,)),
+    'ObserveObserved': ('observeObserved', 'observed-[data_src_sys_id]-[id]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolClient', 'extpolController', 'extpolProvider', 'extpolRegistry', 'observeObservedCont'), ('eventInst', 'faultInst', 'observeFilter', 'observeObservedFsm', 'observeObservedFsmTask'), (None,)),
+    'ObserveObservedCont': ('observeObservedCont', 'observe', 'Version211a', 'InputOutput', 1, (), ('admin',), ('topRoot',), ('observeObserved',), (None,)),
+    'ObserveObservedFsm': ('observeObservedFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('observeObserved',), ('observeObservedFsmStage',), (None,)),
+    'ObserveObservedFsmStage': ('observeObservedFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('observeObservedFsm',), (), (None,)),
+    'ObserveObservedFsmTask': ('observeObservedFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('observeObserved',), (), (None,)),
+    'OrgOrg': ('orgOrg', 'org-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'org-management'), ('orgOrg',), ('aaaEpAuthProfile', 'adaptorHostEthIfProfile', 'adaptorHostFcIfProfile', 'adaptorHostIscsiIfProfile', 'biosVProfile', 'cimcvmediaMountConfigPolicy', 'commSvcPolicy', 'computeAutoconfigPolicy', 'computeBladeDiscPolicy', 'computeBladeInheritPolicy', 'computeChassisConnPolicy', 'computeChassisDiscPolicy', 'computeKvmMgmtPolicy', 'computeMemoryConfigPolicy', 'computePool', 'computePoolingPolicy', 'computePowerSyncPolicy', 'computePsuPolicy', 'computeQual', 'computeScrubPolicy', 'computeServerDiscPolicy', 'computeServerMgmtPolicy', 'cpmaintMaintPolicy', 'diagRunPolicy', 'epqosDefinition', 'epqosDefinitionDelTask', 'equipmentAutoconfigPolicy', 'equipmentChassisInheritPolicy', 'equipmentChassisProfile', 'equipmentPool', 'equipmentPoolingPolicy', 'equipmentQual', 'equipmentTier', 'fabricLacpPolicy', 'fabricLanCloudPolicy', 'fabricMulticastPolicy', 'fabricOrgVlanPolicy', 'fabricUdldPolicy', 'fabricVConProfile', 'fabricVlanGroupReq', 'fabricVlanPermit', 'fabricVlanReq', 'faultSuppressTask', 'fcpoolInitiators', 'firmwareAutoSyncPolicy', 'firmwareCatalogPack', 'firmwareChassisPack', 'firmwareComputeHostPack', 'firmwareComputeMgmtPack', 'firmwareInfraPack', 'hostimgPolicy', 'imgprovPolicy', 'imgsecPolicy', 'ippoolPool', 'iqnpoolPool', 'iscsiAuthProfile', 'lsAgentPolicy', 'lsServer', 'lsTier', 'lsbootPolicy', 'lsmaintMaintPolicy', 'lstorageDiskGroupConfigPolicy', 'lstorageDiskZoningPolicy', 'lstorageProfile', 'macpoolPool', 'mgmtBackupExportExtPolicy', 'mgmtBackupPolicy', 'mgmtCfgExportPolicy', 'nwctrlDefinition', 'orgOrg', 'orgSourceMask', 'powerGroupAdditionPolicy', 'powerMgmtPolicy', 'powerPlacement', 'powerPolicy', 'solPolicy', 'statsThresholdPolicy', 'storageConnectionPolicy', 'storageLocalDiskConfigPolicy', 'sysdebugMEpLogPolicy', 'topInfoSyncPolicy', 'trigTest', 'uuidpoolPool', 'vmLifeCyclePolicy', 'vnicDynamicConPolicy', 'vnicFcGroupTempl', 'vnicIScsiInitAutoConfigPolicy', 'vnicLanConnPolicy', 'vnicLanConnTempl', 'vnicSanConnPolicy', 'vnicSanConnTempl', 'vnicUsnicConPolicy', 'vnicVhbaBehPolicy', 'vnicVmqConPolicy', 'vnicVnicBehPolicy'), ('Add', 'Get', 'Remove', 'Set')),
+    'OrgSourceMask': ('orgSourceMask', 'src-mask', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('orgOrg',), (), (None,)),
+    'OsARPLinkMonitoringPolicy': ('osARPLinkMonitoringPolicy', 'link-mon-pol', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), ('osARPTarget',), (None,)),
+    'OsARPTarget': ('osARPTarget', 'arp-target-[name]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osARPLinkMonitoringPolicy',), (), (None,)),
+    'OsAgent': ('osAgent', 'agent', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'OsEthBondIntf': ('osEthBondIntf', 'bond-intf-[name]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osInstance',), ('osARPLinkMonitoringPolicy', 'osEthBondModeActiveBackup', 'osEthBondModeBalancedALB', 'osEthBondModeBalancedRR', 'osEthBondModeBalancedTLB', 'osEthBondModeBalancedXOR', 'osEthBondModeBroadcast', 'osEthIntf', 'osMiiLinkMonitoringPolicy'), (None,)),
+    'OsEthBondModeActiveBackup': ('osEthBondModeActiveBackup', 'eth-bond-mode', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), ('osPrimarySlave',), (None,)),
+    'OsEthBondModeBalancedALB': ('osEthBondModeBalancedALB', 'eth-bond-mode', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), ('osPrimarySlave',), (None,)),
+    'OsEthBondModeBalancedRR': ('osEthBondModeBalancedRR', 'eth-bond-mode', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), ('osPrimarySlave',), (None,)),
+    'OsEthBondModeBalancedTLB': ('osEthBondModeBalancedTLB', 'eth-bond-mode', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), ('osPrimarySlave',), (None,)),
+    'OsEthBondModeBalancedXOR': ('osEthBondModeBalancedXOR', 'eth-bond-mode', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), ('osPrimarySlave',), (None,)),
+    'OsEthBondModeBroadcast': ('osEthBondModeBroadcast', 'eth-bond-mode', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), ('osPrimarySlave',), (None,)),
+    'OsEthIntf': ('osEthIntf', 'intf-[name]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf', 'osInstance'), (), (None,)),
+    'OsInstance': ('osInstance', 'os', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), ('osEthBondIntf', 'osEthIntf'), ('Get',)),
+    'OsMiiLinkMonitoringPolicy': ('osMiiLinkMonitoringPolicy', 'link-mon-pol', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondIntf',), (), (None,)),
+    'OsPrimarySlave': ('osPrimarySlave', 'slave-intf-[name]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('osEthBondModeActiveBackup', 'osEthBondModeBalancedALB', 'osEthBondModeBalancedRR', 'osEthBondModeBalancedTLB', 'osEthBondModeBalancedXOR', 'osEthBondModeBroadcast'), (), (None,)),
+    'PciEquipSlot': ('pciEquipSlot', 'equipped-slot-[id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'PciUnit': ('pciUnit', 'unit-[id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'PkiCertReq': ('pkiCertReq', 'certreq', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('pkiKeyRing',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'PkiEp': ('pkiEp', 'pki-ext', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('eventInst', 'faultInst', 'pkiEpFsm', 'pkiEpFsmTask', 'pkiKeyRing', 'pkiTP'), ('Get',)),
+    'PkiEpFsm': ('pkiEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('pkiEp',), ('pkiEpFsmStage',), (None,)),
+    'PkiEpFsmStage': ('pkiEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('pkiEpFsm',), (), (None,)),
+    'PkiEpFsmTask': ('pkiEpFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('pkiEp',), (), (None,)),
+    'PkiKeyRing': ('pkiKeyRing', 'keyring-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('pkiEp',), ('faultInst', 'pkiCertReq'), ('Add', 'Get', 'Remove', 'Set')),
+    'PkiTP': ('pkiTP', 'tp-[name]', 'Version101e', 'InputOutput', 1, (), ('aaa', 'admin'), ('pkiEp',), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'PolicyCentraleSync': ('policyCentraleSync', 'centrale-sync', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('policyControlEp',), (), (None,)),
+    'PolicyCommunication': ('policyCommunication', 'comm-ctrl', 'Version211a', 'InputOutput', 1, (), ('aaa', 'admin'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyConfigBackup': ('policyConfigBackup', 'cfg-backup-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'operations'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyControlEp': ('policyControlEp', 'control-ep-[type]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('eventInst', 'faultInst', 'policyCentraleSync', 'policyCommunication', 'policyConfigBackup', 'policyControlEpFsm', 'policyControlEpFsmTask', 'policyDateTime', 'policyDiscovery', 'policyDns', 'policyEquipment', 'policyFault', 'policyIdResolvePolicy', 'policyInfraFirmware', 'policyMEp', 'policyMonitoring', 'policyPortConfig', 'policyPowerMgmt', 'policyPsu', 'policySecurity', 'policyStorageAutoConfig'), ('Add', 'Get', 'Remove', 'Set')),
+    'PolicyControlEpFsm': ('policyControlEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('policyControlEp',), ('policyControlEpFsmStage',), (None,)),
+    'PolicyControlEpFsmStage': ('policyControlEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('policyControlEpFsm',), (), (None,)),
+    'PolicyControlEpFsmTask': ('policyControlEpFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('policyControlEp',), (), (None,)),
+    'PolicyControlledInstance': ('policyControlledInstance', 'ctrlled-[type]-inst-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('policyCommunication', 'policyConfigBackup', 'policyDateTime', 'policyDiscovery', 'policyDns', 'policyEquipment', 'policyFault', 'policyInfraFirmware', 'policyMEp', 'policyMonitoring', 'policyPortConfig', 'policyPowerMgmt', 'policyPsu', 'policySecurity', 'policyStorageAutoConfig'), (), (None,)),
+    'PolicyControlledType': ('policyControlledType', 'ctrlled-type-[type]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('policyCommunication', 'policyConfigBackup', 'policyDateTime', 'policyDiscovery', 'policyDns', 'policyEquipment', 'policyFault', 'policyInfraFirmware', 'policyMEp', 'policyMonitoring', 'policyPortConfig', 'policyPowerMgmt', 'policyPsu', 'policySecurity', 'policyStorageAutoConfig'), ('eventInst', 'faultInst', 'policyControlledTypeFsm', 'policyControlledTypeFsmTask'), (None,)),
+    'PolicyControlledTypeFsm': ('policyControlledTypeFsm', 'fsm', 'Version212a', 'OutputOnly', 1, (), ('',), ('policyControlledType',), ('policyControlledTypeFsmStage',), (None,)),
+    'PolicyControlledTypeFsmStage': ('policyControlledTypeFsmStage', 'stage-[name]', 'Version212a', 'OutputOnly', 1, (), ('',), ('policyControlledTypeFsm',), (), (None,)),
+    'PolicyControlledTypeFsmTask': ('policyControlledTypeFsmTask', 'task-[item]', 'Version212a', 'OutputOnly', 1, (), ('',), ('policyControlledType',), (), (None,)),
+    'PolicyDateTime': ('policyDateTime', 'datetime-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-security', 'operations'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyDigest': ('policyDigest', 'policy-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'PolicyDiscovery': ('policyDiscovery', 'discovery-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), (None,)),
+    'PolicyDns': ('policyDns', 'dns-ctrl', 'Version211a', 'InputOutput', 1, (), ('aaa', 'admin', 'ext-lan-config'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyElement': ('policyElement', 'element-[converted_dn]', 'Version212a', 'InputOutput', 1, (), ('admin',), ('policyLocalMap',), ('policyRefReq',), (None,)),
+    'PolicyEquipment': ('policyEquipment', 'equipment-ctrl', 'Version227b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-policy'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Get', 'Set')),
+    'PolicyFault': ('policyFault', 'fault-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'fault'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyIdResolvePolicy': ('policyIdResolvePolicy', 'id-policy', 'Version223a', 'InputOutput', 1, (), ('admin', 'operations'), ('policyControlEp',), (), ('Get', 'Set')),
+    'PolicyInfraFirmware': ('policyInfraFirmware', 'fabric-fw-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'operations'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyLocalMap': ('policyLocalMap', 'localmap', 'Version212a', 'InputOutput', 1, (), ('admin',), ('policyPolicyEp',), ('policyElement',), (None,)),
+    'PolicyMEp': ('policyMEp', 'mep-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'operations'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyMonitoring': ('policyMonitoring', 'monitoring-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'operations'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyPolicyEp': ('policyPolicyEp', 'policy-ep', 'Version211a', 'InputOutput', 1, (), ('admin',), ('topRoot',), ('policyLocalMap', 'policyPolicyScopeCont', 'policySystemEp'), (None,)),
+    'PolicyPolicyRequestor': ('policyPolicyRequestor', 'requestor-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('policyPolicyScope',), (), (None,)),
+    'PolicyPolicyScope': ('policyPolicyScope', 'scope-[policy_type]-[resolve_type]-[policy_name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('policyPolicyScopeContext',), ('eventInst', 'faultInst', 'policyPolicyRequestor', 'policyPolicyScopeFsm', 'policyPolicyScopeFsmTask'), (None,)),
+    'PolicyPolicyScopeCont': ('policyPolicyScopeCont', 'scope-cont-[app_type]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('extpolClient', 'extpolController', 'extpolProvider', 'extpolRegistry', 'policyPolicyEp'), ('policyPolicyScopeContext',), (None,)),
+    'PolicyPolicyScopeContext': ('policyPolicyScopeContext', 'context-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('policyPolicyScopeCont',), ('policyPolicyScope',), (None,)),
+    'PolicyPolicyScopeFsm': ('policyPolicyScopeFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('policyPolicyScope',), ('policyPolicyScopeFsmStage',), (None,)),
+    'PolicyPolicyScopeFsmStage': ('policyPolicyScopeFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('policyPolicyScopeFsm',), (), (None,)),
+    'PolicyPolicyScopeFsmTask': ('policyPolicyScopeFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('policyPolicyScope',), (), (None,)),
+    'PolicyPortConfig': ('policyPortConfig', 'portconfig-ctrl', 'Version227b', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-policy'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Get', 'Set')),
+    'PolicyPowerMgmt': ('policyPowerMgmt', 'powermgmt-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyPsu': ('policyPsu', 'psu-ctrl', 'Version211a', 'InputOutput', 1, (), ('admin', 'pn-equipment', 'pn-policy'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyRefReq': ('policyRefReq', 'refreq-[ref_converted_dn]', 'Version212a', 'InputOutput', 1, (), ('admin',), ('policyElement',), (), (None,)),
+    'PolicySecurity': ('policySecurity', 'security-ctrl', 'Version211a', 'InputOutput', 1, (), ('aaa', 'admin'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), ('Add', 'Get', 'Set')),
+    'PolicyStorageAutoConfig': ('policyStorageAutoConfig', 'storage-autoconfig-ctrl', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-storage', 'pn-policy'), ('policyControlEp',), ('policyControlledInstance', 'policyControlledType'), (None,)),
+    'PolicySystemEp': ('policySystemEp', 'system-policies', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('policyPolicyEp',), ('adaptorHostEthIfProfile', 'lsbootPolicy', 'nwctrlDefinition', 'powerPolicy', 'solPolicy'), (None,)),
+    'PortDomainEp': ('portDomainEp', 'domain-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('etherPIo', 'etherServerIntFIo', 'etherSwitchIntFIo', 'fcPIo'), (), ('Get',)),
+    'PortGroup': ('portGroup', '[type]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('equipmentIOCard', 'equipmentSharedIOModule', 'equipmentSwitchCard', 'equipmentSwitchIOCard'), ('etherPIo', 'etherServerIntFIo', 'etherServerIntFIoPc', 'etherSwitchIntFIo', 'etherSwitchIntFIoPc', 'fcPIo', 'portSubGroup'), ('Get',)),
+    'PortPIoFsm': ('portPIoFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('etherPIo', 'fcPIo'), ('portPIoFsmStage',), (None,)),
+    'PortPIoFsmStage': ('portPIoFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('portPIoFsm',), (), (None,)),
+    'PortPIoFsmTask': ('portPIoFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('etherPIo', 'fcPIo'), (), (None,)),
+    'PortSubGroup': ('portSubGroup', 'aggr-port-[aggr_port_id]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('portGroup',), ('etherPIo', 'fcPIo'), (None,)),
+    'PortTrustMode': ('portTrustMode', 'trust-mode', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('etherServerIntFIo', 'fabricPathEp', 'swAccessEp'), (), ('Get',)),
+    'PowerBudget': ('powerBudget', 'budget', 'Version111j', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('computeBlade', 'computeExtBoard', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'equipmentFex', 'networkElement'), ('faultInst', 'powerProfiledPower'), ('Get', 'Set')),
+    'PowerChassisMember': ('powerChassisMember', 'ch-member-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'power-mgmt', 'read-only'), ('powerGroup',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'PowerEp': ('powerEp', 'power-ep', 'Version141i', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('topSystem',), ('powerGroup', 'powerPrioWght'), ('Get',)),
+    'PowerFIMember': ('powerFIMember', 'fi-member-[id]', 'Version312b', 'InputOutput', 1, (), ('admin', 'power-mgmt', 'read-only'), ('powerGroup',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'PowerFexMember': ('powerFexMember', 'fex-member-[id]', 'Version312b', 'InputOutput', 1, (), ('admin', 'power-mgmt', 'read-only'), ('powerGroup',), (), ('Add', 'Get', 'Remove')),
+    'PowerGroup': ('powerGroup', 'group-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('powerEp',), ('faultInst', 'powerChassisMember', 'powerFIMember', 'powerFexMember', 'powerRackUnitMember'), ('Add', 'Get', 'Remove', 'Set')),
+    'PowerGroupAdditionPolicy': ('powerGroupAdditionPolicy', 'group-add-policy', 'Version141i', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('orgOrg',), (), ('Get',)),
+    'PowerGroupQual': ('powerGroupQual', 'power-group-[group_name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), (), ('Add', 'Get', 'Remove')),
+    'PowerGroupStats': ('powerGroupStats', 'stats', 'Version141i', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), (), ('powerGroupStatsHist',), ('Get',)),
+    'PowerGroupStatsHist': ('powerGroupStatsHist', '[id]', 'Version141i', 'OutputOnly', 1, (), ('read-only',), ('powerGroupStats',), (), ('Get',)),
+    'PowerMgmtPolicy': ('powerMgmtPolicy', 'pwr-mgmt-policy', 'Version141i', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('orgOrg',), (), ('Get', 'Set')),
+    'PowerPlacement': ('powerPlacement', 'placement-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy'), ('orgOrg',), (), ('Get',)),
+    'PowerPolicy': ('powerPolicy', 'power-policy-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-server-policy'), ('orgOrg', 'policySystemEp'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'PowerPrioWght': ('powerPrioWght', 'weight-[prio]', 'Version141i', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('powerEp',), (), ('Get',)),
+    'PowerProfiledPower': ('powerProfiledPower', 'prof-power', 'Version302c', 'InputOutput', 1, (), ('admin', 'power-mgmt'), ('powerBudget',), (), ('Get',)),
+    'PowerRackUnitMember': ('powerRackUnitMember', 'ru-member-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'power-mgmt', 'read-only'), ('powerGroup',), (), ('Get',)),
+    'ProcDoer': ('procDoer', 'doer[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('procManager',), (), ('Get',)),
+    'ProcManager': ('procManager', 'proc-info', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('procDoer', 'procPrt', 'procPrtCounts', 'procStimulusCounts', 'procSvc', 'procTxCounts'), ('Get',)),
+    'ProcPrt': ('procPrt', 'prt[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('procManager',), (), ('Get',)),
+    'ProcPrtCounts': ('procPrtCounts', 'prt', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('procManager',), (), ('Get',)),
+    'ProcStimulusCounts': ('procStimulusCounts', 'stim', 'Version101e', 'InputOutput', 1, (), ('admin', 'read-only'), ('procManager', 'procSvc'), (), ('Get',)),
+    'ProcSvc': ('procSvc', 'svc-[name]', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('procManager',), ('procStimulusCounts', 'procTxCounts'), ('Get',)),
+    'ProcTxCounts': ('procTxCounts', 'tx', 'Version101e', 'InputOutput', 1, (), ('admin', 'read-only'), ('procManager', 'procSvc'), (), ('Get',)),
+    'ProcessorCore': ('processorCore', 'core-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('processorUnit',), ('processorThread',), (None,)),
+    'ProcessorEnvStats': ('processorEnvStats', 'env-stats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('processorUnit',), ('processorEnvStatsHist',), ('Get',)),
+    'ProcessorEnvStatsHist': ('processorEnvStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('processorEnvStats',), (), ('Get',)),
+    'ProcessorErrorStats': ('processorErrorStats', 'error-stats', 'Version131c', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('processorUnit',), (), ('Get',)),
+    'ProcessorQual': ('processorQual', 'cpu', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'ProcessorRuntime': ('processorRuntime', 'cpu-rt', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('computeBlade',), ('processorRuntimeHist',), ('Get',)),
+    'ProcessorRuntimeHist': ('processorRuntimeHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('processorRuntime',), (), ('Get',)),
+    'ProcessorThread': ('processorThread', 'thr-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('processorCore',), (), ('Get',)),
+    'ProcessorUnit': ('processorUnit', 'cpu-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), ('faultInst', 'processorCore', 'processorEnvStats', 'processorErrorStats'), ('Get',)),
+    'ProcessorUnitAssocCtx': ('processorUnitAssocCtx', 'procunit-assoc-ctx', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('lsServerAssocCtx',), (), ('Get',)),
+    'QosclassDefinition': ('qosclassDefinition', 'classes', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-qos', 'ext-san-qos', 'ls-network', 'ls-network-policy', 'ls-qos-policy'), ('fabricLanCloud',), ('eventInst', 'faultInst', 'qosclassDefinitionFsm', 'qosclassDefinitionFsmTask', 'qosclassEthBE', 'qosclassEthClassified', 'qosclassFc'), ('Get', 'Set')),
+    'QosclassDefinitionFsm': ('qosclassDefinitionFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('qosclassDefinition',), ('qosclassDefinitionFsmStage',), (None,)),
+    'QosclassDefinitionFsmStage': ('qosclassDefinitionFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('qosclassDefinitionFsm',), (), (None,)),
+    'QosclassDefinitionFsmTask': ('qosclassDefinitionFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('qosclassDefinition',), (), (None,)),
+    'QosclassEthBE': ('qosclassEthBE', 'class-best-effort', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-qos', 'ext-san-qos', 'ls-network', 'ls-network-policy', 'ls-qos-policy'), ('qosclassDefinition',), (), ('Get', 'Set')),
+    'QosclassEthClassified': ('qosclassEthClassified', 'class-[priority]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-qos', 'ext-san-qos', 'ls-network', 'ls-network-policy', 'ls-qos-policy'), ('qosclassDefinition',), (), ('Get', 'Set')),
+    'QosclassFc': ('qosclassFc', 'class-fc', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-qos', 'ext-san-qos', 'ls-network', 'ls-network-policy', 'ls-qos-policy'), ('qosclassDefinition',), (), ('Get', 'Set')),
+    'QueryresultDependency': ('queryresultDependency', 'dependency-[ref_converted_dn]', 'Version221b', 'InputOutput', 1, (), ('admin',), (), (), (None,)),
+    'QueryresultUsage': ('queryresultUsage', 'usage-[ref_converted_dn]', 'Version221b', 'InputOutput', 1, (), ('admin',), (), (), (None,)),
+    'SecurityUnit': ('securityUnit', 'security-unit-[id]', 'Version227b', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), (), ('Get',)),
+    'SesDiskSlotEp': ('sesDiskSlotEp', 'disk-slot-ep-[enc_id]-id-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('sesEnclosure',), (), ('Get',)),
+    'SesEnclosure': ('sesEnclosure', 'ses-enc-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('equipmentChassis',), ('sesDiskSlotEp',), ('Get',)),
+    'SolConfig': ('solConfig', 'sol', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server'), ('lsServer',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'SolIf': ('solIf', 'sol-if', 'Version101e', 'InputOutput', 1, (), ('admin', 'read-only'), ('computeBlade', 'computeRackUnit', 'computeServerUnit'), (), ('Get',)),
+    'SolPolicy': ('solPolicy', 'sol-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config-policy'), ('orgOrg', 'policySystemEp'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'StatsCollectionPolicy': ('statsCollectionPolicy', 'coll-policy-[name]', 'Version102d', 'InputOutput', 1, (), ('admin', 'operations'), ('statsHolder',), ('eventInst', 'faultInst', 'statsCollectionPolicyFsm', 'statsCollectionPolicyFsmTask'), ('Get', 'Set')),
+    'StatsCollectionPolicyFsm': ('statsCollectionPolicyFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('statsCollectionPolicy',), ('statsCollectionPolicyFsmStage',), (None,)),
+    'StatsCollectionPolicyFsmStage': ('statsCollectionPolicyFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('statsCollectionPolicyFsm',), (), (None,)),
+    'StatsCollectionPolicyFsmTask': ('statsCollectionPolicyFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('statsCollectionPolicy',), (), (None,)),
+    'StatsHolder': ('statsHolder', 'stats', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('topRoot',), ('statsCollectionPolicy',), ('Get',)),
+    'StatsThr32Definition': ('statsThr32Definition', '[prop_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('statsThresholdClass',), ('statsThr32Value', 'statsThr64Value', 'statsThrFloatValue'), ('Add', 'Get', 'Set')),
+    'StatsThr32Value': ('statsThr32Value', '[direction]-[severity]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('statsThr32Definition', 'statsThr64Definition', 'statsThrFloatDefinition'), (), ('Add', 'Get', 'Set')),
+    'StatsThr64Definition': ('statsThr64Definition', '[prop_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('statsThresholdClass',), ('statsThr32Value', 'statsThr64Value', 'statsThrFloatValue'), ('Add', 'Get', 'Set')),
+    'StatsThr64Value': ('statsThr64Value', '[direction]-[severity]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('statsThr32Definition', 'statsThr64Definition', 'statsThrFloatDefinition'), (), ('Add', 'Get', 'Set')),
+    'StatsThrFloatDefinition': ('statsThrFloatDefinition', '[prop_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('statsThresholdClass',), ('statsThr32Value', 'statsThr64Value', 'statsThrFloatValue'), ('Get',)),
+    'StatsThrFloatValue': ('statsThrFloatValue', '[direction]-[severity]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('statsThr32Definition', 'statsThr64Definition', 'statsThrFloatDefinition'), (), ('Get',)),
+    'StatsThresholdClass': ('statsThresholdClass', '[stats_class_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('statsThresholdPolicy',), ('statsThr32Definition', 'statsThr64Definition', 'statsThrFloatDefinition'), ('Add', 'Get', 'Remove', 'Set')),
+    'StatsThresholdPolicy': ('statsThresholdPolicy', 'thr-policy-[name]', 'Version102d', 'InputOutput', 1, (), ('admin', 'operations'), ('fabricCabling', 'fabricDceSrv', 'fabricEthEstcCloud', 'fabricFcEstcCloud', 'fabricLanCloud', 'fabricLanMonCloud', 'fabricSanCloud', 'fabricSanMonCloud', 'orgOrg'), ('statsThresholdClass',), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageAuthKey': ('storageAuthKey', 'key-[type]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('storageIScsiTargetIf',), (), (None,)),
+    'StorageConnectionDef': ('storageConnectionDef', 'storage-conndef', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy', 'ls-config', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('vnicFcGroupDef',), ('faultInst', 'storageFcTargetEp'), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageConnectionPolicy': ('storageConnectionPolicy', 'storage-connpolicy-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('faultInst', 'storageFcTargetEp'), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageController': ('storageController', 'storage-[type]-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('computeBoard', 'equipmentChassis'), ('faultInst', 'firmwareBootDefinition', 'firmwareRunning', 'lstorageControllerDef', 'mgmtController', 'storageDrive', 'storageEmbeddedStorage', 'storageEnclosure', 'storageLocalDisk', 'storageLocalDiskConfigDef', 'storageLocalDiskEp', 'storageLocalLun', 'storageMezzFlashLife', 'storageNvmeStats', 'storageOnboardDevice', 'storageOperation', 'storageRaidBattery', 'storageVirtualDrive', 'storageVirtualDriveEp'), ('Get',)),
+    'StorageControllerEp': ('storageControllerEp', 'controller-ep-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('storageLocalDisk', 'storageVirtualDrive'), (), ('Get',)),
+    'StorageControllerRef': ('storageControllerRef', 'server-[server_id]-controller-[controller_type]-[controller_id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('storageEnclosureDiskSlotEp',), (), ('Get',)),
+    'StorageDiskEnvStats': ('storageDiskEnvStats', 'disk-env-stats', 'Version302c', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('storageLocalDisk',), ('storageDiskEnvStatsHist',), (None,)),
+    'StorageDiskEnvStatsHist': ('storageDiskEnvStatsHist', '[id]', 'Version302c', 'OutputOnly', 1, (), ('read-only',), ('storageDiskEnvStats',), (), (None,)),
+    'StorageDomainEp': ('storageDomainEp', 'storage-ep', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('storageSystem',), (None,)),
+    'StorageDrive': ('storageDrive', 'drive-[id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('storageController',), (), ('Get',)),
+    'StorageEmbeddedStorage': ('storageEmbeddedStorage', 'embedded-storage', 'Version312b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('storageController',), (), ('Get',)),
+    'StorageEnclosure': ('storageEnclosure', 'enc-[id]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-storage'), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis', 'storageController'), ('eventInst', 'faultInst', 'storageEnclosureDiskSlotEp', 'storageEnclosureFsm', 'storageEnclosureFsmTask', 'storageHddMotherBoardTempStats', 'storageLocalDisk'), ('Get',)),
+    'StorageEnclosureCap': ('storageEnclosureCap', 'physical-holder-[type]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentBladeCapProvider', 'equipmentChassisCapProvider', 'equipmentRackUnitCapProvider'), (), ('Get',)),
+    'StorageEnclosureDiskSlotEp': ('storageEnclosureDiskSlotEp', 'disk-slot-[id]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('storageEnclosure',), ('faultInst', 'storageControllerRef'), ('Get',)),
+    'StorageEnclosureFsm': ('storageEnclosureFsm', 'fsm', 'Version312b', 'OutputOnly', 1, (), ('',), ('storageEnclosure',), ('storageEnclosureFsmStage',), (None,)),
+    'StorageEnclosureFsmStage': ('storageEnclosureFsmStage', 'stage-[name]', 'Version312b', 'OutputOnly', 1, (), ('',), ('storageEnclosureFsm',), (), (None,)),
+    'StorageEnclosureFsmTask': ('storageEnclosureFsmTask', 'task-[item]', 'Version312b', 'OutputOnly', 1, (), ('',), ('storageEnclosure',), (), (None,)),
+    'StorageEnclosureLocalDiskConfig': ('storageEnclosureLocalDiskConfig', 'enc-disk-config-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), (), ('storageSasPort',), (None,)),
+    'StorageEpUser': ('storageEpUser', 'user-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('initiatorFcInitiatorEp', 'initiatorIScsiInitiatorEp'), ('aaaCimcSession',), (None,)),
+    'StorageEtherIf': ('storageEtherIf', 'ether-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('storageIScsiTargetIf',), ('ipServiceIf',), (None,)),
+    'StorageFcIf': ('storageFcIf', 'fc-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('storageFcTargetIf',), (), (None,)),
+    'StorageFcTargetEp': ('storageFcTargetEp', 'fc-target-ep-[targetwwpn]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy', 'ls-storage', 'ls-storage-policy'), ('storageConnectionDef', 'storageConnectionPolicy'), ('storageVsanRef',), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageFcTargetIf': ('storageFcTargetIf', 'fc-tgt-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), ('storageFcIf',), (None,)),
+    'StorageFlexFlashCard': ('storageFlexFlashCard', 'card-[slot_number]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('storageFlexFlashController',), ('faultInst', 'storageFlexFlashDrive'), ('Get',)),
+    'StorageFlexFlashController': ('storageFlexFlashController', 'storage-flexflash-[id]', 'Version221b', 'InputOutput', 1, (), ('admin',), ('computeBoard',), ('eventInst', 'faultInst', 'firmwareRunning', 'storageFlexFlashCard', 'storageFlexFlashControllerFsm', 'storageFlexFlashControllerFsmTask', 'storageFlexFlashVirtualDrive', 'storageLocalDiskConfigDef'), ('Get',)),
+    'StorageFlexFlashControllerFsm': ('storageFlexFlashControllerFsm', 'fsm', 'Version223a', 'OutputOnly', 1, (), ('',), ('storageFlexFlashController',), ('storageFlexFlashControllerFsmStage',), (None,)),
+    'StorageFlexFlashControllerFsmStage': ('storageFlexFlashControllerFsmStage', 'stage-[name]', 'Version223a', 'OutputOnly', 1, (), ('',), ('storageFlexFlashControllerFsm',), (), (None,)),
+    'StorageFlexFlashControllerFsmTask': ('storageFlexFlashControllerFsmTask', 'task-[item]', 'Version223a', 'OutputOnly', 1, (), ('',), ('storageFlexFlashController',), (), (None,)),
+    'StorageFlexFlashDrive': ('storageFlexFlashDrive', 'drive-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('storageFlexFlashCard',), ('faultInst',), ('Get',)),
+    'StorageFlexFlashVirtualDrive': ('storageFlexFlashVirtualDrive', 'vd-[id]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('storageFlexFlashController',), ('faultInst',), ('Get',)),
+    'StorageHddMotherBoardTempStats': ('storageHddMotherBoardTempStats', 'hdd-mobo-temp-stats', 'Version312b', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('storageEnclosure',), ('storageHddMotherBoardTempStatsHist',), ('Get',)),
+    'StorageHddMotherBoardTempStatsHist': ('storageHddMotherBoardTempStatsHist', '[id]', 'Version312b', 'OutputOnly', 1, (), ('read-only',), ('storageHddMotherBoardTempStats',), (), ('Get',)),
+    'StorageIScsiTargetIf': ('storageIScsiTargetIf', 'iscsi-tgt-[name]', 'Version211a', 'InputOutput', 1, (), ('admin',), ('storageNodeEp',), ('initiatorLunEp', 'storageAuthKey', 'storageEtherIf'), (None,)),
+    'StorageIniGroup': ('storageIniGroup', 'grp-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('lsServer', 'vnicSanConnPolicy'), ('faultInst', 'storageInitiator', 'vnicFcGroupDef'), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageInitiator': ('storageInitiator', 'ini-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('storageIniGroup',), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'StorageItem': ('storageItem', 'stor-part-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('faultInst',), ('Get',)),
+    'StorageLocalDisk': ('storageLocalDisk', 'disk-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('storageController', 'storageEnclosure'), ('equipmentLocatorLed', 'eventInst', 'faultInst', 'firmwareBootDefinition', 'firmwareRunning', 'mgmtController', 'storageControllerEp', 'storageDiskEnvStats', 'storageLocalDiskFsm', 'storageLocalDiskFsmTask', 'storageLocalDiskPartition', 'storageOperation', 'storageSasPort'), ('Get', 'Set')),
+    'StorageLocalDiskConfigDef': ('storageLocalDiskConfigDef', 'local-disk-config', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('lsServer', 'lstorageDasScsiLun', 'storageController', 'storageFlexFlashController'), ('storageLocalDiskPartition',), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageLocalDiskConfigPolicy': ('storageLocalDiskConfigPolicy', 'local-disk-config-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-config-policy', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('storageLocalDiskPartition',), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageLocalDiskEp': ('storageLocalDiskEp', 'disk-ep-[enc_id]-id-[id]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('storageController',), (), ('Get',)),
+    'StorageLocalDiskFsm': ('storageLocalDiskFsm', 'fsm', 'Version312b', 'OutputOnly', 1, (), ('',), ('storageLocalDisk',), ('storageLocalDiskFsmStage',), (None,)),
+    'StorageLocalDiskFsmStage': ('storageLocalDiskFsmStage', 'stage-[name]', 'Version312b', 'OutputOnly', 1, (), ('',), ('storageLocalDiskFsm',), (), (None,)),
+    'StorageLocalDiskFsmTask': ('storageLocalDiskFsmTask', 'task-[item]', 'Version312b', 'OutputOnly', 1, (), ('',), ('storageLocalDisk',), (), (None,)),
+    'StorageLocalDiskPartition': ('storageLocalDiskPartition', 'partition-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('storageLocalDisk', 'storageLocalDiskConfigDef', 'storageLocalDiskConfigPolicy'), (), ('Get',)),
+    'StorageLocalDiskSlotEp': ('storageLocalDiskSlotEp', 'disk-[id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('computeBoard',), ('faultInst',), ('Get',)),
+    'StorageLocalLun': ('storageLocalLun', 'lun-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('storageController',), (), ('Get',)),
+    'StorageLunDisk': ('storageLunDisk', 'disk-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('storageVirtualDrive',), (), ('Get',)),
+    'StorageLunResourceSelectionLog': ('storageLunResourceSelectionLog', 'selection-log-[order]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('storageVirtualDriveRef',), (), (None,)),
+    'StorageMezzFlashLife': ('storageMezzFlashLife', 'flash-life-', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('storageController',), ('faultInst',), ('Get',)),
+    'StorageNodeEp': ('storageNodeEp', 'node-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('initiatorGroupEp',), ('storageIScsiTargetIf',), (None,)),
+    'StorageNvmeStats': ('storageNvmeStats', 'nvme-stats', 'Version312b', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('storageController',), ('storageNvmeStatsHist',), ('Get',)),
+    'StorageNvmeStatsHist': ('storageNvmeStatsHist', '[id]', 'Version312b', 'OutputOnly', 1, (), ('read-only',), ('storageNvmeStats',), (), ('Get',)),
+    'StorageOnboardDevice': ('storageOnboardDevice', 'onboard-device-[device_type]-[id]', 'Version227b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('storageController', 'storageSasExpander'), ('firmwareBootDefinition', 'firmwareRunning', 'firmwareUpdatable'), (None,)),
+    'StorageOperation': ('storageOperation', 'op-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('storageController', 'storageLocalDisk', 'storageRaidBattery', 'storageVirtualDrive'), (), (None,)),
+    'StorageQual': ('storageQual', 'local-storage', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('computeQual',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'StorageRaidBattery': ('storageRaidBattery', 'raid-battery', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('storageController',), ('faultInst', 'storageOperation', 'storageTransportableFlashModule'), ('Get',)),
+    'StorageSasExpander': ('storageSasExpander', 'sas-expander-[id]', 'Version226c', 'InputOutput', 1, (), ('read-only',), ('computeBoard', 'equipmentChassis'), ('faultInst', 'firmwareBootDefinition', 'firmwareRunning', 'mgmtController', 'storageOnboardDevice', 'storageSasUpLink'), (None,)),
+    'StorageSasLinkDescriptor': ('storageSasLinkDescriptor', 'sas-link-desc-server-[server_id]-controller-[controller_type]-[controller_id]-id-[id]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentChassisCapProvider',), (), ('Get',)),
+    'StorageSasPort': ('storageSasPort', 'sas-port-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('storageEnclosureLocalDiskConfig', 'storageLocalDisk'), (), ('Get',)),
+    'StorageSasPortDescriptor': ('storageSasPortDescriptor', 'sas-port-desc-[id]', 'Version312b', 'InputOutput', 1, (), ('',), ('equipmentChassisCapProvider',), (), ('Get',)),
+    'StorageSasUpLink': ('storageSasUpLink', 'sas-uplink-server-[server_id]-controller-[controller_type]-[controller_id]-id-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('storageSasExpander',), (), ('Get',)),
+    'StorageScsiLunRef': ('storageScsiLunRef', 'scsi-lun-ref-[id]', 'Version224b', 'InputOutput', 1, (), ('read-only',), ('storageVirtualDrive',), (), (None,)),
+    'StorageSystem': ('storageSystem', 'system', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('storageDomainEp',), ('eventInst', 'faultInst', 'initiatorRequestorEp', 'storageSystemFsm', 'storageSystemFsmTask'), (None,)),
+    'StorageSystemFsm': ('storageSystemFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('storageSystem',), ('storageSystemFsmStage',), (None,)),
+    'StorageSystemFsmStage': ('storageSystemFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('storageSystemFsm',), (), (None,)),
+    'StorageSystemFsmTask': ('storageSystemFsmTask', 'task-[item]', 'Version211a', 'OutputOnly', 1, (), ('',), ('storageSystem',), (), (None,)),
+    'StorageTransportableFlashModule': ('storageTransportableFlashModule', 'flash-module', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('storageRaidBattery',), (), ('Get',)),
+    'StorageVDMemberEp': ('storageVDMemberEp', 'member-[id]', 'Version224b', 'InputOutput', 1, (), ('read-only',), ('storageVirtualDrive',), ('faultInst',), ('Get',)),
+    'StorageVirtualDrive': ('storageVirtualDrive', 'vd-[id]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('storageController', 'storageVirtualDriveContainer'), ('faultInst', 'storageControllerEp', 'storageLunDisk', 'storageOperation', 'storageScsiLunRef', 'storageVDMemberEp'), (None,)),
+    'StorageVirtualDriveContainer': ('storageVirtualDriveContainer', 'vd-container-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('computeBlade', 'computeRackUnit', 'computeServerUnit', 'equipmentChassis'), ('storageVirtualDrive',), ('Get',)),
+    'StorageVirtualDriveEp': ('storageVirtualDriveEp', 'vd-ep-[container_id]-id-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('storageController',), (), ('Get',)),
+    'StorageVirtualDriveRef': ('storageVirtualDriveRef', 'vdrive-ref-[lun_item_name]', 'Version224b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('lsServer',), ('lstorageDiskGroupConfigDef', 'storageLunResourceSelectionLog'), ('Get',)),
+    'StorageVsanRef': ('storageVsanRef', 'vsan-ref', 'Version211a', 'InputOutput', 1, (), ('admin', 'ext-san-config', 'ext-san-policy', 'ls-storage', 'ls-storage-policy'), ('fabricFcUserZone', 'storageFcTargetEp'), ('faultInst',), ('Add', 'Get', 'Set')),
+    'SwAccessDomain': ('swAccessDomain', 'access-eth', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('eventInst', 'faultInst', 'swAccessDomainFsm', 'swAccessDomainFsmTask', 'swAccessEp', 'swSubGroup'), ('Get',)),
+    'SwAccessDomainFsm': ('swAccessDomainFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('swAccessDomain',), ('swAccessDomainFsmStage',), (None,)),
+    'SwAccessDomainFsmStage': ('swAccessDomainFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('swAccessDomainFsm',), (), (None,)),
+    'SwAccessDomainFsmTask': ('swAccessDomainFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('swAccessDomain',), (), (None,)),
+    'SwAccessEp': ('swAccessEp', 'ep-slot-[slot_id]port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('swAccessDomain', 'swSubGroup'), ('portTrustMode', 'swUlan'), ('Get',)),
+    'SwCardEnvStats': ('swCardEnvStats', 'cardenvstats', 'Version211a', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('networkElement',), ('swCardEnvStatsHist',), ('Get',)),
+    'SwCardEnvStatsHist': ('swCardEnvStatsHist', '[id]', 'Version211a', 'OutputOnly', 1, (), ('read-only',), ('swCardEnvStats',), (), ('Get',)),
+    'SwCmclan': ('swCmclan', 'vlan-cmc[id]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('dcxVc',), (), (None,)),
+    'SwEnvStats': ('swEnvStats', 'envstats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('networkElement',), ('swEnvStatsHist',), ('Get',)),
+    'SwEnvStatsHist': ('swEnvStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('swEnvStats',), (), ('Get',)),
+    'SwEthEstcEp': ('swEthEstcEp', 'ethestc-ep-slot-[slot_id]port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swEthLanBorder', 'swSubGroup'), ('swEthTargetEp', 'swVlan'), ('Get',)),
+    'SwEthEstcPc': ('swEthEstcPc', 'pc-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swEthLanBorder', 'swEthMon'), ('swEthTargetEp', 'swVlan'), ('Get',)),
+    'SwEthLanBorder': ('swEthLanBorder', 'border-eth', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('eventInst', 'faultInst', 'swEthEstcEp', 'swEthEstcPc', 'swEthLanBorderFsm', 'swEthLanBorderFsmTask', 'swEthLanEp', 'swEthLanPc', 'swSubGroup', 'swVlan', 'swVlanGroup'), ('Get',)),
+    'SwEthLanBorderFsm': ('swEthLanBorderFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('swEthLanBorder',), ('swEthLanBorderFsmStage',), (None,)),
+    'SwEthLanBorderFsmStage': ('swEthLanBorderFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('swEthLanBorderFsm',), (), (None,)),
+    'SwEthLanBorderFsmTask': ('swEthLanBorderFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('swEthLanBorder',), (), (None,)),
+    'SwEthLanEp': ('swEthLanEp', 'ep-slot-[slot_id]port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('swEthLanBorder', 'swSubGroup'), ('swVlan',), ('Get',)),
+    'SwEthLanFlowMon': ('swEthLanFlowMon', 'ethlanflowmon', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('dcxVc', 'eventInst', 'faultInst', 'swEthLanFlowMonFsm', 'swEthLanFlowMonFsmTask', 'swIpRoute', 'swNetflowExporter', 'swNetflowMonSession', 'swNetflowMonitor', 'swNetflowRecordDef', 'swVirtL3Intf'), (None,)),
+    'SwEthLanFlowMonFsm': ('swEthLanFlowMonFsm', 'fsm', 'Version221b', 'OutputOnly', 1, (), ('',), ('swEthLanFlowMon',), ('swEthLanFlowMonFsmStage',), (None,)),
+    'SwEthLanFlowMonFsmStage': ('swEthLanFlowMonFsmStage', 'stage-[name]', 'Version221b', 'OutputOnly', 1, (), ('',), ('swEthLanFlowMonFsm',), (), (None,)),
+    'SwEthLanFlowMonFsmTask': ('swEthLanFlowMonFsmTask', 'task-[item]', 'Version221b', 'OutputOnly', 1, (), ('',), ('swEthLanFlowMon',), (), (None,)),
+    'SwEthLanMon': ('swEthLanMon', 'lanmon-eth', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('swEthMon',), ('Get',)),
+    'SwEthLanPc': ('swEthLanPc', 'pc-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('swEthLanBorder', 'swEthMon'), ('swVlan',), ('Get',)),
+    'SwEthMon': ('swEthMon', 'mon-[name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swEthLanMon',), ('dcxVc', 'eventInst', 'faultInst', 'swEthEstcPc', 'swEthLanPc', 'swEthMonDestEp', 'swEthMonFsm', 'swEthMonFsmTask', 'swEthMonSrcEp', 'swSubGroup', 'swVlan'), ('Get',)),
+    'SwEthMonDestEp': ('swEthMonDestEp', 'mon-dest-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swEthMon', 'swFcMon', 'swSubGroup'), (), ('Get',)),
+    'SwEthMonFsm': ('swEthMonFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('swEthMon',), ('swEthMonFsmStage',), (None,)),
+    'SwEthMonFsmStage': ('swEthMonFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('swEthMonFsm',), (), (None,)),
+    'SwEthMonFsmTask': ('swEthMonFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('swEthMon',), (), (None,)),
+    'SwEthMonSrcEp': ('swEthMonSrcEp', 'mon-src-[chassis_id]-[slot_id]-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swEthMon', 'swSubGroup'), (), ('Get',)),
+    'SwEthTargetEp': ('swEthTargetEp', 'eth-target-[name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swEthEstcEp', 'swEthEstcPc'), ('faultInst',), ('Get',)),
+    'SwExtUtility': ('swExtUtility', 'ext', 'Version311e', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('eventInst', 'faultInst', 'swExtUtilityFsm', 'swExtUtilityFsmTask', 'swPortBreakout'), (None,)),
+    'SwExtUtilityFsm': ('swExtUtilityFsm', 'fsm', 'Version311e', 'OutputOnly', 1, (), ('',), ('swExtUtility',), ('swExtUtilityFsmStage',), (None,)),
+    'SwExtUtilityFsmStage': ('swExtUtilityFsmStage', 'stage-[name]', 'Version311e', 'OutputOnly', 1, (), ('',), ('swExtUtilityFsm',), (), (None,)),
+    'SwExtUtilityFsmTask': ('swExtUtilityFsmTask', 'task-[item]', 'Version311e', 'OutputOnly', 1, (), ('',), ('swExtUtility',), (), (None,)),
+    'SwFabricZoneNs': ('swFabricZoneNs', 'fabric-zone-ns', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('networkElement',), (), (None,)),
+    'SwFabricZoneNsOverride': ('swFabricZoneNsOverride', 'fabric-zone-override', 'Version211a', 'InputOutput', 1, (), ('admin',), ('topSysDefaults',), (), (None,)),
+    'SwFcEndpoint': ('swFcEndpoint', 'wwpn-[wwpn]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('swFcUserZone',), (), ('Get',)),
+    'SwFcEstcEp': ('swFcEstcEp', 'fcestc-ep-slot-[slot_id]port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swFcSanBorder',), (), ('Get',)),
+    'SwFcMon': ('swFcMon', 'mon-[name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swFcSanMon',), ('dcxVc', 'eventInst', 'faultInst', 'swEthMonDestEp', 'swFcMonDestEp', 'swFcMonFsm', 'swFcMonFsmTask', 'swFcMonSrcEp', 'swFcSanPc', 'swFcoeSanPc', 'swSubGroup', 'swVsan'), ('Get',)),
+    'SwFcMonDestEp': ('swFcMonDestEp', 'mon-dest-[slot_id]-port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swFcMon',), (), ('Get',)),
+    'SwFcMonFsm': ('swFcMonFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('swFcMon',), ('swFcMonFsmStage',), (None,)),
+    'SwFcMonFsmStage': ('swFcMonFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('swFcMonFsm',), (), (None,)),
+    'SwFcMonFsmTask': ('swFcMonFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('swFcMon',), (), (None,)),
+    'SwFcMonSrcEp': ('swFcMonSrcEp', 'mon-src-[chassis_id]-[slot_id]-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swFcMon',), (), ('Get',)),
+    'SwFcSanBorder': ('swFcSanBorder', 'border-fc', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('eventInst', 'faultInst', 'swFcEstcEp', 'swFcSanBorderFsm', 'swFcSanBorderFsmTask', 'swFcSanEp', 'swFcSanPc', 'swFcoeEstcEp', 'swFcoeSanEp', 'swFcoeSanPc', 'swSubGroup', 'swVlan', 'swVsan'), ('Get',)),
+    'SwFcSanBorderFsm': ('swFcSanBorderFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('swFcSanBorder',), ('swFcSanBorderFsmStage',), (None,)),
+    'SwFcSanBorderFsmStage': ('swFcSanBorderFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('swFcSanBorderFsm',), (), (None,)),
+    'SwFcSanBorderFsmTask': ('swFcSanBorderFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('swFcSanBorder',), (), (None,)),
+    'SwFcSanEp': ('swFcSanEp', 'ep-slot-[slot_id]port-[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('swFcSanBorder',), (), ('Get',)),
+    'SwFcSanMon': ('swFcSanMon', 'sanmon-fc', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('swFcMon',), ('Get',)),
+    'SwFcSanPc': ('swFcSanPc', 'pc-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swFcMon', 'swFcSanBorder'), (), ('Get',)),
+    'SwFcServerZoneGroup': ('swFcServerZoneGroup', 'zone-group-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swFcZoneSet',), ('swZoneInitiatorMember',), (None,)),
+    'SwFcUserZone': ('swFcUserZone', 'zone-[id]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('swFcUserZoneGroup',), ('swFcEndpoint',), ('Get',)),
+    'SwFcUserZoneGroup': ('swFcUserZoneGroup', 'user-zone-group-[name]', 'Version312b', 'InputOutput', 1, (), ('read-only',), ('swFcZoneSet',), ('swFcUserZone',), ('Get',)),
+    'SwFcZone': ('swFcZone', 'zone-[identity]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swZoneInitiatorMember',), ('swZoneTargetMember',), (None,)),
+    'SwFcZoneSet': ('swFcZoneSet', 'zone-set-default', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swVsan',), ('swFcServerZoneGroup', 'swFcUserZoneGroup'), (None,)),
+    'SwFcoeEstcEp': ('swFcoeEstcEp', 'fcoeestc-ep-slot-[slot_id]port-[port_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('swFcSanBorder', 'swSubGroup'), ('dcxFcoeVifEp', 'dcxVifEp', 'swVlan'), ('Get',)),
+    'SwFcoeSanEp': ('swFcoeSanEp', 'fcoesan-ep-slot-[slot_id]port-[port_id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swFcSanBorder', 'swSubGroup'), ('dcxFcoeVifEp', 'dcxVifEp', 'swVlan'), ('Add', 'Get', 'Remove', 'Set')),
+    'SwFcoeSanPc': ('swFcoeSanPc', 'fcoesan-pc-[port_id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swFcMon', 'swFcSanBorder'), ('dcxFcoeVifEp', 'dcxVifEp', 'swVlan'), ('Add', 'Get', 'Remove', 'Set')),
+    'SwIpRoute': ('swIpRoute', 'ip-route-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('swEthLanFlowMon',), (), (None,)),
+    'SwNFExporterRef': ('swNFExporterRef', 'nf-exporter-ref-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('swNetflowMonitor',), (), (None,)),
+    'SwNetflowExporter': ('swNetflowExporter', 'flowexporter-netflow-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('swEthLanFlowMon',), ('swVlan',), (None,)),
+    'SwNetflowMonSession': ('swNetflowMonSession', 'flowmonsession-netflow-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('swEthLanFlowMon',), ('swNetflowMonitor', 'swNetflowMonitorRef'), (None,)),
+    'SwNetflowMonitor': ('swNetflowMonitor', 'flowmonitor-netflow-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('swEthLanFlowMon', 'swNetflowMonSession'), ('swNFExporterRef',), (None,)),
+    'SwNetflowMonitorRef': ('swNetflowMonitorRef', 'nf-monitor-ref-[name]-[direction]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('dcxVc', 'swNetflowMonSession', 'vnicProfile'), (), (None,)),
+    'SwNetflowRecordDef': ('swNetflowRecordDef', 'flowrecord-netflow-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('swEthLanFlowMon',), (), (None,)),
+    'SwPhys': ('swPhys', 'phys', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('eventInst', 'faultInst', 'swPhysEtherEp', 'swPhysFcEp', 'swPhysFsm', 'swPhysFsmTask', 'swSubGroup'), ('Get',)),
+    'SwPhysEtherEp': ('swPhysEtherEp', 'phys-eth-slot-[slot_id]port-[port_id]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('swPhys', 'swSubGroup'), (), ('Get',)),
+    'SwPhysFcEp': ('swPhysFcEp', 'phys-fc-slot-[slot_id]port-[port_id]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('swPhys', 'swSubGroup'), (), ('Get',)),
+    'SwPhysFsm': ('swPhysFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('swPhys',), ('swPhysFsmStage',), (None,)),
+    'SwPhysFsmStage': ('swPhysFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('swPhysFsm',), (), (None,)),
+    'SwPhysFsmTask': ('swPhysFsmTask', 'task-[item]', 'Version201m', 'OutputOnly', 1, (), ('',), ('swPhys',), (), (None,)),
+    'SwPortBreakout': ('swPortBreakout', 'breakout-slot-[slot_id]-port-[port_id]', 'Version311e', 'InputOutput', 1, (), ('admin',), ('swExtUtility',), (), (None,)),
+    'SwSubGroup': ('swSubGroup', 'slot-[slot_id]-aggr-port-[aggr_port_id]', 'Version302c', 'InputOutput', 1, (), ('read-only',), ('swAccessDomain', 'swEthLanBorder', 'swEthMon', 'swFcMon', 'swFcSanBorder', 'swPhys'), ('swAccessEp', 'swEthEstcEp', 'swEthLanEp', 'swEthMonDestEp', 'swEthMonSrcEp', 'swFcoeEstcEp', 'swFcoeSanEp', 'swPhysEtherEp', 'swPhysFcEp'), (None,)),
+    'SwSystemStats': ('swSystemStats', 'sysstats', 'Version111j', 'OutputOnly', 1, (), ('admin', 'operations', 'read-only'), ('networkElement',), ('faultInst', 'swSystemStatsHist'), ('Get',)),
+    'SwSystemStatsHist': ('swSystemStatsHist', '[id]', 'Version111j', 'OutputOnly', 1, (), ('read-only',), ('swSystemStats',), (), ('Get',)),
+    'SwUlan': ('swUlan', 'vlan-[purpose]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('dcxVc', 'etherServerIntFIo', 'swAccessEp', 'swUtilityDomain'), (), ('Get',)),
+    'SwUtilityDomain': ('swUtilityDomain', 'utility-eth', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('eventInst', 'faultInst', 'swUlan', 'swUtilityDomainFsm', 'swUtilityDomainFsmTask'), ('Get',)),
+    'SwUtilityDomainFsm': ('swUtilityDomainFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('swUtilityDomain',), ('swUtilityDomainFsmStage',), (None,)),
+    'SwUtilityDomainFsmStage': ('swUtilityDomainFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('swUtilityDomainFsm',), (), (None,)),
+    'SwUtilityDomainFsmTask': ('swUtilityDomainFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('swUtilityDomain',), (), (None,)),
+    'SwVIFRef': ('swVIFRef', 'vifref-[id]', 'Version311e', 'InputOutput', 1, (), ('read-only',), ('swVlanGroup',), (), ('Get',)),
+    'SwVirtL3Intf': ('swVirtL3Intf', 'l3-vlan-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('swEthLanFlowMon',), (), (None,)),
+    'SwVlan': ('swVlan', 'vlan-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('dcxVc', 'swEthEstcEp', 'swEthEstcPc', 'swEthLanBorder', 'swEthLanEp', 'swEthLanPc', 'swEthMon', 'swFcSanBorder', 'swFcoeEstcEp', 'swFcoeSanEp', 'swFcoeSanPc', 'swNetflowExporter', 'vnicInternalProfile', 'vnicRackServerDiscoveryProfile'), ('fabricNetflowIPv4Addr', 'faultInst'), ('Get',)),
+    'SwVlanGroup': ('swVlanGroup', 'vlan-group-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swEthLanBorder',), ('swVIFRef', 'swVlanRef'), (None,)),
+    'SwVlanPortNs': ('swVlanPortNs', 'vlan-port-ns', 'Version131c', 'InputOutput', 1, (), ('read-only',), ('networkElement',), ('faultInst',), ('Get',)),
+    'SwVlanPortNsOverride': ('swVlanPortNsOverride', 'vlan-port-override', 'Version142b', 'InputOutput', 1, (), ('admin',), ('topSysDefaults',), (), ('Get',)),
+    'SwVlanRef': ('swVlanRef', 'vlanref-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swVlanGroup',), (), (None,)),
+    'SwVsan': ('swVsan', 'vsan-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('dcxFcoeVifEp', 'dcxVc', 'dcxVifEp', 'swFcMon', 'swFcSanBorder'), ('swFcZoneSet',), ('Get',)),
+    'SwZoneInitiatorMember': ('swZoneInitiatorMember', 'initiator-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swFcServerZoneGroup',), ('swFcZone',), (None,)),
+    'SwZoneTargetMember': ('swZoneTargetMember', 'target-[wwpn]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('swFcZone',), (), (None,)),
+    'SwatAction': ('swatAction', 'action-[name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('swatInjection',), ('swatCondition', 'swatTarget', 'swatTrigger'), ('Get',)),
+    'SwatCondition': ('swatCondition', 'cond-[var_name]-[operation]-[var_value]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('swatAction', 'swatTrigger'), (), ('Get',)),
+    'SwatInjection': ('swatInjection', 'inject-[name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('swatAction',), ('Get',)),
+    'SwatResultstats': ('swatResultstats', '', 'Version101e', 'InputOutput', 1, (), ('admin',), (), (), ('Get',)),
+    'SwatTarget': ('swatTarget', 'target-[var_name]-[var_value]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('swatAction',), (), ('Get',)),
+    'SwatTrigger': ('swatTrigger', 'trigger-[name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('swatAction', 'swatTrigger'), ('swatCondition', 'swatTrigger'), ('Get',)),
+    'SyntheticDirectory': ('syntheticDirectory', 'dir-[ino]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('syntheticDirectory', 'topSystem'), ('syntheticDirectory', 'syntheticFile'), ('Get',)),
+    'SyntheticFile': ('syntheticFile', 'file-[ino]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('syntheticDirectory',), (), ('Get',)),
+    'SyntheticFileSystem': ('syntheticFileSystem', 'FS-', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), (), ('Get',)),
+    'SyntheticFsObj': ('syntheticFsObj', 'file-[name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('topSystem',), ('eventInst', 'faultInst', 'syntheticFsObjFsm', 'syntheticFsObjFsmTask'), ('Get',)),
+    'SyntheticFsObjFsm': ('syntheticFsObjFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('syntheticFsObj',), ('syntheticFsObjFsmStage',), (None,)),
+    'SyntheticFsObjFsmStage': ('syntheticFsObjFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('syntheticFsObjFsm',), (), (None,)),
+    'SyntheticFsObjFsmTask': ('syntheticFsObjFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('syntheticFsObj',), (), (None,)),
+    'SyntheticTime': ('syntheticTime', 'time-[ts]', 'Version101e', 'InputOutput', 1, (), ('admin',), (), (), ('Get',)),
+    'SysdebugAutoCoreFileExportTarget': ('sysdebugAutoCoreFileExportTarget', 'file-export', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugEp',), ('eventInst', 'faultInst', 'sysdebugAutoCoreFileExportTargetFsm', 'sysdebugAutoCoreFileExportTargetFsmTask'), ('Get', 'Set')),
+    'SysdebugAutoCoreFileExportTargetFsm': ('sysdebugAutoCoreFileExportTargetFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugAutoCoreFileExportTarget',), ('sysdebugAutoCoreFileExportTargetFsmStage',), (None,)),
+    'SysdebugAutoCoreFileExportTargetFsmStage': ('sysdebugAutoCoreFileExportTargetFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugAutoCoreFileExportTargetFsm',), (), (None,)),
+    'SysdebugAutoCoreFileExportTargetFsmTask': ('sysdebugAutoCoreFileExportTargetFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('sysdebugAutoCoreFileExportTarget',), (), (None,)),
+    'SysdebugBackupBehavior': ('sysdebugBackupBehavior', 'backup', 'Version111j', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugMEpLogPolicy',), (), ('Get', 'Set')),
+    'SysdebugCore': ('sysdebugCore', 'file-[name]|[switch_id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugCoreFileRepository',), ('eventInst', 'faultInst', 'sysdebugCoreFsm', 'sysdebugCoreFsmTask', 'sysdebugManualCoreFileExportTarget', 'sysfileMutation'), ('Get',)),
+    'SysdebugCoreFileRepository': ('sysdebugCoreFileRepository', 'corefiles', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('topSystem',), ('sysdebugCore', 'sysfileMutation'), ('Get',)),
+    'SysdebugCoreFsm': ('sysdebugCoreFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugCore',), ('sysdebugCoreFsmStage',), (None,)),
+    'SysdebugCoreFsmStage': ('sysdebugCoreFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugCoreFsm',), (), (None,)),
+    'SysdebugCoreFsmTask': ('sysdebugCoreFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('sysdebugCore',), (), (None,)),
+    'SysdebugEp': ('sysdebugEp', 'sysdebug', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('sysdebugAutoCoreFileExportTarget', 'sysdebugLogControlEp', 'sysdebugLogExportPolicy'), ('Get',)),
+    'SysdebugLogControlDestinationFile': ('sysdebugLogControlDestinationFile', 'file', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugLogControlDomain',), (), ('Get',)),
+    'SysdebugLogControlDestinationSyslog': ('sysdebugLogControlDestinationSyslog', 'syslog', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugLogControlDomain',), (), ('Get',)),
+    'SysdebugLogControlDomain': ('sysdebugLogControlDomain', 'domain-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugLogControlEp',), ('sysdebugLogControlDestinationFile', 'sysdebugLogControlDestinationSyslog', 'sysdebugLogControlModule'), ('Get',)),
+    'SysdebugLogControlEp': ('sysdebugLogControlEp', 'logcontrol', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugEp',), ('eventInst', 'faultInst', 'sysdebugLogControlDomain', 'sysdebugLogControlEpFsm', 'sysdebugLogControlEpFsmTask'), ('Get',)),
+    'SysdebugLogControlEpFsm': ('sysdebugLogControlEpFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugLogControlEp',), ('sysdebugLogControlEpFsmStage',), (None,)),
+    'SysdebugLogControlEpFsmStage': ('sysdebugLogControlEpFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugLogControlEpFsm',), (), (None,)),
+    'SysdebugLogControlEpFsmTask': ('sysdebugLogControlEpFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('sysdebugLogControlEp',), (), (None,)),
+    'SysdebugLogControlModule': ('sysdebugLogControlModule', 'module-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugLogControlDomain',), (), ('Get',)),
+    'SysdebugLogExportPolicy': ('sysdebugLogExportPolicy', 'log-export-policy', 'Version222c', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugEp',), ('eventInst', 'faultInst', 'sysdebugLogExportPolicyFsm', 'sysdebugLogExportPolicyFsmTask', 'sysdebugLogExportStatus'), ('Get', 'Set')),
+    'SysdebugLogExportPolicyFsm': ('sysdebugLogExportPolicyFsm', 'fsm', 'Version222c', 'OutputOnly', 1, (), ('',), ('sysdebugLogExportPolicy',), ('sysdebugLogExportPolicyFsmStage',), (None,)),
+    'SysdebugLogExportPolicyFsmStage': ('sysdebugLogExportPolicyFsmStage', 'stage-[name]', 'Version222c', 'OutputOnly', 1, (), ('',), ('sysdebugLogExportPolicyFsm',), (), (None,)),
+    'SysdebugLogExportPolicyFsmTask': ('sysdebugLogExportPolicyFsmTask', 'task-[item]', 'Version222c', 'OutputOnly', 1, (), ('',), ('sysdebugLogExportPolicy',), (), (None,)),
+    'SysdebugLogExportStatus': ('sysdebugLogExportStatus', 'log-export-status-[switch_id]', 'Version222c', 'InputOutput', 1, (), ('read-only',), ('sysdebugLogExportPolicy',), ('faultInst',), ('Get',)),
+    'SysdebugMEpLog': ('sysdebugMEpLog', 'log-[type]-[id]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('mgmtController',), ('faultInst',), ('Get', 'Set')),
+    'SysdebugMEpLogPolicy': ('sysdebugMEpLogPolicy', 'log-[type]', 'Version111j', 'InputOutput', 1, (), ('admin', 'operations'), ('orgOrg',), ('sysdebugBackupBehavior',), ('Get',)),
+    'SysdebugManualCoreFileExportTarget': ('sysdebugManualCoreFileExportTarget', 'export-to-[hostname]', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugCore',), ('eventInst', 'faultInst', 'sysdebugManualCoreFileExportTargetFsm', 'sysdebugManualCoreFileExportTargetFsmTask'), ('Get',)),
+    'SysdebugManualCoreFileExportTargetFsm': ('sysdebugManualCoreFileExportTargetFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugManualCoreFileExportTarget',), ('sysdebugManualCoreFileExportTargetFsmStage',), (None,)),
+    'SysdebugManualCoreFileExportTargetFsmStage': ('sysdebugManualCoreFileExportTargetFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugManualCoreFileExportTargetFsm',), (), (None,)),
+    'SysdebugManualCoreFileExportTargetFsmTask': ('sysdebugManualCoreFileExportTargetFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('sysdebugManualCoreFileExportTarget',), (), (None,)),
+    'SysdebugTechSupFileRepository': ('sysdebugTechSupFileRepository', 'tech-support-files', 'Version141i', 'InputOutput', 1, (), ('admin', 'operations'), ('topSystem',), ('sysdebugTechSupport',), ('Get',)),
+    'SysdebugTechSupport': ('sysdebugTechSupport', 'tech-support-[creation_ts]', 'Version141i', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugTechSupFileRepository',), ('eventInst', 'faultInst', 'sysdebugTechSupportCmdOpt', 'sysdebugTechSupportFsm', 'sysdebugTechSupportFsmTask'), ('Add', 'Get', 'Set')),
+    'SysdebugTechSupportCmdOpt': ('sysdebugTechSupportCmdOpt', 'tech-support-cmd-opt', 'Version141i', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugTechSupport',), (), ('Add', 'Get', 'Set')),
+    'SysdebugTechSupportFsm': ('sysdebugTechSupportFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugTechSupport',), ('sysdebugTechSupportFsmStage',), (None,)),
+    'SysdebugTechSupportFsmStage': ('sysdebugTechSupportFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysdebugTechSupportFsm',), (), (None,)),
+    'SysdebugTechSupportFsmTask': ('sysdebugTechSupportFsmTask', 'task-[item]', 'Version141i', 'OutputOnly', 1, (), ('',), ('sysdebugTechSupport',), (), (None,)),
+    'SysfileDigest': ('sysfileDigest', 'filedigest-[name]-[creation_ts]', 'Version211a', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'SysfileMutation': ('sysfileMutation', 'mutation', 'Version101e', 'InputOutput', 1, (), ('admin', 'operations'), ('sysdebugCore', 'sysdebugCoreFileRepository'), ('eventInst', 'faultInst', 'sysfileMutationFsm', 'sysfileMutationFsmTask'), ('Add', 'Get')),
+    'SysfileMutationFsm': ('sysfileMutationFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysfileMutation',), ('sysfileMutationFsmStage',), (None,)),
+    'SysfileMutationFsmStage': ('sysfileMutationFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('sysfileMutationFsm',), (), (None,)),
+    'SysfileMutationFsmTask': ('sysfileMutationFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('sysfileMutation',), (), (None,)),
+    'TopInfoPolicy': ('topInfoPolicy', 'info-policy', 'Version223a', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-san-config'), ('topSystem',), (), ('Get', 'Set')),
+    'TopInfoSyncPolicy': ('topInfoSyncPolicy', 'info-sync-policy', 'Version227b', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-san-config'), ('orgOrg',), (), ('Get',)),
+    'TopMetaInf': ('topMetaInf', 'meta', 'Version111j', 'InputOutput', 1, (), ('read-only',), ('topRoot',), (), ('Get',)),
+    'TopRoot': ('topRoot', '', 'Version101e', 'InputOutput', 1, (), ('read-only',), (), ('aaaLog', 'apeManager', 'callhomeEp', 'capabilityCatalogue', 'clitestTypeTest', 'clitestTypeTest2', 'computeDefaults', 'dhcpInst', 'eventHolder', 'eventLog', 'extpolEp', 'fabricEp', 'faultHolder', 'fcpoolUniverse', 'gmetaEp', 'identMetaVerse', 'ippoolUniverse', 'iqnpoolUniverse', 'macpoolUniverse', 'morefImportRoot', 'nfsEp', 'observeObservedCont', 'orgOrg', 'policyPolicyEp', 'procManager', 'statsHolder', 'storageDomainEp', 'syntheticFileSystem', 'topMetaInf', 'topSysDefaults', 'topSystem', 'uuidpoolUniverse', 'vmEp'), ('Get',)),
+    'TopSysDefaults': ('topSysDefaults', 'sys-defaults', 'Version142b', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('capabilityNetworkLimits', 'capabilityStorageLimits', 'capabilitySystemLimits', 'swFabricZoneNsOverride', 'swVlanPortNsOverride'), ('Get',)),
+    'TopSystem': ('topSystem', 'sys', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config'), ('topRoot',), ('aaaAuthRealm', 'aaaLdapEp', 'aaaRadiusEp', 'aaaSessionInfoTable', 'aaaTacacsPlusEp', 'aaaUserEp', 'commSvcEp', 'computeRackUnit', 'controllerHaController', 'domainEnvironmentFeatureCont', 'domainNetworkFeatureCont', 'domainServerFeatureCont', 'domainStorageFeatureCont', 'equipmentChassis', 'equipmentFex', 'extmgmtIfMonPolicy', 'extvmmEp', 'featureContextEp', 'firmwareCatalogue', 'firmwareStatus', 'firmwareSystem', 'firmwareUpgradeInfo', 'fsmStatus', 'initiatorRequestorEp', 'initiatorRequestorGrpEp', 'licenseEp', 'mgmtAccessPolicy', 'mgmtBackup', 'mgmtBackupPolicyConfig', 'mgmtController', 'mgmtEntity', 'mgmtImporter', 'mgmtIntAuthPolicy', 'networkElement', 'pkiEp', 'policyControlEp', 'powerEp', 'swatInjection', 'syntheticDirectory', 'syntheticFsObj', 'sysdebugCoreFileRepository', 'sysdebugEp', 'sysdebugTechSupFileRepository', 'topInfoPolicy', 'trigLocalSched', 'trigMeta', 'trigSched', 'versionEp'), ('Get', 'Set')),
+    'TrigAbsWindow': ('trigAbsWindow', 'abs-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('trigLocalSched', 'trigSched'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'TrigClientToken': ('trigClientToken', 'clienttoken-[id]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('trigTriggered',), (), (None,)),
+    'TrigLocalAbsWindow': ('trigLocalAbsWindow', 'local-abs-default', 'Version211a', 'InputOutput', 1, (), ('admin',), ('trigLocalSched', 'trigSched'), (), ('Add', 'Get', 'Set')),
+    'TrigLocalSched': ('trigLocalSched', 'local-sched-default', 'Version211a', 'InputOutput', 1, (), ('admin',), ('computeFwSyncAck', 'cpmaintAck', 'faultSuppressTask', 'firmwareAck', 'firmwareInfra', 'lsmaintAck', 'mgmtBackupPolicyConfig', 'topSystem', 'trigTest'), ('trigAbsWindow', 'trigLocalAbsWindow', 'trigRecurrWindow'), ('Add', 'Get')),
+    'TrigMeta': ('trigMeta', 'meta-trig-[sched_name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('trigTriggered',), ('Get',)),
+    'TrigRecurrWindow': ('trigRecurrWindow', 'recurr-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('trigLocalSched', 'trigSched'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'TrigSched': ('trigSched', 'sched-[name]', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('topSystem',), ('trigAbsWindow', 'trigLocalAbsWindow', 'trigRecurrWindow'), ('Add', 'Get', 'Remove', 'Set')),
+    'TrigTest': ('trigTest', 'test-[name]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('orgOrg',), ('faultInst', 'trigLocalSched'), ('Get',)),
+    'TrigTriggered': ('trigTriggered', 'trig-[tr_id]', 'Version141i', 'InputOutput', 1, (), ('read-only',), ('trigMeta',), ('trigClientToken',), ('Get',)),
+    'UuidpoolAddr': ('uuidpoolAddr', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('uuidpoolUniverse',), ('faultInst', 'uuidpoolPoolable'), ('Get',)),
+    'UuidpoolBlock': ('uuidpoolBlock', 'block-from-[r_from]-to-[to]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('uuidpoolPool',), (), ('Add', 'Get', 'Remove')),
+    'UuidpoolFormat': ('uuidpoolFormat', 'format-[format]-[mask]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-storage', 'ls-storage-policy'), ('uuidpoolUniverse',), (), ('Get',)),
+    'UuidpoolPool': ('uuidpoolPool', 'uuid-pool-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('faultInst', 'uuidpoolBlock', 'uuidpoolPooled'), ('Add', 'Get', 'Remove', 'Set')),
+    'UuidpoolPoolable': ('uuidpoolPoolable', 'pool-[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('uuidpoolAddr',), (), ('Get',)),
+    'UuidpoolPooled': ('uuidpoolPooled', '[id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('uuidpoolPool',), (), ('Get',)),
+    'UuidpoolUniverse': ('uuidpoolUniverse', 'uuid', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('uuidpoolAddr', 'uuidpoolFormat'), ('Get',)),
+    'VersionApplication': ('versionApplication', 'application', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('versionEp',), (), (None,)),
+    'VersionEp': ('versionEp', 'version', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('topSystem',), ('versionApplication',), (None,)),
+    'VmComputeEp': ('vmComputeEp', 'computeEp-[uuid]', 'Version201m', 'InputOutput', 1, (), ('admin', 'read-only'), ('vmEp',), ('vmHba', 'vmNic'), ('Get',)),
+    'VmDC': ('vmDC', 'dc-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('extvmmProvider', 'vmDCOrg'), ('vmOrg',), ('Add', 'Get', 'Remove', 'Set')),
+    'VmDCOrg': ('vmDCOrg', 'dc-cont-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('extvmmProvider',), ('vmDC',), ('Add', 'Get', 'Remove', 'Set')),
+    'VmEp': ('vmEp', 'vmm', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('topRoot',), ('vmComputeEp', 'vmHv', 'vmInstance'), ('Get',)),
+    'VmHba': ('vmHba', 'hba-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'read-only'), ('vmComputeEp', 'vmHv', 'vmInstance'), ('vmVsan',), ('Get',)),
+    'VmHv': ('vmHv', 'hv-[uuid]', 'Version111j', 'InputOutput', 1, (), ('admin', 'read-only'), ('vmEp',), ('vmHba', 'vmNic'), ('Get',)),
+    'VmInstance': ('vmInstance', 'vm-[uuid]', 'Version101e', 'InputOutput', 1, (), ('admin', 'read-only'), ('vmEp',), ('vmHba', 'vmNic'), ('Get',)),
+    'VmLifeCyclePolicy': ('vmLifeCyclePolicy', 'vm-lc-policy', 'Version111j', 'InputOutput', 1, (), ('admin', 'pn-policy'), ('orgOrg',), ('eventInst', 'faultInst', 'vmLifeCyclePolicyFsm', 'vmLifeCyclePolicyFsmTask'), ('Get', 'Set')),
+    'VmLifeCyclePolicyFsm': ('vmLifeCyclePolicyFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('vmLifeCyclePolicy',), ('vmLifeCyclePolicyFsmStage',), (None,)),
+    'VmLifeCyclePolicyFsmStage': ('vmLifeCyclePolicyFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('vmLifeCyclePolicyFsm',), (), (None,)),
+    'VmLifeCyclePolicyFsmTask': ('vmLifeCyclePolicyFsmTask', 'task-[item]', 'Version201m', 'OutputOnly', 1, (), ('',), ('vmLifeCyclePolicy',), (), (None,)),
+    'VmNic': ('vmNic', 'nic-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'read-only'), ('vmComputeEp', 'vmHv', 'vmInstance'), ('adaptorEthPortBySizeLargeStats', 'adaptorEthPortBySizeSmallStats', 'adaptorEthPortErrStats', 'adaptorEthPortMcastStats', 'adaptorEthPortOutsizedStats', 'adaptorEthPortStats', 'adaptorFcPortStats', 'adaptorVnicStats', 'fabricEthMonSrcEp', 'fabricFcMonSrcEp', 'faultInst', 'vmVif', 'vmVlan'), ('Get',)),
+    'VmOrg': ('vmOrg', 'org-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('vmDC',), ('vmSwitch',), ('Add', 'Get', 'Remove', 'Set')),
+    'VmSwitch': ('vmSwitch', 'switch-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('extvmmProvider', 'extvmmSwitchSet', 'vmOrg'), ('extvmmUpLinkPP', 'vmVnicProfInst'), ('Add', 'Get', 'Remove', 'Set')),
+    'VmVif': ('vmVif', 'sw-[ph_switch_id]vif-[vif_id]', 'Version111j', 'InputOutput', 1, (), ('admin',), ('vmNic',), ('faultInst',), ('Get',)),
+    'VmVlan': ('vmVlan', 'net-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('vmNic',), (), ('Get',)),
+    'VmVnicProfCl': ('vmVnicProfCl', 'cl-[name]', 'Version111j', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-config-policy', 'ls-network', 'pn-policy'), ('vnicProfile',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VmVnicProfInst': ('vmVnicProfInst', 'vnic-prof-[name]', 'Version111j', 'InputOutput', 1, (), ('read-only',), ('vmSwitch',), ('vnicOProfileAlias', 'vnicProfileAlias'), ('Get',)),
+    'VmVsan': ('vmVsan', 'net-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('vmHba',), (), ('Get',)),
+    'VnicBootIpPolicy': ('vnicBootIpPolicy', '', 'Version141i', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), (), (), ('Get',)),
+    'VnicBootTarget': ('vnicBootTarget', 'boot-target', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), ('vnicFc',), (), ('Get',)),
+    'VnicConnDef': ('vnicConnDef', 'conn-def', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server'), ('lsServer',), ('faultInst',), ('Add', 'Get', 'Set')),
+    'VnicDefBeh': ('vnicDefBeh', 'def-beh-[type]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server'), ('lsServer',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicDynamicCon': ('vnicDynamicCon', 'dynamic-con', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-network-policy', 'ls-server'), ('lsServer',), (), ('Get', 'Set')),
+    'VnicDynamicConPolicy': ('vnicDynamicConPolicy', 'dynamic-con-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicDynamicConPolicyRef': ('vnicDynamicConPolicyRef', 'con-ref-[con_policy_name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), ('vnicEther', 'vnicLanConnTempl'), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'VnicDynamicIdUniverse': ('vnicDynamicIdUniverse', 'dynamic-id-universe-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), (), (), ('Get',)),
+    'VnicDynamicProvider': ('vnicDynamicProvider', 'dynamic-provider-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('vnicProfileSet',), ('vnicDynamicProviderEp',), ('Get',)),
+    'VnicDynamicProviderEp': ('vnicDynamicProviderEp', 'ep-[switch_id]-[chassis_id]:[slot_id]:[port_id]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('vnicDynamicProvider',), (), ('Get',)),
+    'VnicEthConfig': ('vnicEthConfig', 'eth-vnic', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('vnicIScsiInitAutoConfigPolicy',), ('faultInst',), (None,)),
+    'VnicEthLif': ('vnicEthLif', 'eth-lif-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-storage'), (), (), ('Get',)),
+    'VnicEther': ('vnicEther', 'ether-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), ('lsServer', 'vnicLanConnPolicy'), ('fabricEthMonSrcEp', 'fabricFcMonSrcEp', 'fabricNetflowMonSrcEp', 'faultInst', 'vnicDynamicConPolicyRef', 'vnicEtherIf', 'vnicFcOEIf', 'vnicLifVlan', 'vnicMacHistory', 'vnicUsnicConPolicyRef', 'vnicVmqConPolicyRef'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicEtherIf': ('vnicEtherIf', 'if-[name]', 'Version101e', 'InputOutput', 1, (), ('admin',), ('extvmmVMNetworkDefinition', 'fabricFlowMonExporterProfile', 'vnicEther', 'vnicIpc', 'vnicLanConnTempl', 'vnicProfile'), ('fabricNetflowIPv4Addr', 'faultInst', 'vnicIPv4If'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicFc': ('vnicFc', 'fc-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), ('lsServer', 'vnicSanConnPolicy'), ('fabricEthMonSrcEp', 'fabricFcMonSrcEp', 'fabricNetflowMonSrcEp', 'faultInst', 'vnicBootTarget', 'vnicFcIf', 'vnicWwpnHistory'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicFcGroupDef': ('vnicFcGroupDef', 'fc-group', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-server', 'ls-storage'), ('storageIniGroup',), ('faultInst', 'storageConnectionDef'), ('Add', 'Get', 'Set')),
+    'VnicFcGroupTempl': ('vnicFcGroupTempl', 'fc-group-templ-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('faultInst',), (None,)),
+    'VnicFcIf': ('vnicFcIf', 'if-default', 'Version101e', 'InputOutput', 1, (), ('admin',), ('vnicFc', 'vnicSanConnTempl'), ('faultInst',), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicFcLif': ('vnicFcLif', 'eth-lif-[name]', 'Version101e', 'InputOutput', 1, (), ('read-only',), (), ('vnicLifVsan',), ('Get',)),
+    'VnicFcNode': ('vnicFcNode', 'fc-node', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), ('lsServer', 'vnicSanConnPolicy'), ('faultInst', 'vnicWwnnHistory'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicFcOEIf': ('vnicFcOEIf', 'fcoe', 'Version101e', 'InputOutput', 1, (), ('admin', 'ext-lan-config', 'ext-lan-policy', 'ext-san-config', 'ext-san-policy', 'ls-config', 'ls-server', 'ls-storage'), ('vnicEther', 'vnicIpc', 'vnicLanConnTempl'), (), ('Get',)),
+    'VnicIPv4Dhcp': ('vnicIPv4Dhcp', 'ipv4-dhcp', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('adaptorHostIscsiIf', 'adaptorVlan', 'vnicIPv4If'), (), ('Add', 'Get', 'Remove')),
+    'VnicIPv4Dns': ('vnicIPv4Dns', 'ipv4-dns-[pref]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('adaptorHostIscsiIf', 'adaptorVlan', 'vnicIPv4If', 'vnicIPv4IscsiAddr', 'vnicIPv4PooledIscsiAddr'), (), ('Get',)),
+    'VnicIPv4If': ('vnicIPv4If', 'ipv4', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('vnicEtherIf', 'vnicIScsiBootVnic', 'vnicVlan'), ('fabricNetflowIPv4Addr', 'vnicIPv4Dhcp', 'vnicIPv4Dns', 'vnicIPv4IscsiAddr', 'vnicIPv4PooledIscsiAddr', 'vnicIPv4StaticRoute', 'vnicIpV4MgmtPooledAddr', 'vnicIpV4PooledAddr', 'vnicIpV4ProfDerivedAddr', 'vnicIpV4StaticAddr'), ('Add', 'Get')),
+    'VnicIPv4IscsiAddr': ('vnicIPv4IscsiAddr', 'ipv4iscsi', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('adaptorHostIscsiIf', 'adaptorVlan', 'vnicIPv4If', 'vnicIScsi'), ('vnicIPv4Dns',), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIPv4PooledIscsiAddr': ('vnicIPv4PooledIscsiAddr', 'ipv4-pooled-iscsiaddr', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('adaptorHostIscsiIf', 'adaptorVlan', 'vnicIPv4If'), ('faultInst', 'vnicIPv4Dns', 'vnicIpV4History'), ('Get', 'Set')),
+    'VnicIPv4StaticRoute': ('vnicIPv4StaticRoute', 'ipv4-route-[addr]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('adaptorHostIscsiIf', 'adaptorVlan', 'vnicIPv4If'), (), ('Get',)),
+    'VnicIPv6If': ('vnicIPv6If', '', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), (), ('vnicIpV6StaticAddr',), (None,)),
+    'VnicIScsi': ('vnicIScsi', 'iscsi-[name]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('lsServer',), ('fabricEthMonSrcEp', 'fabricFcMonSrcEp', 'fabricNetflowMonSrcEp', 'faultInst', 'vnicIPv4IscsiAddr', 'vnicIScsiAutoTargetIf', 'vnicIScsiStaticTargetIf', 'vnicIqnHistory', 'vnicMacHistory', 'vnicVlan'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIScsiAutoTargetIf': ('vnicIScsiAutoTargetIf', 'auto', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('adaptorVlan', 'vnicIScsi', 'vnicIScsiBootVnic', 'vnicVlan'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIScsiBootParams': ('vnicIScsiBootParams', 'iscsi-boot-params', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('lsServer',), ('vnicIScsiBootVnic',), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIScsiBootVnic': ('vnicIScsiBootVnic', 'boot-vnic-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('vnicIScsiBootParams',), ('faultInst', 'vnicIPv4If', 'vnicIScsiAutoTargetIf', 'vnicIScsiStaticTargetIf'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIScsiConfig': ('vnicIScsiConfig', 'iscsi-vnic', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('vnicIScsiInitAutoConfigPolicy',), ('faultInst',), (None,)),
+    'VnicIScsiInitAutoConfigPolicy': ('vnicIScsiInitAutoConfigPolicy', 'iscsi-init-autoconf-[name]', 'Version302c', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-server-policy', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('vnicEthConfig', 'vnicIScsiConfig'), (None,)),
+    'VnicIScsiLCP': ('vnicIScsiLCP', 'iscsi-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('lsServer', 'vnicLanConnPolicy'), ('fabricEthMonSrcEp', 'fabricFcMonSrcEp', 'fabricNetflowMonSrcEp', 'faultInst', 'vnicVlan'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIScsiNode': ('vnicIScsiNode', 'iscsi-node', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), ('lsServer', 'vnicLanConnPolicy'), ('faultInst', 'vnicIqnHistory'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIScsiStaticTargetIf': ('vnicIScsiStaticTargetIf', '[priority]', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('adaptorVlan', 'vnicIScsi', 'vnicIScsiBootVnic', 'vnicVlan'), ('faultInst', 'vnicLun'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicInternalProfile': ('vnicInternalProfile', 'vnic-[name]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('vnicProfileSet',), ('swVlan',), ('Get',)),
+    'VnicIpV4History': ('vnicIpV4History', 'ipv4-history', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('vnicIPv4PooledIscsiAddr', 'vnicIpV4MgmtPooledAddr', 'vnicIpV4PooledAddr'), (), (None,)),
+    'VnicIpV4MgmtPooledAddr': ('vnicIpV4MgmtPooledAddr', 'ipv4-pooled-addr', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('adaptorHostIscsiIf', 'adaptorVlan', 'lsServer', 'mgmtVnet', 'vnicIPv4If'), ('faultInst', 'vnicIpV4History'), ('Get', 'Remove', 'Set')),
+    'VnicIpV4PooledAddr': ('vnicIpV4PooledAddr', 'ipv4-pooled-addr', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('adaptorHostIscsiIf', 'adaptorVlan', 'lsServer', 'mgmtController', 'mgmtVnet', 'vnicIPv4If'), ('faultInst', 'vnicIpV4History'), ('Get',)),
+    'VnicIpV4ProfDerivedAddr': ('vnicIpV4ProfDerivedAddr', 'ipv4-prof-addr', 'Version141i', 'InputOutput', 1, (), ('admin',), ('adaptorHostIscsiIf', 'adaptorVlan', 'mgmtController', 'vnicIPv4If'), (), ('Get',)),
+    'VnicIpV4StaticAddr': ('vnicIpV4StaticAddr', 'ipv4-static-addr', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('adaptorHostIscsiIf', 'adaptorVlan', 'lsServer', 'lsbootLanImagePath', 'mgmtController', 'mgmtVnet', 'vnicIPv4If'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIpV6History': ('vnicIpV6History', 'ipv6-history', 'Version221b', 'InputOutput', 1, (), ('read-only',), ('vnicIpV6MgmtPooledAddr',), (), (None,)),
+    'VnicIpV6MgmtPooledAddr': ('vnicIpV6MgmtPooledAddr', 'ipv6-pooled-addr', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('mgmtVnet',), ('faultInst', 'vnicIpV6History'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIpV6StaticAddr': ('vnicIpV6StaticAddr', 'ipv6-static-addr', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('mgmtVnet', 'vnicIPv6If'), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicIpc': ('vnicIpc', 'ipc-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), ('lsServer',), ('fabricEthMonSrcEp', 'fabricFcMonSrcEp', 'fabricNetflowMonSrcEp', 'faultInst', 'vnicEtherIf', 'vnicFcOEIf', 'vnicLifVlan'), ('Get',)),
+    'VnicIpcIf': ('vnicIpcIf', 'if-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), (), (), ('Get',)),
+    'VnicIqnHistory': ('vnicIqnHistory', 'iqn-history', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('vnicIScsi', 'vnicIScsiNode'), (), (None,)),
+    'VnicLanConnPolicy': ('vnicLanConnPolicy', 'lan-conn-pol-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), ('orgOrg',), ('vnicEther', 'vnicIScsiLCP', 'vnicIScsiNode'), ('Add', 'Get', 'Remove')),
+    'VnicLanConnTempl': ('vnicLanConnTempl', 'lan-conn-templ-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('orgOrg',), ('faultInst', 'vnicDynamicConPolicyRef', 'vnicEtherIf', 'vnicFcOEIf', 'vnicUsnicConPolicyRef', 'vnicVmqConPolicyRef'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicLifVlan': ('vnicLifVlan', 'vlan-[vnet]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('vnicEther', 'vnicIpc'), (), ('Get',)),
+    'VnicLifVsan': ('vnicLifVsan', 'vsan-[vnet]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('vnicFcLif',), (), ('Get',)),
+    'VnicLun': ('vnicLun', 'lun', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), ('vnicIScsiStaticTargetIf',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicMacHistory': ('vnicMacHistory', 'mac-history', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('vnicEther', 'vnicIScsi'), (), (None,)),
+    'VnicOProfileAlias': ('vnicOProfileAlias', 'swid-[v_switch_name]alias-[alias]', 'Version201m', 'InputOutput', 1, (), ('read-only',), ('vmVnicProfInst', 'vnicProfile'), (), ('Get',)),
+    'VnicProfile': ('vnicProfile', 'vnic-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('vnicProfileSet',), ('fabricNetflowMonSrcEp', 'faultInst', 'swNetflowMonitorRef', 'vmVnicProfCl', 'vnicEtherIf', 'vnicOProfileAlias', 'vnicProfileAlias'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicProfileAlias': ('vnicProfileAlias', 'uuid-[sw_uuid]alias-[alias]', 'Version101e', 'InputOutput', 1, (), ('read-only',), ('vmVnicProfInst', 'vnicProfile'), (), ('Get',)),
+    'VnicProfileRef': ('vnicProfileRef', 'vnic-profileref-[name]', 'Version221b', 'InputOutput', 1, (), ('read-only',), (), (), (None,)),
+    'VnicProfileSet': ('vnicProfileSet', 'profiles', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy'), ('fabricLanCloud',), ('eventInst', 'faultInst', 'vnicDynamicProvider', 'vnicInternalProfile', 'vnicProfile', 'vnicProfileSetFsm', 'vnicProfileSetFsmTask', 'vnicRackServerDiscoveryProfile'), ('Get',)),
+    'VnicProfileSetFsm': ('vnicProfileSetFsm', 'fsm', 'Version211a', 'OutputOnly', 1, (), ('',), ('vnicProfileSet',), ('vnicProfileSetFsmStage',), (None,)),
+    'VnicProfileSetFsmStage': ('vnicProfileSetFsmStage', 'stage-[name]', 'Version211a', 'OutputOnly', 1, (), ('',), ('vnicProfileSetFsm',), (), (None,)),
+    'VnicProfileSetFsmTask': ('vnicProfileSetFsmTask', 'task-[item]', 'Version111j', 'OutputOnly', 1, (), ('',), ('vnicProfileSet',), (), (None,)),
+    'VnicRackServerDiscoveryProfile': ('vnicRackServerDiscoveryProfile', 'vnic-[name]', 'Version211a', 'InputOutput', 1, (), ('read-only',), ('equipmentChassis', 'vnicProfileSet'), ('swVlan',), (None,)),
+    'VnicSanConnPolicy': ('vnicSanConnPolicy', 'san-conn-pol-[name]', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), ('orgOrg',), ('storageIniGroup', 'vnicFc', 'vnicFcNode'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicSanConnTempl': ('vnicSanConnTempl', 'san-conn-templ-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-storage', 'ls-storage-policy'), ('orgOrg',), ('faultInst', 'vnicFcIf'), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicScsi': ('vnicScsi', 'scsi-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), ('lsServer',), ('fabricEthMonSrcEp', 'fabricFcMonSrcEp', 'fabricNetflowMonSrcEp', 'faultInst'), ('Get',)),
+    'VnicScsiIf': ('vnicScsiIf', 'if-[name]', 'Version101e', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), (), (), ('Get',)),
+    'VnicUsnicConPolicy': ('vnicUsnicConPolicy', 'usnic-con-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-network', 'ls-network-policy', 'ls-server'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicUsnicConPolicyRef': ('vnicUsnicConPolicyRef', 'usnic-con-ref', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-config', 'ls-network', 'ls-server'), ('vnicEther', 'vnicLanConnTempl'), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'VnicVhbaBehPolicy': ('vnicVhbaBehPolicy', 'beh-vhba', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-server', 'ls-storage'), ('orgOrg',), (), ('Get', 'Set')),
+    'VnicVlan': ('vnicVlan', 'vlan', 'Version201m', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server', 'ls-storage'), ('vnicIScsi', 'vnicIScsiLCP'), ('vnicIPv4If', 'vnicIScsiAutoTargetIf', 'vnicIScsiStaticTargetIf'), ('Add', 'Get', 'Set')),
+    'VnicVmqConPolicy': ('vnicVmqConPolicy', 'vmq-con-[name]', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-compute', 'ls-network', 'ls-network-policy', 'ls-server'), ('orgOrg',), (), ('Add', 'Get', 'Remove', 'Set')),
+    'VnicVmqConPolicyRef': ('vnicVmqConPolicyRef', 'vmq-con-ref', 'Version221b', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), ('vnicEther', 'vnicLanConnTempl'), ('faultInst',), ('Add', 'Get', 'Remove')),
+    'VnicVnicBehPolicy': ('vnicVnicBehPolicy', 'beh-vnic', 'Version211a', 'InputOutput', 1, (), ('admin', 'ls-config', 'ls-network', 'ls-server'), ('orgOrg',), (), ('Get', 'Set')),
+    'VnicWwnnHistory': ('vnicWwnnHistory', 'wwnn-history', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('vnicFcNode',), (), (None,)),
+    'VnicWwpnHistory': ('vnicWwpnHistory', 'wwpn-history', 'Version212a', 'InputOutput', 1, (), ('read-only',), ('vnicFc',), (), (None,)),
+}
@@ -19,6 +19,7 @@ from __future__ import print_function
 
 import logging
 import os
+import sys
 
 from . import ucsgenutils
 from . import ucscoreutils
@@ -34,9 +35,100 @@ except ImportError:
 from .ucscoremeta import WriteXmlOption
 from .ucsexception import UcsValidationException, UcsWarning
 from .ucscore import UcsBase
+from .ucsrntemplate import rn_template
 
 log = logging.getLogger('ucs')
 
+# ElementTree sorts the attributes of the elements it serializes before
+# python 3.8, and keeps their order since
+_SORT_ATTRIB = sys.version_info < (3, 8)
+# ElementTree escapes carriage returns and tabs in attribute values from
+# python 3.9, and writes them raw before
+_ESCAPE_CR_TAB = sys.version_info >= (3, 9)
+
+try:
+    _TEXT_TYPES = (str, unicode)
+except NameError:
+    _TEXT_TYPES = (str,)
+
+# ManagedObject subclass -> names of its properties that are also class
+# attributes
+_class_attr_props = {}
+
+# ManagedObject subclass -> ({property name: (xml attribute, dirty mask)},
+# names of the properties read through getattr) of the properties written
+# by to_xml
+_xml_plans = {}
+
+
+def _xml_plan(cls):
+    """
+    Returns the serialization plan of a ManagedObject subclass, computed
+    once per class from its prop_meta.
+    """
+
+    plan = _xml_plans.get(cls)
+    if plan is None:
+        attrs = dict((name, (prop.xml_attribute, prop.mask))
+                     for name, prop in cls.prop_meta.items() if name != 'rn')
+        plan = (attrs, frozenset(name for name in attrs
+                                 if hasattr(cls, name)))
+        _xml_plans[cls] = plan
+    return plan
+
+
+def _escape_attrib(value):
+    """
+    Escapes an attribute value the way ElementTree serializes it.
+    """
+
+    if not isinstance(value, _TEXT_TYPES):
+        raise TypeError("cannot serialize %r (type %s)" % (
+            value, type(value).__name__))
+    if "&" in value:
+        value = value.replace("&", "&amp;")
+    if "<" in value:
+        value = value.replace("<", "&lt;")
+    if ">" in value:
+        value = value.replace(">", "&gt;")
+    if "\"" in value:
+        value = value.replace("\"", "&quot;")
+    if "\r" in value and _ESCAPE_CR_TAB:
+        value = value.replace("\r", "&#13;")
+    if "\n" in value:
+        value = value.replace("\n", "&#10;")
+    if "\t" in value and _ESCAPE_CR_TAB:
+        value = value.replace("\t", "&#09;")
+    return value
+
+
+def write_xml_elem(write, tag, attrib, children=None):
+    """
+    Writes an element the way ElementTree serializes it, without creating
+    the element.
+
+    Args:
+        write (function): called with every piece of the xml string
+        tag (str): tag of the element
+        attrib (dict): attributes of the element, in order, sorted like
+            ElementTree does before python 3.8
+        children (list): xml strings of the child elements
+    """
+
+    items = attrib.items()
+    if _SORT_ATTRIB:
+        items = sorted(items)
+    write("<" + tag)
+    for key, value in items:
+        write(' %s="%s"' % (key, _escape_attrib(value)))
+    if children:
+        write(">")
+        for child in children:
+            write(child)
+        write("</" + tag + ">")
+    else:
+        write(" />")
+
 
 class _GenericProp():
     """
@@ -143,7 +235,7 @@ class ManagedObject(UcsBase):
         if from_xml_response:
             return
 
-        if "prop_meta" in dir(self) and "rn" in self.prop_meta:
+        if "rn" in self.__prop_names():
             self.rn = self.make_rn()
         else:
             self.rn = ""
@@ -156,7 +248,7 @@ class ManagedObject(UcsBase):
         if from_xml_response:
             return
 
-        if "prop_meta" in dir(self) and "dn" in self.prop_meta:
+        if "dn" in self.__prop_names():
             if self.__parent_dn:
                 self.dn = self.__parent_dn + '/' + self.rn
             else:
@@ -164,13 +256,32 @@ class ManagedObject(UcsBase):
         else:
             self.dn = ""
 
+    def __prop_names(self):
+        """
+        Internal method to get the names of the known properties of the
+        class. Also records which of them shadow a class attribute, as those
+        count as initialized from the start.
+        """
+
+        cls = self.__class__
+        prop_meta = getattr(cls, "prop_meta", None)
+        if prop_meta is None:
+            return ()
+
+        if cls not in _class_attr_props:
+            _class_attr_props[cls] = frozenset(
+                name for name in prop_meta if hasattr(cls, name))
+        return prop_meta
+
     def __setattr__(self, name, value):
         """
         overridden setattr method
         """
 
-        if "prop_meta" in dir(self) and name in self.prop_meta:
-            if name in dir(self):
+        if name in self.__prop_names():
+            # the property is set through __set_prop once initialized
+            if name in self.__dict__ or \
+                    name in _class_attr_props[self.__class__]:
                 self.__set_prop(name, value)
             else:
                 if value:
@@ -272,7 +383,7 @@ class ManagedObject(UcsBase):
 
         if self.__class__.__name__ == "ManagedObject" and not self.is_dirty():
             self._dirty_mask = ManagedObject.DUMMY_DIRTY
-        elif "mo_meta" in dir(self):
+        elif hasattr(self, "mo_meta"):
             self._dirty_mask = self.mo_meta.mask
 
     def is_dirty(self):
@@ -309,20 +420,19 @@ class ManagedObject(UcsBase):
         This method returns the Rn for a managed object.
         """
 
-        import re
-
-        rn_pattern = self.mo_meta.rn
-        for prop in re.findall(r"""\[([^\]]*)\]""", rn_pattern):
+        template = rn_template(self.mo_meta.rn)
+        values = {}
+        for prop in template.props:
             if prop in self.prop_meta:
-                if getattr(self, prop):
-                    rn_pattern = re.sub(r"""\[%s\]""" % prop,
-                                        '%s' % getattr(self, prop), rn_pattern)
-                else:
-                    log.debug('Property "%s" was None in make_rn' % prop)
-                    if self.rn_is_special_case():
-                        return self.rn_get_special_case()
-                    raise UcsValidationException(
-                        'Property "%s" was None in make_rn' % prop)
+                value = getattr(self, prop)
+                if value:
+                    values[prop] = value
+                    continue
+                log.debug('Property "%s" was None in make_rn' % prop)
+                if self.rn_is_special_case():
+                    return self.rn_get_special_case()
+                raise UcsValidationException(
+                    'Property "%s" was None in make_rn' % prop)
             else:
                 log.debug(
                     'Property "%s" was not found in make_rn arguments' % prop)
@@ -331,7 +441,7 @@ class ManagedObject(UcsBase):
                 raise UcsValidationException(
                     'Property "%s" was not found in make_rn arguments' % prop)
 
-        return rn_pattern
+        return template.format(values)
 
     def to_xml(self, xml_doc=None, option=None, elem_name=None):
         """
@@ -346,17 +456,38 @@ class ManagedObject(UcsBase):
                                    xml_doc=xml_doc,
                                    override_tag=elem_name)
 
-        for key in self.__dict__:
-            if key != 'rn' and key in self.prop_meta:
-                mo_prop_meta = self.prop_meta[key]
-                if (option != WriteXmlOption.DIRTY or (
-                    mo_prop_meta.mask is not None and
-                        self._dirty_mask & mo_prop_meta.mask != 0)):
-                    value = getattr(self, key)
+        for key, value in self.__xml_attrib(option).items():
+            xml_obj.set(key, value)
+
+        self.child_to_xml(xml_obj, option)
+        return xml_obj
+
+    def __xml_attrib(self, option):
+        """
+        Internal method returning the xml attributes written by to_xml, in
+        order.
+        """
+
+        attrib = {}
+        plan, class_attrs = _xml_plan(self.__class__)
+        dirty_only = option == WriteXmlOption.DIRTY
+        dirty_mask = self._dirty_mask
+        xtra_props = self.__xtra_props
+        for key, value in self.__dict__.items():
+            if value is None and key not in class_attrs:
+                # most of the properties are not set, and never written
+                continue
+            prop = plan.get(key)
+            if prop is not None:
+                xml_attribute, mask = prop
+                if not dirty_only or (mask is not None and
+                                      dirty_mask & mask != 0):
+                    if key in class_attrs:
+                        value = getattr(self, key)
                     if value is not None:
-                        xml_obj.set(mo_prop_meta.xml_attribute, value)
+                        attrib[xml_attribute] = value
             else:
-                if key not in self.__xtra_props:
+                if key not in xtra_props:
                     # This is an internal property
                     # This should not be a part of the xml
                     continue
@@ -365,17 +496,45 @@ class ManagedObject(UcsBase):
                 # This should be a part of the xml
                 # The server might understand this property, even though
                 # the sdk does not
-                if option != WriteXmlOption.DIRTY or \
-                        self.__xtra_props[key].is_dirty:
-                    value = self.__xtra_props[key].value
+                if not dirty_only or xtra_props[key].is_dirty:
+                    value = xtra_props[key].value
                     if value is not None:
-                        xml_obj.set(key, value)
+                        attrib[key] = value
 
-        if 'dn' not in xml_obj.attrib:
-            xml_obj.set('dn', self.dn)
+        if 'dn' not in attrib:
+            attrib['dn'] = self.dn
+        return attrib
 
-        self.child_to_xml(xml_obj, option)
-        return xml_obj
+    def write_xml(self, write, option=None):
+        """
+        Writes the xml representation of the managed object, the same as
+        the serialized element of to_xml, without creating the element.
+
+        Args:
+            write (function): called with every piece of the xml string
+            option (WriteXmlOption): WriteXmlOption.DIRTY to only write
+                the modified properties and objects
+
+        Returns:
+            True if the object was written, False if it was not dirty
+        """
+
+        if option == WriteXmlOption.DIRTY and not self.is_dirty():
+            log.debug("Object is not dirty")
+            return False
+
+        children = []
+        for child in self._child:
+            if isinstance(child, ManagedObject):
+                child.write_xml(children.append, option)
+                continue
+            elem = child.to_xml(option=option)
+            if elem is not None:
+                children.append(ET.tostring(elem).decode('ascii'))
+
+        write_xml_elem(write, self.mo_meta.xml_attribute,
+                       self.__xml_attrib(option), children)
+        return True
 
     def from_xml(self, elem, handle=None):
         """
@@ -407,7 +566,7 @@ class ManagedObject(UcsBase):
             self.__set_prop("rn", os.path.basename(self.dn), forced=True)
         self.mark_clean()
 
-        child_elems = elem.getchildren()
+        child_elems = list(elem)
         if child_elems:
             for child_elem in child_elems:
                 if not ET.iselement(child_elem):
@@ -477,9 +636,8 @@ def generic_mo_from_xml_elem(elem):
     create GenericMo object from xml element
     """
 
-    from . import ucsxmlcodec as xc
-    xml_str = xc.to_xml_str(elem)
-    gmo = generic_mo_from_xml(xml_str)
+    gmo = GenericMo(elem.tag)
+    gmo.from_xml(elem)
     return gmo
 
 
@@ -623,7 +781,7 @@ class GenericMo(UcsBase):
         # else:
         #     raise ValueError("Both rn and dn does not present.")
 
-        children = elem.getchildren()
+        children = list(elem)
         if children:
             for child in children:
                 if not ET.iselement(child):
@@ -642,12 +800,10 @@ class GenericMo(UcsBase):
         Internal methods to create managed object from class_id
         """
 
-        import inspect
-
-        mo_class = ucscoreutils.load_class(class_id)
-        mo_class_params = inspect.getargspec(mo_class.__init__)[0][2:]
+        mo_class, naming_props, top_root = \
+            ucscoreutils.load_mo_class_info(class_id)
         mo_class_param_dict = {}
-        for param in mo_class_params:
+        for param in naming_props:
             mo_param = mo_class.prop_meta[param].xml_attribute
             if mo_param not in self.__properties:
                 if 'rn' in self.__properties:
@@ -666,7 +822,7 @@ class GenericMo(UcsBase):
 
         p_dn = ""
 
-        if 'topRoot' in mo_class.mo_meta.parents:
+        if top_root:
             mo_obj = mo_class(**mo_class_param_dict)
         else:
             mo_obj = mo_class(parent_mo_or_dn=p_dn, **mo_class_param_dict)
@@ -0,0 +1,528 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the managed object cache of a UcsHandle, which keeps
+a copy of selected classes and subtrees current from the event channel.
+"""
+
+import logging
+import os
+import threading
+import time
+
+from . import ucsgenutils
+from . import ucscoreutils
+from . import ucsxmlcodec as xc
+from .ucsexception import UcsException, UcsValidationException
+
+log = logging.getLogger('ucs')
+
+
+class _CacheScope(object):
+    """
+    The objects of a cached class or subtree, stored as xml elements and
+    indexed by dn and by parent dn.
+    """
+
+    def __init__(self, key, max_objects):
+        self.key = key
+        self.max_objects = max_objects
+        self.objects = {}
+        self.children = {}
+        self.loaded_at = None
+        self.loading = False
+        self.stale = False
+        self.evicted = False
+        # events received while the scope is loaded, applied once the
+        # loaded objects replace the cached ones
+        self.backlog = []
+
+    def put(self, elem):
+        dn = elem.attrib["dn"]
+        if dn not in self.objects:
+            self.children.setdefault(os.path.dirname(dn), set()).add(dn)
+        self.objects[dn] = elem
+
+    def pop(self, dn):
+        if self.objects.pop(dn, None) is None:
+            return
+        parent_dn = os.path.dirname(dn)
+        siblings = self.children.get(parent_dn)
+        siblings.discard(dn)
+        if not siblings:
+            del self.children[parent_dn]
+
+    def clear(self):
+        self.objects = {}
+        self.children = {}
+
+
+class UcsMoCache(object):
+    """
+    Keeps an in-memory copy of the managed objects of selected classes and
+    subtrees of a UcsHandle, current from the configMoChangeEvents of the
+    event channel, and serves the queries of the handle on them.
+
+    The cache subscribes to the event channel first, then loads every class
+    with one configResolveClass and every subtree with one hierarchical
+    configResolveDn. Created objects are added, modified ones updated with
+    the changed properties and deleted ones removed with their descendants.
+
+    A class or subtree is reloaded on its next query once it is older than
+    max_age seconds, after events were missed, and after objects it covers
+    were committed through the handle. A class or subtree
+    growing beyond max_objects objects is dropped from the cache and its
+    queries go to the server.
+
+    Args:
+        handle (UcsHandle): connection handle
+        class_ids (list): class ids of the objects to cache
+        dns (list): dns of the subtrees to cache
+        max_age (float): seconds after which a class or subtree is reloaded,
+            None to only rely on the events
+        max_objects (int or dict): maximum number of objects of a class or
+            subtree, or dict of the maximum of every class id or dn
+        reactor (UcsEventReactor): reactor which runs the event handle
+
+    Example:
+        cache = UcsMoCache(handle, class_ids=["LsServer", "ComputeBlade"],
+                           max_age=3600)\n
+        cache.start()\n
+        found, sps = cache.lookup_classid("LsServer")\n
+        cache.stop()\n
+    """
+
+    def __init__(self, handle, class_ids=(), dns=(), max_age=None,
+                 max_objects=None, reactor=None):
+        if not class_ids and not dns:
+            raise ValueError("Provide class_ids or dns to cache.")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be a positive number")
+
+        self.__handle = handle
+        self.__reactor = reactor
+        self.__max_age = max_age
+        self.__lock = threading.RLock()
+        self.__ueh = None
+        self.__classes = {}
+        self.__subtrees = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reloads = 0
+
+        for class_id in class_ids:
+            meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+                class_id)
+            if meta_class_id is None:
+                raise UcsValidationException(
+                    "Invalid ClassId %s specified." % class_id)
+            self.__classes[meta_class_id] = _CacheScope(
+                meta_class_id, self.__max_objects(max_objects, class_id,
+                                                  meta_class_id))
+        for dn in dns:
+            dn = dn.rstrip("/")
+            self.__subtrees[dn] = _CacheScope(
+                dn, self.__max_objects(max_objects, dn))
+
+    @staticmethod
+    def __max_objects(max_objects, *keys):
+        if not isinstance(max_objects, dict):
+            return max_objects
+        for key in keys:
+            if key in max_objects:
+                return max_objects[key]
+        return None
+
+    def __scopes(self):
+        return list(self.__classes.values()) + list(self.__subtrees.values())
+
+    def start(self):
+        """
+        Subscribes to the event channel and loads the cached classes and
+        subtrees. A class or subtree which cannot be loaded yet is loaded
+        on its first query.
+        """
+
+        from .ucseventhandler import UcsEventHandle, _SUBSCRIBE_TIMEOUT
+
+        if self.__ueh is not None:
+            return
+        self.__ueh = UcsEventHandle(self.__handle, reactor=self.__reactor)
+        self.__ueh._resync_callbacks.append(self.invalidate)
+        self.__ueh.add(call_back=self.__apply)
+
+        # Event.wait returns None before python 2.7
+        self.__ueh._subscribed.wait(_SUBSCRIBE_TIMEOUT)
+        if not self.__ueh._subscribed.is_set():
+            log.info("Event subscription failed, the cache of %s is not "
+                     "loaded." % self.__handle.uri)
+            return
+        for scope in self.__scopes():
+            self.__load(scope)
+
+    def stop(self):
+        """
+        Closes the event channel of the cache and drops the cached objects.
+        """
+
+        ueh, self.__ueh = self.__ueh, None
+        if ueh is not None:
+            ueh.clean()
+        with self.__lock:
+            for scope in self.__scopes():
+                scope.clear()
+                scope.loaded_at = None
+
+    def invalidate(self, class_id_or_dn=None):
+        """
+        Reloads a class or subtree, or all of them, on their next query.
+
+        Args:
+            class_id_or_dn (str): class id or subtree dn, None for all
+        """
+
+        key = class_id_or_dn
+        if key is not None:
+            key = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+                key) or key.rstrip("/")
+        with self.__lock:
+            for scope in self.__scopes():
+                if key is None or scope.key == key:
+                    scope.stale = True
+
+    def invalidate_mos(self, mos):
+        """
+        Reloads the classes and subtrees of committed objects on their next
+        query, their events may only come after it. Called by
+        UcsHandle.commit.
+
+        Args:
+            mos (list): committed managed objects, their modified children
+                included
+        """
+
+        with self.__lock:
+            for mo in mos:
+                class_id = \
+                    ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+                        mo.get_class_id())
+                prefix = mo.dn + "/"
+                deleted = "deleted" in (getattr(mo, "status", None) or "")
+                for scope in self.__scopes():
+                    if self.__covers(scope, class_id, mo.dn) or (
+                            deleted and any(dn.startswith(prefix)
+                                            for dn in scope.objects)):
+                        scope.stale = True
+
+    def stats(self):
+        """
+        Returns the counters of the cache and the state of every cached
+        class and subtree.
+
+        Returns:
+            dict
+
+        Example:
+            print(cache.stats()["hits"])\n
+        """
+
+        now = time.time()
+        with self.__lock:
+            scopes = {}
+            for scope in self.__scopes():
+                age = None
+                if scope.loaded_at is not None:
+                    age = now - scope.loaded_at
+                scopes[scope.key] = {"objects": len(scope.objects),
+                                     "age": age,
+                                     "stale": scope.stale,
+                                     "evicted": scope.evicted}
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions,
+                    "reloads": self.reloads,
+                    "scopes": scopes}
+
+    def __is_current(self, scope):
+        if scope.loaded_at is None or scope.loading or scope.stale or \
+                scope.evicted:
+            return False
+        if self.__max_age is not None and \
+                time.time() - scope.loaded_at > self.__max_age:
+            return False
+        return True
+
+    def __ensure(self, scope):
+        """
+        Returns True if the objects of the scope can be served, reloading
+        the scope first if needed.
+        """
+
+        with self.__lock:
+            if self.__is_current(scope):
+                return True
+            if scope.evicted or scope.loading or self.__ueh is None or \
+                    not self.__ueh._subscribed.is_set():
+                return False
+        return self.__load(scope)
+
+    def __fetch(self, scope):
+        from .ucsmethodfactory import config_resolve_class, \
+            config_resolve_dn
+
+        handle = self.__handle
+        if scope.key in self.__classes:
+            elem = config_resolve_class(cookie=handle.cookie,
+                                        class_id=scope.key,
+                                        in_filter=None,
+                                        in_hierarchical=False)
+        else:
+            elem = config_resolve_dn(cookie=handle.cookie, dn=scope.key,
+                                     in_hierarchical=True)
+
+        stream = handle._post_elem_stream(elem)
+        try:
+            response_str = stream.read()
+        finally:
+            stream.close()
+        if isinstance(response_str, bytes):
+            response_str = response_str.decode('utf-8')
+        root = xc.extract_root_elem(
+            ucsgenutils.add_escape_chars(response_str))
+        if root.tag == "error" or root.attrib.get('errorCode', "0") != "0":
+            raise UcsException(root.attrib.get('errorCode'),
+                               root.attrib.get('errorDescr'))
+
+        elems = []
+        for out_configs in root:
+            for mo_elem in out_configs:
+                self.__flatten(mo_elem, "", elems)
+        return elems
+
+    def __flatten(self, mo_elem, parent_dn, elems):
+        attrib = dict(mo_elem.attrib)
+        if "dn" not in attrib:
+            attrib["dn"] = parent_dn + "/" + attrib.get("rn", "")
+        elems.append(xc.Element(mo_elem.tag, attrib))
+        for child in mo_elem:
+            self.__flatten(child, attrib["dn"], elems)
+
+    def __load(self, scope):
+        with self.__lock:
+            if scope.loading:
+                return False
+            scope.loading = True
+            scope.stale = False
+            scope.backlog = []
+
+        try:
+            elems = self.__fetch(scope)
+        except Exception as e:
+            log.info("Loading %s in the cache failed: %s" % (scope.key,
+                                                             str(e)))
+            with self.__lock:
+                scope.loading = False
+            return False
+
+        with self.__lock:
+            scope.clear()
+            for elem in elems:
+                scope.put(elem)
+            scope.loading = False
+            scope.loaded_at = time.time()
+            self.reloads += 1
+            backlog, scope.backlog = scope.backlog, []
+            for class_id, dn, properties in backlog:
+                self.__apply_to_scope(scope, class_id, dn, properties)
+            self.__check_size(scope)
+            return self.__is_current(scope)
+
+    def __check_size(self, scope):
+        if scope.max_objects is None or \
+                len(scope.objects) <= scope.max_objects:
+            return
+        log.info("%s has more than %d objects, dropped from the cache." % (
+            scope.key, scope.max_objects))
+        scope.clear()
+        scope.evicted = True
+        self.evictions += 1
+
+    def __covers(self, scope, class_id, dn):
+        if scope.key in self.__classes:
+            return scope.key == class_id
+        return dn == scope.key or dn.startswith(scope.key + "/")
+
+    def __apply(self, mce):
+        """
+        Callback of the watch block of the cache, called for every event.
+        """
+
+        properties = mce.properties
+        dn = mce.dn
+        if dn is None:
+            return
+        class_id = mce.class_id
+
+        with self.__lock:
+            for scope in self.__scopes():
+                if scope.loading:
+                    scope.backlog.append((class_id, dn, properties))
+                elif scope.loaded_at is not None and not scope.evicted:
+                    self.__apply_to_scope(scope, class_id, dn, properties)
+                    self.__check_size(scope)
+
+    def __apply_to_scope(self, scope, class_id, dn, properties):
+        if properties is None:
+            # the event carries a managed object, not the changed
+            # properties of an xml element
+            if self.__covers(scope, class_id, dn):
+                scope.stale = True
+            return
+
+        properties = dict(properties)
+        status = properties.pop("status", "")
+        if "deleted" in status:
+            prefix = dn + "/"
+            for each in [each for each in scope.objects
+                         if each == dn or each.startswith(prefix)]:
+                scope.pop(each)
+            return
+
+        if not self.__covers(scope, class_id, dn):
+            return
+        elem = scope.objects.get(dn)
+        if elem is not None:
+            elem.attrib.update(properties)
+        elif "created" in status:
+            properties["dn"] = dn
+            scope.put(xc.Element(ucsgenutils.word_l(class_id), properties))
+        else:
+            # the object was created while events were missed
+            scope.stale = True
+
+    def __to_mo(self, elem):
+        class_id = ucsgenutils.word_u(elem.tag)
+        mo = ucscoreutils.get_ucs_obj(class_id, elem)
+        mo.from_xml(elem, self.__handle)
+        return mo
+
+    def __count(self, hit):
+        with self.__lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def __subtree_of(self, dn):
+        for root_dn, scope in self.__subtrees.items():
+            if dn == root_dn or dn.startswith(root_dn + "/"):
+                return scope
+        return None
+
+    def lookup_dn(self, dn):
+        """
+        Looks up an object in the cache.
+
+        Args:
+            dn (str): distinguished name of the object
+
+        Returns:
+            (True, managed object or None) if the cache covers the dn,
+            (False, None) otherwise
+        """
+
+        from .ucsrntemplate import get_class_id_for_dn
+
+        scope = self.__subtree_of(dn)
+        if scope is not None and self.__ensure(scope):
+            with self.__lock:
+                elem = scope.objects.get(dn)
+            self.__count(True)
+            return True, self.__to_mo(elem) if elem is not None else None
+
+        # only the class of the dn is loaded, if it is cached
+        scope = None
+        if self.__classes:
+            scope = self.__classes.get(get_class_id_for_dn(dn))
+        if scope is not None and self.__ensure(scope):
+            with self.__lock:
+                elem = scope.objects.get(dn)
+            if elem is not None:
+                self.__count(True)
+                return True, self.__to_mo(elem)
+
+        self.__count(False)
+        return False, None
+
+    def lookup_classid(self, class_id):
+        """
+        Looks up the objects of a class in the cache.
+
+        Args:
+            class_id (str): class id of the objects
+
+        Returns:
+            (True, list of managed objects sorted by dn) if the class is
+            cached, (False, None) otherwise
+        """
+
+        meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+            class_id)
+        scope = self.__classes.get(meta_class_id)
+        if scope is None or not self.__ensure(scope):
+            self.__count(False)
+            return False, None
+
+        with self.__lock:
+            elems = [scope.objects[dn] for dn in sorted(scope.objects)]
+        self.__count(True)
+        return True, [self.__to_mo(elem) for elem in elems]
+
+    def lookup_children(self, parent_dn, class_id=None):
+        """
+        Looks up the children of an object in the cache.
+
+        Args:
+            parent_dn (str): distinguished name of the parent
+            class_id (str): class id of the children, None for all of them
+
+        Returns:
+            (True, list of managed objects sorted by dn) if the cache covers
+            the children, (False, None) otherwise
+        """
+
+        meta_class_id = None
+        if class_id:
+            meta_class_id = \
+                ucscoreutils.find_class_id_in_mo_meta_ignore_case(class_id)
+            if meta_class_id is None:
+                self.__count(False)
+                return False, None
+
+        scope = self.__subtree_of(parent_dn)
+        if scope is None or not self.__ensure(scope):
+            scope = self.__classes.get(meta_class_id)
+            if scope is None or not self.__ensure(scope):
+                self.__count(False)
+                return False, None
+
+        with self.__lock:
+            elems = [scope.objects[dn] for dn in
+                     sorted(scope.children.get(parent_dn, ()))]
+        if meta_class_id is not None:
+            tag = ucsgenutils.word_l(meta_class_id)
+            elems = [elem for elem in elems if elem.tag == tag]
+        self.__count(True)
+        return True, [self.__to_mo(elem) for elem in elems]
@@ -0,0 +1,209 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the read-only records returned by the queries in
+records mode, a compact alternative to managed objects for large reads.
+"""
+
+import os
+
+from . import ucsgenutils
+from . import ucscoreutils
+
+# class_id -> record class, generated once per class on first use
+_record_classes = {}
+
+
+class MoRecord(object):
+    """
+    Read-only record of the properties of a managed object.
+
+    Every class id has a record class of its own, with a slot per property
+    and no per-instance dict, so that a record takes a fraction of the
+    memory of a managed object. Properties are read like those of a managed
+    object, a property the server did not send reads as None. A record is
+    promoted to a managed object with to_mo, to be modified.
+
+    Example:
+        for fault in handle.query_classid("FaultInst", records=True):\n
+            print(fault.dn, fault.severity)\n
+        mo = fault.to_mo()\n
+    """
+
+    __slots__ = ("_xtra",)
+
+    # xml attribute -> property name, the property names, and the xml tag
+    # of the class
+    _prop_map = {}
+    _prop_names = frozenset()
+    _class_id = None
+    _tag = None
+
+    def __init__(self, **kwargs):
+        raise TypeError("Records are created from a query response")
+
+    @classmethod
+    def _from_attrib(cls, attrib, values=None):
+        record = object.__new__(cls)
+        prop_map = cls._prop_map
+        xtra = None
+        for attr, value in attrib.items():
+            if values is not None:
+                # equal values of different records share a single string
+                value = values.setdefault(value, value)
+            name = prop_map.get(attr)
+            if name is None:
+                if xtra is None:
+                    xtra = {}
+                xtra[attr] = value
+            else:
+                object.__setattr__(record, name, value)
+        object.__setattr__(record, "_xtra", xtra)
+        return record
+
+    def __getattr__(self, name):
+        # only called for the slots which were not set
+        if name == "rn" and self.dn is not None:
+            return os.path.basename(self.dn)
+        if name in self._prop_names:
+            return None
+        xtra = object.__getattribute__(self, "_xtra")
+        if xtra is not None and name in xtra:
+            return xtra[name]
+        raise AttributeError("%s has no property %s" % (
+            self.__class__.__name__, name))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("%s is read-only, use to_mo() to modify it" %
+                             self.__class__.__name__)
+
+    def __delattr__(self, name):
+        raise AttributeError("%s is read-only" % self.__class__.__name__)
+
+    def __repr__(self):
+        return "<%s %s>" % (self.__class__.__name__, self.dn)
+
+    def get_class_id(self):
+        return self._class_id
+
+    def attrib(self):
+        """
+        Returns the xml attributes of the record, as sent by the server.
+        """
+
+        attrib = {}
+        for attr, name in self._prop_map.items():
+            try:
+                attrib[attr] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        if self._xtra:
+            attrib.update(self._xtra)
+        return attrib
+
+    def to_mo(self, handle=None):
+        """
+        Creates the managed object of the record.
+
+        Args:
+            handle (UcsHandle): handle set on the managed object
+
+        Returns:
+            ManagedObject or GenericMo
+        """
+
+        from . import ucsxmlcodec as xc
+
+        elem = xc.Element(self._tag, self.attrib())
+        mo = ucscoreutils.get_ucs_obj(self._class_id, elem)
+        mo.from_xml(elem, handle)
+        return mo
+
+
+def mo_record_class(class_id):
+    """
+    Returns the record class of a class id, generated on first use.
+
+    Args:
+        class_id (str): class id, as in the xml tags or the meta
+
+    Returns:
+        subclass of MoRecord
+
+    Example:
+        record_class = mo_record_class("faultInst")\n
+    """
+
+    record_class = _record_classes.get(class_id)
+    if record_class is not None:
+        return record_class
+
+    meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+        class_id)
+    if meta_class_id is not None:
+        mo_class = ucscoreutils.load_mo_class_info(meta_class_id).mo_class
+        prop_map = dict(mo_class.prop_map)
+        prop_map["dn"] = "dn"
+        slots = tuple(sorted(set(prop_map.values())))
+        name = meta_class_id + "Record"
+        tag = ucsgenutils.word_l(meta_class_id)
+    else:
+        # classes unknown to this version of the sdk keep all their
+        # properties in _xtra
+        prop_map = {"dn": "dn"}
+        slots = ("dn",)
+        meta_class_id = ucsgenutils.word_u(class_id)
+        name = "GenericMoRecord"
+        tag = class_id
+
+    record_class = type(name, (MoRecord,), {"__slots__": slots,
+                                            "_prop_map": prop_map,
+                                            "_prop_names": frozenset(slots),
+                                            "_class_id": meta_class_id,
+                                            "_tag": tag})
+    _record_classes[class_id] = record_class
+    return record_class
+
+
+def records_from_elem(elem, hierarchy=False, parent_dn="", values=None):
+    """
+    Creates the records of an xml element of a query response, and of its
+    descendants with hierarchy.
+
+    Args:
+        elem (xml element): managed object element
+        hierarchy (bool): if True, also returns the records of the
+            descendants, breadth first
+        parent_dn (str): dn of the parent, for the elements without dn
+        values (dict): strings shared by the records of a response
+
+    Returns:
+        list of MoRecord
+    """
+
+    records = []
+    current = [(elem, parent_dn)]
+    while current:
+        child_elems = []
+        for each, each_parent_dn in current:
+            attrib = each.attrib
+            if "dn" not in attrib:
+                attrib = dict(attrib)
+                attrib["dn"] = each_parent_dn + "/" + attrib.get("rn", "")
+            records.append(mo_record_class(each.tag)._from_attrib(attrib,
+                                                                  values))
+            if hierarchy:
+                child_elems.extend((child, attrib["dn"]) for child in each)
+        current = child_elems
+    return records
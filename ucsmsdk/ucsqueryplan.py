@@ -0,0 +1,273 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the query planner, which folds many lookups into the
+fewest configResolveDns and configResolveClasses requests.
+"""
+
+import logging
+
+from . import ucsgenutils
+from . import ucscoreutils
+from .ucsexception import UcsException
+
+log = logging.getLogger('ucs')
+
+_DN = "dn"
+_CLASS = "class"
+_CHILDREN = "children"
+
+
+def _parent_dn(mo):
+    rn = getattr(mo, "rn", None)
+    if rn and mo.dn.endswith("/" + rn):
+        return mo.dn[:-len(rn) - 1]
+    return mo.dn.rsplit("/", 1)[0] if "/" in mo.dn else ""
+
+
+def _queue_key(table, order, key, value):
+    if key not in table:
+        table[key] = value
+        order.append(key)
+
+
+def _batches(items, size):
+    items = list(items)
+    for index in range(0, len(items), size):
+        yield items[index:index + size]
+
+
+class UcsQueryPlanner(object):
+    """
+    Queues lookups of objects by dn, by class id and of the children of a dn,
+    and resolves them with as few requests as possible.
+
+    Dns are resolved with configResolveDns and class ids with
+    configResolveClasses, max_batch_size of them per request. The children
+    of a class requested for at least min_folded_parents parents, or whose
+    class is looked up anyway, are queried once for the whole class and
+    are then handed back per parent dn. The other children, and children
+    queried without a class id, take a configResolveChildren each.
+
+    Args:
+        handle (UcsHandle): connection handle
+        max_batch_size (int): maximum number of dns or class ids per request
+        min_folded_parents (int): number of parents from which the children
+            of a class are queried with the whole class
+
+    Example:
+        planner = UcsQueryPlanner(handle)\n
+        sys_ = planner.add_dn("sys")\n
+        blades = planner.add_classid("ComputeBlade")\n
+        cpus = planner.add_children("sys/chassis-1/blade-1",
+                                    class_id="ProcessorUnit")\n
+        results = planner.execute()\n
+        print(results[sys_].name, len(results[blades]), len(results[cpus]))\n
+    """
+
+    def __init__(self, handle, max_batch_size=100, min_folded_parents=4):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        if min_folded_parents < 1:
+            raise ValueError("min_folded_parents must be a positive integer")
+
+        self.__handle = handle
+        self.__max_batch_size = max_batch_size
+        self.__min_folded_parents = min_folded_parents
+        self.__requests = []
+
+    def __len__(self):
+        return len(self.__requests)
+
+    def __queue(self, request):
+        self.__requests.append(request)
+        return len(self.__requests) - 1
+
+    def __class_id(self, class_id):
+        meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+            class_id.strip())
+        return meta_class_id or class_id.strip()
+
+    def add_dn(self, dn, hierarchy=False):
+        """
+        Queues the lookup of an object by distinguished name.
+
+        Args:
+            dn (str): distinguished name of the object
+            hierarchy (bool): if True, also looks up its descendants
+
+        Returns:
+            index of the result in the list returned by execute.
+            The result is the managed object or None, or the list of the
+            object and its descendants if hierarchy is True, like query_dn
+        """
+
+        if not dn:
+            raise ValueError("Provide dn.")
+        return self.__queue((_DN, dn.strip(), bool(hierarchy)))
+
+    def add_classid(self, class_id, hierarchy=False):
+        """
+        Queues the lookup of the objects of a class.
+
+        Args:
+            class_id (str): class id of the objects
+            hierarchy (bool): if True, also looks up their descendants
+
+        Returns:
+            index of the result in the list returned by execute.
+            The result is a list of managed objects, like query_classid
+        """
+
+        if not class_id:
+            raise ValueError("Provide Parameter class_id")
+        return self.__queue((_CLASS, self.__class_id(class_id),
+                             bool(hierarchy)))
+
+    def add_children(self, in_dn, class_id=None):
+        """
+        Queues the lookup of the children of a distinguished name.
+
+        The children of a class are looked up with the whole class, and
+        filtered by parent, when they are queued for min_folded_parents
+        parents or more: one request then replaces a request per parent,
+        but brings the objects of the class under every other parent too.
+
+        Args:
+            in_dn (str): distinguished name of the parent
+            class_id (str): class id of the children to look up
+
+        Returns:
+            index of the result in the list returned by execute.
+            The result is a list of managed objects, like query_children
+        """
+
+        if not in_dn:
+            raise ValueError('[Error]: GetChild: Provide in_mo or in_dn.')
+        if class_id:
+            class_id = self.__class_id(class_id)
+        return self.__queue((_CHILDREN, in_dn.strip(), class_id))
+
+    def execute(self):
+        """
+        Resolves all the queued lookups and empties the queue.
+
+        Returns:
+            list of the results, in the order the lookups were queued
+        """
+
+        requests, self.__requests = self.__requests, []
+
+        dns = {False: {}, True: {}}
+        class_ids = {False: {}, True: {}}
+        dn_order = {False: [], True: []}
+        class_id_order = {False: [], True: []}
+        # class id of the children -> their parent dns
+        parents = {}
+        parent_order = []
+        for kind, key, option in requests:
+            if kind == _DN:
+                _queue_key(dns[option], dn_order[option], key, None)
+            elif kind == _CLASS:
+                _queue_key(class_ids[option], class_id_order[option], key, [])
+            elif option:
+                _queue_key(parents, parent_order, option, set())
+                parents[option].add(key)
+
+        for class_id in parent_order:
+            if len(parents[class_id]) >= self.__min_folded_parents:
+                _queue_key(class_ids[False], class_id_order[False],
+                           class_id, [])
+
+        for hierarchy in (False, True):
+            self.__resolve_dns(dns[hierarchy], dn_order[hierarchy],
+                               hierarchy)
+            self.__resolve_classes(class_ids[hierarchy],
+                                   class_id_order[hierarchy], hierarchy)
+
+        children = {}
+        for class_id, mos in class_ids[False].items():
+            for mo in mos:
+                children.setdefault((_parent_dn(mo), class_id),
+                                    []).append(mo)
+
+        results = []
+        for kind, key, option in requests:
+            if kind == _DN:
+                result = dns[option][key]
+                if option and result is None:
+                    result = []
+            elif kind == _CLASS:
+                result = list(class_ids[option][key])
+            elif option in class_ids[False]:
+                result = list(children.get((key, option), []))
+            else:
+                result = self.__handle.query_children(in_dn=key,
+                                                      class_id=option)
+            results.append(result)
+        return results
+
+    def __post(self, elem):
+        response = self.__handle.post_elem(elem)
+        if response.error_code != 0:
+            raise UcsException(response.error_code, response.error_descr)
+        return response.out_configs.child
+
+    def __resolve_dns(self, dn_dict, dn_order, hierarchy):
+        from .ucsbasetype import DnSet, Dn
+        from .ucsmethodfactory import config_resolve_dns
+
+        for batch in _batches(dn_order, self.__max_batch_size):
+            log.debug("Resolving %d dns in one request" % len(batch))
+            dn_set = DnSet()
+            for dn in batch:
+                dn_obj = Dn()
+                dn_obj.value = dn
+                dn_set.child_add(dn_obj)
+
+            elem = config_resolve_dns(cookie=self.__handle.cookie,
+                                      in_dns=dn_set,
+                                      in_hierarchical=hierarchy)
+            for out_mo in self.__post(elem):
+                if hierarchy:
+                    dn_dict[out_mo.dn] = ucscoreutils.flatten_mo_tree(out_mo)
+                else:
+                    dn_dict[out_mo.dn] = out_mo
+
+    def __resolve_classes(self, class_id_dict, class_id_order, hierarchy):
+        from .ucsbasetype import ClassIdSet, ClassId
+        from .ucsmethodfactory import config_resolve_classes
+
+        lowered = dict((ucsgenutils.word_l(class_id), class_id)
+                       for class_id in class_id_dict)
+        for batch in _batches(class_id_order, self.__max_batch_size):
+            log.debug("Resolving %d classes in one request" % len(batch))
+            class_id_set = ClassIdSet()
+            for class_id in batch:
+                class_id_obj = ClassId()
+                class_id_obj.value = ucsgenutils.word_l(class_id)
+                class_id_set.child_add(class_id_obj)
+
+            elem = config_resolve_classes(cookie=self.__handle.cookie,
+                                          in_ids=class_id_set,
+                                          in_hierarchical=hierarchy)
+            for out_mo in self.__post(elem):
+                class_id = lowered.get(ucsgenutils.word_l(out_mo._class_id))
+                if class_id is None:
+                    continue
+                if hierarchy:
+                    class_id_dict[class_id].extend(
+                        ucscoreutils.flatten_mo_tree(out_mo))
+                else:
+                    class_id_dict[class_id].append(out_mo)
@@ -0,0 +1,255 @@
+# Copyright 2017 Cisco Systems, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the compiled rn templates of the managed objects, used
+to build and parse rns, and to find the class of a dn.
+"""
+
+import re
+
+from . import ucscoreutils
+from .ucsexception import UcsValidationException
+from .ucsmeta import MO_CLASS_META
+
+_PROP_PATTERN = re.compile(r"\[([^\]]*)\]")
+
+# rn pattern -> RnTemplate, compiled once per pattern
+_templates = {}
+
+# parent class_id -> _ChildRns, built once per parent class
+_child_rns = {}
+
+
+class RnTemplate(object):
+    """
+    Compiled rn pattern of a managed object class, like "ls-[name]".
+
+    The pattern is split once in its literal parts and naming properties,
+    rns are then built by joining the parts, and parsed with regular
+    expressions compiled on first use.
+
+    Args:
+        pattern (str): rn pattern, as in the meta of the class
+
+    Example:
+        template = rn_template("ls-[name]")\n
+        rn = template.format({"name": "sp1"})\n
+        naming_props = template.parse("ls-sp1")\n
+    """
+
+    def __init__(self, pattern):
+        self.pattern = pattern
+        # literal, property, literal, ... property, literal
+        self.parts = tuple(_PROP_PATTERN.split(pattern))
+        self.props = self.parts[1::2]
+        self.has_literal = any(self.parts[0::2])
+        self.__parse_regex = None
+        self.__match_regex = None
+
+    def __regex(self, prop_regex, end=""):
+        # prop_regex is formatted with the name of each naming property
+        return re.compile("".join(
+            prop_regex.format(part) if index % 2 else re.escape(part)
+            for index, part in enumerate(self.parts)) + end)
+
+    def format(self, values):
+        """
+        Builds an rn from the values of its naming properties.
+
+        Args:
+            values (dict): naming property -> value
+
+        Returns:
+            str
+        """
+
+        parts = list(self.parts)
+        for index in range(1, len(parts), 2):
+            parts[index] = "%s" % values[parts[index]]
+        return "".join(parts)
+
+    def parse(self, rn):
+        """
+        Extracts the values of the naming properties from an rn. The values
+        are matched greedily, from the start of the rn.
+
+        Args:
+            rn (str): rn of an object of the class
+
+        Returns:
+            dict of naming property -> value, None if the rn does not
+            match the pattern
+        """
+
+        if self.__parse_regex is None:
+            self.__parse_regex = self.__regex("(?P<{0}>.+)")
+        match = self.__parse_regex.match(rn)
+        if match is None:
+            return None
+        return match.groupdict()
+
+    def matches(self, rn):
+        """
+        Returns True if the whole rn matches the pattern.
+        """
+
+        if not self.props:
+            return rn == self.pattern
+        if self.__match_regex is None:
+            self.__match_regex = self.__regex("(?:.*?)", "$")
+        return self.__match_regex.match(rn) is not None
+
+
+def rn_template(pattern):
+    """
+    Returns the compiled template of an rn pattern.
+
+    Args:
+        pattern (str): rn pattern, like "ls-[name]"
+
+    Returns:
+        RnTemplate
+    """
+
+    template = _templates.get(pattern)
+    if template is None:
+        template = _templates.setdefault(pattern, RnTemplate(pattern))
+    return template
+
+
+def class_rn_template(class_id):
+    """
+    Returns the compiled rn template of a managed object class.
+
+    Args:
+        class_id (str): class id, case insensitive
+
+    Returns:
+        RnTemplate or None for an unknown class id
+
+    Example:
+        rn = class_rn_template("LsServer").format({"name": "sp1"})\n
+    """
+
+    meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+        class_id)
+    if meta_class_id is None:
+        return None
+    return rn_template(MO_CLASS_META[meta_class_id].rn)
+
+
+class _ChildRns(object):
+    """
+    The rn templates of the children of a class, in the order of its meta.
+    """
+
+    def __init__(self, parent_class_id):
+        # rn -> (position, class_id) of the children without naming property
+        self.literal = {}
+        # (position, prefix, template, class_id) of the children with naming
+        # properties and literal parts, prefix being the literal before the
+        # first naming property
+        self.templates = []
+        # the first child whose rn is only made of naming properties
+        self.naming_only = None
+
+        for position, child in enumerate(
+                MO_CLASS_META[parent_class_id].children):
+            class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+                child)
+            if class_id is None:
+                continue
+            template = rn_template(MO_CLASS_META[class_id].rn)
+            if not template.props:
+                self.literal.setdefault(template.pattern,
+                                        (position, class_id))
+            elif template.has_literal:
+                self.templates.append((position, template.parts[0],
+                                       template, class_id))
+            elif self.naming_only is None:
+                self.naming_only = class_id
+
+    def find(self, rn):
+        literal = self.literal.get(rn)
+        last = literal[0] if literal is not None else None
+        for position, prefix, template, class_id in self.templates:
+            if last is not None and position > last:
+                break
+            if rn.startswith(prefix) and template.matches(rn):
+                return class_id
+        if literal is not None:
+            return literal[1]
+        return self.naming_only
+
+
+def get_class_id_for_rn(rn, parent_class_id=None):
+    """
+    Finds the class of an rn, among the children of a class.
+
+    The children are tried in the order of the meta of the parent class.
+    A child whose rn is only made of naming properties, like "[id]", is
+    only returned when no other child matches.
+
+    Args:
+        rn (str): rn
+        parent_class_id (str): class id of the parent, case insensitive,
+            topRoot if None
+
+    Returns:
+        class id or None
+
+    Raises:
+        UcsValidationException: if the parent class id is not valid
+
+    Example:
+        class_id = get_class_id_for_rn("ls-sp1", "OrgOrg")\n
+    """
+
+    if not parent_class_id:
+        parent_class_id = "TopRoot"
+
+    meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
+        parent_class_id)
+    if meta_class_id is None:
+        raise UcsValidationException(
+            '[Error]: class_id [%s] is not valid' % (
+                parent_class_id))
+
+    child_rns = _child_rns.get(meta_class_id)
+    if child_rns is None:
+        child_rns = _child_rns.setdefault(meta_class_id,
+                                          _ChildRns(meta_class_id))
+    return child_rns.find(rn)
+
+
+def get_class_id_for_dn(dn):
+    """
+    Finds the class of a dn, walking its rns down from topRoot.
+
+    Args:
+        dn (str): dn
+
+    Returns:
+        class id or None
+
+    Example:
+        class_id = get_class_id_for_dn("org-root/ls-sp1")\n
+    """
+
+    class_id = None
+    for rn in dn.split('/'):
+        class_id = get_class_id_for_rn(rn, class_id)
+        if class_id is None:
+            break
+    return class_id
@@ -23,7 +23,64 @@ from .ucsdriver import UcsDriver
 from .ucsgenutils import Progress
 
 log = logging.getLogger('ucs')
-tx_lock = threading.Lock()
+
+# Query methods which do not modify the configuration on the server. When
+# concurrent reads are enabled, these share the transaction lock of a session.
+_READ_ONLY_METHODS = frozenset([
+    "configCountClass",
+    "configFindDnsByClassId",
+    "configResolveChildren",
+    "configResolveChildrenSorted",
+    "configResolveClass",
+    "configResolveClassSorted",
+    "configResolveClasses",
+    "configResolveClassesSorted",
+    "configResolveDn",
+    "configResolveDns",
+    "configResolveParent",
+    "configScope"
+])
+
+
+class _TxLock(object):
+    """
+    Transaction lock of a UcsSession.
+
+    Writers always get exclusive access, which keeps the order of messages
+    (and of cookie refreshes) within a session. Readers can share the lock
+    with other readers. Waiting writers take precedence over new readers.
+    """
+
+    def __init__(self):
+        self.__cond = threading.Condition(threading.Lock())
+        self.__readers = 0
+        self.__writer = False
+        self.__writers_waiting = 0
+
+    def acquire_read(self):
+        with self.__cond:
+            while self.__writer or self.__writers_waiting:
+                self.__cond.wait()
+            self.__readers += 1
+
+    def release_read(self):
+        with self.__cond:
+            self.__readers -= 1
+            if self.__readers == 0:
+                self.__cond.notify_all()
+
+    def acquire_write(self):
+        with self.__cond:
+            self.__writers_waiting += 1
+            while self.__writer or self.__readers:
+                self.__cond.wait()
+            self.__writers_waiting -= 1
+            self.__writer = True
+
+    def release_write(self):
+        with self.__cond:
+            self.__writer = False
+            self.__cond.notify_all()
 
 
 class UcsSession(object):
@@ -59,6 +116,11 @@ class UcsSession(object):
         self.__dump_xml = False
         self.__redirect = False
         self.__threaded = False
+        self.__concurrent_reads = False
+        self.__direct_xml = False
+        self.__tx_lock = _TxLock()
+        self.__connection_pool = {"pool_size": 4, "idle_timeout": 60,
+                                  "health_check": True}
         self.__driver = UcsDriver(proxy=self.__proxy)
 
     @property
@@ -126,6 +188,14 @@ class UcsSession(object):
     def threaded(self):
         return self.__threaded
 
+    @property
+    def concurrent_reads(self):
+        return self.__concurrent_reads
+
+    @property
+    def direct_xml(self):
+        return self.__direct_xml
+
     def _freeze(self):
         save = {
             "ip": self.__ip,
@@ -148,7 +218,10 @@ class UcsSession(object):
             "auto_refresh": self.__auto_refresh,
             "dump_xml": self.__dump_xml,
             "redirect": self.__redirect,
-            "threaded": self.__threaded
+            "threaded": self.__threaded,
+            "concurrent_reads": self.__concurrent_reads,
+            "direct_xml": self.__direct_xml,
+            "connection_pool": self.__connection_pool
         }
         return json.dumps(save)
 
@@ -159,6 +232,7 @@ class UcsSession(object):
 
         # update the drvier if a proxy configuration exists
         self.__driver = UcsDriver(proxy=self.__proxy)
+        self.__apply_connection_pool()
 
         # cookie might be stale, if so relogin
         if self.__auto_refresh and not self.__validate_connection():
@@ -275,13 +349,15 @@ class UcsSession(object):
         if self.__dump_xml:
             log.debug('%s <==== %s' % (self.__uri, resp))
 
-    def post_elem(self, elem):
+    def post_elem(self, elem, shared=False):
         """
         sends the request and receives the response from ucsm server using xml
         element
 
         Args:
             elem (xml element)
+            shared (bool): if True, the session lock is shared with the
+                other shared requests and the read-only queries
 
         Returns:
             response xml string
@@ -292,17 +368,18 @@ class UcsSession(object):
 
         from . import ucsxmlcodec as xc
 
-        self._tx_lock_acquire_conditional(elem)
-        if self._is_stale_cookie(elem):
-            elem.attrib['cookie'] = self.cookie
+        lock_mode = self._tx_lock_acquire_conditional(elem, shared)
+        try:
+            if self._is_stale_cookie(elem):
+                elem.attrib['cookie'] = self.cookie
 
-        self.dump_xml_request(elem)
-        xml_str = xc.to_xml_str(elem)
+            self.dump_xml_request(elem)
+            xml_str = xc.to_xml_str(elem)
 
-        response_str = self.post_xml(xml_str)
-        self.dump_xml_response(response_str)
+            response_str = self.post_xml(xml_str)
+            self.dump_xml_response(response_str)
 
-        try:
+            response = None
             if response_str:
                 response = xc.from_xml_str(response_str, self)
 
@@ -312,30 +389,105 @@ class UcsSession(object):
             if elem.tag == "aaaRefresh":
                 self._update_cookie(response)
 
-            self._tx_lock_release_conditional(elem)
             return response
-        except:
-            self._tx_lock_release_conditional(elem)
-            raise
+        finally:
+            self._tx_lock_release_conditional(lock_mode)
+
+    def _post_bytes(self, tag, build, shared=False):
+        """
+        sends a request written straight to bytes, without an xml element,
+        and receives the response from ucsm server
+
+        Args:
+            tag (str): tag of the request
+            build (function): called with the cookie of the session, under
+                the session lock, returns the xml bytes of the request
+            shared (bool): if True, the session lock is shared with the
+                other shared requests and the read-only queries
+
+        Returns:
+            response object
+        """
+
+        from . import ucsxmlcodec as xc
+
+        lock_mode = self._tx_lock_acquire_conditional(xc.Element(tag),
+                                                      shared)
+        try:
+            xml_str = build(self.cookie)
+            if self.__dump_xml:
+                log.debug('%s ====> %s' % (self.__uri, xml_str))
+
+            response_str = self.post_xml(xml_str)
+            self.dump_xml_response(response_str)
+
+            response = None
+            if response_str:
+                response = xc.from_xml_str(response_str, self)
+            return response
+        finally:
+            self._tx_lock_release_conditional(lock_mode)
+
+    def _post_elem_stream(self, elem):
+        """
+        sends the request and returns the response stream, for the caller
+        to decode incrementally. The session lock is only held while the
+        request is sent.
+
+        Args:
+            elem (xml element)
+
+        Returns:
+            file-like response object
+        """
+
+        from . import ucsxmlcodec as xc
 
-        self._tx_lock_release_conditional(elem)
-        return None
+        lock_mode = self._tx_lock_acquire_conditional(elem)
+        try:
+            if self._is_stale_cookie(elem):
+                elem.attrib['cookie'] = self.cookie
+
+            self.dump_xml_request(elem)
+            xml_str = xc.to_xml_str(elem)
+            return self.post_xml(xml_str, read=False)
+        finally:
+            self._tx_lock_release_conditional(lock_mode)
 
-    def _tx_lock_acquire_conditional(self, elem):
+    def _tx_lock_acquire_conditional(self, elem, shared=False):
         """
-        tx_lock is used to maintain the order of messages
+        tx_lock is used to maintain the order of messages within a session.
+        Every session has its own tx_lock, so that handles to different
+        servers do not wait on each other.
         Let aaaLogout always pass, and not be stuck for locks.
+        Read-only queries share the lock when concurrent reads are enabled,
+        requests known not to depend on each other share it when shared is
+        True, like the commits of independent buffers.
+
+        Returns:
+            the mode in which the lock was acquired, to be passed to
+            _tx_lock_release_conditional
         """
-        if elem.tag != "aaaLogout":
-            tx_lock.acquire()
+        if elem.tag == "aaaLogout":
+            return None
+
+        if shared or (self.__concurrent_reads and
+                      elem.tag in _READ_ONLY_METHODS):
+            self.__tx_lock.acquire_read()
+            return "read"
+
+        self.__tx_lock.acquire_write()
+        return "write"
 
-    def _tx_lock_release_conditional(self, elem):
+    def _tx_lock_release_conditional(self, lock_mode):
         """
-        Release the global tx_lock.
+        Release the tx_lock of the session.
         We do not acquire lock for aaaLogout
         """
-        if elem.tag != "aaaLogout":
-            tx_lock.release()
+        if lock_mode == "read":
+            self.__tx_lock.release_read()
+        elif lock_mode == "write":
+            self.__tx_lock.release_write()
 
     def file_download(
             self,
@@ -633,6 +785,7 @@ class UcsSession(object):
                                response.error_descr)
 
         self.__clear()
+        self.__driver.close()
 
         return True
 
@@ -651,6 +804,29 @@ class UcsSession(object):
     def _set_mode_threading(self, enable=False):
         self.__threaded = enable
 
+    def _set_mode_concurrent_reads(self, enable=False):
+        self.__concurrent_reads = enable
+
+    def _set_mode_direct_xml(self, enable=False):
+        self.__direct_xml = enable
+
+    def _set_connection_pool(self, pool_size=4, idle_timeout=60,
+                             health_check=True):
+        self.__connection_pool = {"pool_size": pool_size,
+                                  "idle_timeout": idle_timeout,
+                                  "health_check": health_check}
+        self.__apply_connection_pool()
+
+    def _unset_connection_pool(self):
+        self.__connection_pool = None
+        self.__apply_connection_pool()
+
+    def __apply_connection_pool(self):
+        if self.__connection_pool is None:
+            self.__driver.unset_pool()
+        else:
+            self.__driver.set_pool(**self.__connection_pool)
+
 
 def _get_port(port, secure):
     if port is not None:
@@ -11,6 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
+
 try:
     import xml.etree.cElementTree as ET
     from xml.etree.cElementTree import Element, SubElement
@@ -40,6 +42,104 @@ def to_xml_str(elem):
     return ET.tostring(elem)
 
 
+def conf_mos_to_xml_bytes(cookie, mo_dict, in_hierarchical=False):
+    """
+    Writes the configConfMos request of the modified objects straight to
+    bytes, without creating the element tree. The result is the same as
+    to_xml_str of the request created by config_conf_mos.
+
+    Args:
+        cookie (str): cookie of the session
+        mo_dict (dict): dn -> modified managed object, as in the commit
+            buffer
+        in_hierarchical (bool): inHierarchical of the request
+
+    Returns:
+        xml bytes
+
+    Example:
+        xml_bytes = conf_mos_to_xml_bytes(handle.cookie, {mo.dn: mo})\n
+    """
+
+    from .ucscoremeta import WriteXmlOption
+    from .ucsmo import write_xml_elem
+
+    pairs = []
+    for dn, mo in mo_dict.items():
+        mo_xml = []
+        mo.write_xml(mo_xml.append, WriteXmlOption.DIRTY)
+        write_xml_elem(pairs.append, "pair", {"key": dn},
+                       ["".join(mo_xml)] if mo_xml else None)
+
+    pieces = []
+    in_configs = []
+    write_xml_elem(in_configs.append, "inConfigs", {}, pairs)
+    write_xml_elem(pieces.append, "configConfMos",
+                   {"cookie": cookie,
+                    "inHierarchical": ("false", "true")[
+                        in_hierarchical in ucsgenutils.AFFIRMATIVE_LIST]},
+                   ["".join(in_configs)])
+    return "".join(pieces).encode("ascii", "xmlcharrefreplace")
+
+
+def conf_mos_pair_to_xml_bytes(dn, mo):
+    """
+    Writes the pair of a modified object of a configConfMos request
+    straight to bytes, for requests whose size is known before they are
+    sent, like the chunks of a commit.
+
+    Args:
+        dn (str): dn of the object, key of the pair
+        mo (ManagedObject): modified object, written with its modified
+            children
+
+    Returns:
+        xml bytes
+    """
+
+    from .ucscoremeta import WriteXmlOption
+    from .ucsmo import write_xml_elem
+
+    mo_xml = []
+    mo.write_xml(mo_xml.append, WriteXmlOption.DIRTY)
+    pair = []
+    write_xml_elem(pair.append, "pair", {"key": dn},
+                   ["".join(mo_xml)] if mo_xml else None)
+    return "".join(pair).encode("ascii", "xmlcharrefreplace")
+
+
+def conf_mos_pairs_to_xml_bytes(cookie, pairs, in_hierarchical=False):
+    """
+    Writes a configConfMos request around pairs already written by
+    conf_mos_pair_to_xml_bytes.
+
+    Args:
+        cookie (str): cookie of the session
+        pairs (list): xml bytes of the pairs, in order
+        in_hierarchical (bool): inHierarchical of the request
+
+    Returns:
+        xml bytes
+    """
+
+    from .ucsmo import write_xml_elem
+
+    # the escaped cookie cannot contain the marker of the pairs
+    marker = "<pairs/>"
+    pieces = []
+    in_configs = []
+    write_xml_elem(in_configs.append, "inConfigs", {},
+                   [marker] if pairs else None)
+    write_xml_elem(pieces.append, "configConfMos",
+                   {"cookie": cookie,
+                    "inHierarchical": ("false", "true")[
+                        in_hierarchical in ucsgenutils.AFFIRMATIVE_LIST]},
+                   ["".join(in_configs)])
+    head, _, tail = "".join(pieces).partition(marker)
+    return b"".join([head.encode("ascii", "xmlcharrefreplace")] + pairs +
+                    [tail.encode("ascii", "xmlcharrefreplace")])
+
+
 def extract_root_elem(xml_str):
     """
     extracts root xml element from xml string.
@@ -97,3 +197,115 @@ def from_xml_str(xml_str, handle=None):
     response = ucscoreutils.get_ucs_obj(class_id, root_elem)
     response.from_xml(root_elem, handle)
     return response
+
+
+class _EscapedNewlineReader(object):
+    """
+    Wraps a response stream and escapes the new lines on the fly, as
+    add_escape_chars does for a complete response.
+    """
+
+    def __init__(self, stream):
+        self.__stream = stream
+
+    def read(self, size=-1):
+        return self.__stream.read(size).replace(b"\n", b"&#xA;")
+
+
+def _iter_out_config_elems(source):
+    """
+    Incrementally parses a method response and yields the elements of its
+    outConfigs as soon as each of them is complete, releasing them once the
+    caller is done with them.
+    """
+
+    if not hasattr(source, "read"):
+        if not isinstance(source, bytes):
+            source = source.encode('utf-8')
+        source = io.BytesIO(source)
+
+    depth = 0
+    out_configs = None
+    events = ET.iterparse(_EscapedNewlineReader(source),
+                          events=("start", "end"))
+    for event, elem in events:
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                if elem.tag == "error":
+                    raise ex.UcsException(elem.attrib['errorCode'],
+                                          elem.attrib['errorDescr'])
+                error_code = elem.attrib.get('errorCode', "0")
+                if error_code != "0":
+                    raise ex.UcsException(error_code,
+                                          elem.attrib.get('errorDescr'))
+            elif depth == 2:
+                out_configs = elem
+            continue
+
+        depth -= 1
+        if depth != 2 or out_configs.tag not in ("outConfigs", "outConfig"):
+            continue
+
+        yield elem
+        # the element is complete and decoded, release it
+        del out_configs[:]
+
+
+def iter_mos_from_xml(source, handle=None, hierarchy=False):
+    """
+    Incrementally decodes a method response and yields the managed objects
+    of its outConfigs as soon as each of them is complete. The xml of the
+    objects already yielded is released, so that memory stays flat however
+    large the response is.
+
+    Args:
+        source (file-like object or str): response stream or xml string
+        handle (UcsHandle): handle set on the managed objects
+        hierarchy (bool): if True, also yields the descendants of every
+            object, detached from their parent like query_classid does
+
+    Returns:
+        generator of managed objects
+
+    Example:
+        for mo in iter_mos_from_xml(response_stream, handle):\n
+            print(mo.dn)\n
+    """
+
+    for elem in _iter_out_config_elems(source):
+        class_id = ucsgenutils.word_u(elem.tag)
+        mo = ucscoreutils.get_ucs_obj(class_id, elem)
+        mo.from_xml(elem, handle)
+
+        if hierarchy:
+            for each in ucscoreutils.flatten_mo_tree(mo):
+                yield each
+        else:
+            yield mo
+
+
+def iter_records_from_xml(source, hierarchy=False):
+    """
+    Incrementally decodes a method response into read-only records, like
+    iter_mos_from_xml does into managed objects.
+
+    Args:
+        source (file-like object or str): response stream or xml string
+        hierarchy (bool): if True, also yields the records of the
+            descendants of every object
+
+    Returns:
+        generator of MoRecord
+
+    Example:
+        for fault in iter_records_from_xml(response_stream):\n
+            print(fault.dn)\n
+    """
+
+    from .ucsmorecord import records_from_elem
+
+    values = {}
+    for elem in _iter_out_config_elems(source):
+        for record in records_from_elem(elem, hierarchy, values=values):
+            yield record
@@ -28,8 +28,8 @@ import xml.dom.minidom
 from os.path import dirname
 from .. import ucsgenutils
 from .. import ucscoreutils
+from .. import ucsrntemplate
 from ..ucsconstants import Status, NamingPropertyId, YesOrNo
-from ..ucsexception import UcsValidationException
 
 import logging
 
@@ -71,17 +71,7 @@ def _get_class_id_for_dn(dn):
     Internal method to get the class id for a given dn
     """
 
-    rns = dn.split('/')
-    class_id = None
-    parent_class_id = None
-
-    for rn in rns:
-        class_id = _get_class_id_for_rn(rn, parent_class_id)
-        if class_id is None:
-            break
-        parent_class_id = class_id
-
-    return class_id
+    return ucsrntemplate.get_class_id_for_dn(dn)
 
 
 def _get_class_id_for_rn(rn, prev_class_id=None):
@@ -89,73 +79,7 @@ def _get_class_id_for_rn(rn, prev_class_id=None):
     Internal method to get the class id for a given rn
     """
 
-    if not prev_class_id:
-        prev_class_id = "TopRoot"
-
-    meta_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
-        prev_class_id)
-    if meta_class_id is None:
-        raise UcsValidationException(
-            '[Error]: class_id [%s] is not valid' % (
-                prev_class_id))
-
-    mo_meta = ucscoreutils.get_mo_property_meta(meta_class_id, "mo_meta")
-    if mo_meta is None:
-        raise UcsValidationException(
-            '[Error]: mo_meta for class_id [%s] is not valid'
-            % prev_class_id)
-
-    for child_class_id in mo_meta.children:
-        # 1.If Rn does not contain [, then there is no naming property.
-        #   Check directly.
-        # 2. If Rn contains [,
-        # 2.1) Check if the Rn contains a "-" and ChildClassId.Rn does not,
-        #      then proceed to next child_class_id.
-        #      substitute \[[^\]]*\] with .* and do a regex match
-        # 2.2) If Rn does not contain a "-",
-        #      then probably the child_class_id has only the naming property
-        #      without any suffix or prefix. Check for "[*]".
-        #      Need to see, if there is a possibility of more than one [*]
-        #      directly under a ClassId
-
-        # child_class_id = "orgorg"
-        child_class_id = ucscoreutils.find_class_id_in_mo_meta_ignore_case(
-            child_class_id)
-        child_mo_meta = ucscoreutils.get_mo_property_meta(child_class_id,
-                                                          "mo_meta")
-        if child_mo_meta is None:
-            continue
-
-        # 2. Check if there is a naming property
-        match = re.search(r"(\[[^\]]+\])", child_mo_meta.rn)
-        if not match:
-            if child_mo_meta.rn == rn:
-                return child_mo_meta.name
-            continue
-
-        # 2.1 Check if it has a prefix or suffix
-        match = re.search(r"(([^\]]\[)|(\][^\[]))", child_mo_meta.rn)
-        if match:
-            mod_meta_rn = re.sub(r"\[([^\]]+)\]", r"(?P<\1>.*?)",
-                                 child_mo_meta.rn)
-            if re.match(r"\|", mod_meta_rn):
-                mod_meta_rn = re.sub(r"\|", r"\|", mod_meta_rn)
-            pattern = "^" + mod_meta_rn + "$"
-            if re.match(pattern, rn):
-                return child_mo_meta.name
-        else:
-            continue
-
-    for child_class_id in mo_meta.children:
-        child_mo_meta = ucscoreutils.get_mo_property_meta(child_class_id,
-                                                          "mo_meta")
-        if child_mo_meta is None:
-            continue
-        match = re.match(r"^(\[[^\]]+\])+$", child_mo_meta.rn)
-        if match:
-            return child_mo_meta.name
-
-    return None
+    return ucsrntemplate.get_class_id_for_rn(rn, prev_class_id)
 
 
 def _get_prop_name(prop):
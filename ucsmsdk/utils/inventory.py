@@ -246,6 +246,19 @@ def _get_inventory(handle, comp, spec, inventory):
     _check_and_create_key(ds=inventory, key=ip, value={})
     _check_and_create_key(ds=inventory[ip], key=comp, value=[])
     inv_comp = inventory[ip][comp]
+
+    # all the children lookups of the component are sent as a few batches
+    planner = handle.query_planner()
+    lookups = {}
+    for mo in mos:
+        for each in component["props"]:
+            class_id = each["class"] if "class" in each else None
+            method = each["method"] if "method" in each else None
+            if class_id and method == "query_children":
+                lookups[(mo.dn, class_id)] = planner.add_children(
+                    in_dn=mo.dn, class_id=class_id)
+    results = planner.execute()
+
     for mo in mos:
         mo_dict = {}
         for each in component["props"]:
@@ -254,10 +267,10 @@ def _get_inventory(handle, comp, spec, inventory):
             method = each["method"] if "method" in each else None
 
             if class_id:
+                sub_mo = None
                 if method == "query_children":
-                    sub_mos = handle.query_children(in_dn=mo.dn,
-                                                    class_id=class_id)
-                    sub_mo = sub_mos[0]
+                    sub_mos = results[lookups[(mo.dn, class_id)]]
+                    sub_mo = sub_mos[0] if sub_mos else None
 
                 if sub_mo:
                     if _should_ignore(component, sub_mo):